@@ -283,6 +283,10 @@ BATCH_INIT_M = dict(items=(('i', f'sf.Frame.from_fields({kwa(FRAME_INIT_FROM_FIE
 
 QUILT_INIT_FROM_FRAME_A = dict(frame=f'sf.Frame.from_fields({kwa(FRAME_INIT_FROM_FIELDS_A)})'.encode('utf-8'), retain_labels=True, chunksize=2)
 
+ITER_WINDOW_REDUCE = tuple(f'{i}().{f}()'
+        for i in ('iter_window', 'iter_window_array', 'iter_window_array_items', 'iter_window_items')
+        for f in ('count', 'max', 'mean', 'min', 'std', 'sum', 'var'))
+
 
 
 #-------------------------------------------------------------------------------
@@ -573,6 +577,10 @@ class ExGen:
     def accessor_hashlib(cls, row: sf.Series) -> tp.Iterator[str]:
         raise StopIteration()
 
+    @classmethod
+    def accessor_group(cls, row: sf.Series) -> tp.Iterator[str]:
+        raise StopIteration()
+
     @staticmethod
     def _accessor_hashlib(row: sf.Series,
             name: str,
@@ -1476,6 +1484,10 @@ class ExGenSeries(ExGen):
             yield f's = {icls}({kwa(SERIES_INIT_N)})'
             yield 's'
             yield f"s.{attr_funcs[0]}(size=3, step=1).{attr_funcs[1]}(lambda pair: pair[1].sum(), use_threads=True)"
+        elif attr in ITER_WINDOW_REDUCE:
+            yield f's = {icls}({kwa(SERIES_INIT_N)})'
+            yield 's'
+            yield f"s.{attr_funcs[0]}(size=3, step=1).{attr_funcs[1]}()"
         else:
             raise NotImplementedError(f'no handling for {attr}')
 
@@ -1681,6 +1693,11 @@ class ExGenFrame(ExGen):
             yield f'from pathlib import Path'
             yield "Path('/tmp/f.csv').read_text()"
             yield f"{iattr}('/tmp/f.csv', index_depth=1)"
+        elif attr == 'from_csv_iter':
+            yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
+            yield 'f1'
+            yield f"f1.to_csv('/tmp/f.csv')"
+            yield f"tuple({iattr}('/tmp/f.csv', chunk_rows=2, index_depth=1))"
         elif attr == 'from_delimited':
             yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
             yield 'f1'
@@ -1688,6 +1705,11 @@ class ExGenFrame(ExGen):
             yield f'from pathlib import Path'
             yield "Path('/tmp/f.psv').read_text()"
             yield f"{iattr}('/tmp/f.psv', delimiter='|', index_depth=1)"
+        elif attr == 'from_delimited_iter':
+            yield f'f1 = {icls}({kwa(FRAME_INIT_A1)})'
+            yield 'f1'
+            yield f"f1.to_delimited('/tmp/f.psv', delimiter='|')"
+            yield f"tuple({iattr}('/tmp/f.psv', delimiter='|', chunk_rows=2, index_depth=1))"
         elif attr == 'from_dict':
             yield f'{iattr}({kwa(FRAME_INIT_FROM_DICT_A, arg_first=False)})'
         elif attr == 'from_dict_records':
@@ -1774,6 +1796,14 @@ class ExGenFrame(ExGen):
             yield f"f1.to_npz('/tmp/f.npz')"
             yield f"{iattr}('/tmp/f.npz')"
 
+        elif attr == 'from_npz_mmap':
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_A)})'
+            yield 'f1'
+            yield f"f1.to_npz('/tmp/f.npz')"
+            yield f"f2, closer = {iattr}('/tmp/f.npz')"
+            yield 'f2'
+            yield 'closer() # close mmaps after usage'
+
         elif attr == 'from_overlay':
             yield f'f1 = {icls}.from_items({kwa(FRAME_INIT_FROM_ITEMS_B)})'
             yield 'f1'
@@ -1819,6 +1849,14 @@ class ExGenFrame(ExGen):
             yield "conn = sqlite3.connect('/tmp/f.db')"
             yield f'{iattr}("select * from x limit 2", connection=conn, index_depth=1)'
 
+        elif attr == 'from_sql_iter':
+            yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_A)})'
+            yield 'f1'
+            yield "f1.to_sqlite('/tmp/f.db')"
+            yield 'import sqlite3'
+            yield "conn = sqlite3.connect('/tmp/f.db')"
+            yield f'tuple({iattr}("select * from x", connection=conn, chunk_rows=2, index_depth=1))'
+
         elif attr == 'from_sqlite':
             yield f'f1 = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_A)})'
             yield 'f1'
@@ -3076,6 +3114,10 @@ class ExGenFrame(ExGen):
                 'iter_window_items().apply_pool()',
                 ):
             pass
+        elif attr in ITER_WINDOW_REDUCE:
+            yield f'f = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_N)})'
+            yield 'f'
+            yield f"f.{attr_funcs[0]}(size=2, step=1).{attr_funcs[1]}()"
         else:
             raise NotImplementedError(f'no handling for {attr}')
 
@@ -3252,6 +3294,16 @@ class ExGenFrame(ExGen):
     def accessor_hashlib(row: sf.Series) -> tp.Iterator[str]:
         yield from ExGen._accessor_hashlib(row, 'f', 'from_fields', FRAME_INIT_FROM_FIELDS_B)
 
+    @staticmethod
+    def accessor_group(row: sf.Series) -> tp.Iterator[str]:
+        icls = f"sf.{ContainerMap.str_to_cls(row['cls_name']).__name__}" # interface cls
+        attr = row['signature_no_args']
+        attr_funcs = [x.strip('.') for x in attr.split('()') if x]
+
+        yield f'f = {icls}.from_fields({kwa(FRAME_INIT_FROM_FIELDS_K)})'
+        yield 'f'
+        yield f"f.via_group('c').{attr_funcs[1]}()"
+
     @staticmethod
     def accessor_values(row: sf.Series) -> tp.Iterator[str]:
         yield from ExGen._accessor_values(row, 'f', 'from_fields', FRAME_INIT_FROM_FIELDS_N)
@@ -4746,6 +4798,13 @@ class ExGenBus(ExGen):
             yield 'b'
             yield f"b.to_zip_csv('/tmp/b.zip')"
             yield f"{iattr}('/tmp/b.zip')"
+        elif attr == 'from_npy_mmap':
+            yield f'b = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_A)})'
+            yield 'b'
+            yield f"b.to_npy('/tmp/b.npy')"
+            yield f"{iattr}('/tmp/b.npy')"
+            yield f'import shutil'
+            yield f"shutil.rmtree('/tmp/b.npy')"
         elif attr == 'from_zip_npy':
             yield f'b = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_A)})'
             yield 'b'
@@ -4789,6 +4848,12 @@ class ExGenBus(ExGen):
             yield f'b = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_A)})'
             yield 'b'
             yield f"b.{attr_func}('/tmp/b.hdf5')"
+        elif attr == 'to_npy()':
+            yield f'b = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_A)})'
+            yield 'b'
+            yield f"b.{attr_func}('/tmp/b.npy')"
+            yield f'import shutil'
+            yield f"shutil.rmtree('/tmp/b.npy')"
         elif attr == 'to_sqlite()':
             yield f'b = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_A)})'
             yield 'b'
@@ -5105,6 +5170,14 @@ class ExGenYarn(ExGen):
             yield f'y = sf.Yarn.from_buses((b1, b2), retain_labels=False)'
             yield 'y'
             yield f"y.{attr_func}('/tmp/y.xlsx')"
+        elif attr == 'to_npy()':
+            yield f'b1 = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_A)})'
+            yield f'b2 = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_B)})'
+            yield f'y = sf.Yarn.from_buses((b1, b2), retain_labels=True)'
+            yield 'y'
+            yield f"y.{attr_func}('/tmp/y.npy', config=sf.StoreConfig(label_encoder=str))"
+            yield f'import shutil'
+            yield f"shutil.rmtree('/tmp/y.npy')"
         elif attr in (
                 'to_zip_csv()',
                 'to_zip_npz()',
@@ -5483,6 +5556,11 @@ class ExGenBatch(ExGen):
         elif attr == 'to_xlsx()':
             yield f'bt1 = {icls}({kwa(BATCH_INIT_A)})'
             yield f"bt1.{attr_func}('/tmp/f.xlsx')"
+        elif attr == 'to_npy()':
+            yield f'bt1 = {icls}({kwa(BATCH_INIT_A)})'
+            yield f"bt1.{attr_func}('/tmp/f.npy')"
+            yield f'import shutil'
+            yield f"shutil.rmtree('/tmp/f.npy')"
         elif attr in (
                 'to_zip_csv()',
                 'to_zip_npy()',
@@ -6063,6 +6141,13 @@ class ExGenQuilt(ExGen):
             yield f'q = {icls}(b, retain_labels=True)'
             yield 'q'
             yield f"q.{attr_func}('/tmp/q.xlsx')"
+        elif attr == 'to_npy()':
+            yield f'b = sf.Bus.from_frames({kwa(BUS_INIT_FROM_FRAMES_D)})'
+            yield f'q = {icls}(b, retain_labels=True)'
+            yield 'q'
+            yield f"q.{attr_func}('/tmp/q.npy')"
+            yield f'import shutil'
+            yield f"shutil.rmtree('/tmp/q.npy')"
         elif attr in (
                 'to_zip_csv()',
                 'to_zip_npy()',
@@ -6436,6 +6521,9 @@ class ExGenQuilt(ExGen):
                 'iter_window_items().apply_pool()',
                 ):
             pass
+        elif attr in ITER_WINDOW_REDUCE:
+            yield from ctr
+            yield f"q.{attr_funcs[0]}(size=2, step=2, axis=0).{attr_funcs[1]}()"
         else:
             raise NotImplementedError(f'no handling for {attr}')
 
@@ -7040,6 +7128,7 @@ def gen_examples(target: tp.Type[ContainerBase], exg: ExGen) -> tp.Iterator[str]
             InterfaceGroup.AccessorFillValue,
             InterfaceGroup.AccessorRe,
             InterfaceGroup.AccessorHashlib,
+            InterfaceGroup.AccessorGroup,
             InterfaceGroup.AccessorValues,
             InterfaceGroup.AccessorTypeClinic,
             ):
@@ -11,6 +11,7 @@ from static_frame.core.archive_npy import NPY as NPY
 from static_frame.core.archive_npy import NPZ as NPZ
 from static_frame.core.batch import Batch as Batch
 from static_frame.core.bus import Bus as Bus
+from static_frame.core.cache import Cache as Cache
 from static_frame.core.container import ContainerBase as ContainerBase
 from static_frame.core.display import Display as Display
 from static_frame.core.display import DisplayActive as DisplayActive
@@ -78,11 +79,13 @@ from static_frame.core.memory_measure import MemoryDisplay as MemoryDisplay
 from static_frame.core.node_dt import InterfaceBatchDatetime as InterfaceBatchDatetime
 from static_frame.core.node_dt import InterfaceDatetime as InterfaceDatetime
 from static_frame.core.node_fill_value import InterfaceFillValue as InterfaceFillValue
+from static_frame.core.node_group import InterfaceGroupBy as InterfaceGroupBy
 from static_frame.core.node_hashlib import InterfaceHashlib as InterfaceHashlib
 from static_frame.core.node_iter import IterNodeApplyType as IterNodeApplyType
 from static_frame.core.node_iter import IterNodeAxis as IterNodeAxis
 from static_frame.core.node_iter import IterNodeDelegate as IterNodeDelegate
 from static_frame.core.node_iter import IterNodeDelegateMapable as IterNodeDelegateMapable
+from static_frame.core.node_iter import IterNodeDelegateWindow as IterNodeDelegateWindow
 from static_frame.core.node_iter import IterNodeDepthLevel as IterNodeDepthLevel
 from static_frame.core.node_iter import IterNodeDepthLevelAxis as IterNodeDepthLevelAxis
 from static_frame.core.node_iter import IterNodeGroup as IterNodeGroup
@@ -5,6 +5,7 @@ import json
 import mmap
 import os
 import shutil
+import sqlite3
 import struct
 from ast import literal_eval
 from io import UnsupportedOperation
@@ -37,6 +38,7 @@ from static_frame.core.util import TName
 from static_frame.core.util import TPathSpecifier
 from static_frame.core.util import TPathSpecifierOrIO
 from static_frame.core.util import concat_resolved
+from static_frame.core.util import get_concurrent_executor
 
 if tp.TYPE_CHECKING:
     import pandas as pd  # pylint: disable=W0611 #pragma: no cover
@@ -247,6 +249,7 @@ class Archive:
 
     _memory_map: bool
     _header_decode_cache: HeaderDecodeCacheType
+    _closable: tp.List[mmap.mmap]
     _archive: tp.Any # defined below tp.Union[ZipFile, ZipFileRO, TPathSpecifier]
 
     # set per subclass
@@ -271,6 +274,15 @@ class Archive:
     def write_array(self, name: str, array: TNDArrayAny) -> None:
         raise NotImplementedError() #pragma: no cover
 
+    def write_arrays(self,
+            items: tp.Iterable[tp.Tuple[str, TNDArrayAny]],
+            max_workers: tp.Optional[int] = None,
+            ) -> None:
+        '''Write many pairs of name and array. Derived classes that write each array to its own file may use `max_workers` threads to write arrays concurrently.
+        '''
+        for name, array in items:
+            self.write_array(name, array)
+
     def read_array(self, name: str) -> TNDArrayAny:
         raise NotImplementedError() #pragma: no cover
 
@@ -293,6 +305,11 @@ class Archive:
         for f in getattr(self, '_closable', ()):
             f.close()
 
+    def release(self) -> None:
+        '''Discard references to memory maps, such that each is closed when the last array that uses it is garbage collected, rather than when this archive is closed.
+        '''
+        self._closable = []
+
 class ArchiveZip(Archive):
 
     '''Archives based on a new ZipFile per Frame; ZipFile creation happens on __init__.
@@ -310,18 +327,18 @@ class ArchiveZip(Archive):
             ):
 
         if writeable:
+            if memory_map:
+                raise RuntimeError(f'Cannot memory_map with {self}')
             self._archive = ZipFile(fp, # pylint: disable=R1732
                 mode='w',
                 compression=ZIP_STORED,
                 allowZip64=True,
                 )
         else:
+            # NOTE: as members are not compressed, memory maps can be created from the underlying file, provided `fp` is a path or a file with a file descriptor
             self._archive = ZipFileRO(fp)
             self._header_decode_cache = {}
 
-        if memory_map:
-            raise RuntimeError(f'Cannot memory_map with {self}')
-
         self._memory_map = memory_map
 
     def __del__(self) -> None:
@@ -352,9 +369,16 @@ class ArchiveZip(Archive):
     def read_array(self, name: str) -> TNDArrayAny:
         f = self._archive.open(name) # pylint: disable=R1732
         try:
-            array, _ = NPYConverter.from_npy(f, self._header_decode_cache)
+            array, mm = NPYConverter.from_npy(f,
+                    self._header_decode_cache,
+                    self._memory_map,
+                    )
         finally:
-            f.close()
+            f.close() # NOTE: can close the file after creating memory map
+        if mm is not None:
+            if not hasattr(self, '_closable'):
+                self._closable = []
+            self._closable.append(mm)
         array.flags.writeable = False
         return array
 
@@ -429,6 +453,26 @@ class ArchiveDirectory(Archive):
         finally:
             f.close()
 
+    def write_arrays(self,
+            items: tp.Iterable[tp.Tuple[str, TNDArrayAny]],
+            max_workers: tp.Optional[int] = None,
+            ) -> None:
+        if max_workers is None or max_workers <= 1:
+            Archive.write_arrays(self, items)
+            return
+
+        # NOTE: as each array is written to a distinct file, arrays can be encoded and written concurrently
+        pool_executor = get_concurrent_executor(
+                use_threads=True,
+                max_workers=max_workers,
+                mp_context=None,
+                )
+        with pool_executor() as executor:
+            futures = [executor.submit(self.write_array, name, array)
+                    for name, array in items]
+        for future in futures:
+            future.result() # raise any exceptions
+
     def read_array(self, name: str) -> TNDArrayAny:
         fp = os.path.join(self._archive, name)
         if self._memory_map:
@@ -443,8 +487,8 @@ class ArchiveDirectory(Archive):
                         )
             finally:
                 f.close() # NOTE: can close the file after creating memory map
-            # self._closable.append(f)
-            self._closable.append(mm)
+            if mm is not None:
+                self._closable.append(mm)
             return array
 
         f = open(fp, 'rb') # pylint: disable=R1732
@@ -526,6 +570,8 @@ class ArchiveZipWrapper(Archive):
             # split on the last observed separator
             if name.endswith(self._delimiter):
                 continue #pragma: no cover
+            if self._delimiter not in name: # not contained in a directory, such as an axis index
+                continue
             dir_current, _ = name.rsplit(self._delimiter, maxsplit=1)
             if dir_current != dir_last:
                 dir_last = dir_current
@@ -592,6 +638,84 @@ class ArchiveZipWrapper(Archive):
         return self._archive.getinfo(name).file_size
 
 
+class ArchiveSQLiteWrapper(Archive):
+    '''Archive based on a shared (and already open) SQLite connection, where each member is a row, of name and NPY-encoded BLOB, of a table named by ``prefix``. The table must be created by clients.
+    '''
+    __slots__ = ('prefix',)
+
+    _archive: sqlite3.Connection
+
+    def __init__(self,
+            connection: sqlite3.Connection,
+            writeable: bool,
+            memory_map: bool,
+            ):
+
+        self._archive = connection
+        self.prefix = '' # must be directly set by clients
+
+        if not writeable:
+            self._header_decode_cache = {}
+        if memory_map:
+            raise RuntimeError(f'Cannot memory_map with {self}')
+        self._memory_map = memory_map
+
+    def _read(self, name: str, field: str = 'value') -> tp.Any:
+        row = self._archive.execute(
+                f'SELECT {field} FROM "{self.prefix}" WHERE name = ?', (name,)
+                ).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return row[0]
+
+    def labels(self) -> tp.Iterator[str]:
+        for (name,) in self._archive.execute(f'SELECT name FROM "{self.prefix}" ORDER BY rowid'):
+            yield name
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            self._read(name, '1')
+        except KeyError:
+            return False
+        return True
+
+    def write_array(self, name: str, array: TNDArrayAny) -> None:
+        f = io.BytesIO()
+        NPYConverter.to_npy(f, array)
+        self._archive.execute(
+                f'INSERT INTO "{self.prefix}" (name, value) VALUES (?, ?)',
+                (name, f.getbuffer()),
+                )
+
+    def read_array(self, name: str) -> TNDArrayAny:
+        f = io.BytesIO(self._read(name))
+        array, _ = NPYConverter.from_npy(f, self._header_decode_cache)
+        array.flags.writeable = False
+        return array
+
+    def read_array_header(self, name: str) -> HeaderType:
+        '''Alternate reader for status displays.
+        '''
+        f = io.BytesIO(self._read(name))
+        return NPYConverter.header_from_npy(f, self._header_decode_cache)
+
+    def size_array(self, name: str) -> int:
+        return self._read(name, 'length(value)') # type: ignore
+
+    def write_metadata(self, content: tp.Any) -> None:
+        # stored as TEXT to be readable by other SQLite clients
+        self._archive.execute(
+                f'INSERT INTO "{self.prefix}" (name, value) VALUES (?, ?)',
+                (self.FILE_META, json.dumps(content)),
+                )
+
+    def read_metadata(self) -> tp.Any:
+        return json.loads(self._read(self.FILE_META))
+
+    def size_metadata(self) -> int:
+        return self._read(self.FILE_META, 'length(CAST(value AS BLOB))') # type: ignore
+
+
 #-------------------------------------------------------------------------------
 
 class ArchiveIndexConverter:
@@ -682,6 +806,7 @@ class ArchiveFrameConverter:
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            max_workers: tp.Optional[int] = None,
             ) -> None:
         metadata: tp.Dict[str, tp.Any] = {}
 
@@ -725,12 +850,16 @@ class ArchiveFrameConverter:
                 depth=depth_columns,
                 include=include_columns,
                 )
-        i = 0
-        for i, array in enumerate(block_iter, 1):
-            archive.write_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i-1), array)
+        count = 0
+        def items() -> tp.Iterator[tp.Tuple[str, TNDArrayAny]]:
+            nonlocal count
+            for count, array in enumerate(block_iter, 1):
+                yield NPYLabel.FILE_TEMPLATE_BLOCKS.format(count-1), array
+
+        archive.write_arrays(items(), max_workers=max_workers)
 
         metadata[NPYLabel.KEY_DEPTHS] = [
-                i, # block count
+                count, # block count
                 depth_index,
                 depth_columns]
 
@@ -745,6 +874,7 @@ class ArchiveFrameConverter:
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            max_workers: tp.Optional[int] = None,
             ) -> None:
         '''
         Write a :obj:`Frame` as an npz file.
@@ -760,6 +890,7 @@ class ArchiveFrameConverter:
                     include_index=include_index,
                     include_columns=include_columns,
                     consolidate_blocks=consolidate_blocks,
+                    max_workers=max_workers,
                     )
         except ErrorNPYEncode:
             archive.close()
@@ -829,8 +960,8 @@ class ArchiveFrameConverter:
                     archive.read_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i))
                     for i in range(block_count)
                     )
-        else:
-            tb = TypeBlocks.from_zero_size_shape()
+        else: # without blocks there are no columns, but there might be rows
+            tb = TypeBlocks.from_zero_size_shape((0 if index is None else len(index), 0))
 
         f = constructor(tb,
                 own_data=True,
@@ -865,7 +996,7 @@ class ArchiveFrameConverter:
     def from_archive_mmap(cls,
             *,
             constructor: tp.Type[TFrameAny],
-            fp: TPathSpecifier,
+            fp: TPathSpecifierOrIO,
             ) -> tp.Tuple[TFrameAny, tp.Callable[[], None]]:
         '''
         Create a :obj:`Frame` from an npz file.
@@ -995,6 +1126,22 @@ class ArchiveComponentsConverter(metaclass=InterfaceMeta):
             name:
             axis:
         '''
+        self._from_arrays(blocks,
+                index=index,
+                columns=columns,
+                name=name,
+                axis=axis,
+                )
+
+    def _from_arrays(self,
+            blocks: tp.Iterable[TNDArrayAny],
+            *,
+            index: TNDArrayAny | IndexBase | None = None,
+            columns: TNDArrayAny | IndexBase | None = None,
+            name: TName = None,
+            axis: int = 0,
+            max_workers: tp.Optional[int] = None,
+            ) -> None:
         if not self._writeable:
             raise UnsupportedOperation('Open with mode "w" to write.')
 
@@ -1073,25 +1220,30 @@ class ArchiveComponentsConverter(metaclass=InterfaceMeta):
                 ]
 
         if axis == 1:
-            rows = 0
-            for i, array in enumerate(blocks):
-                if not rows:
-                    rows = array.shape[0]
-                else:
-                    if array.shape[0] != rows:
-                        raise RuntimeError('incompatible block shapes')
-                self._archive.write_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i), array)
+            count = 0
+            def items() -> tp.Iterator[tp.Tuple[str, TNDArrayAny]]:
+                nonlocal count
+                rows = 0
+                for count, array in enumerate(blocks, 1):
+                    if not rows:
+                        rows = array.shape[0]
+                    else:
+                        if array.shape[0] != rows:
+                            raise RuntimeError('incompatible block shapes')
+                    yield NPYLabel.FILE_TEMPLATE_BLOCKS.format(count-1), array
+
+            self._archive.write_arrays(items(), max_workers=max_workers)
         elif axis == 0:
             # for now, just vertically concat and write, though this has a 2X memory requirement
             resolved = concat_resolved(blocks, axis=0)
             # if this results in an obect array, an exception will be raised
             self._archive.write_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(0), resolved)
-            i = 0
+            count = 1
         else:
             raise AxisInvalid(f'invalid axis {axis}')
 
         metadata[NPYLabel.KEY_DEPTHS] = [
-                i + 1, # block count
+                count, # block count
                 depth_index,
                 depth_columns]
         self._archive.write_metadata(metadata)
@@ -1117,8 +1269,27 @@ class ArchiveComponentsConverter(metaclass=InterfaceMeta):
             union:
             name:
             fill_value:
-
         '''
+        self._from_frames(frames,
+                include_index=include_index,
+                include_columns=include_columns,
+                axis=axis,
+                union=union,
+                name=name,
+                fill_value=fill_value,
+                )
+
+    def _from_frames(self,
+            frames: tp.Iterable[TFrameAny],
+            *,
+            include_index: bool = True,
+            include_columns: bool = True,
+            axis: int = 0,
+            union: bool = True,
+            name: TName = None,
+            fill_value: object = np.nan,
+            max_workers: tp.Optional[int] = None,
+            ) -> None:
         if not self._writeable:
             raise UnsupportedOperation('Open with mode "w" to write.')
 
@@ -1205,12 +1376,13 @@ class ArchiveComponentsConverter(metaclass=InterfaceMeta):
         else:
             raise AxisInvalid(f'no support for {axis}')
 
-        self.from_arrays(
+        self._from_arrays(
                 blocks=blocks(),
                 index=index,
                 columns=columns,
                 name=name,
                 axis=1, # blocks are normalized for horizontal concat
+                max_workers=max_workers,
                 )
 
 class NPZ(ArchiveComponentsConverter):
@@ -1223,4 +1395,67 @@ class NPY(ArchiveComponentsConverter):
     '''
     _ARCHIVE_CLS = ArchiveDirectory
 
+    def from_arrays(self,
+            blocks: tp.Iterable[TNDArrayAny],
+            *,
+            index: TNDArrayAny | IndexBase | None = None,
+            columns: TNDArrayAny | IndexBase | None = None,
+            name: TName = None,
+            axis: int = 0,
+            max_workers: tp.Optional[int] = None,
+            ) -> None:
+        '''
+        Given an iterable of arrays, write out an NPY directory directly, without building up intermediary :obj:`Frame`. If axis 0, the arrays are vertically stacked; if axis 1, they are horizontally stacked. For both axis, if included, indices must be of appropriate length.
+
+        Args:
+            blocks:
+            *
+            index: An array, :obj:`Index`, or :obj:`IndexHierarchy`.
+            columns: An array, :obj:`Index`, or :obj:`IndexHierarchy`.
+            name:
+            axis:
+            max_workers: If greater than 1, the number of threads used to write NPY files concurrently.
+        '''
+        self._from_arrays(blocks,
+                index=index,
+                columns=columns,
+                name=name,
+                axis=axis,
+                max_workers=max_workers,
+                )
+
+    def from_frames(self,
+            frames: tp.Iterable[TFrameAny],
+            *,
+            include_index: bool = True,
+            include_columns: bool = True,
+            axis: int = 0,
+            union: bool = True,
+            name: TName = None,
+            fill_value: object = np.nan,
+            max_workers: tp.Optional[int] = None,
+            ) -> None:
+        '''Given an iterable of Frames, write out an NPY directory directly, without building up an intermediary Frame. If axis 0, the Frames must be block compatible; if axis 1, the Frames must have the same number of rows. For both axis, if included, concatenated indices must be unique or aligned.
+
+        Args:
+            frames:
+            *
+            include_index:
+            include_columns:
+            axis:
+            union:
+            name:
+            fill_value:
+            max_workers: If greater than 1, the number of threads used to write NPY files concurrently.
+        '''
+        self._from_frames(frames,
+                include_index=include_index,
+                include_columns=include_columns,
+                axis=axis,
+                union=union,
+                name=name,
+                fill_value=fill_value,
+                max_workers=max_workers,
+                )
+
 
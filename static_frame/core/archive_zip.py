@@ -297,6 +297,11 @@ class ZipFilePartRO(io.BufferedIOBase):
     def tell(self) -> int:
         return self._pos
 
+    def fileno(self) -> int:
+        if self._file is None:
+            raise ValueError("I/O operation on closed file.")
+        return self._file.fileno()
+
     def seek(self, offset: int, whence: int = 0) -> int:
         if self._file is None:
             raise ValueError("I/O operation on closed file.")
@@ -343,6 +348,79 @@ class ZipFilePartRO(io.BufferedIOBase):
         raise NotImplementedError() #pragma: no cover
 
 
+class ZipFileSectionRO(io.BufferedIOBase):
+    '''
+    A read-only view of a file that ends at `end`, permitting an uncompressed ZIP stored (at any offset) in another uncompressed ZIP to be read with ZipFileRO without copying. Positions are those of the composed file; as with ZIPs concatenated to other files, ZipFileRO derives member offsets from the position of the end of central directory record.
+    '''
+    __slots__ = (
+            '_file',
+            '_end',
+            )
+
+    def __init__(self,
+            file: tp.IO[bytes],
+            end: int,
+            ) -> None:
+        '''
+        Args:
+            end: the position, in `file`, of the end of the section.
+        '''
+        self._file: tp.IO[bytes] | None = file
+        self._end = end
+
+    def __enter__(self) -> tp.Self:
+        return self
+
+    def __exit__(self,
+            type: tp.Type[BaseException] | None,
+            value: BaseException | None,
+            traceback: TracebackType | None,
+            ) -> None:
+        self.close()
+
+    def _get_file(self) -> tp.IO[bytes]:
+        if self._file is None:
+            raise ValueError("I/O operation on closed file.")
+        return self._file
+
+    def seekable(self) -> bool:
+        return self._get_file().seekable()
+
+    def tell(self) -> int:
+        return self._get_file().tell()
+
+    def fileno(self) -> int:
+        return self._get_file().fileno()
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        file = self._get_file()
+        if whence == 2:
+            return file.seek(self._end + offset, 0)
+        return file.seek(offset, whence)
+
+    def read(self, n: int | None = -1) -> bytes:
+        file = self._get_file()
+        n_max = max(self._end - file.tell(), 0)
+        if n is None or n < 0 or n > n_max:
+            n = n_max
+        return file.read(n)
+
+    def readinto(self, buffer: tp.Buffer) -> int:
+        file = self._get_file()
+        n_max = max(self._end - file.tell(), 0)
+        view = memoryview(buffer).cast('B')
+        return file.readinto(view[:n_max]) # type: ignore
+
+    def close(self) -> None:
+        if self._file is not None:
+            file = self._file
+            self._file = None
+            file.close()
+
+    def write(self, data: tp.Buffer, /) -> int:
+        raise NotImplementedError() #pragma: no cover
+
+
 #-------------------------------------------------------------------------------
 
 @tp.overload
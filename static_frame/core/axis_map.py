@@ -2,13 +2,19 @@ from __future__ import annotations
 
 from copy import deepcopy
 from functools import partial
+from io import BytesIO
 from itertools import repeat
+from zipfile import ZIP_STORED
+from zipfile import ZipFile
 
 import typing_extensions as tp
 from arraykit import array_deepcopy
 
+from static_frame.core.archive_npy import ArchiveFrameConverter
+from static_frame.core.archive_npy import ArchiveZipWrapper
 from static_frame.core.bus import Bus
 from static_frame.core.exception import AxisInvalid
+from static_frame.core.frame import Frame
 from static_frame.core.generic_aliases import TBusAny
 from static_frame.core.generic_aliases import TFrameAny
 from static_frame.core.generic_aliases import TIndexAny
@@ -20,6 +26,7 @@ from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.index_hierarchy import IndexHierarchyGO
 from static_frame.core.index_hierarchy import TTreeNode
 from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TLabel
 from static_frame.core.util import TName
@@ -132,6 +139,61 @@ def bus_to_hierarchy(
             index_constructors=IndexAutoConstructorFactory), opposite
 
 
+def axis_index_to_bytes(
+        axis: int,
+        hierarchy: IndexHierarchy,
+        opposite: IndexBase,
+        depths: tp.Optional[tp.Tuple[int, int]] = None,
+        ) -> bytes:
+    '''
+    Encode the :obj:`IndexHierarchy` of the axis of concatenation, and the index of the opposite axis, as a ZIP of NPY, where each is the index of a :obj:`Frame` without columns. The axis, and the ``index_depth`` and ``columns_depth`` needed to read the contributing :obj:`Frame` (or None if not needed), are stored as the name of the first :obj:`Frame`, the size of the opposite axis as the name of the second.
+    '''
+    dst = BytesIO()
+    with ZipFile(dst, mode='w', compression=ZIP_STORED) as zf:
+        archive = ArchiveZipWrapper(zf,
+                writeable=True,
+                memory_map=False,
+                delimiter='/',
+                )
+        for prefix, index, name in (('hierarchy', hierarchy, (axis, depths)), ('opposite', opposite, len(opposite))):
+            archive.prefix = prefix # mutate
+            ArchiveFrameConverter.frame_encode(
+                    archive=archive,
+                    frame=Frame(index=index, name=name),
+                    )
+    return dst.getvalue()
+
+
+def axis_index_from_bytes(
+        src: bytes,
+        ) -> tp.Tuple[int, tp.Optional[tp.Tuple[int, int]], IndexHierarchy, IndexBase]:
+    '''
+    Decode the axis, the ``index_depth`` and ``columns_depth`` needed to read the contributing :obj:`Frame` (or None), the :obj:`IndexHierarchy` of the axis of concatenation, and the index of the opposite axis, from bytes returned by :obj:`axis_index_to_bytes`.
+    '''
+    frames = []
+    with ZipFile(BytesIO(src)) as zf:
+        archive = ArchiveZipWrapper(zf,
+                writeable=False,
+                memory_map=False,
+                delimiter='/',
+                )
+        for prefix in ('hierarchy', 'opposite'):
+            archive.prefix = prefix # mutate
+            frames.append(ArchiveFrameConverter.frame_decode(
+                    archive=archive,
+                    constructor=Frame,
+                    ))
+    hierarchy, opposite = frames
+    axis, depths = hierarchy.name # type: ignore
+    if len(opposite.index) != opposite.name:
+        # labels of an auto-incremented index are not stored
+        return axis, depths, hierarchy.index, Index( # type: ignore
+                PositionsAllocator.get(opposite.name), # type: ignore
+                loc_is_iloc=True,
+                )
+    return axis, depths, hierarchy.index, opposite.index # type: ignore
+
+
 def buses_to_iloc_hierarchy(
         buses: tp.Iterable[TBusAny],
         deepcopy_from_bus: bool,
@@ -28,6 +28,10 @@ from static_frame.core.node_str import InterfaceBatchString
 from static_frame.core.node_transpose import InterfaceBatchTranspose
 from static_frame.core.node_values import InterfaceBatchValues
 from static_frame.core.series import Series
+from static_frame.core.shared_memory import FrameSharedMemory
+from static_frame.core.shared_memory import frame_from_shared_memory
+from static_frame.core.shared_memory import frame_to_shared_memory
+from static_frame.core.shared_memory import shared_memory_prepare
 from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_config import StoreConfigMap
@@ -48,6 +52,7 @@ from static_frame.core.util import ELEMENT_TUPLE
 from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import TBlocKey
 from static_frame.core.util import TBoolOrBools
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TDtypeSpecifier
 from static_frame.core.util import TILocSelectorCompound
@@ -108,6 +113,33 @@ def call_attr(bundle: tp.Tuple[TFrameOrSeries, str, tp.Any, tp.Any]
     func = getattr(container, attr)
     return func(*args, **kwargs) # type: ignore
 
+# a stage is a caller, the arguments to the caller following the container, and an optional exception that, if raised, excludes the container
+TStage = tp.Tuple[tp.Callable[..., TFrameOrSeries], tp.Tuple[tp.Any, ...], tp.Optional[tp.Type[Exception]]]
+TStages = tp.Tuple[TStage, ...]
+
+def call_stages(bundle: tp.Tuple[TFrameOrSeries, TLabel, TStages]
+        ) -> tp.Tuple[bool, tp.Optional[TFrameOrSeries]]:
+    container, label, stages = bundle
+    post: tp.Optional[TFrameOrSeries] = container
+    for caller, args, exception in stages:
+        if caller is call_func_items:
+            args = (*args, label)
+        if exception is None:
+            post = caller((post, *args))
+        else:
+            try:
+                post = caller((post, *args))
+            except exception:
+                return False, None
+    return True, post
+
+def call_stages_shared_memory(bundle: tp.Tuple[TFrameOrSeries, TLabel, TStages]
+        ) -> tp.Tuple[bool, tp.Union[TFrameOrSeries, FrameSharedMemory, None]]:
+    valid, post = call_stages(bundle)
+    if valid and isinstance(post, Frame):
+        return valid, frame_to_shared_memory(post)
+    return valid, post
+
 #-------------------------------------------------------------------------------
 class Batch(ContainerOperand, StoreClientMixin):
     '''
@@ -122,6 +154,9 @@ class Batch(ContainerOperand, StoreClientMixin):
             '_chunksize',
             '_use_threads',
             '_mp_context',
+            '_shared_memory',
+            '_source',
+            '_stages',
             )
 
     _config: StoreConfigMap
@@ -136,6 +171,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''Return a :obj:`Batch` from an iterable of :obj:`Frame`; labels will be drawn from :obj:`Frame.name`.
         '''
@@ -146,6 +182,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     #---------------------------------------------------------------------------
@@ -160,6 +197,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         config_map = StoreConfigMap.from_initializer(config)
 
@@ -172,6 +210,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -184,6 +223,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped TSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -197,6 +237,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -209,6 +250,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped CSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -222,6 +264,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -234,6 +277,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped pickle :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -247,6 +291,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -259,6 +304,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPZ :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -272,6 +318,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -284,6 +331,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPY :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -297,6 +345,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -309,6 +358,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped parquet :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -322,6 +372,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
 
@@ -335,6 +386,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to an XLSX :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -349,6 +401,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
 
@@ -362,6 +415,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to an SQLite :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -375,6 +429,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
 
@@ -388,6 +443,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to a HDF5 :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -401,6 +457,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     #---------------------------------------------------------------------------
@@ -413,6 +470,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ):
         '''
         Default constructor of a :obj:`Batch`.
@@ -428,6 +486,11 @@ class Batch(ContainerOperand, StoreClientMixin):
         self._chunksize = chunksize
         self._use_threads = use_threads
         self._mp_context = mp_context
+        self._shared_memory = shared_memory
+
+        # if derived from a pool, the items and stages from which items are evaluated
+        self._source: tp.Optional[TIteratorFrameItems] = None
+        self._stages: TStages = ()
 
     #---------------------------------------------------------------------------
     def _derive(self,
@@ -442,6 +505,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=self._max_workers,
                 chunksize=self._chunksize,
                 use_threads=self._use_threads,
+                mp_context=self._mp_context,
+                shared_memory=self._shared_memory,
                 )
 
     @property
@@ -518,34 +583,24 @@ class Batch(ContainerOperand, StoreClientMixin):
             yield label, frame
 
     def _apply_pool(self,
-            labels: tp.List[TLabel],
-            arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
-            caller: tp.Callable[..., TFrameOrSeries],
-            ) -> 'Batch':
-
-        pool_executor = get_concurrent_executor(
-                use_threads=self._use_threads,
-                max_workers=self._max_workers,
-                mp_context=self._mp_context,
-                )
-
-        def gen_pool() -> TIteratorFrameItems:
-            with pool_executor() as executor:
-                yield from zip(labels,
-                        executor.map(caller, arg_iter, chunksize=self._chunksize)
-                        )
-        return self._derive(gen_pool)
-
-    def _apply_pool_except(self,
-            labels: tp.List[TLabel],
-            arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
             caller: tp.Callable[..., TFrameOrSeries],
-            exception: tp.Type[Exception],
+            args: tp.Tuple[tp.Any, ...],
+            exception: tp.Optional[tp.Type[Exception]] = None,
             ) -> 'Batch':
-
-        if self._chunksize != 1:
+        '''Add a stage to the pipeline of stages evaluated in a pool. If this :obj:`Batch` was derived from a pool, the stage is fused with the stages of that pool, such that each worker evaluates all stages on a :obj:`Frame` and only the final result is returned from the worker; a chain of operations thus uses one executor.
+        '''
+        if exception is not None and self._chunksize != 1:
             raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
 
+        if self._stages:
+            assert self._source is not None #mypy
+            source = self._source
+            stages = self._stages + ((caller, args, exception),)
+        else:
+            source = self._items
+            stages = ((caller, args, exception),)
+
+        shared_memory = self._shared_memory and not self._use_threads
         pool_executor = get_concurrent_executor(
                 use_threads=self._use_threads,
                 max_workers=self._max_workers,
@@ -553,19 +608,32 @@ class Batch(ContainerOperand, StoreClientMixin):
                 )
 
         def gen_pool() -> TIteratorFrameItems:
-            futures = []
-            with pool_executor() as executor:
-                for args in arg_iter:
-                    futures.append(executor.submit(caller, args))
-
-                for label, future in zip(labels, futures):
+            if shared_memory:
+                shared_memory_prepare()
+            caller = call_stages_shared_memory if shared_memory else call_stages
+            labels = []
+            def arg_gen() -> tp.Iterator[tp.Tuple[TFrameOrSeries, TLabel, TStages]]:
+                for pair in source:
                     try:
-                        container = future.result()
-                    except exception:
-                        continue
-                    yield label, container
+                        label, frame = pair
+                    except ValueError:
+                        raise BatchIterableInvalid() from None
+                    labels.append(label)
+                    yield frame, label, stages
 
-        return self._derive(gen_pool)
+            with pool_executor() as executor:
+                for label, (valid, container) in zip(labels,
+                        executor.map(caller, arg_gen(), chunksize=self._chunksize)
+                        ):
+                    if valid:
+                        if isinstance(container, FrameSharedMemory):
+                            container = frame_from_shared_memory(container)
+                        yield label, container
+
+        post = self._derive(gen_pool)
+        post._source = source
+        post._stages = stages
+        return post
 
     def _apply_attr(self,
             *args: tp.Any,
@@ -581,13 +649,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                     yield label, call_attr((frame, attr, args, kwargs))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[TFrameOrSeries, str, tp.Any, tp.Any]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, attr, args, kwargs
-
-        return self._apply_pool(labels, arg_gen(), call_attr)
+        return self._apply_pool(call_attr, (attr, args, kwargs))
 
     def apply(self, func: TCallableAny) -> 'Batch':
         '''
@@ -599,13 +661,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                     yield label, call_func((frame, func))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[TFrameOrSeries, TCallableAny]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool(labels, arg_gen(), call_func)
+        return self._apply_pool(call_func, (func,))
 
     def apply_except(self,
             func: TCallableAny,
@@ -623,17 +679,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                         pass
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[TFrameOrSeries, TCallableAny]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func,
-                exception,
-                )
+        return self._apply_pool(call_func, (func,), exception)
 
     def apply_items(self, func: TCallableAny) -> 'Batch':
         '''
@@ -645,13 +691,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                     yield label, call_func_items((frame, func, label))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[TFrameOrSeries, TCallableAny, TLabel]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func, label
-
-        return self._apply_pool(labels, arg_gen(), call_func_items)
+        return self._apply_pool(call_func_items, (func,))
 
     def apply_items_except(self,
             func: TCallableAny,
@@ -669,17 +709,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                         pass
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[TFrameOrSeries, TCallableAny, TLabel]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func, label
-
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func_items,
-                exception,
-                )
+        return self._apply_pool(call_func_items, (func,), exception)
 
     #---------------------------------------------------------------------------
     # extraction
@@ -1818,6 +1848,18 @@ class Batch(ContainerOperand, StoreClientMixin):
                 name=self._name,
                 )
 
+    def _iter_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> tp.Iterator[TBytesLike]:
+
+        yield from self.to_bus()._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding,
+                )
+
     def _to_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from itertools import chain
+from functools import partial
 from itertools import zip_longest
 
 import numpy as np
@@ -33,6 +33,7 @@ from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.store_hdf5 import StoreHDF5
+from static_frame.core.store_npy import StoreNPY
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
 from static_frame.core.store_zip import StoreZipCSV
@@ -51,6 +52,7 @@ from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import ZIP_LONGEST_DEFAULT
 from static_frame.core.util import TBoolOrBools
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TILocSelector
 from static_frame.core.util import TIndexCtorSpecifier
 from static_frame.core.util import TIndexCtorSpecifiers
@@ -61,6 +63,7 @@ from static_frame.core.util import TName
 from static_frame.core.util import TNDArrayObject
 from static_frame.core.util import TPathSpecifier
 from static_frame.core.util import TSortKinds
+from static_frame.core.util import get_concurrent_executor
 
 
 #-------------------------------------------------------------------------------
@@ -72,9 +75,61 @@ class FrameDeferred(metaclass=FrameDeferredMeta):
     '''
     Token placeholder for :obj:`Frame` not yet loaded.
     '''
+
+class BusPrefetcher:
+    '''
+    Read :obj:`Frame` from a :obj:`Store` on a single background thread, permitting reading ahead of the :obj:`Frame` currently in use. All reads are done on the same thread, such that the :obj:`Store` is never read concurrently.
+    '''
+
+    __slots__ = (
+            '_store',
+            '_config',
+            '_executor',
+            '_futures',
+            )
+
+    def __init__(self,
+            store: Store,
+            config: StoreConfigMap,
+            ) -> None:
+        self._store = store
+        self._config = config
+        self._executor = get_concurrent_executor(
+                use_threads=True,
+                max_workers=1,
+                mp_context=None,
+                )()
+        self._futures: tp.Dict[TLabel, Future[TFrameAny]] = {}
+
+    def _read(self, label: TLabel) -> TFrameAny:
+        return next(self._store.read_many((label,), config=self._config))
+
+    def submit(self, label: TLabel) -> None:
+        '''Schedule reading the :obj:`Frame` at `label`, if not already scheduled.
+        '''
+        if label not in self._futures:
+            self._futures[label] = self._executor.submit(self._read, label)
+
+    def read_many(self, labels: tp.Iterable[TLabel]) -> TIterFrame:
+        '''Return an iterator of :obj:`Frame` for `labels`, using those already read ahead where available.
+        '''
+        labels = list(labels)
+        for label in labels: # schedule in order before waiting on any
+            self.submit(label)
+        for label in labels:
+            yield self._futures.pop(label).result()
+
+    def close(self) -> None:
+        '''Cancel outstanding reads and release the thread.
+        '''
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._futures.clear()
+
 #-------------------------------------------------------------------------------
 
 if tp.TYPE_CHECKING:
+    from concurrent.futures import Future  # pragma: no cover
+
     from static_frame.core.generic_aliases import TFrameAny  # pragma: no cover
     from static_frame.core.generic_aliases import TIndexHierarchyAny  # pragma: no cover
     from static_frame.core.generic_aliases import TSeriesAny  # pragma: no cover
@@ -107,6 +162,10 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         '_config',
         '_last_accessed',
         '_max_persist',
+        '_max_persist_bytes',
+        '_loaded_nbytes',
+        '_prefetch',
+        '_prefetcher',
         )
 
     _values_mutable: TNDArrayAny
@@ -191,6 +250,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             store: tp.Optional[Store] = None,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             own_data: bool = False,
             ) -> tp.Self:
         '''
@@ -202,6 +263,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 own_data=own_data,
                 own_index=True,
                 name=series.name,
@@ -230,6 +293,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         return cls(None, # will generate FrameDeferred array
@@ -238,6 +303,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 own_data=True,
                 )
 
@@ -248,6 +315,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -259,6 +328,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -269,6 +340,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -280,6 +353,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -290,6 +365,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -301,6 +378,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -311,6 +390,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -322,6 +403,33 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
+                index_constructor=index_constructor,
+                )
+
+    @classmethod
+    @doc_inject(selector='bus_constructor')
+    def from_npy_mmap(cls,
+            fp: TPathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
+            index_constructor: TIndexCtorSpecifier = None,
+            ) -> tp.Self:
+        '''
+        Given a file path to a directory of NPY directories :obj:`Bus` store, return a :obj:`Bus` instance that loads :obj:`Frame` using memory maps. Memory maps are closed when :obj:`Frame` are unpersisted and no longer referenced.
+
+        {args}
+        '''
+        store = StoreNPY(fp)
+        return cls._from_store(store,
+                config=config,
+                max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -332,6 +440,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -343,6 +453,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -353,6 +465,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -364,6 +478,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -374,6 +490,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -386,6 +504,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -396,6 +516,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -407,6 +529,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -417,6 +541,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -428,6 +554,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 index_constructor=index_constructor,
                 )
 
@@ -441,6 +569,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             store: tp.Optional[Store] = None,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: int = 0,
             own_index: bool = False,
             own_data: bool = False,
             ):
@@ -450,9 +580,11 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
 
         {args}
         '''
-        if max_persist is not None:
-            # use an (ordered) dictionary to give use an ordered set, simply pointing to None for all keys
-            self._last_accessed: tp.Dict[TLabel, None] = {}
+        if max_persist is not None or max_persist_bytes is not None:
+            # use an (ordered) dictionary to give use an ordered set; if max_persist_bytes is defined, keys point to the nbytes of each loaded Frame, else None
+            self._last_accessed: tp.Dict[TLabel, tp.Optional[int]] = {}
+        if max_persist_bytes is not None:
+            self._loaded_nbytes = 0
 
         if own_index:
             self._index = index #type: ignore
@@ -503,7 +635,10 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 if value is FrameDeferred:
                     self._loaded[i] = False
                 elif isinstance(value, Frame): # permit FrameGO?
-                    if max_persist is not None:
+                    if max_persist_bytes is not None:
+                        self._last_accessed[label] = value.nbytes
+                        self._loaded_nbytes += value.nbytes
+                    elif max_persist is not None:
                         self._last_accessed[label] = None
                     self._loaded[i] = True
                 else:
@@ -525,6 +660,15 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         if max_persist is not None and max_persist < self._loaded.sum():
             raise ErrorInitBus('max_persist cannot be less than the number of already loaded Frames')
         self._max_persist = max_persist
+        # NOTE: Frames already loaded are retained even if they exceed max_persist_bytes; they are removed, least-recently used first, as other Frames are loaded
+        self._max_persist_bytes = max_persist_bytes
+
+        if prefetch < 0:
+            raise ErrorInitBus('prefetch cannot be negative')
+        if prefetch and max_persist is not None and max_persist < 2:
+            raise ErrorInitBus('prefetch requires a max_persist of at least 2, as read-ahead Frames are counted against max_persist')
+        self._prefetch = prefetch
+        self._prefetcher: tp.Optional[BusPrefetcher] = None
 
         # providing None will result in default; providing a StoreConfig or StoreConfigMap will return an appropriate map
         self._config = StoreConfigMap.from_initializer(config)
@@ -542,6 +686,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=self._store,
                 config=self._config,
                 max_persist=self._max_persist,
+                max_persist_bytes=self._max_persist_bytes,
+                prefetch=self._prefetch,
                 own_data=own_data,
                 )
 
@@ -575,6 +721,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=self._store,
                 config=self._config,
                 max_persist=self._max_persist,
+                max_persist_bytes=self._max_persist_bytes,
+                prefetch=self._prefetch,
                 own_index=True,
                 own_data=False,
                 )
@@ -742,18 +890,21 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         '''
         max_persist = self._max_persist
         max_persist_active = max_persist is not None
+        max_persist_bytes = self._max_persist_bytes
+        max_persist_bytes_active = max_persist_bytes is not None
+        lru_active = max_persist_active or max_persist_bytes_active
 
         target_loaded = self._loaded[key]
         target_loaded_count = target_loaded.sum()
         load = False if self._loaded_all else not target_loaded.all()
-        if not load and not max_persist_active:
+        if not load and not lru_active:
             return
 
         index = self._index
         label: TLabel
         key_is_element = isinstance(key, INT_TYPES)
 
-        if not load and max_persist_active: # must update LRU position
+        if not load: # lru_active, must update LRU position
             labels = (index.iloc[key],) if key_is_element else index.iloc[key].values
             for label in labels: # update LRU position
                 self._last_accessed[label] = self._last_accessed.pop(label, None)
@@ -786,8 +937,16 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
 
         # NOTE: prepare iterable of pairs of label, Frame / FrameDeferred; ensure that for every FrameDeferred, the appropriate Frame is loaded and yielded from the store_reader in order. We must ensure within the target of requested Frame we do not delete any previously-loaded Frame. If max_persist is less than the target, reduce the target to max_persist.
 
+        if self._prefetcher is not None:
+            read_many = self._prefetcher.read_many
+        else:
+            read_many = partial(self._store.read_many, config=self._config)
+
         if key_is_element:
-            store_reader = iter((self._store.read(target_labels, config=self._config[target_labels]),)) # type: ignore
+            if self._prefetcher is not None:
+                store_reader = self._prefetcher.read_many((target_labels,)) # type: ignore
+            else:
+                store_reader = iter((self._store.read(target_labels, config=self._config[target_labels]),)) # type: ignore
             targets_items = ((target_labels, target_values),) # type: ignore
         # more than one Frame
         elif (not max_persist_active
@@ -800,7 +959,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             else: # no targets are loaded
                 labels_to_read = target_labels
 
-            store_reader = self._store.read_many(labels_to_read, config=self._config)
+            store_reader = read_many(labels_to_read)
             targets_items = zip(target_labels, target_values)
         # max_persist_active, must delete some Frame
         else:
@@ -830,14 +989,20 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                     # no targets are loaded, will only load a subset of targets of size equal to max_persist; can unpersist everything else
                     labels_to_read = target_labels
 
+                    labels_release = self._index[self._loaded]
                     array[self._loaded] = FrameDeferred
                     self._loaded[NULL_SLICE] = False
+                    self._store.release(labels_release)
                     self._last_accessed.clear()
+                    if max_persist_bytes_active:
+                        self._loaded_nbytes = 0
 
-            store_reader = self._store.read_many(labels_to_read, config=self._config)
+            store_reader = read_many(labels_to_read)
             targets_items = zip(target_labels, target_values)
 
         # Iterate over items that have been selected; there must be at least 1 FrameDeferred among this selection. Note that we iterate over all Frame in the target, not just those form the store, as we need to update LRU positions for all values in the target
+        labels_retain: tp.Optional[tp.Set[TLabel]] = None
+
         for label, frame in targets_items: # pyright: ignore
             idx = index._loc_to_iloc(label)
 
@@ -847,22 +1012,51 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 self._loaded[idx] = True # update loaded status
                 if max_persist_active:
                     loaded_count += 1
+                if max_persist_bytes_active:
+                    self._last_accessed[label] = frame.nbytes
+                    self._loaded_nbytes += frame.nbytes
 
-            if max_persist_active: # update LRU position
+            if lru_active: # update LRU position
                 self._last_accessed[label] = self._last_accessed.pop(label, None)
 
-                if loaded_count > max_persist: # pyright: ignore
-                    label_remove = next(iter(self._last_accessed))
-                    del self._last_accessed[label_remove]
-                    idx_remove = index._loc_to_iloc(label_remove)
-                    self._loaded[idx_remove] = False
-                    array[idx_remove] = FrameDeferred
-                    loaded_count -= 1
+            if max_persist is not None and loaded_count > max_persist:
+                label_remove = next(iter(self._last_accessed))
+                self._remove_persisted(label_remove)
+                loaded_count -= 1
+
+            if max_persist_bytes is not None and self._loaded_nbytes > max_persist_bytes:
+                # remove least-recently used Frames, but never those in the target
+                if labels_retain is None:
+                    labels_retain = ({target_labels} if key_is_element # type: ignore
+                            else set(target_labels))
+                labels_remove = []
+                nbytes = self._loaded_nbytes
+                for label_remove, nbytes_remove in self._last_accessed.items():
+                    if nbytes <= max_persist_bytes:
+                        break
+                    if label_remove not in labels_retain:
+                        labels_remove.append(label_remove)
+                        nbytes -= nbytes_remove # type: ignore
+                for label_remove in labels_remove:
+                    self._remove_persisted(label_remove)
+                if max_persist_active:
+                    loaded_count -= len(labels_remove)
 
 
 
         self._loaded_all = self._loaded.all()
 
+    def _remove_persisted(self, label: TLabel) -> None:
+        '''Replace the loaded :obj:`Frame` at `label` with :obj:`FrameDeferred`, removing it from the LRU.
+        '''
+        nbytes = self._last_accessed.pop(label)
+        if self._max_persist_bytes is not None:
+            self._loaded_nbytes -= nbytes # type: ignore
+        idx = self._index._loc_to_iloc(label)
+        self._loaded[idx] = False
+        self._values_mutable[idx] = FrameDeferred
+        self._store.release((label,)) # type: ignore
+
     def unpersist(self) -> None:
         '''Replace all loaded :obj:`Frame` with :obj:`FrameDeferred`.
         '''
@@ -870,12 +1064,16 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             # no-op so Yarn or Quilt can call regardless of Store
             return
 
+        labels_release = self._index[self._loaded]
         self._values_mutable[self._loaded] = FrameDeferred
         self._loaded[NULL_SLICE] = False
         self._loaded_all = False
+        self._store.release(labels_release)
 
-        if self._max_persist is not None:
+        if self._max_persist is not None or self._max_persist_bytes is not None:
             self._last_accessed.clear()
+        if self._max_persist_bytes is not None:
+            self._loaded_nbytes = 0
 
     #---------------------------------------------------------------------------
     # extraction
@@ -900,6 +1098,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=self._store,
                 config=self._config,
                 max_persist=self._max_persist,
+                max_persist_bytes=self._max_persist_bytes,
+                prefetch=self._prefetch,
                 own_index=True,
                 own_data=False, # force immutable copy
                 )
@@ -936,15 +1136,63 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         '''
         yield from self.items()
 
+    def _iter_element_prefetch(self) -> tp.Iterator[tp.Tuple[int, TFrameAny]]:
+        '''Generator of pairs of position and :obj:`Frame`, reading ahead up to ``prefetch`` deferred :obj:`Frame` on a background thread while the current :obj:`Frame` is processed. Frames are loaded in groups of ``max_persist`` (if greater than 1) or individually, such that ``max_persist`` and ``max_persist_bytes`` are observed. Read-ahead :obj:`Frame` are counted against ``max_persist``: ``prefetch`` is limited to one less than ``max_persist``, groups are reduced by ``prefetch``, and loaded :obj:`Frame` outside of the current group and the read ahead are released before reading ahead.
+        '''
+        size = self.__len__()
+        max_persist = self._max_persist
+        prefetch = self._prefetch
+        if max_persist is not None:
+            prefetch = min(prefetch, max_persist - 1)
+            step = max_persist - prefetch
+        else:
+            step = 1
+        labels: tp.Union[TNDArrayAny, tp.List[TLabel]] = (self._index.values
+                if self._index._NDIM == 1 else list(self._index))
+
+        self._prefetcher = prefetcher = BusPrefetcher(self._store, self._config) # type: ignore
+        try:
+            i = 0
+            while i < size:
+                stop = min(i + step, size)
+                for j in range(i, stop):
+                    if not self._loaded[j]:
+                        prefetcher.submit(labels[j])
+                self._update_values_mutable_iloc(key=i if step == 1 else slice(i, stop))
+
+                stop_ahead = min(stop + prefetch, size)
+                read_ahead = [j for j in range(stop, stop_ahead) if not self._loaded[j]]
+                if max_persist is not None and read_ahead:
+                    excess = self._loaded.sum() + len(read_ahead) - max_persist
+                    if excess > 0:
+                        labels_retain = {labels[j] for j in range(i, stop_ahead)}
+                        labels_remove = [label for label in self._last_accessed
+                                if label not in labels_retain][:excess]
+                        for label in labels_remove:
+                            self._remove_persisted(label)
+                        self._loaded_all = False
+                for j in read_ahead:
+                    prefetcher.submit(labels[j])
+
+                for j in range(i, stop):
+                    yield j, self._values_mutable[j]
+                i = stop
+        finally:
+            self._prefetcher = None
+            prefetcher.close()
+
     def _axis_element(self,
             ) -> tp.Iterator[tp.Any]:
         if self._loaded_all:
             yield from self._values_mutable
-        elif self._max_persist is None: # load all at once if possible
+        elif self._prefetch and self._prefetcher is None:
+            for _, frame in self._iter_element_prefetch():
+                yield frame
+        elif self._max_persist is None and self._max_persist_bytes is None: # load all at once if possible
             if not self._loaded_all:
                 self._update_values_mutable_iloc(key=NULL_SLICE)
             yield from self._values_mutable
-        elif self._max_persist > 1:
+        elif self._max_persist is not None and self._max_persist > 1:
             i = 0
             i_max = len(self._index.values)
             while i < i_max:
@@ -954,7 +1202,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 for j in range(key.start, key.stop):
                     yield self._values_mutable[j]
                 i += self._max_persist
-        else: # max_persist is 1
+        else: # max_persist is 1, or only max_persist_bytes is defined
             for i in range(self.__len__()):
                 self._update_values_mutable_iloc(key=i)
                 yield self._values_mutable[i]
@@ -967,11 +1215,13 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         '''
         if self._loaded_all:
             yield from zip(self._index, self._values_mutable)
-        elif self._max_persist is None: # load all at once if possible
+        elif self._prefetch and self._prefetcher is None:
+            yield from zip(self._index, (f for _, f in self._iter_element_prefetch()))
+        elif self._max_persist is None and self._max_persist_bytes is None: # load all at once if possible
             if not self._loaded_all:
                 self._update_values_mutable_iloc(key=NULL_SLICE)
             yield from zip(self._index, self._values_mutable)
-        elif self._max_persist > 1:
+        elif self._max_persist is not None and self._max_persist > 1:
             # if _max_persist is greater than 1, load as many Frame as possible (up to the max persist) at a time; this optimizes read operations from the Store
             labels = self._index.values
             i = 0
@@ -982,7 +1232,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 self._update_values_mutable_iloc(key=key)
                 yield from zip(labels_select, self._values_mutable[key])
                 i += self._max_persist
-        else: # max_persist is 1
+        else: # max_persist is 1, or only max_persist_bytes is defined
             for i, label in enumerate(self._index.values):
                 self._update_values_mutable_iloc(key=i)
                 yield label, self._values_mutable[i]
@@ -1000,7 +1250,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             post.flags.writeable = False
             return post
 
-        if self._max_persist is None: # load all at once if possible
+        if self._max_persist is None and self._max_persist_bytes is None: # load all at once if possible
             # b._loaded_all must be False
             self._update_values_mutable_iloc(key=NULL_SLICE)
             post = self._values_mutable.copy()
@@ -1010,7 +1260,10 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         # return a new array; force new iteration to account for max_persist
         post = np.empty(self.__len__(), dtype=object)
 
-        if self._max_persist > 1:
+        if self._prefetch and self._prefetcher is None:
+            for i, frame in self._iter_element_prefetch():
+                post[i] = frame
+        elif self._max_persist is not None and self._max_persist > 1:
             i = 0
             i_max = len(self._index.values)
             while i < i_max:
@@ -1019,7 +1272,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 self._update_values_mutable_iloc(key=key)
                 post[key] = self._values_mutable[key]
                 i += self._max_persist
-        else: # max_persist is 1
+        else: # max_persist is 1, or only max_persist_bytes is defined
             for i in range(self.__len__()):
                 self._update_values_mutable_iloc(key=i)
                 post[i] = self._values_mutable[i]
@@ -1100,6 +1353,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
     def nbytes(self) -> int:
         '''Total bytes of data currently loaded in the Bus.
         '''
+        if self._max_persist_bytes is not None:
+            return self._loaded_nbytes
         return sum(f.nbytes if f is not FrameDeferred else 0 for f in self._values_mutable)
 
     @property
@@ -1423,28 +1678,37 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 name=self._name,
                 )
 
+    def _iter_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> tp.Iterator[TBytesLike]:
+
+        yield from iter_component_signature_bytes(self,
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._index._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        # NOTE: as Frame are loaded one at a time, retention is bound by max_persist
+        for f in self._axis_element():
+            yield from f._iter_signature_bytes(
+                    include_name=include_name,
+                    include_class=include_class,
+                    encoding=encoding)
+
     def _to_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
             encoding: str = 'utf-8',
             ) -> bytes:
 
-        v = (f._to_signature_bytes(
+        return b''.join(self._iter_signature_bytes(
                 include_name=include_name,
                 include_class=include_class,
-                encoding=encoding,
-                ) for f in self._axis_element())
-
-        return b''.join(chain(
-                iter_component_signature_bytes(self,
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                (self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),),
-                v))
+                encoding=encoding))
 
 
 TBusAny = Bus[tp.Any]
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import os
+import threading
+from functools import wraps
+from types import CodeType
+
+import numpy as np
+import typing_extensions as tp
+
+from static_frame.core.archive_npy import NPZFrameConverter
+from static_frame.core.container import ContainerBase
+from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
+from static_frame.core.frame import FrameHE
+from static_frame.core.index_base import IndexBase
+from static_frame.core.series import Series
+from static_frame.core.util import TBytesLike
+from static_frame.core.util import TCallableAny
+from static_frame.core.util import TPathSpecifier
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=W0611 #pragma: no cover
+
+TVCallable = tp.TypeVar('TVCallable', bound=TCallableAny)
+
+# element types that have a stable repr that can be used in a key
+CACHE_KEY_ELEMENT_TYPES = (
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        np.generic,
+        datetime.date,
+        datetime.timedelta,
+        )
+
+# Frame classes that can be cached; the class name is stored in the file name
+CACHE_FRAME_CLASSES: tp.Tuple[tp.Type[TFrameAny], ...] = (Frame, FrameGO, FrameHE)
+
+CACHE_EXT = '.npz'
+
+
+def _container_has_object(value: ContainerBase) -> bool:
+    '''Return True if `value` has object-dtype values or labels, or if the values or labels of `value` cannot be determined.
+    '''
+    if isinstance(value, IndexBase):
+        if value.depth == 1:
+            return value.dtype.kind == 'O' # type: ignore
+        return any(dt.kind == 'O' for dt in value.dtypes.values) # type: ignore
+    if isinstance(value, Series):
+        return value.dtype.kind == 'O' or _container_has_object(value.index)
+    if isinstance(value, Frame):
+        return (any(dt.kind == 'O' for dt in value._blocks.dtypes)
+                or _container_has_object(value.index)
+                or _container_has_object(value.columns))
+    return True
+
+
+def iter_cache_key_bytes(value: tp.Any, encoding: str = 'utf-8') -> tp.Iterator[TBytesLike]:
+    '''Yield byte components that identify `value` for usage in a cache key. Containers are identified by their `via_hashlib` signature bytes, and must not have object values or labels; arrays by dtype, shape, and buffer; other values must be elements (or collections of elements) with a stable repr.
+    '''
+    if isinstance(value, ContainerBase):
+        # the signature bytes of object values and labels include memory addresses, which are neither stable across processes nor unique over time
+        if _container_has_object(value):
+            raise TypeError(f'A cache key cannot be derived from a {value.__class__.__name__} with object values or labels.')
+        # as names need not be strings, include them as key elements rather than in the signature
+        names = [value.name]
+        for attr in ('index', 'columns'):
+            component = getattr(value, attr, None)
+            if isinstance(component, IndexBase):
+                names.append(component.name)
+        yield from iter_cache_key_bytes(names, encoding=encoding)
+        yield from value._iter_signature_bytes(
+                include_name=False,
+                include_class=True,
+                encoding=encoding,
+                )
+    elif isinstance(value, np.ndarray):
+        if value.dtype.kind == 'O':
+            raise TypeError('Object arrays cannot be used to derive a cache key.')
+        yield bytes(f'{value.dtype.str}{value.shape}', encoding=encoding)
+        yield np.ascontiguousarray(value).tobytes()
+    elif isinstance(value, CACHE_KEY_ELEMENT_TYPES):
+        yield bytes(f'{value.__class__.__name__}:{value!r}', encoding=encoding)
+    elif isinstance(value, (tuple, list)):
+        yield bytes(f'{value.__class__.__name__}:{len(value)}', encoding=encoding)
+        for v in value:
+            yield from iter_cache_key_bytes(v, encoding=encoding)
+    elif isinstance(value, dict):
+        yield bytes(f'dict:{len(value)}', encoding=encoding)
+        for k, v in value.items():
+            yield from iter_cache_key_bytes(k, encoding=encoding)
+            yield from iter_cache_key_bytes(v, encoding=encoding)
+    else:
+        raise TypeError(f'A cache key cannot be derived from {value.__class__}.')
+
+
+def _iter_code_bytes(code: CodeType, encoding: str) -> tp.Iterator[bytes]:
+    yield code.co_code
+    # names of attributes, globals, locals, and closure variables are referenced by position from the bytecode
+    for names in (code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars):
+        yield bytes(repr(names), encoding=encoding)
+    for c in code.co_consts:
+        # nested functions are constants with a repr that includes a memory address
+        if isinstance(c, CodeType):
+            yield from _iter_code_bytes(c, encoding)
+        else:
+            yield bytes(repr(c), encoding=encoding)
+
+def iter_cache_func_bytes(func: TCallableAny, encoding: str = 'utf-8') -> tp.Iterator[bytes]:
+    '''Yield byte components that identify a function by its qualified name and, where available, its compiled code and the names it references, such that changing the implementation of a function invalidates its cached results. Values referenced by the function as globals or from closures are not included.
+    '''
+    module = getattr(func, '__module__', None)
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None)
+    if name is None:
+        raise TypeError(f'A cache key cannot be derived from {func!r}.')
+    yield bytes(f'{module}.{name}', encoding=encoding)
+
+    code = getattr(func, '__code__', None)
+    if code is not None:
+        yield from _iter_code_bytes(code, encoding)
+
+
+class Cache:
+    '''A content-addressed, on-disk cache of :obj:`Frame` results of functions. Results are keyed by the identity of the function and the `via_hashlib` signature of the arguments, and are stored in `directory` as NPZ. When `max_bytes` is given, the least-recently used results are removed until the total size of stored results is no larger than `max_bytes`.
+
+    A :obj:`Cache` instance can be used as a decorator. As values referenced by a function as globals or from closures are not part of the key, cached functions should depend only on their arguments.
+    '''
+
+    __slots__ = (
+            '_directory',
+            '_max_bytes',
+            )
+
+    def __init__(self,
+            directory: TPathSpecifier,
+            *,
+            max_bytes: tp.Optional[int] = None,
+            ) -> None:
+        '''
+        Args:
+            directory: A directory in which to store results; it will be created if it does not exist.
+            max_bytes: The maximum total size, in bytes, of stored results; if None, results are never removed.
+        '''
+        if max_bytes is not None and max_bytes < 0:
+            raise RuntimeError('max_bytes must be greater than or equal to 0.')
+
+        self._directory = os.fspath(directory)
+        self._max_bytes = max_bytes
+        os.makedirs(self._directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: {self._directory}>'
+
+    #---------------------------------------------------------------------------
+
+    def _fp(self, key: str, cls: tp.Type[TFrameAny]) -> str:
+        return os.path.join(self._directory, f'{key}.{cls.__name__}{CACHE_EXT}')
+
+    def _iter_entries(self) -> tp.Iterator[os.DirEntry[str]]:
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(CACHE_EXT) and entry.is_file():
+                    yield entry
+
+    def _evict(self, retain: str) -> None:
+        '''Remove the least-recently used results until the total size is no larger than `max_bytes`. The result at `retain` is never removed.
+        '''
+        if self._max_bytes is None:
+            return
+
+        stats = []
+        total = 0
+        for entry in self._iter_entries():
+            st = entry.stat()
+            total += st.st_size
+            stats.append((st.st_mtime_ns, st.st_size, entry.path))
+
+        if total <= self._max_bytes:
+            return
+
+        stats.sort()
+        for _, size, fp in stats:
+            if total <= self._max_bytes:
+                break
+            if fp == retain:
+                continue
+            try:
+                os.remove(fp)
+            except FileNotFoundError: # removed by another process
+                pass
+            total -= size
+
+    #---------------------------------------------------------------------------
+
+    def key(self,
+            func: TCallableAny,
+            *args: tp.Any,
+            **kwargs: tp.Any,
+            ) -> str:
+        '''Return the hexadecimal key of the result of calling `func` with `args` and `kwargs`.
+        '''
+        h = hashlib.sha256()
+        for b in iter_cache_func_bytes(func):
+            h.update(b)
+        for b in iter_cache_key_bytes(args):
+            h.update(b)
+        for b in iter_cache_key_bytes(dict(sorted(kwargs.items()))):
+            h.update(b)
+        return h.hexdigest()
+
+    def get(self, key: str) -> tp.Optional[TFrameAny]:
+        '''Return the result stored at `key`, or None if no result is stored. Retrieving a result marks it as most-recently used.
+        '''
+        for cls in CACHE_FRAME_CLASSES:
+            fp = self._fp(key, cls)
+            try:
+                f = NPZFrameConverter.from_archive(constructor=cls, fp=fp)
+            except FileNotFoundError:
+                continue
+            try:
+                os.utime(fp) # mark as most-recently used
+            except FileNotFoundError: # removed by another process
+                pass
+            return f
+        return None
+
+    def put(self, key: str, frame: TFrameAny) -> None:
+        '''Store `frame` at `key`, then remove least-recently used results if `max_bytes` is exceeded.
+        '''
+        if frame.__class__ not in CACHE_FRAME_CLASSES:
+            raise TypeError(f'Only {", ".join(c.__name__ for c in CACHE_FRAME_CLASSES)} results can be cached, not {frame.__class__.__name__}.')
+
+        fp = self._fp(key, frame.__class__)
+        # write to a temporary file and replace to avoid exposing partial writes to concurrent readers
+        fp_temp = f'{fp}.{os.getpid()}.{threading.get_ident()}.tmp'
+        NPZFrameConverter.to_archive(frame=frame, fp=fp_temp)
+        os.replace(fp_temp, fp)
+        self._evict(retain=fp)
+
+    def call(self,
+            func: tp.Callable[..., TFrameAny],
+            *args: tp.Any,
+            **kwargs: tp.Any,
+            ) -> TFrameAny:
+        '''Return the result of calling `func` with `args` and `kwargs`, loading the result from the cache if present, and storing it otherwise.
+        '''
+        key = self.key(func, *args, **kwargs)
+        f = self.get(key)
+        if f is None:
+            f = func(*args, **kwargs)
+            self.put(key, f)
+        return f
+
+    def __call__(self, func: TVCallable) -> TVCallable:
+        '''Decorate `func` such that results are loaded from, or stored in, this cache.
+        '''
+        @wraps(func)
+        def wrapper(*args: tp.Any, **kwargs: tp.Any) -> TFrameAny:
+            return self.call(func, *args, **kwargs)
+
+        return tp.cast(TVCallable, wrapper)
+
+    #---------------------------------------------------------------------------
+
+    @property
+    def nbytes(self) -> int:
+        '''Return the total size, in bytes, of stored results.
+        '''
+        return sum(entry.stat().st_size for entry in self._iter_entries())
+
+    def __len__(self) -> int:
+        '''Return the number of stored results.
+        '''
+        return sum(1 for _ in self._iter_entries())
+
+    def clear(self) -> None:
+        '''Remove all stored results.
+        '''
+        for entry in list(self._iter_entries()):
+            os.remove(entry.path)
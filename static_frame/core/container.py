@@ -23,6 +23,7 @@ from static_frame.core.util import DTYPES_INEXACT
 from static_frame.core.util import INT64_MAX
 from static_frame.core.util import OPERATORS
 from static_frame.core.util import UFUNC_TO_REVERSE_OPERATOR
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TDtypeSpecifier
 from static_frame.core.util import TName
 from static_frame.core.util import TUFunc
@@ -192,13 +193,26 @@ class ContainerBase(metaclass=InterfaceMeta):
             ) -> bytes:
         raise NotImplementedError() #pragma: no cover
 
+    def _iter_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> tp.Iterator[TBytesLike]:
+        '''Yield the components of the signature bytes, such that they can be incrementally passed to a hash function; concatenated, the components are equal to the result of `_to_signature_bytes()`.
+        '''
+        yield self._to_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding,
+                )
+
     @property
     def via_hashlib(self) -> InterfaceHashlib:
         '''
         Interface for deriving cryptographic hashes from this container.
         '''
         return InterfaceHashlib(
-                to_bytes=self._to_signature_bytes,
+                iter_bytes=self._iter_signature_bytes,
                 include_name=True,
                 include_class=True,
                 encoding='utf-8',
@@ -27,7 +27,9 @@ from static_frame.core.rank import rank_1d
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_OBJECT_KIND
 from static_frame.core.util import DTYPE_STR
 from static_frame.core.util import DTYPE_STR_KINDS
 from static_frame.core.util import INT_TYPES
@@ -37,6 +39,7 @@ from static_frame.core.util import FrozenGenerator
 from static_frame.core.util import ManyToOneType
 from static_frame.core.util import TBlocKey
 from static_frame.core.util import TBoolOrBools
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TDepthLevel
 from static_frame.core.util import TDtypeSpecifier
@@ -925,6 +928,64 @@ def axis_window_items( *,
         if count > count_window_max or idx_left > idx_left_max or size < 0:
             break
 
+def axis_window_bounds(*,
+        count_labels: int,
+        size: int,
+        step: int = 1,
+        window_sized: bool = True,
+        label_shift: int = 0,
+        label_missing_skips: bool = True,
+        label_missing_raises: bool = False,
+        start_shift: int = 0,
+        size_increment: int = 0,
+        ) -> tp.Tuple[TNDArrayIntDefault, TNDArrayIntDefault, TNDArrayIntDefault]:
+    '''Return, for each valid window that would be produced by ``axis_window_items``, the start and stop positions of the window and the position of its label, where -1 marks a missing label. All windows are determined without iteration.
+    '''
+    if size <= 0:
+        raise RuntimeError('window size must be greater than 0')
+    if step < 0:
+        raise RuntimeError('window step cannot be less than than 0')
+
+    if start_shift >= 0:
+        count_window_max = count_labels
+    else: # add for iterations when less than 0
+        count_window_max = count_labels + abs(start_shift)
+    idx_left_max = count_window_max - 1
+
+    iterations = np.arange(count_window_max + 1, dtype=DTYPE_INT_DEFAULT)
+    idx_left = start_shift + iterations * step
+    sizes = size + iterations * size_increment
+
+    # an iteration is followed by another only if no break condition is met; the final iteration always breaks
+    proceed = ((iterations < count_window_max)
+            & (idx_left + step <= idx_left_max)
+            & (sizes + size_increment >= 0)
+            )
+    count = int(np.argmin(proceed)) + 1
+    idx_left = idx_left[:count]
+    sizes = sizes[:count]
+
+    idx_right = idx_left + sizes - 1
+    starts = np.maximum(idx_left, 0)
+    stops = np.minimum(np.maximum(idx_right, -1) + 1, count_labels)
+    lengths = stops - starts
+
+    valid = lengths > 0
+    if window_sized:
+        valid &= lengths == sizes
+
+    idx_label = idx_right + label_shift
+    missing = valid & ((idx_label < 0) | (idx_label >= count_labels))
+    if missing.any():
+        if label_missing_raises:
+            raise InvalidWindowLabel(int(idx_label[missing][0]))
+        if label_missing_skips:
+            valid &= ~missing
+        else:
+            idx_label[missing] = -1
+
+    return starts[valid], stops[valid], idx_label[valid]
+
 def get_block_match(
         width: int,
         values_source: tp.List[TNDArrayAny],
@@ -1851,6 +1912,17 @@ def iter_component_signature_bytes(
     if include_class:
         yield bytes(container.__class__.__name__, encoding=encoding)
 
+def iter_array_signature_bytes(array: TNDArrayAny) -> tp.Iterator[TBytesLike]:
+    '''Yield byte components that, concatenated, are equal to `array.tobytes('F')`. Contiguous arrays are yielded as views of their buffer; other 2D arrays are copied one column at a time.
+    '''
+    if array.dtype.kind != DTYPE_OBJECT_KIND and array.flags.f_contiguous:
+        yield array.ravel(order='F').view(np.uint8).data
+    elif array.ndim == 1:
+        yield array.tobytes()
+    else:
+        for i in range(array.shape[1]):
+            yield array[NULL_SLICE, i].tobytes()
+
 
 
 
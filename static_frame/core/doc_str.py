@@ -39,6 +39,10 @@ INDEX_CONSTRUCTOR = 'index_constructor: Optional class or constructor function t
 
 MAX_PERSIST = 'max_persist: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum number of :obj:`Frame` to remain in the :obj:`Bus`, regardless of the size of the :obj:`Bus`. If more than ``max_persist`` number of :obj:`Frame` are loaded, least-recently loaded :obj:`Frame` will be replaced by ``FrameDeferred``. A ``max_persist`` of 1, for example, permits reading one :obj:`Frame` at a time without ever holding in memory more than 1 :obj:`Frame`.'
 
+MAX_PERSIST_BYTES = 'max_persist_bytes: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum total ``nbytes`` of :obj:`Frame` to remain in the :obj:`Bus`. If loading a :obj:`Frame` exceeds ``max_persist_bytes``, least-recently used :obj:`Frame` will be replaced by ``FrameDeferred`` until the total is within ``max_persist_bytes``; :obj:`Frame` in the current selection are never replaced, even if they alone exceed ``max_persist_bytes``. Can be combined with ``max_persist``.'
+
+PREFETCH = 'prefetch: When iterating over :obj:`Frame` loaded from a :obj:`Store`, optionally define the number of subsequent :obj:`Frame` to read ahead on a background thread, overlapping reading with processing. Read-ahead :obj:`Frame` are counted against ``max_persist``, such that at most ``max_persist - 1`` :obj:`Frame` are read ahead; ``max_persist`` must be at least 2 if ``prefetch`` is greater than 0.'
+
 MAX_WORKERS = 'max_workers: Number of parallel executors, as passed to the Thread- or ProcessPoolExecutor; ``None`` defaults to the max number of machine processes.'
 
 NAME = 'name: A hashable object to label the container.'
@@ -49,6 +53,8 @@ OWN_DATA = '''own_data: Flag the data values as ownable by this :obj:`static_fra
 
 OWN_INDEX = '''own_index: Flag the passed index as ownable by this :obj:`static_frame.{class_name}`. Primarily used by internal clients.'''
 
+SHARED_MEMORY = 'shared_memory: If ``True``, and not using threads, :obj:`Frame` results are returned from worker processes with block arrays in shared memory, rather than pickled.'
+
 RETAIN_LABELS = 'retain_labels: Boolean to determine if, along the axis of virtual concatentation, if component :obj:`Frame` labels should be used to form the outer depth of an :obj:`IndexHierarchy`. This is required to be ``True`` if component :obj:`Frame` labels are not globally unique along the axis of concatenation.'
 
 STORE = 'store: A :obj:`Store` subclass.'
@@ -148,6 +154,7 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {SHARED_MEMORY}
             '''
             )
 
@@ -159,6 +166,7 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {SHARED_MEMORY}
             '''
             )
 
@@ -168,6 +176,8 @@ class DOC_TEMPLATE:
             {FP}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PREFETCH}
             '''
             )
 
@@ -177,6 +187,8 @@ class DOC_TEMPLATE:
             {STORE}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PREFETCH}
             '''
             )
 
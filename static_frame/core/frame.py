@@ -12,9 +12,11 @@ from functools import partial
 from io import BytesIO
 from io import StringIO
 from itertools import chain
+from itertools import count
+from itertools import islice
 from itertools import product
 from itertools import zip_longest
-from operator import itemgetter
+from math import ceil
 
 import numpy as np
 import typing_extensions as tp
@@ -49,6 +51,7 @@ from static_frame.core.container_util import index_from_optional_constructors
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_to_one
 from static_frame.core.container_util import is_fill_value_factory_initializer
+from static_frame.core.container_util import iter_array_signature_bytes
 from static_frame.core.container_util import iter_component_signature_bytes
 from static_frame.core.container_util import key_to_ascending_key
 from static_frame.core.container_util import matmul
@@ -88,6 +91,7 @@ from static_frame.core.metadata import JSONMeta
 from static_frame.core.node_dt import InterfaceDatetime
 from static_frame.core.node_fill_value import InterfaceFillValue
 from static_frame.core.node_fill_value import InterfaceFillValueGO
+from static_frame.core.node_group import InterfaceGroupBy
 from static_frame.core.node_iter import IterNodeApplyType
 from static_frame.core.node_iter import IterNodeAxis
 from static_frame.core.node_iter import IterNodeAxisElement
@@ -137,6 +141,7 @@ from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_NA_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import DTYPE_STR_KINDS
 from static_frame.core.util import DTYPE_TIMEDELTA_KIND
 from static_frame.core.util import EMPTY_ARRAY
 from static_frame.core.util import FILL_VALUE_DEFAULT
@@ -145,12 +150,14 @@ from static_frame.core.util import INT_TYPES
 from static_frame.core.util import KEY_MULTIPLE_TYPES
 from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import SQL_FETCH_ROWS
 from static_frame.core.util import STORE_LABEL_DEFAULT
 from static_frame.core.util import Join
 from static_frame.core.util import JSONFilter
 from static_frame.core.util import ManyToOneType
 from static_frame.core.util import TBlocKey
 from static_frame.core.util import TBoolOrBools
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TCallableOrCallableMap
 from static_frame.core.util import TDepthLevel
@@ -192,12 +199,14 @@ from static_frame.core.util import dtype_kind_to_na
 from static_frame.core.util import dtype_to_fill_value
 from static_frame.core.util import file_like_manager
 from static_frame.core.util import full_for_fill
+from static_frame.core.util import get_concurrent_executor
 from static_frame.core.util import get_tuple_constructor
 from static_frame.core.util import iloc_to_insertion_iloc
 from static_frame.core.util import is_callable_or_mapping
 from static_frame.core.util import is_dtype_specifier
 from static_frame.core.util import isfalsy_array
 from static_frame.core.util import isna_array
+from static_frame.core.util import iter_delimited_chunks
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_nd
 from static_frame.core.util import key_normalize
@@ -1772,6 +1781,135 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
     #---------------------------------------------------------------------------
     # file, data format loaders
 
+    @classmethod
+    def _from_sql_header(cls,
+            cursor: sqlite3.Cursor,
+            *,
+            index_depth: int,
+            index_constructors: TIndexCtorSpecifiers,
+            columns_depth: int,
+            columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None,
+            columns_constructors: TIndexCtorSpecifiers,
+            dtypes: TDtypesSpecifier,
+            ) -> tp.Tuple[
+                    tp.Optional[IndexBase],
+                    bool,
+                    tp.Optional[tp.Sequence[int]],
+                    TIndexCtorSpecifier,
+                    ]:
+        '''
+        Given a cursor with an executed query, return the columns, if columns are owned, the positions of selected value fields (or None if all are selected), and the index constructor, if index_depth is greater than 0.
+        '''
+        columns: tp.Optional[IndexBase] = None
+        own_columns = False
+        iloc_sel: tp.Optional[tp.Sequence[int]] = None
+
+        if columns_select:
+            columns_select = set(columns_select)
+
+        if columns_depth > 0 or columns_select:
+            # always need to derive labels if using columns_select
+            labels = (col for (col, *_) in cursor.description[index_depth:])
+
+        if columns_depth <= 1 and columns_select:
+            iloc_sel, labels = zip(*(
+                    pair for pair in enumerate(labels) if pair[1] in columns_select
+                    ))
+
+        if columns_depth == 1:
+            columns, own_columns = index_from_optional_constructors(
+                    labels,
+                    depth=columns_depth,
+                    default_constructor=cls._COLUMNS_CONSTRUCTOR,
+                    explicit_constructors=columns_constructors, # cannot supply name
+                    )
+        elif columns_depth > 1:
+            # NOTE: we only support loading in IH if encoded in each header with a space delimiter
+            columns_constructor: TIndexHierarchyCtor = partial(
+                    cls._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels_delimited,
+                    delimiter=' ',
+                    )
+            columns, own_columns = index_from_optional_constructors(
+                    labels,
+                    depth=columns_depth,
+                    default_constructor=columns_constructor,
+                    explicit_constructors=columns_constructors,
+                    )
+
+            if columns_select:
+                iloc_sel = columns._loc_to_iloc(columns.isin(columns_select)) # type: ignore
+                columns = columns.iloc[iloc_sel] # type: ignore
+
+        # map dtypes in context of pre-index extraction
+        if index_depth > 0:
+            get_col_dtype = None if dtypes is None else get_col_dtype_factory(
+                    dtypes,
+                    [col for (col, *_) in cursor.description],
+                    )
+
+        index_constructor: TIndexCtorSpecifier
+        if index_depth == 0:
+            index_constructor = None
+        elif index_depth == 1:
+            default_constructor: tp.Type[Index] = partial(Index, dtype=get_col_dtype(0)) if get_col_dtype else Index # type: ignore
+            # parital to include everything but values
+            index_constructor = constructor_from_optional_constructors( # type: ignore
+                    depth=index_depth,
+                    default_constructor=default_constructor,
+                    explicit_constructors=index_constructors,
+                    )
+        else: # > 1
+            def default_constructor(
+                    iterables: tp.Iterable[tp.Iterable[TLabel]],
+                    index_constructors: TIndexCtorSpecifiers,
+                    ) -> IndexHierarchy: #pylint: disable=function-redefined
+                if get_col_dtype:
+                    blocks = [iterable_to_array_1d(it, get_col_dtype(i))[0]
+                            for i, it in enumerate(iterables)]
+                else:
+                    blocks = [iterable_to_array_1d(it)[0] for it in iterables]
+                return IndexHierarchy._from_type_blocks(
+                        TypeBlocks.from_blocks(blocks),
+                        index_constructors=index_constructors,
+                        own_blocks=True,
+                        )
+            # parital to include everything but values
+            index_constructor = constructor_from_optional_constructors( # type: ignore
+                    depth=index_depth,
+                    default_constructor=default_constructor,
+                    explicit_constructors=index_constructors,
+                    )
+
+        return columns, own_columns, iloc_sel, index_constructor
+
+    @staticmethod
+    def _sql_rows_to_arrays(
+            rows: tp.Sequence[tp.Sequence[tp.Any]],
+            *,
+            index_depth: int,
+            iloc_sel: tp.Optional[tp.Sequence[int]],
+            get_col_dtype: tp.Optional[tp.Callable[[int], TDtypeSpecifier]],
+            ) -> tp.Tuple[tp.Sequence[tp.Sequence[TLabel]], tp.List[TNDArrayAny]]:
+        '''
+        Transpose a batch of rows into index labels per depth and an array per selected value field.
+        '''
+        fields = list(zip(*rows))
+        values = fields[index_depth:]
+        if iloc_sel is not None:
+            values = [values[i] for i in iloc_sel]
+
+        def get_value_iter(col_key: TLabel, col_idx: int) -> tp.Iterator[tp.Any]:
+            return iter(values[col_idx])
+
+        arrays = [array_from_value_iter(
+                key=col_idx,
+                idx=col_idx,
+                get_value_iter=get_value_iter,
+                get_col_dtype=get_col_dtype,
+                row_count=len(rows),
+                ) for col_idx in range(len(values))]
+        return fields[:index_depth], arrays
+
     @classmethod
     @doc_inject(selector='constructor_frame')
     def from_sql(cls,
@@ -1804,124 +1942,46 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             {consolidate_blocks}
             parameters: Provide a list of values for an SQL query expecting parameter substitution.
         '''
-        columns: tp.Optional[IndexBase] = None
-        own_columns = False
-
         # We cannot assume the cursor object returned by DBAPI Connection to have a context manager, thus all cursor usage needs to be wrapped in a try/finally to insure that the cursor is closed.
         cursor: sqlite3.Cursor | None = None
         try:
             cursor = connection.cursor()
             cursor.execute(query, parameters)
 
-            if columns_select:
-                columns_select = set(columns_select)
-                # selector function defined below
-                def filter_row(row: tp.Sequence[tp.Any]) -> tp.Sequence[tp.Any]:
-                    post = selector(row)
-                    return post if not selector_reduces else (post,) # type: ignore
-
-            if columns_depth > 0 or columns_select:
-                # always need to derive labels if using columns_select
-                labels = (col for (col, *_) in cursor.description[index_depth:])
-
-            if columns_depth <= 1 and columns_select:
-                iloc_sel, labels = zip(*(
-                        pair for pair in enumerate(labels) if pair[1] in columns_select
-                        ))
-                selector = itemgetter(*iloc_sel)
-                selector_reduces = len(iloc_sel) == 1
-
-            if columns_depth == 1:
-                columns, own_columns = index_from_optional_constructors(
-                        labels,
-                        depth=columns_depth,
-                        default_constructor=cls._COLUMNS_CONSTRUCTOR,
-                        explicit_constructors=columns_constructors, # cannot supply name
-                        )
-            elif columns_depth > 1:
-                # NOTE: we only support loading in IH if encoded in each header with a space delimiter
-                columns_constructor: TIndexHierarchyCtor = partial(
-                        cls._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels_delimited,
-                        delimiter=' ',
-                        )
-                columns, own_columns = index_from_optional_constructors(
-                        labels,
-                        depth=columns_depth,
-                        default_constructor=columns_constructor,
-                        explicit_constructors=columns_constructors,
-                        )
-
-                if columns_select:
-                    iloc_sel = columns._loc_to_iloc(columns.isin(columns_select)) # type: ignore
-                    selector = itemgetter(*iloc_sel)
-                    selector_reduces = len(iloc_sel) == 1 # pyright: ignore
-                    columns = columns.iloc[iloc_sel] # type: ignore
-
-            # NOTE: cannot own_index as we defer calling the constructor until after call Frame
-            # map dtypes in context of pre-index extraction
-            if index_depth > 0:
-                get_col_dtype = None if dtypes is None else get_col_dtype_factory(
-                        dtypes,
-                        [col for (col, *_) in cursor.description],
-                        )
-
-            index_constructor: TIndexCtorSpecifier
-            row_gen: tp.Callable[..., tp.Iterator[tp.Sequence[tp.Any]]] # pyright: ignore
-
-            if index_depth == 0:
-                index = None
-                row_gen = lambda: cursor
-                index_constructor = None
-            elif index_depth == 1:
-                index = [] # lazily populate
-                default_constructor: tp.Type[Index] = partial(Index, dtype=get_col_dtype(0)) if get_col_dtype else Index # type: ignore
-                # parital to include everything but values
-                index_constructor = constructor_from_optional_constructors( # type: ignore
-                        depth=index_depth,
-                        default_constructor=default_constructor,
-                        explicit_constructors=index_constructors,
-                        )
-                def row_gen() -> tp.Iterator[tp.Sequence[tp.Any]]:
-                    for row in cursor:
-                        index.append(row[0])
-                        yield row[1:]
-            else: # > 1
-                index = [list() for _ in range(index_depth)]
-
-                def default_constructor(
-                        iterables: tp.Iterable[tp.Iterable[TLabel]],
-                        index_constructors: TIndexCtorSpecifiers,
-                        ) -> IndexHierarchy: #pylint: disable=function-redefined
-                    if get_col_dtype:
-                        blocks = [iterable_to_array_1d(it, get_col_dtype(i))[0]
-                                for i, it in enumerate(iterables)]
-                    else:
-                        blocks = [iterable_to_array_1d(it)[0] for it in iterables]
-                    return IndexHierarchy._from_type_blocks(
-                            TypeBlocks.from_blocks(blocks),
-                            index_constructors=index_constructors,
-                            own_blocks=True,
-                            )
-                # parital to include everything but values
-                index_constructor = constructor_from_optional_constructors( # type: ignore
-                        depth=index_depth,
-                        default_constructor=default_constructor,
-                        explicit_constructors=index_constructors,
+            columns, own_columns, iloc_sel, index_constructor = cls._from_sql_header(
+                    cursor,
+                    index_depth=index_depth,
+                    index_constructors=index_constructors,
+                    columns_depth=columns_depth,
+                    columns_select=columns_select,
+                    columns_constructors=columns_constructors,
+                    dtypes=dtypes,
+                    )
+            get_col_dtype = None if dtypes is None else get_col_dtype_factory(dtypes, columns)
+
+            # rows are fetched in batches and transposed into arrays per field, such that all rows are never retained as Python tuples; arrays of each batch are concatenated once all rows are fetched
+            labels: tp.List[tp.List[TLabel]] = [[] for _ in range(index_depth)]
+            field_arrays: tp.List[tp.List[TNDArrayAny]] = []
+            while rows := cursor.fetchmany(SQL_FETCH_ROWS):
+                batch_labels, arrays = cls._sql_rows_to_arrays(rows,
+                        index_depth=index_depth,
+                        iloc_sel=iloc_sel,
+                        get_col_dtype=get_col_dtype,
                         )
+                for dst, src in zip(labels, batch_labels):
+                    dst.extend(src)
+                if not field_arrays:
+                    field_arrays = [[] for _ in arrays]
+                for parts, array in zip(field_arrays, arrays):
+                    parts.append(array)
+        finally:
+            if cursor:
+                cursor.close()
 
-                def row_gen() -> tp.Iterator[tp.Sequence[tp.Any]]:
-                    for row in cursor:
-                        for i, label in enumerate(row[:index_depth]):
-                            index[i].append(label)
-                        yield row[index_depth:]
-
-            if columns_select:
-                row_gen_final = (filter_row(row) for row in row_gen())
-            else:
-                row_gen_final = row_gen() # type: ignore
+        index: tp.Any = None if index_depth == 0 else labels[0] if index_depth == 1 else labels
 
-            return cls.from_records(
-                    row_gen_final,
+        if not field_arrays: # no rows; let from_records handle empty records
+            return cls.from_records((),
                     columns=columns,
                     index=index,
                     dtypes=dtypes,
@@ -1930,10 +1990,121 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                     index_constructor=index_constructor,
                     consolidate_blocks=consolidate_blocks,
                     )
-        finally:
-            if cursor:
+
+        blocks = (arrays[0] if len(arrays) == 1 else concat_resolved(arrays)
+                for arrays in field_arrays)
+        return cls._from_sql_arrays(blocks,
+                index=index,
+                index_constructor=index_constructor,
+                columns=columns,
+                own_columns=own_columns,
+                name=name,
+                consolidate_blocks=consolidate_blocks,
+                )
+
+    @classmethod
+    def _from_sql_arrays(cls,
+            blocks: tp.Iterable[TNDArrayAny],
+            *,
+            index: tp.Any,
+            index_constructor: TIndexCtorSpecifier,
+            columns: tp.Optional[IndexBase],
+            own_columns: bool,
+            name: TLabel,
+            consolidate_blocks: bool,
+            ) -> tp.Self:
+        if consolidate_blocks:
+            blocks = TypeBlocks.consolidate_blocks(blocks)
+        return cls(TypeBlocks.from_blocks(blocks),
+                index=index,
+                columns=columns,
+                name=name,
+                own_data=True,
+                index_constructor=index_constructor,
+                own_columns=own_columns,
+                )
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_sql_iter(cls,
+            query: str,
+            *,
+            connection: sqlite3.Connection,
+            chunk_rows: int,
+            index_depth: int = 0,
+            index_constructors: TIndexCtorSpecifiers = None,
+            columns_depth: int = 1,
+            columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            dtypes: TDtypesSpecifier = None,
+            name: TLabel = None,
+            consolidate_blocks: bool = False,
+            parameters: tp.Any = (),
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Create an iterator of :obj:`Frame`, each with at most ``chunk_rows`` rows, from an SQL query and a database connection object. Rows are fetched from the cursor one chunk at a time, permitting processing of results larger than memory. Each :obj:`Frame` has the same columns. As types are evaluated per chunk, ``dtypes`` should be provided to ensure consistent types across chunks. The cursor is closed when the iterator is exhausted or closed.
+
+        Args:
+            query: A query string.
+            connection: A DBAPI2 (PEP 249) Connection object, such as those returned from SQLite (via the sqlite3 module) or PyODBC.
+            chunk_rows: The maximum number of rows in each :obj:`Frame`.
+            {dtypes}
+            index_depth:
+            index_constructors:
+            columns_depth:
+            columns_select: An optional iterable of field names to extract from the results of the query.
+            columns_constructors:
+            {name}
+            {consolidate_blocks}
+            parameters: Provide a list of values for an SQL query expecting parameter substitution.
+
+        Returns:
+            Iterator of :obj:`static_frame.Frame`
+        '''
+        if chunk_rows < 1:
+            raise ErrorInitFrame('chunk_rows must be greater than 0')
+
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, parameters)
+            columns, own_columns, iloc_sel, index_constructor = cls._from_sql_header(
+                    cursor,
+                    index_depth=index_depth,
+                    index_constructors=index_constructors,
+                    columns_depth=columns_depth,
+                    columns_select=columns_select,
+                    columns_constructors=columns_constructors,
+                    dtypes=dtypes,
+                    )
+        except Exception:
+            cursor.close()
+            raise
+        get_col_dtype = None if dtypes is None else get_col_dtype_factory(dtypes, columns)
+
+        def gen() -> tp.Iterator[tp.Self]:
+            nonlocal own_columns
+            try:
+                while rows := cursor.fetchmany(chunk_rows):
+                    labels, arrays = cls._sql_rows_to_arrays(rows,
+                            index_depth=index_depth,
+                            iloc_sel=iloc_sel,
+                            get_col_dtype=get_col_dtype,
+                            )
+                    yield cls._from_sql_arrays(arrays,
+                            index=None if index_depth == 0 else labels[0] if index_depth == 1 else labels,
+                            index_constructor=index_constructor,
+                            columns=columns,
+                            own_columns=own_columns,
+                            name=name,
+                            consolidate_blocks=consolidate_blocks,
+                            )
+                    # columns can only be owned by the first Frame, as they might be mutable
+                    own_columns = False
+            finally:
                 cursor.close()
 
+        return gen()
+
     #---------------------------------------------------------------------------
     @classmethod
     @doc_inject(selector='json')
@@ -2172,66 +2343,17 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
 
 
     #---------------------------------------------------------------------------
-    @classmethod
-    @doc_inject(selector='constructor_frame')
-    def from_delimited(cls,
+    @staticmethod
+    def _delimited_row_iter(
             fp: TPathSpecifierOrTextIOOrIterator,
             *,
-            delimiter: str,
-            index_depth: int = 0,
-            index_column_first: int = 0,
-            index_name_depth_level: tp.Optional[TDepthLevel] = None,
-            index_constructors: TIndexCtorSpecifiers = None,
-            index_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
-            columns_depth: int = 1,
-            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
-            columns_constructors: TIndexCtorSpecifiers = None,
-            columns_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
-            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
-            skip_header: int = 0,
-            skip_footer: int = 0,
-            skip_initial_space: bool = False,
-            quoting: int = csv.QUOTE_MINIMAL,
-            quote_char: str = '"',
-            quote_double: bool = True,
-            escape_char: tp.Optional[str] = None,
-            thousands_char: str = '',
-            decimal_char: str = '.',
-            encoding: tp.Optional[str] = None,
-            dtypes: TDtypesSpecifier = None,
-            name: TLabel = None,
-            consolidate_blocks: bool = False,
-            store_filter: tp.Optional[StoreFilter] = None,
-            ) -> tp.Self:
+            skip_header: int,
+            skip_footer: int,
+            encoding: tp.Optional[str],
+            ) -> tp.Iterator[str]:
         '''
-        Create a :obj:`Frame` from a file path or a file-like object defining a delimited (CSV, TSV) data file.
-
-        Args:
-            fp: A file path or a file-like object.
-            delimiter: The character used to seperate row elements.
-            index_depth: Specify the number of columns used to create the index labels; a value greater than 1 will attempt to create a hierarchical index.
-            index_column_first: Optionally specify a column, by position in the realized columns, to become the start of the index if index_depth is greater than 0 and columns_depth is 0.
-            index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
-            index_constructors:
-            index_continuation_token:
-            columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
-            columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
-            columns_constructors:
-            columns_continuation_token:
-            columns_select: an iterable of columns to select by label or position; can only be used if index_depth is 0.
-            skip_header: Number of leading lines to skip.
-            skip_footer: Number of trailing lines to skip.
-            store_filter: A StoreFilter instance, defining translation between unrepresentable strings and types. By default it is disabled, and only empty fields or "NAN" are intepreted as NaN. To force usage, set the type of the column to string.
-            {dtypes}
-            {name}
-            {consolidate_blocks}
-
-        Returns:
-            :obj:`static_frame.Frame`
+        Return an iterator of lines from a file path or file-like object, with header lines skipped and footer lines withheld.
         '''
-        if skip_header < 0:
-            raise ErrorInitFrame('skip_header must be greater than or equal to 0')
-
         fpf = path_filter(fp) # normalize Path to strings
 
         if not skip_footer:
@@ -2261,7 +2383,31 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         if skip_header:
             for _ in range(skip_header):
                 next(row_iter)
+        return row_iter
 
+    @classmethod
+    def _from_delimited_header(cls,
+            row_iter: tp.Iterator[str],
+            *,
+            delimiter: str,
+            index_depth: int,
+            columns_depth: int,
+            columns_name_depth_level: tp.Optional[TDepthLevel],
+            columns_constructors: TIndexCtorSpecifiers,
+            columns_continuation_token: tp.Optional[TLabel],
+            columns_select: tp.Optional[tp.Iterable[TLabel]],
+            skip_initial_space: bool,
+            quoting: int,
+            quote_char: str,
+            quote_double: bool,
+            escape_char: tp.Optional[str],
+            thousands_char: str,
+            decimal_char: str,
+            store_filter: tp.Optional[StoreFilter],
+            ) -> tp.Tuple[tp.Optional[IndexBase], bool, tp.List[tp.Any], tp.Optional[tp.Callable[[int], bool]]]:
+        '''
+        Consume ``columns_depth`` rows from ``row_iter`` and return the columns, the columns ownership flag, apex rows, and a column selection function, if necessary.
+        '''
         apex_rows = []
         if columns_depth:
             columns_arrays = []
@@ -2380,22 +2526,28 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         else:
             line_select = None
 
-        get_col_dtype = (None if dtypes is None
-                else get_col_dtype_factory(dtypes, columns, index_depth))
-        values_arrays: tp.Sequence[TNDArrayAny] = delimited_to_arrays(
-                row_iter,
-                axis=1, # process type per column
-                line_select=line_select,
-                delimiter=delimiter,
-                quoting=quoting,
-                quotechar=quote_char,
-                doublequote=quote_double,
-                escapechar=escape_char,
-                thousandschar=thousands_char,
-                decimalchar=decimal_char,
-                skipinitialspace=skip_initial_space,
-                dtypes=get_col_dtype,
-                )
+        return columns, own_columns, apex_rows, line_select
+
+    @classmethod
+    def _from_delimited_arrays(cls,
+            values_arrays: tp.Sequence[TNDArrayAny],
+            *,
+            columns: tp.Optional[IndexBase],
+            own_columns: bool,
+            apex_rows: tp.List[tp.Any],
+            index_depth: int,
+            index_column_first: int,
+            index_name_depth_level: tp.Optional[TDepthLevel],
+            index_constructors: TIndexCtorSpecifiers,
+            index_continuation_token: tp.Optional[TLabel],
+            columns_depth: int,
+            name: TLabel,
+            consolidate_blocks: bool,
+            store_filter: tp.Optional[StoreFilter],
+            ) -> tp.Self:
+        '''
+        Given column arrays parsed from delimited text, extract the index and create a :obj:`Frame`.
+        '''
         if store_filter is not None:
             values_arrays = [store_filter.to_type_filter_array(a)
                     for a in values_arrays]
@@ -2450,47 +2602,297 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         index_values: tp.Iterable[tp.Any]
         index_constructor: TIndexCtor
 
-        if index_depth == 1:
-            if not index_arrays:
-                index_values = () # assume an empty Frame
-                assert blocks is FRAME_INITIALIZER_DEFAULT
-            else:
-                index_values = index_arrays[0]
-            index_constructor = partial(Index, name=index_name)
-            index, own_index = index_from_optional_constructors(
-                    index_values,
-                    depth=index_depth,
-                    default_constructor=index_constructor,
-                    explicit_constructors=index_constructors, # cannot supply name
-                    )
-        elif index_continuation_token is not CONTINUATION_TOKEN_INACTIVE:
-            # expect all index_arrays to have the same length
-            index_values = zip(*index_arrays)
-            index_constructor = partial(IndexHierarchy.from_labels,
-                    name=index_name,
-                    continuation_token=index_continuation_token,
-                    )
-            index, own_index = index_from_optional_constructors(
-                    index_values,
-                    depth=index_depth,
-                    default_constructor=index_constructor,
-                    explicit_constructors=index_constructors, # cannot supply name
-                    )
-        else: # index_depth > 1, no continuation toke`n
-            index_constructor = partial(
-                    IndexHierarchy.from_values_per_depth,
-                    name=index_name,
+        if index_depth == 1:
+            if not index_arrays:
+                index_values = () # assume an empty Frame
+                assert blocks is FRAME_INITIALIZER_DEFAULT
+            else:
+                index_values = index_arrays[0]
+            index_constructor = partial(Index, name=index_name)
+            index, own_index = index_from_optional_constructors(
+                    index_values,
+                    depth=index_depth,
+                    default_constructor=index_constructor,
+                    explicit_constructors=index_constructors, # cannot supply name
+                    )
+        elif index_continuation_token is not CONTINUATION_TOKEN_INACTIVE:
+            # expect all index_arrays to have the same length
+            index_values = zip(*index_arrays)
+            index_constructor = partial(IndexHierarchy.from_labels,
+                    name=index_name,
+                    continuation_token=index_continuation_token,
+                    )
+            index, own_index = index_from_optional_constructors(
+                    index_values,
+                    depth=index_depth,
+                    default_constructor=index_constructor,
+                    explicit_constructors=index_constructors, # cannot supply name
+                    )
+        else: # index_depth > 1, no continuation toke`n
+            index_constructor = partial(
+                    IndexHierarchy.from_values_per_depth,
+                    name=index_name,
+                    )
+            index, own_index = index_from_optional_constructors(
+                    index_arrays, # type: ignore
+                    depth=index_depth,
+                    default_constructor=index_constructor,
+                    explicit_constructors=index_constructors, # cannot supply name
+                    )
+        return cls(
+                index=index,
+                own_index=own_index,
+                **kwargs # type: ignore
+                )
+
+    @staticmethod
+    def _delimited_chunk_to_arrays(
+            lines: tp.Sequence[str],
+            *,
+            dtypes: TDtypesSpecifier,
+            columns: tp.Optional[IndexBase],
+            index_depth: int,
+            **kwargs: tp.Any,
+            ) -> tp.List[TNDArrayAny]:
+        '''
+        Parse lines of delimited text into column arrays. Used for multiprocessing, and thus the ``dtypes`` function is created in the worker.
+        '''
+        get_col_dtype = (None if dtypes is None
+                else get_col_dtype_factory(dtypes, columns, index_depth))
+        return delimited_to_arrays(
+                lines,
+                axis=1,
+                dtypes=get_col_dtype,
+                **kwargs,
+                )
+
+    @classmethod
+    def _delimited_to_arrays_concurrent(cls,
+            row_iter: tp.Iterator[str],
+            *,
+            max_workers: int,
+            line_select: tp.Optional[tp.Callable[[int], bool]],
+            dtypes: TDtypesSpecifier,
+            columns: tp.Optional[IndexBase],
+            index_depth: int,
+            delimiter: str,
+            quoting: int,
+            quote_char: str,
+            quote_double: bool,
+            escape_char: tp.Optional[str],
+            thousands_char: str,
+            decimal_char: str,
+            skip_initial_space: bool,
+            ) -> tp.List[TNDArrayAny]:
+        '''
+        Split lines into chunks at record boundaries, parse chunks in a process pool, and concatenate the resulting column arrays. Columns whose types were evaluated differently in different chunks are parsed again over all lines, such that results are always the same as parsing in a single process.
+        '''
+        lines = list(row_iter)
+        chunks = list(iter_delimited_chunks(lines,
+                count=max(1, ceil(len(lines) / max_workers)),
+                delimiter=delimiter,
+                quoting=quoting,
+                quotechar=quote_char,
+                doublequote=quote_double,
+                escapechar=escape_char,
+                skipinitialspace=skip_initial_space,
+                ))
+        to_arrays = partial(cls._delimited_chunk_to_arrays,
+                dtypes=dtypes,
+                columns=columns,
+                index_depth=index_depth,
+                delimiter=delimiter,
+                quoting=quoting,
+                quotechar=quote_char,
+                doublequote=quote_double,
+                escapechar=escape_char,
+                thousandschar=thousands_char,
+                decimalchar=decimal_char,
+                skipinitialspace=skip_initial_space,
+                )
+        if len(chunks) <= 1:
+            return to_arrays(lines, line_select=line_select)
+
+        pool_executor = get_concurrent_executor(
+                use_threads=False,
+                max_workers=max_workers,
+                mp_context=None,
+                )
+        with pool_executor() as executor:
+            arrays_per_chunk = list(executor.map(
+                    partial(to_arrays, line_select=line_select),
+                    chunks,
+                    ))
+
+        if len(set(len(arrays) for arrays in arrays_per_chunk)) > 1:
+            # ragged rows produce a different number of columns per chunk
+            return to_arrays(lines, line_select=line_select)
+
+        values_arrays: tp.List[TNDArrayAny] = []
+        reparse: tp.List[int] = []
+        for i, arrays in enumerate(zip(*arrays_per_chunk)):
+            dtype = arrays[0].dtype
+            # NOTE: type evaluation of a column produces the same type over all lines if it produced that type for each chunk; strings might differ only in size
+            if all(a.dtype == dtype for a in arrays) or (
+                    dtype.kind in DTYPE_STR_KINDS
+                    and all(a.dtype.kind == dtype.kind for a in arrays)):
+                array = concat_resolved(arrays)
+                array.flags.writeable = False
+                values_arrays.append(array)
+            else:
+                values_arrays.append(EMPTY_ARRAY) # replaced below
+                reparse.append(i)
+
+        if reparse:
+            # map from positions in values_arrays to positions in the line
+            if line_select is None:
+                positions: tp.Sequence[int] = range(len(values_arrays))
+            else:
+                positions = list(islice(
+                        (i for i in count() if line_select(i)),
+                        len(values_arrays),
+                        ))
+            selected = frozenset(positions[i] for i in reparse)
+            for i, array in zip(reparse,
+                    to_arrays(lines, line_select=selected.__contains__),
+                    ):
+                values_arrays[i] = array
+
+        return values_arrays
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_delimited(cls,
+            fp: TPathSpecifierOrTextIOOrIterator,
+            *,
+            delimiter: str,
+            index_depth: int = 0,
+            index_column_first: int = 0,
+            index_name_depth_level: tp.Optional[TDepthLevel] = None,
+            index_constructors: TIndexCtorSpecifiers = None,
+            index_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            columns_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            skip_header: int = 0,
+            skip_footer: int = 0,
+            skip_initial_space: bool = False,
+            quoting: int = csv.QUOTE_MINIMAL,
+            quote_char: str = '"',
+            quote_double: bool = True,
+            escape_char: tp.Optional[str] = None,
+            thousands_char: str = '',
+            decimal_char: str = '.',
+            encoding: tp.Optional[str] = None,
+            dtypes: TDtypesSpecifier = None,
+            name: TLabel = None,
+            consolidate_blocks: bool = False,
+            store_filter: tp.Optional[StoreFilter] = None,
+            max_workers: tp.Optional[int] = None,
+            ) -> tp.Self:
+        '''
+        Create a :obj:`Frame` from a file path or a file-like object defining a delimited (CSV, TSV) data file.
+
+        Args:
+            fp: A file path or a file-like object.
+            delimiter: The character used to seperate row elements.
+            index_depth: Specify the number of columns used to create the index labels; a value greater than 1 will attempt to create a hierarchical index.
+            index_column_first: Optionally specify a column, by position in the realized columns, to become the start of the index if index_depth is greater than 0 and columns_depth is 0.
+            index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
+            index_constructors:
+            index_continuation_token:
+            columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
+            columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
+            columns_constructors:
+            columns_continuation_token:
+            columns_select: an iterable of columns to select by label or position; can only be used if index_depth is 0.
+            skip_header: Number of leading lines to skip.
+            skip_footer: Number of trailing lines to skip.
+            store_filter: A StoreFilter instance, defining translation between unrepresentable strings and types. By default it is disabled, and only empty fields or "NAN" are intepreted as NaN. To force usage, set the type of the column to string.
+            {dtypes}
+            {name}
+            {consolidate_blocks}
+            max_workers: If provided, rows are split into chunks that are parsed concurrently in a process pool with this number of workers; ``dtypes`` must be picklable.
+
+        Returns:
+            :obj:`static_frame.Frame`
+        '''
+        if skip_header < 0:
+            raise ErrorInitFrame('skip_header must be greater than or equal to 0')
+
+        row_iter = cls._delimited_row_iter(fp,
+                skip_header=skip_header,
+                skip_footer=skip_footer,
+                encoding=encoding,
+                )
+        columns, own_columns, apex_rows, line_select = cls._from_delimited_header(
+                row_iter,
+                delimiter=delimiter,
+                index_depth=index_depth,
+                columns_depth=columns_depth,
+                columns_name_depth_level=columns_name_depth_level,
+                columns_constructors=columns_constructors,
+                columns_continuation_token=columns_continuation_token,
+                columns_select=columns_select,
+                skip_initial_space=skip_initial_space,
+                quoting=quoting,
+                quote_char=quote_char,
+                quote_double=quote_double,
+                escape_char=escape_char,
+                thousands_char=thousands_char,
+                decimal_char=decimal_char,
+                store_filter=store_filter,
+                )
+
+        values_arrays: tp.Sequence[TNDArrayAny]
+        if max_workers is not None:
+            values_arrays = cls._delimited_to_arrays_concurrent(row_iter,
+                    max_workers=max_workers,
+                    line_select=line_select,
+                    dtypes=dtypes,
+                    columns=columns,
+                    index_depth=index_depth,
+                    delimiter=delimiter,
+                    quoting=quoting,
+                    quote_char=quote_char,
+                    quote_double=quote_double,
+                    escape_char=escape_char,
+                    thousands_char=thousands_char,
+                    decimal_char=decimal_char,
+                    skip_initial_space=skip_initial_space,
                     )
-            index, own_index = index_from_optional_constructors(
-                    index_arrays, # type: ignore
-                    depth=index_depth,
-                    default_constructor=index_constructor,
-                    explicit_constructors=index_constructors, # cannot supply name
+        else:
+            get_col_dtype = (None if dtypes is None
+                    else get_col_dtype_factory(dtypes, columns, index_depth))
+            values_arrays = delimited_to_arrays(
+                    row_iter,
+                    axis=1, # process type per column
+                    line_select=line_select,
+                    delimiter=delimiter,
+                    quoting=quoting,
+                    quotechar=quote_char,
+                    doublequote=quote_double,
+                    escapechar=escape_char,
+                    thousandschar=thousands_char,
+                    decimalchar=decimal_char,
+                    skipinitialspace=skip_initial_space,
+                    dtypes=get_col_dtype,
                     )
-        return cls(
-                index=index,
-                own_index=own_index,
-                **kwargs # type: ignore
+        return cls._from_delimited_arrays(values_arrays,
+                columns=columns,
+                own_columns=own_columns,
+                apex_rows=apex_rows,
+                index_depth=index_depth,
+                index_column_first=index_column_first,
+                index_name_depth_level=index_name_depth_level,
+                index_constructors=index_constructors,
+                index_continuation_token=index_continuation_token,
+                columns_depth=columns_depth,
+                name=name,
+                consolidate_blocks=consolidate_blocks,
+                store_filter=store_filter,
                 )
 
     @classmethod
@@ -2521,6 +2923,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name: TLabel = None,
             consolidate_blocks: bool = False,
             store_filter: tp.Optional[StoreFilter] = None,
+            max_workers: tp.Optional[int] = None,
             ) -> tp.Self:
         '''
         Specialized version of :obj:`Frame.from_delimited` for CSV files.
@@ -2553,6 +2956,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 name=name,
                 consolidate_blocks=consolidate_blocks,
                 store_filter=store_filter,
+                max_workers=max_workers,
                 )
 
     @classmethod
@@ -2583,6 +2987,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name: TLabel = None,
             consolidate_blocks: bool = False,
             store_filter: tp.Optional[StoreFilter] = None,
+            max_workers: tp.Optional[int] = None,
             ) -> tp.Self:
         '''
         Specialized version of :obj:`Frame.from_delimited` for TSV files.
@@ -2616,6 +3021,206 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 name=name,
                 consolidate_blocks=consolidate_blocks,
                 store_filter=store_filter,
+                max_workers=max_workers,
+                )
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_delimited_iter(cls,
+            fp: TPathSpecifierOrTextIOOrIterator,
+            *,
+            delimiter: str,
+            chunk_rows: int,
+            index_depth: int = 0,
+            index_column_first: int = 0,
+            index_name_depth_level: tp.Optional[TDepthLevel] = None,
+            index_constructors: TIndexCtorSpecifiers = None,
+            index_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            columns_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            skip_header: int = 0,
+            skip_footer: int = 0,
+            skip_initial_space: bool = False,
+            quoting: int = csv.QUOTE_MINIMAL,
+            quote_char: str = '"',
+            quote_double: bool = True,
+            escape_char: tp.Optional[str] = None,
+            thousands_char: str = '',
+            decimal_char: str = '.',
+            encoding: tp.Optional[str] = None,
+            dtypes: TDtypesSpecifier = None,
+            name: TLabel = None,
+            consolidate_blocks: bool = False,
+            store_filter: tp.Optional[StoreFilter] = None,
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Create an iterator of :obj:`Frame`, each with at most ``chunk_rows`` rows, from a file path or a file-like object defining a delimited (CSV, TSV) data file. Lines are read and parsed one chunk at a time, permitting processing of files larger than memory. Each :obj:`Frame` has the same columns. As types are evaluated per chunk, ``dtypes`` should be provided to ensure consistent types across chunks.
+
+        Args:
+            fp: A file path or a file-like object.
+            delimiter: The character used to seperate row elements.
+            chunk_rows: The maximum number of rows in each :obj:`Frame`.
+            index_depth: Specify the number of columns used to create the index labels; a value greater than 1 will attempt to create a hierarchical index.
+            index_column_first: Optionally specify a column, by position in the realized columns, to become the start of the index if index_depth is greater than 0 and columns_depth is 0.
+            index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
+            index_constructors:
+            index_continuation_token:
+            columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
+            columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
+            columns_constructors:
+            columns_continuation_token:
+            columns_select: an iterable of columns to select by label or position; can only be used if index_depth is 0.
+            skip_header: Number of leading lines to skip.
+            skip_footer: Number of trailing lines to skip.
+            store_filter: A StoreFilter instance, defining translation between unrepresentable strings and types. By default it is disabled, and only empty fields or "NAN" are intepreted as NaN. To force usage, set the type of the column to string.
+            {dtypes}
+            {name}
+            {consolidate_blocks}
+
+        Returns:
+            Iterator of :obj:`static_frame.Frame`
+        '''
+        if skip_header < 0:
+            raise ErrorInitFrame('skip_header must be greater than or equal to 0')
+        if chunk_rows < 1:
+            raise ErrorInitFrame('chunk_rows must be greater than 0')
+
+        row_iter = cls._delimited_row_iter(fp,
+                skip_header=skip_header,
+                skip_footer=skip_footer,
+                encoding=encoding,
+                )
+        columns, own_columns, apex_rows, line_select = cls._from_delimited_header(
+                row_iter,
+                delimiter=delimiter,
+                index_depth=index_depth,
+                columns_depth=columns_depth,
+                columns_name_depth_level=columns_name_depth_level,
+                columns_constructors=columns_constructors,
+                columns_continuation_token=columns_continuation_token,
+                columns_select=columns_select,
+                skip_initial_space=skip_initial_space,
+                quoting=quoting,
+                quote_char=quote_char,
+                quote_double=quote_double,
+                escape_char=escape_char,
+                thousands_char=thousands_char,
+                decimal_char=decimal_char,
+                store_filter=store_filter,
+                )
+        get_col_dtype = (None if dtypes is None
+                else get_col_dtype_factory(dtypes, columns, index_depth))
+
+        def gen() -> tp.Iterator[tp.Self]:
+            nonlocal own_columns
+            for lines in iter_delimited_chunks(row_iter,
+                    count=chunk_rows,
+                    delimiter=delimiter,
+                    quoting=quoting,
+                    quotechar=quote_char,
+                    doublequote=quote_double,
+                    escapechar=escape_char,
+                    skipinitialspace=skip_initial_space,
+                    ):
+                values_arrays = delimited_to_arrays(
+                        lines,
+                        axis=1, # process type per column
+                        line_select=line_select,
+                        delimiter=delimiter,
+                        quoting=quoting,
+                        quotechar=quote_char,
+                        doublequote=quote_double,
+                        escapechar=escape_char,
+                        thousandschar=thousands_char,
+                        decimalchar=decimal_char,
+                        skipinitialspace=skip_initial_space,
+                        dtypes=get_col_dtype,
+                        )
+                yield cls._from_delimited_arrays(values_arrays,
+                        columns=columns,
+                        own_columns=own_columns,
+                        apex_rows=apex_rows,
+                        index_depth=index_depth,
+                        index_column_first=index_column_first,
+                        index_name_depth_level=index_name_depth_level,
+                        index_constructors=index_constructors,
+                        index_continuation_token=index_continuation_token,
+                        columns_depth=columns_depth,
+                        name=name,
+                        consolidate_blocks=consolidate_blocks,
+                        store_filter=store_filter,
+                        )
+                # columns can only be owned by the first Frame, as they might be mutable
+                own_columns = False
+
+        return gen()
+
+    @classmethod
+    def from_csv_iter(cls,
+            fp: TPathSpecifierOrTextIOOrIterator,
+            *,
+            chunk_rows: int,
+            index_depth: int = 0,
+            index_column_first: int = 0,
+            index_name_depth_level: tp.Optional[TDepthLevel] = None,
+            index_constructors: TIndexCtorSpecifiers = None,
+            index_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            columns_continuation_token: tp.Optional[TLabel] = CONTINUATION_TOKEN_INACTIVE,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            skip_header: int = 0,
+            skip_footer: int = 0,
+            skip_initial_space: bool = False,
+            quoting: int = csv.QUOTE_MINIMAL,
+            quote_char: str = '"',
+            quote_double: bool = True,
+            escape_char: tp.Optional[str] = None,
+            thousands_char: str = '',
+            decimal_char: str = '.',
+            encoding: tp.Optional[str] = None,
+            dtypes: TDtypesSpecifier = None,
+            name: TLabel = None,
+            consolidate_blocks: bool = False,
+            store_filter: tp.Optional[StoreFilter] = None,
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Specialized version of :obj:`Frame.from_delimited_iter` for CSV files.
+
+        Returns:
+            Iterator of :obj:`Frame`
+        '''
+        return cls.from_delimited_iter(fp,
+                delimiter=',',
+                chunk_rows=chunk_rows,
+                index_depth=index_depth,
+                index_column_first=index_column_first,
+                index_name_depth_level=index_name_depth_level,
+                index_constructors=index_constructors,
+                index_continuation_token=index_continuation_token,
+                columns_depth=columns_depth,
+                columns_name_depth_level=columns_name_depth_level,
+                columns_constructors=columns_constructors,
+                columns_continuation_token=columns_continuation_token,
+                columns_select=columns_select,
+                skip_header=skip_header,
+                skip_footer=skip_footer,
+                skip_initial_space=skip_initial_space,
+                quoting=quoting,
+                quote_char=quote_char,
+                quote_double=quote_double,
+                escape_char=escape_char,
+                thousands_char=thousands_char,
+                decimal_char=decimal_char,
+                encoding=encoding,
+                dtypes=dtypes,
+                name=name,
+                consolidate_blocks=consolidate_blocks,
+                store_filter=store_filter,
                 )
 
     @classmethod
@@ -2819,6 +3424,24 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 fp=fp,
                 )
 
+    @classmethod
+    def from_npz_mmap(cls,
+            fp: TPathSpecifier,
+            ) -> tp.Tuple[TFrameAny, tp.Callable[[], None]]:
+        '''
+        Create a :obj:`Frame` from an npz file using memory maps.
+
+        Args:
+            fp: The path to the npz file.
+
+        Returns:
+            A tuple of :obj:`Frame` and the callable needed to close the open memory map objects. On some platforms this must be called before the process exits.
+        '''
+        return NPZFrameConverter.from_archive_mmap(
+                constructor=cls,
+                fp=fp,
+                )
+
     @classmethod
     def from_npy(cls,
             fp: TPathSpecifier,
@@ -3699,6 +4322,17 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 flags=flags,
                 )
 
+    def via_group(self,
+            key: TLocSelector,
+            ) -> InterfaceGroupBy[TFrameAny]:
+        '''
+        Interface for reducing groups of rows, defined by the values of the columns selected by ``key``, without creating a container per group.
+
+        Args:
+            key: a column label or labels used to form groups.
+        '''
+        return InterfaceGroupBy(self, key=key)
+
     #---------------------------------------------------------------------------
     # iterators
 
@@ -8346,29 +8980,38 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 for v in self._blocks.axis_values(axis))))
 
 
+    def _iter_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> tp.Iterator[TBytesLike]:
+
+        yield from iter_component_signature_bytes(self,
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._index._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._columns._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        # NOTE: use Fortran ordering to ensure uniform result regardless of block consolidation
+        for a in self._blocks._blocks:
+            yield from iter_array_signature_bytes(a)
+
     def _to_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
             encoding: str = 'utf-8',
             ) -> bytes:
 
-        # NOTE: use Fortran ordering to ensure uniform result regardless of block consolidation
-        v = (a.tobytes('F') for a in self._blocks._blocks)
-
-        return b''.join(chain(
-                iter_component_signature_bytes(self,
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                (self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                self._columns._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding)),
-                v))
+        return b''.join(self._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding))
 
 
     #---------------------------------------------------------------------------
@@ -9099,10 +9742,22 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             label: TLabel = STORE_LABEL_DEFAULT,
             include_index: bool = True,
             include_columns: bool = True,
+            bulk: bool = False,
+            pragmas: tp.Optional[tp.Mapping[str, tp.Union[str, int]]] = None,
+            npy_blob: bool = False,
             # store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
             ) -> None:
         '''
         Write the Frame as single-table SQLite file.
+
+        Args:
+            fp: file path to write.
+            label: the name of the table; if not provided, the name of the :obj:`Frame` is used.
+            include_index: if False, the index is not written.
+            include_columns: if False, the columns are not written.
+            bulk: if True, durability pragmas are relaxed, rows are committed in chunks, and the primary key is created after all rows are inserted.
+            pragmas: a mapping of SQLite pragma names to values applied before writing; if ``bulk`` is True, these update the default bulk-load pragmas.
+            npy_blob: if True, the table stores NPY-encoded BLOBs, one per block and per depth of index and columns, rather than rows; such tables are read without parsing values.
         '''
         from static_frame.core.store_config import StoreConfig
         from static_frame.core.store_sqlite import StoreSQLite
@@ -9110,6 +9765,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         config = StoreConfig(
                 include_index=include_index,
                 include_columns=include_columns,
+                write_bulk=bulk,
+                write_pragmas=pragmas,
+                write_npy_blob=npy_blob,
                 )
 
         if label is STORE_LABEL_DEFAULT:
@@ -9178,9 +9836,17 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            max_workers: tp.Optional[int] = None,
             ) -> None:
         '''
         Write a :obj:`Frame` as a directory of npy file.
+
+        Args:
+            fp: file path to write.
+            include_index: if False, the index is not written.
+            include_columns: if False, the columns are not written.
+            consolidate_blocks: if True, blocks of the same dtype are combined before writing.
+            max_workers: if greater than 1, the number of threads used to encode blocks concurrently.
         '''
         NPYFrameConverter.to_archive(
                 frame=self,
@@ -9188,6 +9854,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 include_index=include_index,
                 include_columns=include_columns,
                 consolidate_blocks=consolidate_blocks,
+                max_workers=max_workers,
                 )
 
     def to_pickle(self,
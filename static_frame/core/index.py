@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections import Counter
 from copy import deepcopy
-from itertools import chain
 from itertools import zip_longest
 
 import numpy as np
@@ -18,6 +17,7 @@ from arraymap import NonUniqueError  # pylint: disable=E0611
 
 from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import apply_binary_operator
+from static_frame.core.container_util import iter_array_signature_bytes
 from static_frame.core.container_util import iter_component_signature_bytes
 from static_frame.core.container_util import key_from_container_key
 from static_frame.core.container_util import matmul
@@ -55,6 +55,7 @@ from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import PositionsAllocator
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TDepthLevel
 from static_frame.core.util import TDtypeSpecifier
 from static_frame.core.util import TILocSelector
@@ -1447,19 +1448,28 @@ class Index(IndexBase, tp.Generic[TVDtype]):
                 name=self._name)
 
 
+    def _iter_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> tp.Iterator[TBytesLike]:
+
+        yield from iter_component_signature_bytes(self,
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from iter_array_signature_bytes(self.values)
+
     def _to_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
             encoding: str = 'utf-8',
             ) -> bytes:
 
-        return b''.join(chain(
-                iter_component_signature_bytes(self,
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                (self.values.tobytes(),),
-                ))
+        return b''.join(self._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding))
 
 
 doc_update(Index.__init__, selector='index_init')
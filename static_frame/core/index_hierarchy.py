@@ -5,7 +5,6 @@ import operator
 from ast import literal_eval
 from copy import deepcopy
 from functools import partial
-from itertools import chain
 
 import numpy as np
 import typing_extensions as tp
@@ -17,6 +16,7 @@ from arraykit import name_filter
 from static_frame.core.container_util import constructor_from_optional_constructor
 from static_frame.core.container_util import get_col_dtype_factory
 from static_frame.core.container_util import index_from_optional_constructor
+from static_frame.core.container_util import iter_array_signature_bytes
 from static_frame.core.container_util import iter_component_signature_bytes
 from static_frame.core.container_util import key_from_container_key
 from static_frame.core.container_util import matmul
@@ -66,6 +66,7 @@ from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import TBoolOrBools
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TDepthLevel
 from static_frame.core.util import TDepthLevelSpecifier
 from static_frame.core.util import TDepthLevelSpecifierMany
@@ -2707,20 +2708,29 @@ class IndexHierarchy(IndexBase, tp.Generic[tp.Unpack[TVIndices]]):
         from static_frame.core.generic_aliases import TFrameGOAny
         return tp.cast(TFrameGOAny, self._to_frame(FrameGO))
 
+    def _iter_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> tp.Iterator[TBytesLike]:
+
+        yield from iter_component_signature_bytes(self,
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        for i in range(self.depth):
+            yield from iter_array_signature_bytes(self.values_at_depth(i))
+
     def _to_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
             encoding: str = 'utf-8',
             ) -> bytes:
 
-        v = (self.values_at_depth(i).tobytes() for i in range(self.depth))
-        return b''.join(chain(
-                iter_component_signature_bytes(self,
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                v,
-                ))
+        return b''.join(self._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding))
 
     # --------------------------------------------------------------------------
     def to_pandas(self) -> pandas.MultiIndex:
@@ -59,6 +59,7 @@ from static_frame.core.node_dt import InterfaceBatchDatetime
 from static_frame.core.node_dt import InterfaceDatetime
 from static_frame.core.node_fill_value import InterfaceBatchFillValue
 from static_frame.core.node_fill_value import InterfaceFillValue
+from static_frame.core.node_group import InterfaceGroupBy
 from static_frame.core.node_hashlib import InterfaceHashlib
 from static_frame.core.node_re import InterfaceBatchRe
 from static_frame.core.node_re import InterfaceRe
@@ -442,6 +443,7 @@ class InterfaceGroup:
     AccessorFillValue = 'Accessor Fill Value'
     AccessorRe = 'Accessor Regular Expression'
     AccessorHashlib = 'Accessor Hashlib'
+    AccessorGroup = 'Accessor Group'
     AccessorTypeClinic = 'Accessor Type Clinic'
 
 # NOTE: order from definition retained
@@ -468,6 +470,7 @@ INTERFACE_GROUP_DOC = {
     'Accessor Fill Value': 'Interface that permits supplying a fill value to be used when binary operator application forces reindexing.',
     'Accessor Regular Expression': 'Interface exposing regular expression application on container elements.',
     'Accessor Hashlib': 'Interface exposing cryptographic hashing via hashlib interfaces.',
+    'Accessor Group': 'Interface for reducing groups of rows without creating a container per group.',
     'Accessor Type Clinic': 'Interface for providing a type hint from a container or validating a container against a type hint.'
     }
 
@@ -757,7 +760,7 @@ class InterfaceRecord(tp.NamedTuple):
         # TypeBlocks as iter_* methods that are just functions
         if hasattr(obj, 'CLS_DELEGATE'):
             cls_interface = obj.CLS_DELEGATE
-            # IterNodeDelegate or IterNodeDelegateMapable
+            # IterNodeDelegate, IterNodeDelegateMapable, or IterNodeDelegateWindow
 
             for field in cls_interface._INTERFACE: # apply, map, etc
                 delegate_obj = getattr(cls_interface, field)
@@ -813,6 +816,8 @@ class InterfaceRecord(tp.NamedTuple):
             group = InterfaceGroup.AccessorRe
         elif cls_interface is InterfaceHashlib: # type: ignore[comparison-overlap]
             group = InterfaceGroup.AccessorHashlib
+        elif cls_interface is InterfaceGroupBy:
+            group = InterfaceGroup.AccessorGroup
         elif cls_interface is TypeClinic: # type: ignore[comparison-overlap]
             group = InterfaceGroup.AccessorTypeClinic
         else:
@@ -828,7 +833,7 @@ class InterfaceRecord(tp.NamedTuple):
                     max_doc_chars=max_doc_chars,
                     )
 
-            if cls_interface in (InterfaceFillValue, InterfaceRe, InterfaceHashlib):
+            if cls_interface in (InterfaceFillValue, InterfaceRe, InterfaceHashlib, InterfaceGroupBy):
                 terminus_sig, terminus_sig_no_args = _get_signatures(
                         name,
                         obj,
@@ -1285,7 +1290,7 @@ class InterfaceSummary(Features):
                         cls_interface=obj.__class__,
                         **kwargs, # pyright: ignore
                         )
-            # as InterfaceFillValue, InterfaceRe are methods, must match on name, not INTERFACE_ATTRIBUTE_CLS
+            # as InterfaceFillValue, InterfaceRe, InterfaceGroupBy are methods, must match on name, not INTERFACE_ATTRIBUTE_CLS
             elif name == 'via_fill_value':
                 yield from InterfaceRecord.gen_from_accessor(
                         cls_interface=InterfaceFillValue,
@@ -1296,6 +1301,11 @@ class InterfaceSummary(Features):
                         cls_interface=InterfaceRe,
                         **kwargs, # pyright: ignore
                         )
+            elif name == 'via_group':
+                yield from InterfaceRecord.gen_from_accessor(
+                        cls_interface=InterfaceGroupBy,
+                        **kwargs, # pyright: ignore
+                        )
 
             elif callable(obj):
                 if obj.__class__ == type: # a class defined on this class
@@ -15,16 +15,22 @@ from static_frame.core.index import Index
 from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.type_blocks import TypeBlocks
 # from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_OBJECT_KIND
 from static_frame.core.util import Join
 from static_frame.core.util import Pair
 from static_frame.core.util import PairLeft
 from static_frame.core.util import PairRight
 from static_frame.core.util import TDepthLevel
+from static_frame.core.util import TDtypeAny
 from static_frame.core.util import TLabel
 from static_frame.core.util import TLocSelector
+from static_frame.core.util import TNDArrayAny
+from static_frame.core.util import TNDArrayIntDefault
 from static_frame.core.util import WarningsSilent
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import dtype_from_element
+from static_frame.core.util import iterable_to_array_1d
 
 if tp.TYPE_CHECKING:
     from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
@@ -32,6 +38,208 @@ if tp.TYPE_CHECKING:
     from static_frame.core.generic_aliases import TFrameAny  # pragma: no cover
     from static_frame.core.generic_aliases import TFrameGOAny  # pragma: no cover
 
+TMapIloc = tp.Dict[int, TNDArrayIntDefault]
+
+DTYPE_KINDS_NUMERIC_JOIN = frozenset(('b', 'i', 'u', 'f', 'c'))
+DTYPE_KINDS_STR_JOIN = frozenset(('U', 'S'))
+DTYPE_KINDS_DATETIME_JOIN = frozenset(('M', 'm'))
+
+
+def _join_map_iloc_loop(
+        target_left: TNDArrayAny,
+        target_right: TNDArrayAny,
+        ) -> tp.Tuple[TMapIloc, bool]:
+    '''Find matches by comparing each left row to all of the right target; this is O(n*m), but supports any comparison NumPy can do element-wise.
+    '''
+    is_many = False # one to many or many to many
+
+    map_iloc: TMapIloc = {}
+    seen = set() # this stores
+
+    for idx_left, row_left in enumerate(target_left):
+        # Get 1D vector showing matches along right's full heigh
+        with WarningsSilent():
+            matched = row_left == target_right
+        if matched is False:
+            continue
+        matched = matched.all(axis=1)
+        if not matched.any():
+            continue
+        # convert Booleans to integer positions
+        matched_idx = np.nonzero(matched)[0]
+        if not is_many: # if user did not select composite index
+            if len(matched_idx) > 1:
+                is_many = True
+            elif len(matched_idx) == 1:
+                if matched_idx[0] in seen:
+                    is_many = True
+                seen.add(matched_idx[0])
+        # build up a dictionary of left ilocs to an integer array of right matches
+        # note that if row_left is the same as a previous row_left, we duplicate the matched_idx
+        map_iloc[idx_left] = matched_idx
+
+    return map_iloc, is_many
+
+
+def _join_targets_to_keys(
+        target_left: TNDArrayAny,
+        target_right: TNDArrayAny,
+        ) -> tp.Optional[tp.Tuple[tp.List[tp.Any], tp.List[tp.Any], TNDArrayAny, TNDArrayAny]]:
+    '''Convert both targets into lists of hashable keys, one per row, such that keys are equal (and have the same hash) only if NumPy element-wise comparison would find the rows equal. Also return, for each target, a Boolean array of rows that can never match (i.e., that have a NaN or NaT). Return None if that equivalence cannot be guaranteed for these dtypes.
+    '''
+    kind_left = target_left.dtype.kind
+    kind_right = target_right.dtype.kind
+
+    if kind_left in DTYPE_KINDS_NUMERIC_JOIN and kind_right in DTYPE_KINDS_NUMERIC_JOIN:
+        # cast to a common type to reproduce NumPy's comparison, which may lose precision
+        dtype = np.promote_types(target_left.dtype, target_right.dtype)
+        target_left = target_left.astype(dtype, copy=False)
+        target_right = target_right.astype(dtype, copy=False)
+        if dtype.kind in ('f', 'c'):
+            invalid_left = np.isnan(target_left).any(axis=1)
+            invalid_right = np.isnan(target_right).any(axis=1)
+        else:
+            invalid_left = np.full(len(target_left), False)
+            invalid_right = np.full(len(target_right), False)
+    elif kind_left in DTYPE_KINDS_STR_JOIN and kind_right in DTYPE_KINDS_STR_JOIN:
+        # str never equals bytes, thus mixed kinds will not match
+        invalid_left = np.full(len(target_left), False)
+        invalid_right = np.full(len(target_right), False)
+    elif kind_left == kind_right and kind_left in DTYPE_KINDS_DATETIME_JOIN:
+        # compare at the finest unit; use integers as tolist() is unit dependent
+        dtype = np.promote_types(target_left.dtype, target_right.dtype)
+        target_left = target_left.astype(dtype, copy=False)
+        target_right = target_right.astype(dtype, copy=False)
+        invalid_left = np.isnat(target_left).any(axis=1)
+        invalid_right = np.isnat(target_right).any(axis=1)
+        target_left = target_left.view(DTYPE_INT_DEFAULT)
+        target_right = target_right.view(DTYPE_INT_DEFAULT)
+    elif (kind_left == DTYPE_OBJECT_KIND
+            and kind_right not in DTYPE_KINDS_DATETIME_JOIN
+            ) or (kind_right == DTYPE_OBJECT_KIND
+            and kind_left not in DTYPE_KINDS_DATETIME_JOIN
+            ):
+        # elements that are not equal to themselves (i.e., NaN) can never match
+        with WarningsSilent():
+            invalid_left = target_left != target_left
+            invalid_right = target_right != target_right
+        if invalid_left.__class__ is not np.ndarray or invalid_right.__class__ is not np.ndarray:
+            return None
+        invalid_left = invalid_left.any(axis=1)
+        invalid_right = invalid_right.any(axis=1)
+    else:
+        return None
+
+    if target_left.shape[1] == 1:
+        keys_left = target_left[:, 0].tolist()
+        keys_right = target_right[:, 0].tolist()
+    else:
+        keys_left = list(map(tuple, target_left.tolist()))
+        keys_right = list(map(tuple, target_right.tolist()))
+
+    return keys_left, keys_right, invalid_left, invalid_right
+
+
+def _join_map_iloc_hash(
+        target_left: TNDArrayAny,
+        target_right: TNDArrayAny,
+        ) -> tp.Optional[tp.Tuple[TMapIloc, bool]]:
+    '''Find matches by hashing the rows of the right target and looking up each row of the left target; this is O(n+m). Returns the same `map_iloc` and `is_many` as `_join_map_iloc_loop`, or None if the targets cannot be hashed with equivalent semantics.
+    '''
+    post = _join_targets_to_keys(target_left, target_right)
+    if post is None:
+        return None
+    keys_left, keys_right, invalid_left, invalid_right = post
+
+    # map each right key to the positions of its rows, in ascending order
+    key_to_ilocs: tp.Dict[tp.Any, tp.List[int]] = {}
+    try:
+        for idx_right, (key, invalid) in enumerate(zip(keys_right, invalid_right.tolist())):
+            if invalid:
+                continue
+            if key in key_to_ilocs:
+                key_to_ilocs[key].append(idx_right)
+            else:
+                key_to_ilocs[key] = [idx_right]
+    except TypeError: # unhashable elements
+        return None
+
+    is_many = False
+    map_iloc: TMapIloc = {}
+    matched_arrays: tp.Dict[tp.Any, TNDArrayIntDefault] = {}
+
+    try:
+        for idx_left, (key, invalid) in enumerate(zip(keys_left, invalid_left.tolist())):
+            if invalid:
+                continue
+            matched_idx = matched_arrays.get(key)
+            if matched_idx is None:
+                if key not in key_to_ilocs:
+                    continue
+                matched_idx = np.array(key_to_ilocs[key], dtype=DTYPE_INT_DEFAULT)
+                matched_idx.flags.writeable = False
+                matched_arrays[key] = matched_idx
+                if len(matched_idx) > 1:
+                    is_many = True
+            else: # a previous left row matched the same right rows
+                is_many = True
+            map_iloc[idx_left] = matched_idx
+    except TypeError: # unhashable elements
+        return None
+
+    return map_iloc, is_many
+
+
+def _join_take_right(
+        blocks: TypeBlocks,
+        *,
+        indexer: TNDArrayIntDefault,
+        fill_value: tp.Any,
+        fill_value_dtype: TDtypeAny,
+        ) -> TypeBlocks:
+    '''Gather rows of the right `blocks` by `indexer`, where negative values denote rows to be filled with `fill_value`. Blocks are taken whole, retaining dtypes where no fill is necessary.
+    '''
+    missing = indexer < 0
+    if not missing.any():
+        return blocks._extract(row_key=indexer)
+
+    missing_iloc = np.nonzero(missing)[0]
+
+    def gen_object(column: TNDArrayAny) -> TNDArrayAny:
+        # as with per-element construction, retain NumPy scalar elements and derive the dtype from all values, rather than converting elements with astype()
+        values = list(column)
+        for i in missing_iloc:
+            values[i] = fill_value
+        array, _ = iterable_to_array_1d(values)
+        array.flags.writeable = False
+        return array
+
+    def gen() -> tp.Iterator[TNDArrayAny]:
+        if not blocks.shape[0]: # all values are fill_value
+            for array in blocks._blocks:
+                array = np.full((len(indexer),) + array.shape[1:],
+                        fill_value,
+                        dtype=fill_value_dtype,
+                        )
+                array.flags.writeable = False
+                yield array
+            return
+        # take a valid row for missing positions, then overwrite with fill_value
+        for array in blocks._extract(row_key=np.where(missing, 0, indexer))._blocks:
+            dtype = resolve_dtype(array.dtype, fill_value_dtype)
+            if dtype.kind == DTYPE_OBJECT_KIND and array.dtype.kind != DTYPE_OBJECT_KIND:
+                if array.ndim == 1:
+                    yield gen_object(array)
+                else:
+                    yield from (gen_object(column) for column in array.T)
+                continue
+            array = array.astype(dtype) # always a copy
+            array[missing] = fill_value
+            array.flags.writeable = False
+            yield array
+
+    return TypeBlocks.from_blocks(gen())
+
 
 def join(frame: TFrameAny,
         other: TFrameAny, # support a named Series as a 1D frame?
@@ -78,35 +286,10 @@ def join(frame: TFrameAny,
         raise RuntimeError('left and right selections must be the same width.')
 
     # Find matching pairs. Get iloc of left to iloc of right.
-
-    is_many = False # one to many or many to many
-
-    map_iloc: tp.Dict[int, np.ndarray[tp.Any, np.dtype[np.int_]]] = {}
-    seen = set() # this stores
-
-    # NOTE: this could be optimized by always iterating over the shorter target
-
-    for idx_left, row_left in enumerate(target_left):
-        # Get 1D vector showing matches along right's full heigh
-        with WarningsSilent():
-            matched = row_left == target_right
-        if matched is False:
-            continue
-        matched = matched.all(axis=1)
-        if not matched.any():
-            continue
-        # convert Booleans to integer positions
-        matched_idx = np.nonzero(matched)[0]
-        if not is_many: # if user did not select composite index
-            if len(matched_idx) > 1:
-                is_many = True
-            elif len(matched_idx) == 1:
-                if matched_idx[0] in seen:
-                    is_many = True
-                seen.add(matched_idx[0])
-        # build up a dictionary of left ilocs to an integer array of right matches
-        # note that if row_left is the same as a previous row_left, we duplicate the matched_idx
-        map_iloc[idx_left] = matched_idx
+    post = _join_map_iloc_hash(target_left, target_right)
+    if post is None:
+        post = _join_map_iloc_loop(target_left, target_right)
+    map_iloc, is_many = post
 
     #-----------------------------------------------------------------------
     # store collections of matches, derive final index
@@ -177,20 +360,35 @@ def join(frame: TFrameAny,
         final = FrameGO(index=final_index)
         left_column_labels = (left_template.format(c) for c in frame.columns)
         final.extend(frame.relabel(columns=left_column_labels), fill_value=fill_value)
-        # build up a Series for each new column
-        for idx_col, col in enumerate(other.columns):
-            values = []
-            for loc in final_index:
-                # what if loc is in both left and rihgt?
-                if loc in left_index and left_index._loc_to_iloc(loc) in map_iloc:
-                    iloc = map_iloc[left_index._loc_to_iloc(loc)] #type: ignore
-                    assert len(iloc) == 1 # not is_many, so all have to be length 1
-                    values.append(other._extract_iloc((iloc[0], idx_col)))
-                elif loc in right_index:
-                    values.append(other._extract_loc((loc, col)))
-                else:
-                    values.append(fill_value)
-            final[right_template.format(col)] = values
+        # get, for each row of final_index, the iloc of the right row to take
+        left_to_right = np.full(len(left_index), -1, dtype=DTYPE_INT_DEFAULT)
+        if map_iloc:
+            left_to_right[list(map_iloc.keys())] = [v[0] for v in map_iloc.values()]
+
+        # only rows not matched from the left need a label-based lookup
+        if final_index is left_index:
+            indexer = left_to_right.copy()
+            unmatched = np.nonzero(indexer < 0)[0]
+            labels = left_index[unmatched]
+        else:
+            indexer = np.full(len(final_index), -1, dtype=DTYPE_INT_DEFAULT)
+            unmatched = range(len(final_index)) # type: ignore
+            labels = final_index
+
+        for i, loc in zip(unmatched, labels):
+            # what if loc is in both left and rihgt?
+            if loc in left_index and left_to_right[left_index._loc_to_iloc(loc)] >= 0:
+                indexer[i] = left_to_right[left_index._loc_to_iloc(loc)]
+            elif loc in right_index:
+                indexer[i] = right_index._loc_to_iloc(loc)
+
+        tb = _join_take_right(other._blocks,
+                indexer=indexer,
+                fill_value=fill_value,
+                fill_value_dtype=fill_value_dtype,
+                )
+        for col, array in zip(other.columns, tb.axis_values(0)):
+            final[right_template.format(col)] = array
 
         if include_index:
             return final.to_frame()
@@ -222,27 +420,20 @@ def join(frame: TFrameAny,
         final = final.reindex(final_index, fill_value=fill_value)
 
     # populate from right columns
-    # NOTE: find optimized path to avoid final_index iteration per column in all scenarios
-
-    other_dtypes = other.dtypes.values
-    for idx_col, col in enumerate(other.columns):
-        array = np.empty(len(final_index), dtype=other_dtypes[idx_col])
-        resolved_dtype = resolve_dtype(array.dtype, fill_value_dtype)
-
-        for i, pair in enumerate(final_index):
-            # NOTE: we used to support pair being something other than a Pair subclass (which would append fill_value to array), but it appears that if is_many is True, each value in final_index will be a Pair instance
-            # assert isinstance(pair, Pair)
-            if pair.__class__ is PairRight: # get from right
-                array[i] = other._extract(right_index._loc_to_iloc(pair[1]), idx_col) #type: ignore
-            elif pair.__class__ is PairLeft:
-                # get from left, but we do not have col, so fill value
-                if resolved_dtype != array.dtype:
-                    array = array.astype(resolved_dtype)
-                array[i] = fill_value
-            else:
-                array[i] = other._extract(right_index._loc_to_iloc(pair[1]), idx_col) # type: ignore
-
-        array.flags.writeable = False
+    # NOTE: if is_many is True, each value in final_index will be a Pair instance
+    indexer = np.fromiter(
+            (-1 if pair.__class__ is PairLeft
+                    else right_index._loc_to_iloc(pair[1]) # type: ignore
+                    for pair in final_index),
+            count=len(final_index),
+            dtype=DTYPE_INT_DEFAULT,
+            )
+    tb = _join_take_right(other._blocks,
+            indexer=indexer,
+            fill_value=fill_value,
+            fill_value_dtype=fill_value_dtype,
+            )
+    for col, array in zip(other.columns, tb.axis_values(0)):
         final[right_template.format(col)] = array
 
     if include_index:
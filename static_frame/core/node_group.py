@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import numpy as np
+import typing_extensions as tp
+from arraykit import name_filter
+
+from static_frame.core.node_selector import Interface
+from static_frame.core.node_selector import TVContainer_co
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import SEGMENT_REDUCE_FUNCS
+from static_frame.core.util import TLabel
+from static_frame.core.util import TLocSelector
+from static_frame.core.util import TName
+from static_frame.core.util import argsort_array
+from static_frame.core.util import array_segment_reduce
+from static_frame.core.util import array_to_groups_and_locations
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.index_base import IndexBase  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.type_blocks import TypeBlocks  # pylint: disable=W0611 #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] #pragma: no cover
+    TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]] #pragma: no cover
+
+
+INTERFACE_GROUP_BY = SEGMENT_REDUCE_FUNCS
+
+
+class InterfaceGroupBy(Interface, tp.Generic[TVContainer_co]):
+    '''Interface for reducing groups of rows, as defined by the values of one or more columns, without creating a container per group. The grouping is factorized once, on creation; each reduction is then evaluated over all groups for each block.
+    '''
+
+    __slots__ = (
+            '_container',
+            '_blocks',
+            '_starts',
+            '_index',
+            '_columns',
+            )
+    _INTERFACE = INTERFACE_GROUP_BY
+
+    def __init__(self,
+            container: TFrameAny,
+            *,
+            key: TLocSelector,
+            ) -> None:
+        from static_frame.core.index import Index
+        from static_frame.core.index_hierarchy import IndexHierarchy
+
+        blocks = container._blocks
+        iloc_key = container._columns._loc_to_iloc(key)
+        group_source = blocks._extract_array(column_key=iloc_key)
+
+        if group_source.ndim == 1:
+            # a stable sort gives both the unique values and the order of rows within each group
+            order = argsort_array(group_source)
+            group_sorted = group_source[order]
+            mask = np.empty(len(group_sorted), dtype=DTYPE_BOOL)
+            mask[:1] = True
+            mask[1:] = group_sorted[1:] != group_sorted[:-1]
+            groups = group_sorted[mask]
+            starts = np.nonzero(mask)[0]
+        else:
+            groups, locations = array_to_groups_and_locations(group_source)
+            # a stable sort of locations retains the original order of rows within each group
+            order = np.argsort(locations, kind=DEFAULT_STABLE_SORT_KIND)
+            counts = np.bincount(locations, minlength=len(groups))
+            starts = np.zeros(len(groups), dtype=DTYPE_INT_DEFAULT)
+            np.cumsum(counts[:-1], out=starts[1:])
+
+        name: TName
+        try:
+            # a key that is a label names the index; unhashable selections raise
+            name = name_filter(tp.cast(TLabel, key))
+        except TypeError:
+            name = None
+
+        if group_source.ndim == 1:
+            self._index: IndexBase = Index(groups, name=name)
+        else:
+            # take depth values from the source columns to retain their dtypes
+            first_rows = order[starts]
+            self._index = IndexHierarchy.from_values_per_depth(
+                    [blocks._extract_array_column(i)[first_rows]
+                    for i in np.arange(blocks.shape[1])[iloc_key]],
+                    name=name,
+                    )
+
+        # exclude the group columns from reduction
+        column_mask = np.full(blocks.shape[1], True, dtype=DTYPE_BOOL)
+        column_mask[iloc_key] = False
+
+        self._container = container
+        self._blocks: TypeBlocks = blocks._extract(row_key=order, column_key=column_mask)
+        self._starts = starts
+        self._columns = container._columns[column_mask]
+
+    def _reduce(self,
+            func_name: str,
+            *,
+            skipna: bool = True,
+            ) -> TVContainer_co:
+        from static_frame.core.type_blocks import TypeBlocks
+
+        blocks = (array_segment_reduce(array,
+                starts=self._starts,
+                func_name=func_name,
+                skipna=skipna,
+                ) for array in self._blocks._blocks)
+
+        return self._container.__class__( # type: ignore
+                TypeBlocks.from_blocks(blocks),
+                index=self._index,
+                columns=self._columns,
+                name=self._container._name,
+                own_data=True,
+                own_index=True,
+                )
+
+    #---------------------------------------------------------------------------
+    def count(self, *,
+            skipna: bool = True,
+            ) -> TVContainer_co:
+        '''Return the count of non-NA values in each group.
+
+        Args:
+            skipna: if False, count all values, including NA values.
+        '''
+        return self._reduce('count', skipna=skipna)
+
+    def first(self) -> TVContainer_co:
+        '''Return the first value in each group.
+        '''
+        return self._reduce('first')
+
+    def last(self) -> TVContainer_co:
+        '''Return the last value in each group.
+        '''
+        return self._reduce('last')
+
+    def max(self, *,
+            skipna: bool = True,
+            ) -> TVContainer_co:
+        '''Return the maximum of each group.
+
+        Args:
+            skipna: if False, groups that contain NA values return NA.
+        '''
+        return self._reduce('max', skipna=skipna)
+
+    def mean(self, *,
+            skipna: bool = True,
+            ) -> TVContainer_co:
+        '''Return the mean of each group.
+
+        Args:
+            skipna: if False, groups that contain NA values return NA.
+        '''
+        return self._reduce('mean', skipna=skipna)
+
+    def min(self, *,
+            skipna: bool = True,
+            ) -> TVContainer_co:
+        '''Return the minimum of each group.
+
+        Args:
+            skipna: if False, groups that contain NA values return NA.
+        '''
+        return self._reduce('min', skipna=skipna)
+
+    def sum(self, *,
+            skipna: bool = True,
+            ) -> TVContainer_co:
+        '''Return the sum of each group.
+
+        Args:
+            skipna: if False, groups that contain NA values return NA.
+        '''
+        return self._reduce('sum', skipna=skipna)
@@ -4,15 +4,19 @@ import hashlib
 
 import typing_extensions as tp
 
+from static_frame.core.util import TBytesLike
+
 if tp.TYPE_CHECKING:
     from hashlib import _Hash  # pylint: disable = E0611 #pragma: no cover
     from hashlib import _VarLenHash  # pylint: disable = E0611 #pragma: no cover
 
+    THash = tp.TypeVar('THash', '_Hash', '_VarLenHash') #pragma: no cover
+
 
 class InterfaceHashlib:
 
     __slots__ = (
-            '_to_bytes',
+            '_iter_bytes',
             '_include_name',
             '_include_class',
             '_encoding',
@@ -32,7 +36,7 @@ class InterfaceHashlib:
             )
 
     def __init__(self,
-            to_bytes: tp.Callable[[bool, bool, str], bytes],
+            iter_bytes: tp.Callable[[bool, bool, str], tp.Iterator[TBytesLike]],
             *,
             include_name: bool,
             include_class: bool,
@@ -45,7 +49,7 @@ class InterfaceHashlib:
             include_class: Whether class name is included in the byte signature.
             encoding: Encoding to use for converting strings to bytes.
         '''
-        self._to_bytes = to_bytes
+        self._iter_bytes = iter_bytes
         self._include_name = include_name
         self._include_class = include_class
         self._encoding = encoding
@@ -63,41 +67,52 @@ class InterfaceHashlib:
             encoding: Encoding to use for converting strings to bytes.
         '''
         return self.__class__(
-                to_bytes=self._to_bytes,
+                iter_bytes=self._iter_bytes,
                 include_name=include_name if include_name is not None else self._include_name,
                 include_class=include_class if include_class is not None else self._include_class,
                 encoding=encoding if encoding is not None else self._encoding,
                 )
 
+    def _update(self, h: THash) -> THash:
+        '''Incrementally update the hash with each component of the byte signature, avoiding the creation of a concatenated byte signature.
+        '''
+        for b in self._iter_bytes(
+                self._include_name,
+                self._include_class,
+                self._encoding,
+                ):
+            h.update(b)
+        return h
+
     def to_bytes(self) -> bytes:
         '''Return the byte signature for this container, suitable for passing to a cryptographic hash function.
         '''
-        return self._to_bytes(
+        return b''.join(self._iter_bytes(
                 self._include_name,
                 self._include_class,
                 self._encoding,
-                )
+                ))
 
     def md5(self) -> '_Hash':
-        return hashlib.md5(self.to_bytes())
+        return self._update(hashlib.md5())
 
     def sha256(self) -> '_Hash':
-        return hashlib.sha256(self.to_bytes())
+        return self._update(hashlib.sha256())
 
     def sha512(self) -> '_Hash':
-        return hashlib.sha512(self.to_bytes())
+        return self._update(hashlib.sha512())
 
     def sha3_256(self) -> '_Hash':
-        return hashlib.sha3_256(self.to_bytes())
+        return self._update(hashlib.sha3_256())
 
     def sha3_512(self) -> '_Hash':
-        return hashlib.sha3_512(self.to_bytes())
+        return self._update(hashlib.sha3_512())
 
     def shake_128(self) -> '_VarLenHash':
-        return hashlib.shake_128(self.to_bytes())
+        return self._update(hashlib.shake_128())
 
     def shake_256(self) -> '_VarLenHash':
-        return hashlib.shake_256(self.to_bytes())
+        return self._update(hashlib.shake_256())
 
     def blake2b(self, *,
             digest_size: int = 64,
@@ -113,8 +128,7 @@ class InterfaceHashlib:
             last_node: bool = False,
             # usedforsecurity: bool = True, # py 3.9
             ) -> '_Hash':
-        return hashlib.blake2b(
-                self.to_bytes(),
+        return self._update(hashlib.blake2b(
                 digest_size=digest_size,
                 key=key,
                 salt=salt,
@@ -127,7 +141,7 @@ class InterfaceHashlib:
                 inner_size=inner_size,
                 last_node=last_node,
                 # usedforsecurity=usedforsecurity,
-                )
+                ))
 
     def blake2s(self, *,
             digest_size: int = 32,
@@ -143,8 +157,7 @@ class InterfaceHashlib:
             last_node: bool = False,
             # usedforsecurity: bool = True,
             ) -> '_Hash':
-        return hashlib.blake2s(
-                self.to_bytes(),
+        return self._update(hashlib.blake2s(
                 digest_size=digest_size,
                 key=key,
                 salt=salt,
@@ -157,6 +170,6 @@ class InterfaceHashlib:
                 inner_size=inner_size,
                 last_node=last_node,
                 # usedforsecurity=usedforsecurity,
-                )
+                ))
 
 
@@ -10,9 +10,12 @@ import numpy as np
 import typing_extensions as tp
 from arraykit import name_filter
 
+from static_frame.core.container_util import axis_window_bounds
 from static_frame.core.container_util import group_from_container
 from static_frame.core.doc_str import doc_inject
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import KEY_ITERABLE_TYPES
+from static_frame.core.util import WINDOW_REDUCE_FUNCS
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TDepthLevel
 from static_frame.core.util import TDtypeSpecifier
@@ -21,6 +24,7 @@ from static_frame.core.util import TLabel
 from static_frame.core.util import TMapping
 from static_frame.core.util import TName
 from static_frame.core.util import TTupleCtor
+from static_frame.core.util import array_window_reduce
 from static_frame.core.util import get_concurrent_executor
 from static_frame.core.util import iterable_to_array_1d
 
@@ -520,6 +524,228 @@ class IterNodeDelegateMapable(IterNodeDelegate[TContainerAny]):
                 index_constructor=index_constructor,
                 )
 
+
+class IterNodeDelegateWindow(IterNodeDelegate[TContainerAny]):
+    '''
+    Delegate returned from :obj:`static_frame.IterNodeWindow`, providing iteration, a family of apply methods, and vectorized window reductions.
+    '''
+
+    __slots__ = (
+            '_container',
+            '_window_kwargs',
+            )
+
+    _INTERFACE = IterNodeDelegate._INTERFACE + WINDOW_REDUCE_FUNCS
+
+    def __init__(self,
+            func_values: tp.Callable[..., tp.Iterable[tp.Any]],
+            func_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
+            yield_type: IterNodeType,
+            apply_constructor: tp.Callable[..., TContainerAny],
+            apply_type: IterNodeApplyType,
+            *,
+            container: TContainerAny,
+            window_kwargs: tp.Dict[str, tp.Any],
+        ) -> None:
+        '''
+        Args:
+            container: the container over which windows are formed.
+            window_kwargs: the arguments given to the window iterator.
+        '''
+        IterNodeDelegate.__init__(self,
+                func_values=func_values,
+                func_items=func_items,
+                yield_type=yield_type,
+                apply_constructor=apply_constructor,
+                apply_type=apply_type,
+                )
+        self._container: TContainerAny = container
+        self._window_kwargs = window_kwargs
+
+    #---------------------------------------------------------------------------
+
+    def _window_reduce(self,
+            func_name: str,
+            *,
+            skipna: bool,
+            ddof: int = 0,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Reduce each window with the cumulative kernels of ``array_window_reduce``, operating directly on the underlying arrays. Returns a :obj:`Series` for a :obj:`Series`; returns a :obj:`Frame`, with windows labelled on the iterated axis, for a :obj:`Frame` or :obj:`Quilt`. For a :obj:`Quilt`, each window is reduced as it is formed, such that :obj:`Frame` are loaded from the :obj:`Bus` as when iterating windows.
+        '''
+        from static_frame.core.frame import Frame
+        from static_frame.core.series import Series
+        from static_frame.core.type_blocks import TypeBlocks
+
+        kwargs = self._window_kwargs
+        if kwargs['window_func'] is not None or kwargs['window_valid'] is not None:
+            raise RuntimeError('window reductions do not support `window_func` or `window_valid`; use apply()')
+
+        container: tp.Union[TSeriesAny, TFrameAny, Quilt] = self._container # type: ignore
+        axis = kwargs['axis']
+        labels = (container.index if container._NDIM == 1 or axis == 0
+                else container.columns) # type: ignore
+
+        starts, stops, label_positions = axis_window_bounds(
+                count_labels=len(labels),
+                size=kwargs['size'],
+                step=kwargs['step'],
+                window_sized=kwargs['window_sized'],
+                label_shift=kwargs['label_shift'],
+                label_missing_skips=kwargs['label_missing_skips'],
+                label_missing_raises=kwargs['label_missing_raises'],
+                start_shift=kwargs['start_shift'],
+                size_increment=kwargs['size_increment'],
+                )
+        if (label_positions >= 0).all():
+            index = labels._extract_iloc(label_positions)
+        else: # some labels are missing and set to None
+            index = labels.from_labels(
+                    (labels.iloc[i] if i >= 0 else None for i in label_positions),
+                    name=labels.name,
+                    )
+
+        if not isinstance(container, (Series, Frame)): # a Quilt
+            reduced: tp.List[tp.Any] = []
+            for _, window in container._axis_window_items(**kwargs):
+                bounds = np.array((0, window.shape[axis]), dtype=DTYPE_INT_DEFAULT)
+                func_window = partial(array_window_reduce,
+                        starts=bounds[:1],
+                        stops=bounds[1:],
+                        func_name=func_name,
+                        skipna=skipna,
+                        ddof=ddof,
+                        )
+                if axis == 0:
+                    reduced.append(Frame(
+                            TypeBlocks.from_blocks(func_window(array) for array in window._blocks._blocks),
+                            columns=window._columns,
+                            own_data=True,
+                            ))
+                else:
+                    reduced.append(func_window(window._blocks.values.T))
+
+            if axis == 0:
+                if not reduced:
+                    return Frame(index=index, columns=container.columns, name=container.name)
+                return Frame.from_concat(reduced, index=index, name=container.name)
+            array = (np.concatenate(reduced).T if reduced
+                    else np.empty((len(container.index), 0)))
+            array.flags.writeable = False
+            return Frame(array,
+                    index=container.index,
+                    columns=index,
+                    name=container.name,
+                    )
+
+        func = partial(array_window_reduce,
+                starts=starts,
+                stops=stops,
+                func_name=func_name,
+                size=None if kwargs['size_increment'] else kwargs['size'],
+                skipna=skipna,
+                ddof=ddof,
+                )
+
+        if isinstance(container, Series):
+            return Series(func(container.values),
+                    index=index,
+                    name=container._name,
+                    own_index=True,
+                    )
+
+        if axis == 0:
+            blocks = (func(array) for array in container._blocks._blocks)
+            return container.__class__(TypeBlocks.from_blocks(blocks),
+                    index=index,
+                    columns=container._columns,
+                    name=container._name,
+                    own_data=True,
+                    own_index=True,
+                    )
+
+        # windows of columns are evaluated on the transposed, consolidated values
+        array = func(container._blocks.values.T).T
+        array.flags.writeable = False
+        return container.__class__(array,
+                index=container._index,
+                columns=index,
+                name=container._name,
+                )
+
+    def count(self, *,
+            skipna: bool = True,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Return the count of non-NA values in each window.
+
+        Args:
+            skipna: if False, count all values, including NA values.
+        '''
+        return self._window_reduce('count', skipna=skipna)
+
+    def max(self, *,
+            skipna: bool = True,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Return the maximum of each window.
+
+        Args:
+            skipna: if False, windows that contain NA values return NA.
+        '''
+        return self._window_reduce('max', skipna=skipna)
+
+    def mean(self, *,
+            skipna: bool = True,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Return the mean of each window.
+
+        Args:
+            skipna: if False, windows that contain NA values return NA.
+        '''
+        return self._window_reduce('mean', skipna=skipna)
+
+    def min(self, *,
+            skipna: bool = True,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Return the minimum of each window.
+
+        Args:
+            skipna: if False, windows that contain NA values return NA.
+        '''
+        return self._window_reduce('min', skipna=skipna)
+
+    def std(self, *,
+            ddof: int = 0,
+            skipna: bool = True,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Return the standard deviation of each window.
+
+        Args:
+            ddof: delta degrees of freedom.
+            skipna: if False, windows that contain NA values return NA.
+        '''
+        return self._window_reduce('std', skipna=skipna, ddof=ddof)
+
+    def sum(self, *,
+            skipna: bool = True,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Return the sum of each window.
+
+        Args:
+            skipna: if False, windows that contain NA values return NA.
+        '''
+        return self._window_reduce('sum', skipna=skipna)
+
+    def var(self, *,
+            ddof: int = 0,
+            skipna: bool = True,
+            ) -> tp.Union[TSeriesAny, TFrameAny]:
+        '''Return the variance of each window.
+
+        Args:
+            ddof: delta degrees of freedom.
+            skipna: if False, windows that contain NA values return NA.
+        '''
+        return self._window_reduce('var', skipna=skipna, ddof=ddof)
+
 #-------------------------------------------------------------------------------
 
 class IterNode(tp.Generic[TContainerAny]):
@@ -534,7 +760,7 @@ class IterNode(tp.Generic[TContainerAny]):
         '_yield_type',
         '_apply_type',
         )
-    CLS_DELEGATE = IterNodeDelegate
+    CLS_DELEGATE: tp.Type[IterNodeDelegate[tp.Any]] = IterNodeDelegate
 
     def __init__(self, *,
             container: TContainerAny,
@@ -770,6 +996,15 @@ class IterNode(tp.Generic[TContainerAny]):
             ) -> IterNodeDelegateMapable[TContainerAny]:
         return IterNodeDelegateMapable(**self._get_delegate_kwargs(**kwargs))
 
+    def get_delegate_window(self,
+            **kwargs: object,
+            ) -> IterNodeDelegateWindow[TContainerAny]:
+        return IterNodeDelegateWindow(
+                container=self._container,
+                window_kwargs=kwargs,
+                **self._get_delegate_kwargs(**kwargs),
+                )
+
 #-------------------------------------------------------------------------------
 # specialize IterNode based on arguments given to __call__
 
@@ -912,6 +1147,7 @@ class IterNodeDepthLevelAxis(IterNode[TContainerAny]):
 class IterNodeWindow(IterNode[TContainerAny]):
 
     __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateWindow
 
     def __call__(self, *,
             size: int,
@@ -925,8 +1161,8 @@ class IterNodeWindow(IterNode[TContainerAny]):
             label_missing_raises: bool = False,
             start_shift: int = 0,
             size_increment: int = 0,
-            ) -> IterNodeDelegate[TContainerAny]:
-        return IterNode.get_delegate(self,
+            ) -> IterNodeDelegateWindow[TContainerAny]:
+        return IterNode.get_delegate_window(self,
                 axis=axis,
                 size=size,
                 step=step,
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+from collections import deque
 from functools import partial
-from itertools import chain
 from itertools import repeat
 from itertools import zip_longest
 
 import numpy as np
 import typing_extensions as tp
 
+from static_frame.core.axis_map import axis_index_from_bytes
+from static_frame.core.axis_map import axis_index_to_bytes
 from static_frame.core.axis_map import bus_to_hierarchy
 from static_frame.core.axis_map import get_extractor
 from static_frame.core.bus import Bus
 from static_frame.core.container import ContainerBase
+from static_frame.core.container_util import axis_window_bounds
 from static_frame.core.container_util import axis_window_items
 from static_frame.core.container_util import iter_component_signature_bytes
 from static_frame.core.display import Display
@@ -24,6 +27,7 @@ from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.exception import ErrorInitQuilt
 from static_frame.core.exception import NotImplementedAxis
+from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.hloc import HLoc
 from static_frame.core.index_auto import IndexAutoConstructorFactory
@@ -40,6 +44,7 @@ from static_frame.core.node_selector import InterGetItemLocCompoundReduces
 from static_frame.core.series import Series
 from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
+from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
@@ -51,8 +56,11 @@ from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
 from static_frame.core.style_config import StyleConfig
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import EMPTY_SLICE
 from static_frame.core.util import INT_TYPES
 from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TILocSelector
 from static_frame.core.util import TILocSelectorCompound
@@ -77,6 +85,8 @@ TSeriesAny = Series[tp.Any, tp.Any]
 TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]]
 TBusAny = Bus[tp.Any]
 TYarnAny = Yarn[tp.Any]
+# the TypeBlocks of a contributing Frame, the name of the Frame, and the name of its index on the axis of concatenation
+TQuiltPart = tp.Tuple[TypeBlocks, TName, TName]
 
 class Quilt(ContainerBase, StoreClientMixin):
     '''
@@ -195,9 +205,25 @@ class Quilt(ContainerBase, StoreClientMixin):
                 config=config,
                 max_persist=max_persist, # None is default
                 )
+        axis_hierarchy = None
+        axis_opposite = None
+        src = store.read_axis_index()
+        if src is not None:
+            axis_stored, depths, hierarchy, opposite = axis_index_from_bytes(src)
+            config_default = StoreConfigMap.from_initializer(config).default
+            # use stored labels only if they were written for this axis and for the Frames in the store, and if Frames are read with the depths with which they were written
+            if (axis_stored == axis
+                    and (depths is None
+                    or depths == (config_default.index_depth, config_default.columns_depth))
+                    and [label for label, _ in hierarchy.label_widths_at_depth(0)] == list(bus.index)):
+                axis_hierarchy = hierarchy
+                axis_opposite = opposite
+
         return cls(bus,
                 axis=axis,
                 retain_labels=retain_labels,
+                axis_hierarchy=axis_hierarchy,
+                axis_opposite=axis_opposite,
                 deepcopy_from_bus=deepcopy_from_bus,
                 )
 
@@ -768,6 +794,40 @@ class Quilt(ContainerBase, StoreClientMixin):
         '''
         yield from self._bus.items()
 
+    def _to_store(self,
+            store: Store,
+            *,
+            config: StoreConfigMapInitializer,
+            **kwargs: tp.Any,
+            ) -> None:
+        '''Write all :obj:`Frame` to `store`; if ``write_axis_index`` is set on the default :obj:`StoreConfig`, also write the labels of both axes.
+        '''
+        config = self._filter_config(config)
+        config_default = StoreConfigMap.from_initializer(config).default
+        src = None
+        if config_default.write_axis_index:
+            if self._assign_axis:
+                self._update_axis_labels()
+            assert self._axis_hierarchy is not None and self._axis_opposite is not None #mypy
+
+            depths = None
+            if store.labels_from_config(config_default):
+                if not config_default.include_index or not config_default.include_columns:
+                    raise StoreParameterConflict('cannot write_axis_index when include_index or include_columns is False with this Store')
+                depth_axis = self._axis_hierarchy.depth - 1
+                depth_opposite = self._axis_opposite.depth
+                depths = ((depth_axis, depth_opposite) if self._axis == 0
+                        else (depth_opposite, depth_axis))
+            # encode before writing Frames such that encoding errors do not leave a partial store
+            src = axis_index_to_bytes(
+                    self._axis,
+                    self._axis_hierarchy,
+                    self._axis_opposite,
+                    depths,
+                    )
+        store.write(self._items_store(), config=config, **kwargs)
+        if src is not None:
+            store.write_axis_index(src)
 
     #---------------------------------------------------------------------------
     # axis iterators
@@ -854,6 +914,98 @@ class Quilt(ContainerBase, StoreClientMixin):
         yield from zip(keys, self._axis_series(axis=axis))
 
     #---------------------------------------------------------------------------
+    def _axis_window_stream(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[TCallableAny] = None,
+            window_valid: tp.Optional[TCallableAny] = None,
+            label_shift: int = 0,
+            label_missing_skips: bool = True,
+            label_missing_raises: bool = False,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            as_array: bool = False,
+            derive_label: bool = True,
+            ) -> tp.Iterator[tp.Tuple[TLabel, tp.Any]]:
+        '''Generator of index, processed-window pairs for windows along the axis of concatenation. Each :obj:`Frame` is loaded from the :obj:`Bus` once, in order; of previously loaded :obj:`Frame`, only the trailing portion needed by windows straddling :obj:`Frame` is retained.
+        '''
+        assert axis == self._axis
+        if self._assign_axis:
+            self._update_axis_labels()
+        assert self._axis_hierarchy is not None #mypy
+
+        labels = self._index if axis == 0 else self._columns
+        starts, stops, label_positions = axis_window_bounds(
+                count_labels=len(labels),
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                label_missing_skips=label_missing_skips,
+                label_missing_raises=label_missing_raises,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
+
+        def slice_blocks(blocks: TypeBlocks, key: slice) -> TypeBlocks:
+            if axis == 0:
+                return blocks._extract(row_key=key)
+            return blocks._extract(column_key=key)
+
+        frame_widths = self._axis_hierarchy.label_widths_at_depth(0)
+        # parts retained for subsequent windows, each with the position of its first element; as window starts never decrease, only the first part can precede a window
+        retained: tp.Deque[tp.Tuple[int, TQuiltPart]] = deque()
+        loaded_stop = 0
+
+        for start, stop, label_position in zip(starts, stops, label_positions):
+            while retained and retained[0][0] + retained[0][1][0].shape[axis] <= start:
+                retained.popleft()
+
+            while loaded_stop < stop:
+                label, width = next(frame_widths)
+                if loaded_stop + width <= start: # a Frame skipped by all windows is not loaded
+                    loaded_stop += width
+                    continue
+                if retained and retained[0][0] < start:
+                    # retain a copy of only the needed portion, such that arrays of a previously loaded Frame are not referenced after it is released by the Bus
+                    pos, (blocks, name, axis_name) = retained.popleft()
+                    tail = slice_blocks(blocks, slice(start - pos, None))
+                    tail = TypeBlocks.from_blocks(
+                            (b.copy() for b in tail._blocks),
+                            shape_reference=tail.shape,
+                            )
+                    retained.appendleft((start, (tail, name, axis_name)))
+                frame = tp.cast(TFrameAny, self._bus.loc[label])
+                axis_name = frame._index.name if axis == 0 else frame._columns.name
+                retained.append((loaded_stop, (frame._blocks, frame._name, axis_name)))
+                loaded_stop += width
+
+            parts: tp.List[TQuiltPart] = []
+            for pos, (blocks, name, axis_name) in retained:
+                if pos >= stop:
+                    break
+                length = blocks.shape[axis]
+                key = slice(max(start - pos, 0), min(stop - pos, length))
+                if key.start or key.stop != length:
+                    blocks = slice_blocks(blocks, key)
+                parts.append((blocks, name, axis_name))
+
+            window: tp.Any = self._parts_to_frame(parts, slice(start, stop), NULL_SLICE)
+            if as_array:
+                window = window._blocks.values
+
+            if window_valid and not window_valid(window):
+                continue
+
+            label = None
+            if derive_label and label_position >= 0:
+                label = labels.iloc[label_position]
+            if window_func:
+                window = window_func(window)
+            yield label, window
+
     def _axis_window_items(self, *,
             size: int,
             axis: int = 0,
@@ -870,9 +1022,13 @@ class Quilt(ContainerBase, StoreClientMixin):
             ) -> tp.Iterator[tp.Tuple[TLabel, tp.Any]]:
         '''Generator of index, processed-window pairs.
         '''
-        # NOTE: this will use _extract, _extract_array to get results, thus we do not need an extractor
-        yield from axis_window_items(
-                source=self,
+        # NOTE: windows along the axis of concatenation are streamed from the Bus; otherwise, this will use _extract, _extract_array to get results, thus we do not need an extractor
+        func: tp.Callable[..., tp.Iterator[tp.Tuple[TLabel, tp.Any]]]
+        if axis == self._axis:
+            func = self._axis_window_stream
+        else:
+            func = partial(axis_window_items, source=self)
+        yield from func(
                 size=size,
                 axis=axis,
                 step=step,
@@ -902,8 +1058,12 @@ class Quilt(ContainerBase, StoreClientMixin):
             size_increment: int = 0,
             as_array: bool = False,
             ) -> tp.Iterator[TFrameAny]:
-        yield from (x for _, x in axis_window_items(
-                source=self,
+        func: tp.Callable[..., tp.Iterator[tp.Tuple[TLabel, tp.Any]]]
+        if axis == self._axis:
+            func = self._axis_window_stream
+        else:
+            func = partial(axis_window_items, source=self)
+        yield from (x for _, x in func(
                 size=size,
                 axis=axis,
                 step=step,
@@ -1003,6 +1163,98 @@ class Quilt(ContainerBase, StoreClientMixin):
         return concat_resolved(parts, axis=self._axis)
 
 
+    def _parts_to_frame(self,
+            parts: tp.Sequence[TQuiltPart],
+            sel_key: slice,
+            opposite_key: TILocSelectorMany,
+            ) -> TFrameAny:
+        '''
+        Given :obj:`TypeBlocks` of contributing :obj:`Frame`, each already sliced on both axes, with the name of each :obj:`Frame` and of its index on the axis of concatenation, form a :obj:`Frame`. If concatenating vertically, each output block is allocated once.
+        '''
+        # as with concatenation, retain a name shared by all components
+        axis_names = {axis_name for _, _, axis_name in parts}
+
+        if self._axis == 0:
+            index = self._index._extract_iloc(sel_key)
+            columns = self._columns._extract_iloc(opposite_key)
+            if len(axis_names) == 1:
+                index = index.rename(axis_names.pop())
+            if parts:
+                # NOTE: a new array is always allocated, thus no need for extractor
+                tb = TypeBlocks.from_blocks(
+                        TypeBlocks.vstack_blocks_to_blocks_allocated(
+                                [blocks for blocks, _, _ in parts]),
+                        shape_reference=(len(index), len(columns)),
+                        own_data=True,
+                        )
+            else:
+                tb = TypeBlocks.from_blocks((), shape_reference=(0, len(columns)))
+        else:
+            index = self._index._extract_iloc(opposite_key)
+            columns = self._columns._extract_iloc(sel_key)
+            if len(axis_names) == 1:
+                columns = columns.rename(axis_names.pop())
+            extractor = get_extractor(
+                    self._deepcopy_from_bus,
+                    is_array=True,
+                    memo_active=False,
+                    )
+            tb = TypeBlocks.from_blocks(
+                    (extractor(b) for blocks, _, _ in parts for b in blocks._blocks),
+                    shape_reference=(len(index), len(columns)),
+                    )
+
+        return Frame(tb,
+                index=index,
+                columns=columns,
+                name=parts[0][1] if len(parts) == 1 else None,
+                own_data=True,
+                own_index=True,
+                )
+
+    def _extract_range(self,
+            sel_key: slice,
+            opposite_key: TILocSelectorMany,
+            ) -> TFrameAny:
+        '''
+        Extract a :obj:`Frame` from a contiguous range along the axis of concatenation. Only the :obj:`TypeBlocks` of contributing :obj:`Frame` are sliced; no intermediary :obj:`Frame` are created.
+        '''
+        assert self._axis_hierarchy is not None #mypy
+
+        start, stop, _ = sel_key.indices(len(self._axis_hierarchy))
+        parts: tp.List[TQuiltPart] = []
+
+        if start >= stop and len(self._bus):
+            # no Frame contributes; take dtypes from an empty slice of the first Frame
+            frame_first = tp.cast(TFrameAny, self._bus.iloc[0])
+            if self._axis == 0:
+                blocks = frame_first._blocks._extract(row_key=EMPTY_SLICE, column_key=opposite_key)
+                parts.append((blocks, None, frame_first._index.name))
+            else:
+                blocks = frame_first._blocks._extract(row_key=opposite_key, column_key=EMPTY_SLICE)
+                parts.append((blocks, None, frame_first._columns.name))
+            return self._parts_to_frame(parts, sel_key, opposite_key)
+
+        frame_start = 0
+        for label, width in self._axis_hierarchy.label_widths_at_depth(0):
+            frame_stop = frame_start + width
+            if frame_stop > start and frame_start < stop:
+                sel_component = slice(max(start, frame_start) - frame_start,
+                        min(stop, frame_stop) - frame_start,
+                        )
+                frame = tp.cast(TFrameAny, self._bus.loc[label])
+                if self._axis == 0:
+                    blocks = frame._blocks._extract(row_key=sel_component, column_key=opposite_key)
+                    parts.append((blocks, frame._name, frame._index.name))
+                else:
+                    blocks = frame._blocks._extract(row_key=opposite_key, column_key=sel_component)
+                    parts.append((blocks, frame._name, frame._columns.name))
+            elif frame_start >= stop:
+                break
+            frame_start = frame_stop
+
+        return self._parts_to_frame(parts, sel_key, opposite_key)
+
     @tp.overload
     def _extract(self, row_key: TILocSelectorOne) -> TSeriesAny: ...
 
@@ -1046,25 +1298,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 )
 
         row_key = NULL_SLICE if row_key is None else row_key
-        row_key_is_array = isinstance(row_key, np.ndarray)
         column_key = NULL_SLICE if column_key is None else column_key
-        column_key_is_array = isinstance(column_key, np.ndarray)
-
-        if (not row_key_is_array and row_key == NULL_SLICE
-                and not column_key_is_array and column_key == NULL_SLICE):
-            if self._retain_labels and self._axis == 0:
-                frames = (extractor(f.relabel_level_add(index=k))
-                        for k, f in self._bus.items())
-            elif self._retain_labels and self._axis == 1:
-                frames = (extractor(f.relabel_level_add(columns=k))
-                        for k, f in self._bus.items())
-            else:
-                frames = (extractor(f) for _, f in self._bus.items())
-
-            return Frame.from_concat(
-                    frames,
-                    axis=self._axis,
-                    )
 
         parts: tp.List[tp.Any] = []
         frame_labels: tp.Iterable[TLabel]
@@ -1078,6 +1312,11 @@ class Quilt(ContainerBase, StoreClientMixin):
             sel_key = column_key
             opposite_key = row_key
 
+        if (sel_key.__class__ is slice
+                and sel_key.step in (None, 1) # type: ignore
+                and not isinstance(opposite_key, INT_TYPES)):
+            return self._extract_range(sel_key, opposite_key) # type: ignore
+
         sel_reduces = isinstance(sel_key, INT_TYPES)
 
         sel = np.full(len(self._axis_hierarchy), False)
@@ -1508,33 +1747,42 @@ class Quilt(ContainerBase, StoreClientMixin):
             self._update_axis_labels()
         return self._extract(NULL_SLICE, NULL_SLICE)
 
-    def _to_signature_bytes(self,
+    def _iter_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
             encoding: str = 'utf-8',
-            ) -> bytes:
+            ) -> tp.Iterator[TBytesLike]:
 
         if self._assign_axis:
             self._update_axis_labels()
 
-        return b''.join(chain(
-                iter_component_signature_bytes(self,
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                (self._axis_hierarchy._to_signature_bytes( #type: ignore
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                self._axis_opposite._to_signature_bytes( #type: ignore
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                self._bus._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),)
-                ))
+        yield from iter_component_signature_bytes(self,
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._axis_hierarchy._iter_signature_bytes( #type: ignore
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._axis_opposite._iter_signature_bytes( #type: ignore
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._bus._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+
+    def _to_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> bytes:
+
+        return b''.join(self._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding))
 
 
 doc_update(Quilt.__init__, selector='quilt_init')
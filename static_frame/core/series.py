@@ -28,6 +28,7 @@ from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_to_one
 from static_frame.core.container_util import is_fill_value_factory_initializer
+from static_frame.core.container_util import iter_array_signature_bytes
 from static_frame.core.container_util import iter_component_signature_bytes
 from static_frame.core.container_util import matmul
 from static_frame.core.container_util import pandas_to_numpy
@@ -85,6 +86,7 @@ from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import ManyToOneType
 from static_frame.core.util import TBoolOrBools
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TDepthLevel
 from static_frame.core.util import TDtypeSpecifier
@@ -3481,23 +3483,32 @@ class Series(ContainerOperand, tp.Generic[TVIndex, TVDtype]):
                 own_index=True,
                 )
 
+    def _iter_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> tp.Iterator[TBytesLike]:
+
+        yield from iter_component_signature_bytes(self,
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._index._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from iter_array_signature_bytes(self.values)
+
     def _to_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
             encoding: str = 'utf-8',
             ) -> bytes:
 
-        return b''.join(chain(
-                iter_component_signature_bytes(self,
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                (self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                self.values.tobytes(),)
-                ))
+        return b''.join(self._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding))
 
     #---------------------------------------------------------------------------
 
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import typing_extensions as tp
+
+from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import TName
+
+if tp.TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory  # pylint: disable=W0611 #pragma: no cover
+
+    from static_frame.core.frame import Frame  # pylint: disable=W0611,C0412 #pragma: no cover
+    from static_frame.core.index_base import IndexBase  # pylint: disable=W0611,C0412 #pragma: no cover
+
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] #pragma: no cover
+    TDtypeAny = np.dtype[tp.Any] #pragma: no cover
+    TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]] #pragma: no cover
+
+# offsets of arrays in a segment are aligned to this many bytes
+SHARED_MEMORY_ALIGN = 64
+
+# on Windows, a segment is destroyed when the last process that opened it closes it, such that a segment cannot outlive the worker that created it
+SHARED_MEMORY_PERSISTS = os.name != 'nt'
+
+# an array stored in a segment is described by its dtype, shape, and offset; arrays that cannot be stored in a segment (object arrays) or do not need to be (empty arrays) are included as is
+TBlockDescriptor = tp.Union['TNDArrayAny', tp.Tuple['TDtypeAny', tp.Tuple[int, ...], int]]
+
+
+class FrameSharedMemory(tp.NamedTuple):
+    '''
+    A picklable description of a :obj:`Frame` with block arrays stored in a shared memory segment. Used for returning :obj:`Frame` from worker processes without pickling block arrays.
+    '''
+    segment: tp.Optional[str]
+    blocks: tp.Tuple[TBlockDescriptor, ...]
+    index_: IndexBase
+    columns: IndexBase
+    name: TName
+    constructor: tp.Type[TFrameAny]
+
+
+class SharedMemoryArray:
+    '''
+    Provide the array interface of an array stored in a shared memory segment, retaining a reference to the segment. As an array created from this object retains this object as its base, the segment is closed only when all arrays that use it are garbage collected.
+    '''
+    __slots__ = (
+            '__array_interface__',
+            '_shm',
+            )
+
+    def __init__(self,
+            shm: SharedMemory,
+            address: int,
+            dtype: TDtypeAny,
+            shape: tp.Tuple[int, ...],
+            ) -> None:
+        self.__array_interface__ = dict(
+                shape=shape,
+                typestr=dtype.str,
+                descr=dtype.descr,
+                data=(address, True), # read-only
+                version=3,
+                )
+        self._shm = shm
+
+
+def shared_memory_prepare() -> None:
+    '''
+    Start the resource tracker of this process, if not already started, such that worker processes subsequently created share it. This must be called before creating a pool that will use :obj:`frame_to_shared_memory`: segments created by workers are then tracked by a process that outlives the workers, and are unlinked on exit if never received.
+    '''
+    from multiprocessing import resource_tracker
+    resource_tracker.ensure_running()
+
+
+def frame_to_shared_memory(frame: TFrameAny) -> FrameSharedMemory:
+    '''
+    Copy the block arrays of ``frame`` into a new shared memory segment, returning a picklable :obj:`FrameSharedMemory`. The segment must be received with :obj:`frame_from_shared_memory`. Where a segment cannot outlive this process (on Windows), block arrays are not stored in a segment and are pickled.
+    '''
+    from multiprocessing.shared_memory import SharedMemory
+
+    blocks: tp.List[TBlockDescriptor] = []
+    size = 0
+    for array in frame._blocks._blocks:
+        if array.dtype.kind == DTYPE_OBJECT_KIND or array.nbytes == 0 or not SHARED_MEMORY_PERSISTS:
+            blocks.append(array)
+            continue
+        blocks.append((array.dtype, array.shape, size))
+        size += -(-array.nbytes // SHARED_MEMORY_ALIGN) * SHARED_MEMORY_ALIGN
+
+    segment = None
+    if size:
+        shm = SharedMemory(create=True, size=size)
+        try:
+            for array, block in zip(frame._blocks._blocks, blocks):
+                if not isinstance(block, np.ndarray):
+                    dst: TNDArrayAny = np.ndarray(array.shape,
+                            dtype=array.dtype,
+                            buffer=shm.buf,
+                            offset=block[2],
+                            )
+                    dst[...] = array
+                    del dst # release the buffer
+            segment = shm.name
+        finally:
+            shm.close()
+
+    return FrameSharedMemory(
+            segment=segment,
+            blocks=tuple(blocks),
+            index_=frame._index,
+            columns=frame._columns,
+            name=frame._name,
+            constructor=frame.__class__,
+            )
+
+
+def frame_from_shared_memory(payload: FrameSharedMemory) -> TFrameAny:
+    '''
+    Create a :obj:`Frame` from a :obj:`FrameSharedMemory`, using block arrays that are immutable views of the shared memory segment. The segment is unlinked, such that its memory is released when all arrays that use it are garbage collected.
+    '''
+    from multiprocessing.shared_memory import SharedMemory
+
+    from static_frame.core.type_blocks import TypeBlocks
+
+    if payload.segment is not None:
+        shm = SharedMemory(name=payload.segment)
+        shm.unlink()
+        # NOTE: take the address without retaining an export of the buffer, such that the segment can be closed when no longer referenced
+        address = np.frombuffer(shm.buf, dtype=np.uint8).ctypes.data
+
+    blocks: tp.List[TNDArrayAny] = []
+    for block in payload.blocks:
+        if isinstance(block, np.ndarray):
+            blocks.append(block)
+        else:
+            dtype, shape, offset = block
+            blocks.append(np.asarray(SharedMemoryArray(shm, address + offset, dtype, shape)))
+
+    tb = TypeBlocks.from_blocks(blocks,
+            shape_reference=(len(payload.index_), len(payload.columns)),
+            )
+    return payload.constructor(tb,
+            index=payload.index_,
+            columns=payload.columns,
+            name=payload.name,
+            own_data=True,
+            own_index=True,
+            own_columns=True,
+            )
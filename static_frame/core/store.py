@@ -56,6 +56,8 @@ def store_coherent_write(f: TCallableAny) -> TCallableAny:
 class Store:
 
     _EXT: tp.FrozenSet[str]
+    # name of the member or table in which the axis labels of a Quilt are stored
+    _AXIS_INDEX_NAME = '__axis_index__'
 
     __slots__ = (
             '_fp',
@@ -258,7 +260,7 @@ class Store:
         return next(self.read_many((label,), config=config, container_type=container_type))
 
     def write(self,
-            items: tp.Iterable[tp.Tuple[str, TFrameAny]],
+            items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
             *,
             config: StoreConfigMapInitializer = None
             ) -> None:
@@ -272,3 +274,22 @@ class Store:
             ) -> tp.Iterator[TLabel]:
         raise NotImplementedError() #pragma: no cover
 
+    def write_axis_index(self, src: bytes) -> None:
+        '''Write the encoded axis labels of a :obj:`Quilt`, as returned by ``axis_index_to_bytes``, to an existing Store, such that a :obj:`Quilt` can be created without reading any Frame.
+        '''
+        raise NotImplementedError(f'{self.__class__.__name__} does not support writing an axis index')
+
+    def read_axis_index(self) -> tp.Optional[bytes]:
+        '''Return the encoded axis labels of a :obj:`Quilt` written with ``write_axis_index``, or None if not written or not supported.
+        '''
+        return None
+
+    def labels_from_config(self, config: StoreConfig) -> bool:
+        '''Return True if the labels of a Frame written with ``config`` are read as determined by the ``index_depth`` and ``columns_depth`` of the config used to read it, rather than as written.
+        '''
+        return True
+
+    def release(self, labels: tp.Iterable[TLabel]) -> None:
+        '''Release resources, such as memory maps, held for Frames, given by `labels`, that are no longer retained by a client. By default, no resources are held.
+        '''
+
@@ -5,9 +5,11 @@ import zipfile
 import typing_extensions as tp
 
 from static_frame.core.doc_str import doc_inject
+from static_frame.core.store import Store
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.store_hdf5 import StoreHDF5
+from static_frame.core.store_npy import StoreNPY
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
 from static_frame.core.store_zip import StoreZipCSV
@@ -44,6 +46,16 @@ class StoreClientMixin:
         # Yarn does not have a _config attr
         return getattr(self, '_config', None)
 
+    def _to_store(self,
+            store: Store,
+            *,
+            config: StoreConfigMapInitializer,
+            **kwargs: tp.Any,
+            ) -> None:
+        '''Write all items to `store`; `kwargs` are passed to the `write()` method of the Store.
+        '''
+        store.write(self._items_store(), config=self._filter_config(config), **kwargs)
+
     #---------------------------------------------------------------------------
     # exporters
 
@@ -60,8 +72,7 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreZipTSV(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config, compression=compression)
+        self._to_store(store, config=config, compression=compression)
 
     @doc_inject(selector='store_client_exporter')
     def to_zip_csv(self,
@@ -76,8 +87,7 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreZipCSV(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config, compression=compression)
+        self._to_store(store, config=config, compression=compression)
 
     @doc_inject(selector='store_client_exporter')
     def to_zip_pickle(self,
@@ -92,8 +102,7 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreZipPickle(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config, compression=compression)
+        self._to_store(store, config=config, compression=compression)
 
     @doc_inject(selector='store_client_exporter')
     def to_zip_npz(self,
@@ -108,8 +117,7 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreZipNPZ(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config, compression=compression)
+        self._to_store(store, config=config, compression=compression)
 
     @doc_inject(selector='store_client_exporter')
     def to_zip_npy(self,
@@ -124,8 +132,21 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreZipNPY(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config, compression=compression)
+        self._to_store(store, config=config, compression=compression)
+
+    @doc_inject(selector='store_client_exporter')
+    def to_npy(self,
+            fp: TPathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            ) -> None:
+        '''
+        Write the complete :obj:`Bus` as a directory of NPY directories.
+
+        {args}
+        '''
+        store = StoreNPY(fp)
+        self._to_store(store, config=config)
 
     @doc_inject(selector='store_client_exporter')
     def to_zip_parquet(self,
@@ -140,8 +161,7 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreZipParquet(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config, compression=compression)
+        self._to_store(store, config=config, compression=compression)
 
     @doc_inject(selector='store_client_exporter')
     def to_xlsx(self,
@@ -155,8 +175,7 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreXLSX(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config)
+        self._to_store(store, config=config)
 
     @doc_inject(selector='store_client_exporter')
     def to_sqlite(self,
@@ -170,8 +189,7 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreSQLite(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config)
+        self._to_store(store, config=config)
 
     @doc_inject(selector='store_client_exporter')
     def to_hdf5(self,
@@ -185,5 +203,4 @@ class StoreClientMixin:
         {args}
         '''
         store = StoreHDF5(fp)
-        config = self._filter_config(config)
-        store.write(self._items_store(), config=config)
+        self._to_store(store, config=config)
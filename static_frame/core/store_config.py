@@ -31,6 +31,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     skip_header: int
     skip_footer: int
     trim_nadir: bool
+    memory_map: bool
     include_index: bool
     include_index_name: bool
     include_columns: bool
@@ -38,8 +39,13 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     merge_hierarchical_labels: bool
     read_max_workers: tp.Optional[int]
     read_chunksize: int
+    read_shared_memory: bool
     write_max_workers: tp.Optional[int]
     write_chunksize: int
+    write_axis_index: bool
+    write_bulk: bool
+    write_pragmas: tp.Optional[tp.Mapping[str, tp.Union[str, int]]]
+    write_npy_blob: bool
     mp_context: tp.Optional[str]
     _hash: tp.Optional[int]
 
@@ -56,6 +62,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'skip_header',
             'skip_footer',
             'trim_nadir',
+            'memory_map',
             'include_index',
             'include_index_name',
             'include_columns',
@@ -63,8 +70,13 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'merge_hierarchical_labels',
             'read_max_workers',
             'read_chunksize',
+            'read_shared_memory',
             'write_max_workers',
             'write_chunksize',
+            'write_axis_index',
+            'write_bulk',
+            'write_pragmas',
+            'write_npy_blob',
             'mp_context',
             '_hash'
             )
@@ -84,6 +96,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             skip_header: int = 0,
             skip_footer: int = 0,
             trim_nadir: bool = False,
+            memory_map: bool = False,
             # exporters
             include_index: bool = True,
             include_index_name: bool = True,
@@ -94,14 +107,25 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             # multiprocessing configuration
             read_max_workers: tp.Optional[int] = None,
             read_chunksize: int = 1,
+            read_shared_memory: bool = False,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            write_axis_index: bool = False,
+            write_bulk: bool = False,
+            write_pragmas: tp.Optional[tp.Mapping[str, tp.Union[str, int]]] = None,
+            write_npy_blob: bool = False,
             mp_context: tp.Optional[str] = None,
             ):
         '''
         Args:
             include_index: Boolean to determine if the ``index`` is included in output.
             include_columns: Boolean to determine if the ``columns`` is included in output.
+            memory_map: Boolean to determine if arrays are memory mapped, rather than read, when supported by the store.
+            read_shared_memory: Boolean to determine if, when reading with ``read_max_workers``, worker processes return block arrays in shared memory, rather than pickled, when supported by the store.
+            write_axis_index: Boolean to determine if, when writing a :obj:`Quilt` to a ZIP or SQLite store, the labels of both axes of the :obj:`Quilt` are also written, such that a :obj:`Quilt` can be created from the store without reading any :obj:`Frame`. For stores that read labels as determined by the config, the stored labels are used only if the ``index_depth`` and ``columns_depth`` of the config used to read match those of the written :obj:`Frame`.
+            write_bulk: Boolean to determine if, when writing to a SQLite store, tables are bulk loaded: durability pragmas are relaxed, rows are committed in chunks, and primary keys are replaced by unique indices created after all rows are inserted. As journaling is disabled, a failed write can leave the file corrupt.
+            write_pragmas: A mapping of SQLite pragma names to values applied before writing to a SQLite store; if ``write_bulk`` is set, these update the default bulk-load pragmas.
+            write_npy_blob: Boolean to determine if, when writing to a SQLite store, each :obj:`Frame` is stored as a table of NPY-encoded BLOBs, one per block and per depth of index and columns, rather than as a table of rows. Such tables are read without parsing values, and without using constructor parameters of the config.
         '''
         # constructor
         self.index_depth = index_depth
@@ -116,6 +140,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
         self.skip_header = skip_header
         self.skip_footer = skip_footer
         self.trim_nadir = trim_nadir
+        self.memory_map = memory_map
 
         # exporter
         self.include_index = include_index
@@ -128,8 +153,13 @@ class StoreConfigHE(metaclass=InterfaceMeta):
 
         self.read_max_workers = read_max_workers
         self.read_chunksize = read_chunksize
+        self.read_shared_memory = read_shared_memory
         self.write_max_workers = write_max_workers
         self.write_chunksize = write_chunksize
+        self.write_axis_index = write_axis_index
+        self.write_bulk = write_bulk
+        self.write_pragmas = write_pragmas
+        self.write_npy_blob = write_npy_blob
         self.mp_context = mp_context
         self._hash = None
 
@@ -179,6 +209,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self.skip_header, # int
                     self.skip_footer, # int
                     self.trim_nadir, # bool
+                    self.memory_map, # bool
                     self.include_index, # bool
                     self.include_index_name, # bool
                     self.include_columns, # bool
@@ -186,8 +217,13 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self.merge_hierarchical_labels, # bool
                     self.read_max_workers, # Optional[int]
                     self.read_chunksize, # int
+                    self.read_shared_memory, # bool
                     self.write_max_workers, # Optional[int]
                     self.write_chunksize, # int
+                    self.write_axis_index, # bool
+                    self.write_bulk, # bool
+                    self.write_pragmas if self.write_pragmas is None else tuple(self.write_pragmas.items()),
+                    self.write_npy_blob, # bool
                     self.mp_context,
             ))
         return self._hash
@@ -235,6 +271,7 @@ class StoreConfig(StoreConfigHE):
             skip_header: int = 0,
             skip_footer: int = 0,
             trim_nadir: bool = False,
+            memory_map: bool = False,
             include_index: bool = True,
             include_index_name: bool = True,
             include_columns: bool = True,
@@ -244,8 +281,13 @@ class StoreConfig(StoreConfigHE):
             label_decoder: tp.Optional[tp.Callable[[str], TLabel]] = None,
             read_max_workers: tp.Optional[int] = None,
             read_chunksize: int = 1,
+            read_shared_memory: bool = False,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            write_axis_index: bool = False,
+            write_bulk: bool = False,
+            write_pragmas: tp.Optional[tp.Mapping[str, tp.Union[str, int]]] = None,
+            write_npy_blob: bool = False,
             mp_context: tp.Optional[str] = None,
             ):
         StoreConfigHE.__init__(self,
@@ -261,6 +303,7 @@ class StoreConfig(StoreConfigHE):
                 skip_header=skip_header,
                 skip_footer=skip_footer,
                 trim_nadir=trim_nadir,
+                memory_map=memory_map,
                 include_index=include_index,
                 include_index_name=include_index_name,
                 include_columns=include_columns,
@@ -268,8 +311,13 @@ class StoreConfig(StoreConfigHE):
                 merge_hierarchical_labels=merge_hierarchical_labels,
                 read_max_workers=read_max_workers,
                 read_chunksize=read_chunksize,
+                read_shared_memory=read_shared_memory,
                 write_max_workers=write_max_workers,
                 write_chunksize=write_chunksize,
+                write_axis_index=write_axis_index,
+                write_bulk=write_bulk,
+                write_pragmas=write_pragmas,
+                write_npy_blob=write_npy_blob,
                 mp_context=mp_context,
         )
         self.label_encoder = label_encoder
@@ -328,10 +376,15 @@ class StoreConfigMap:
     _ALIGN_WITH_DEFAULT_ATTRS = (
             'label_encoder',
             'label_decoder',
+            'memory_map',
             'read_max_workers',
             'read_chunksize',
+            'read_shared_memory',
             'write_max_workers',
             'write_chunksize',
+            'write_axis_index',
+            'write_bulk',
+            'write_pragmas',
     )
 
     @classmethod
@@ -162,6 +162,20 @@ class StoreFilter(metaclass=InterfaceMeta):
                 (-np.inf, tuple(self.to_neginf)),
                 )
 
+    def __getstate__(self) -> tp.Tuple[None, tp.Dict[str, tp.Any]]:
+        # derived attributes hold lambdas that cannot be pickled; only retain constructor arguments and rebuild on __setstate__
+        return (
+            None,
+            {
+                attr: getattr(self, attr)
+                for attr in self.__slots__
+                if not attr.startswith('_')
+            }
+        )
+
+    def __setstate__(self, state: tp.Tuple[None, tp.Dict[str, tp.Any]]) -> None:
+        self.__init__(**state[1]) # type: ignore
+
     # --------------------------------------------------------------------------
     # converting from types (in memory) to data store
 
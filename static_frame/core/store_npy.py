@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+import typing_extensions as tp
+
+from static_frame.core.archive_npy import Archive
+from static_frame.core.archive_npy import ArchiveDirectory
+from static_frame.core.archive_npy import NPYFrameConverter
+from static_frame.core.exception import ErrorNPYEncode
+from static_frame.core.frame import Frame
+from static_frame.core.store import Store
+from static_frame.core.store import store_coherent_non_write
+from static_frame.core.store import store_coherent_write
+from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_config import StoreConfigMap
+from static_frame.core.store_config import StoreConfigMapInitializer
+from static_frame.core.util import NOT_IN_CACHE_SENTINEL
+from static_frame.core.util import TLabel
+from static_frame.core.util import TPathSpecifier
+
+TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]]
+
+
+class StoreNPY(Store):
+    '''A directory of NPY directories, one per Frame, where Frames are loaded with memory maps. Memory maps are closed when Frames are released by a client (if no longer referenced by any array), such that only pages of the file system cache are used by loaded Frames.
+    '''
+    _EXT: tp.FrozenSet[str] = frozenset(('', '.npy'))
+    FILE_LABELS = '__labels__.json'
+
+    def __init__(self, fp: TPathSpecifier):
+        Store.__init__(self, fp)
+        self._archives: tp.Dict[TLabel, Archive] = {}
+
+    def __setstate__(self, state: tp.Tuple[None, tp.Dict[str, tp.Any]]) -> None:
+        Store.__setstate__(self, state)
+        self._archives = {}
+
+    @store_coherent_write
+    def write(self,
+            items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
+            *,
+            config: StoreConfigMapInitializer = None,
+            ) -> None:
+        config_map = StoreConfigMap.from_initializer(config)
+
+        # as with ArchiveDirectory, an error in writing will remove the entire directory, so the directory must be newly created
+        if os.path.exists(self._fp):
+            raise RuntimeError(f'Atttempting to write to an existant directory: {self._fp}')
+        os.mkdir(self._fp)
+
+        try:
+            names = []
+            for label, frame in items:
+                c: StoreConfig = config_map[label]
+                name = config_map.default.label_encode(label)
+                NPYFrameConverter.to_archive(
+                        frame=frame,
+                        fp=os.path.join(self._fp, name),
+                        include_index=c.include_index,
+                        include_columns=c.include_columns,
+                        consolidate_blocks=c.consolidate_blocks,
+                        )
+                names.append(name)
+            # directory listings are not ordered; retain the order of labels
+            with open(os.path.join(self._fp, self.FILE_LABELS), 'w', encoding='utf-8') as f:
+                json.dump(names, f)
+        except ErrorNPYEncode:
+            shutil.rmtree(self._fp)
+            raise
+
+    @store_coherent_non_write
+    def labels(self, *,
+            config: StoreConfigMapInitializer = None,
+            strip_ext: bool = True, # not used
+            ) -> tp.Iterator[TLabel]:
+        config_map = StoreConfigMap.from_initializer(config)
+
+        with open(os.path.join(self._fp, self.FILE_LABELS), encoding='utf-8') as f:
+            names = json.load(f)
+        yield from (config_map.default.label_decode(name) for name in names)
+
+    @store_coherent_non_write
+    def read_many(self,
+            labels: tp.Iterable[TLabel],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[TFrameAny] = Frame,
+            ) -> tp.Iterator[TFrameAny]:
+        config_map = StoreConfigMap.from_initializer(config)
+
+        for label in labels:
+            cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+            if cache_lookup is not NOT_IN_CACHE_SENTINEL:
+                if cache_lookup.__class__ is not container_type:
+                    yield cache_lookup._to_frame(container_type) # type: ignore
+                else:
+                    yield cache_lookup # type: ignore
+                continue
+
+            archive = ArchiveDirectory(
+                    os.path.join(self._fp, config_map.default.label_encode(label)),
+                    writeable=False,
+                    memory_map=True,
+                    )
+            frame = NPYFrameConverter.frame_decode(
+                    archive=archive,
+                    constructor=container_type,
+                    )
+            self.release((label,)) # if not released by a client
+            self._archives[label] = archive
+            self._weak_cache[label] = frame
+            yield frame
+
+    def release(self, labels: tp.Iterable[TLabel]) -> None:
+        '''Release memory maps of Frames, given by `labels`, such that each is closed when the last array that uses it is garbage collected.
+        '''
+        for label in labels:
+            archive = self._archives.pop(label, None)
+            if archive is not None:
+                archive.release()
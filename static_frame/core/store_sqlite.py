@@ -1,34 +1,52 @@
 from __future__ import annotations
 
 import os
+import pathlib
 import sqlite3
+import threading
 from contextlib import suppress
 from fractions import Fraction
 
 import numpy as np
 import typing_extensions as tp
 
+from static_frame.core.archive_npy import ArchiveFrameConverter
+from static_frame.core.archive_npy import ArchiveSQLiteWrapper
 # from static_frame.core.doc_str import doc_inject
 from static_frame.core.frame import Frame
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
+from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
 from static_frame.core.util import DTYPE_INEXACT_KINDS
 from static_frame.core.util import DTYPE_INT_KINDS
 from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import INT64_MAX
 from static_frame.core.util import TLabel
 
 if tp.TYPE_CHECKING:
     TDtypeAny = np.dtype[tp.Any] #pragma: no cover
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] #pragma: no cover
 TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]]
 
 class StoreSQLite(Store):
 
     _EXT: tp.FrozenSet[str] =  frozenset(('.db', '.sqlite'))
     _BYTES_ONE = b'1'
+    # a table of the labels of tables written with StoreConfig.write_npy_blob
+    _NPY_TABLES_NAME = '__npy_tables__'
+    # number of rows converted to tuples, and inserted, at a time; with StoreConfig.write_bulk, rows are committed after each chunk
+    _WRITE_ROWS = 16_384
+    # pragmas applied with StoreConfig.write_bulk; as a failed write removes the file before writing again, durability is not needed
+    _BULK_PRAGMAS: tp.Mapping[str, tp.Union[str, int]] = {
+            'journal_mode': 'OFF',
+            'synchronous': 'OFF',
+            'cache_size': -262_144, # in KiB
+            }
 
     @staticmethod
     def _dtype_to_affinity_type(
@@ -48,14 +66,45 @@ class StoreSQLite(Store):
             return 'REAL'
         return 'NONE'
 
+    @classmethod
+    def _iter_row_chunks(cls,
+            *,
+            frame: TFrameAny,
+            include_index: bool,
+            ) -> tp.Iterator[tp.List[tp.Tuple[tp.Any, ...]]]:
+        '''
+        Yield lists of row tuples, of at most ``_WRITE_ROWS`` rows. Each block is converted to Python objects with ``tolist()``, rather than creating an array, and numpy scalars, per row.
+        '''
+        arrays: tp.List[TNDArrayAny] = []
+        if include_index:
+            index = frame._index
+            arrays.extend(index.values_at_depth(d) for d in range(index.depth))
+        arrays.extend(frame._blocks._blocks)
+
+        for i, array in enumerate(arrays):
+            # SQLite INTEGER is a signed 64-bit integer: uint64 values that exceed it are stored as REAL
+            if array.dtype.kind == 'u' and array.dtype.itemsize == 8 and array.size and array.max() > INT64_MAX:
+                arrays[i] = array.astype(DTYPE_FLOAT_DEFAULT)
+
+        for start in range(0, frame._blocks.shape[0], cls._WRITE_ROWS):
+            columns: tp.List[tp.List[tp.Any]] = []
+            for array in arrays:
+                part = array[start: start + cls._WRITE_ROWS]
+                if part.ndim == 1:
+                    columns.append(part.tolist())
+                else:
+                    columns.extend(part.T.tolist())
+            yield list(zip(*columns))
+
     @classmethod
     def _frame_to_table(cls,
             *,
             frame: TFrameAny,
             label: str, # can be None
-            cursor: sqlite3.Cursor,
+            connection: sqlite3.Connection,
             include_columns: bool,
             include_index: bool,
+            bulk: bool = False,
             # store_filter: tp.Optional[StoreFilter]
             ) -> None:
 
@@ -72,20 +121,22 @@ class StoreSQLite(Store):
         index = frame._index
         # columns = frame._columns
 
-        if not include_index:
+        field_types = [cls._dtype_to_affinity_type(dtype) for dtype in dtypes]
+
+        # in bulk mode, a unique index is created after inserting, unless the primary key is a single INTEGER field, which is an alias of the rowid and does not need an index
+        defer_primary_key = bulk and include_index and not (
+                index.depth == 1 and field_types[0] == 'INTEGER')
+
+        primary_fields = ', '.join(field_names[:index.depth])
+        if not include_index or defer_primary_key:
             create_primary_key = ''
         else:
-            primary_fields = ', '.join(field_names[:index.depth])
             # need leading comma
             create_primary_key = f', PRIMARY KEY ({primary_fields})'
 
-        field_name_to_field_type = (
-                (field, cls._dtype_to_affinity_type(dtype))
-                for field, dtype in zip(field_names, dtypes)
-                )
-
-        create_fields = ', '.join(f'{k} {v}' for k, v in field_name_to_field_type)
+        create_fields = ', '.join(f'{k} {v}' for k, v in zip(field_names, field_types))
         create = f'CREATE TABLE "{label}" ({create_fields}{create_primary_key})'
+        cursor = connection.cursor()
         cursor.execute(create)
 
         # works for IndexHierarchy too
@@ -93,8 +144,43 @@ class StoreSQLite(Store):
         insert_template = ', '.join('?' for _ in field_names)
         insert = f'INSERT INTO "{label}" ({insert_fields}) VALUES ({insert_template})'
 
-        values = cls._get_row_iterator(frame=frame, include_index=include_index)
-        cursor.executemany(insert, values())
+        for rows in cls._iter_row_chunks(frame=frame, include_index=include_index):
+            cursor.executemany(insert, rows)
+            if bulk:
+                connection.commit()
+
+        if defer_primary_key:
+            cursor.execute(f'CREATE UNIQUE INDEX "{label}_primary_key" ON "{label}" ({primary_fields})')
+
+    @classmethod
+    def _frame_to_npy_table(cls,
+            *,
+            frame: TFrameAny,
+            label: str,
+            connection: sqlite3.Connection,
+            include_columns: bool,
+            include_index: bool,
+            consolidate_blocks: bool,
+            ) -> None:
+        '''
+        Write a table of NPY-encoded BLOBs, one row per array, as done for NPY archives, and record the label in the table of NPY tables.
+        '''
+        connection.execute(f'CREATE TABLE IF NOT EXISTS "{cls._NPY_TABLES_NAME}" (label TEXT PRIMARY KEY)')
+        connection.execute(f'INSERT INTO "{cls._NPY_TABLES_NAME}" (label) VALUES (?)', (label,))
+        connection.execute(f'CREATE TABLE "{label}" (name TEXT PRIMARY KEY, value BLOB)')
+
+        archive = ArchiveSQLiteWrapper(connection,
+                writeable=True,
+                memory_map=False,
+                )
+        archive.prefix = label
+        ArchiveFrameConverter.frame_encode(
+                archive=archive,
+                frame=frame,
+                include_index=include_index,
+                include_columns=include_columns,
+                consolidate_blocks=consolidate_blocks,
+                )
 
     @store_coherent_write
     def write(self,
@@ -120,25 +206,145 @@ class StoreSQLite(Store):
         with suppress(FileNotFoundError):
             os.remove(self._fp)
 
+        pragmas: tp.Dict[str, tp.Union[str, int]] = {}
+        if config_map.default.write_bulk:
+            pragmas.update(self._BULK_PRAGMAS)
+        if config_map.default.write_pragmas:
+            pragmas.update(config_map.default.write_pragmas)
+
         # hierarchical columns might be stored as tuples
         with sqlite3.connect(self._fp, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            cursor = conn.cursor()
+            for name, value in pragmas.items():
+                conn.execute(f'PRAGMA {name} = {value}')
+
             for label, frame in items:
                 c = config_map[label]
 
                 # if label is STORE_LABEL_DEFAULT this will raise
                 label = config_map.default.label_encode(label)
 
+                if c.write_npy_blob:
+                    self._frame_to_npy_table(frame=frame,
+                            label=label,
+                            connection=conn,
+                            include_columns=c.include_columns,
+                            include_index=c.include_index,
+                            consolidate_blocks=c.consolidate_blocks,
+                            )
+                    continue
+
                 self._frame_to_table(frame=frame,
                         label=label,
-                        cursor=cursor,
+                        connection=conn,
                         include_columns=c.include_columns,
                         include_index=c.include_index,
+                        bulk=c.write_bulk,
                         # store_filter=store_filter
                         )
 
             conn.commit()
 
+    @classmethod
+    def _read_npy_tables(cls,
+            connection: sqlite3.Connection,
+            ) -> tp.FrozenSet[str]:
+        '''
+        Return the labels of tables written with StoreConfig.write_npy_blob.
+        '''
+        cursor = connection.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
+                (cls._NPY_TABLES_NAME,))
+        if cursor.fetchone() is None:
+            return frozenset()
+        cursor = connection.execute(f'SELECT label FROM "{cls._NPY_TABLES_NAME}"')
+        return frozenset(row[0] for row in cursor)
+
+    @classmethod
+    def _table_to_frame(cls,
+            *,
+            label: TLabel,
+            connection: sqlite3.Connection,
+            config_map: StoreConfigMap,
+            container_type: tp.Type[TFrameAny],
+            npy_tables: tp.FrozenSet[str],
+            ) -> TFrameAny:
+        c = config_map[label]
+        label_encoded = config_map.default.label_encode(label)
+
+        if label_encoded in npy_tables:
+            archive = ArchiveSQLiteWrapper(connection,
+                    writeable=False,
+                    memory_map=False,
+                    )
+            archive.prefix = label_encoded
+            return ArchiveFrameConverter.frame_decode(
+                    archive=archive,
+                    constructor=container_type,
+                    )
+
+        query = f'SELECT * from "{label_encoded}"'
+
+        return container_type.from_sql(query=query,
+                connection=connection,
+                index_depth=c.index_depth,
+                index_constructors=c.index_constructors,
+                columns_depth=c.columns_depth,
+                columns_select=c.columns_select,
+                columns_constructors=c.columns_constructors,
+                dtypes=c.dtypes,
+                name=label,
+                consolidate_blocks=c.consolidate_blocks
+                )
+
+    def _read_many_threads(self,
+            labels: tp.Iterable[TLabel],
+            *,
+            config_map: StoreConfigMap,
+            container_type: tp.Type[TFrameAny],
+            ) -> tp.Iterator[TFrameAny]:
+        '''
+        Read tables in a thread pool, where each worker thread opens its own read-only connection.
+        '''
+        local = threading.local()
+        connections: tp.List[sqlite3.Connection] = []
+        uri = f'{pathlib.Path(os.path.abspath(self._fp)).as_uri()}?mode=ro'
+
+        connection = sqlite3.connect(uri, uri=True)
+        try:
+            npy_tables = self._read_npy_tables(connection)
+        finally:
+            connection.close()
+
+        def initializer() -> None:
+            # NOTE: check_same_thread is disabled only so connections can be closed from the calling thread after all workers have stopped
+            local.connection = sqlite3.connect(uri,
+                    uri=True,
+                    detect_types=sqlite3.PARSE_DECLTYPES,
+                    check_same_thread=False,
+                    )
+            connections.append(local.connection)
+
+        def read(label: TLabel) -> TFrameAny:
+            return self._table_to_frame(
+                    label=label,
+                    connection=local.connection,
+                    config_map=config_map,
+                    container_type=container_type,
+                    npy_tables=npy_tables,
+                    )
+
+        # NOTE: this import is conditional as this module is not supported in pyodide
+        from concurrent.futures import ThreadPoolExecutor
+        try:
+            with ThreadPoolExecutor(
+                    max_workers=config_map.default.read_max_workers,
+                    initializer=initializer,
+                    ) as executor:
+                yield from executor.map(read, labels)
+        finally:
+            for connection in connections:
+                connection.close()
+
     @store_coherent_non_write
     def read_many(self,
             labels: tp.Iterable[TLabel],
@@ -150,28 +356,24 @@ class StoreSQLite(Store):
         config_map = StoreConfigMap.from_initializer(config)
         sqlite3.register_converter('BOOLEAN', lambda x: x == self._BYTES_ONE)
 
+        if config_map.default.read_max_workers is not None:
+            yield from self._read_many_threads(labels,
+                    config_map=config_map,
+                    container_type=container_type,
+                    )
+            return
+
         with sqlite3.connect(self._fp,
                 detect_types=sqlite3.PARSE_DECLTYPES
                 ) as conn:
-
+            npy_tables = self._read_npy_tables(conn)
             for label in labels:
-                c = config_map[label]
-
-                label_encoded = config_map.default.label_encode(label)
-                name = label
-
-                query = f'SELECT * from "{label_encoded}"'
-
-                yield container_type.from_sql(query=query,
+                yield self._table_to_frame(
+                        label=label,
                         connection=conn,
-                        index_depth=c.index_depth,
-                        index_constructors=c.index_constructors,
-                        columns_depth=c.columns_depth,
-                        columns_select=c.columns_select,
-                        columns_constructors=c.columns_constructors,
-                        dtypes=c.dtypes,
-                        name=name,
-                        consolidate_blocks=c.consolidate_blocks
+                        config_map=config_map,
+                        container_type=container_type,
+                        npy_tables=npy_tables,
                         )
 
     @store_coherent_non_write
@@ -186,4 +388,30 @@ class StoreSQLite(Store):
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
             for row in cursor:
+                if row[0] == self._AXIS_INDEX_NAME or row[0] == self._NPY_TABLES_NAME:
+                    continue
                 yield config_map.default.label_decode(row[0])
+
+    @store_coherent_write
+    def write_axis_index(self, src: bytes) -> None:
+        with sqlite3.connect(self._fp) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'DROP TABLE IF EXISTS "{self._AXIS_INDEX_NAME}"')
+            cursor.execute(f'CREATE TABLE "{self._AXIS_INDEX_NAME}" (value BLOB)')
+            cursor.execute(f'INSERT INTO "{self._AXIS_INDEX_NAME}" (value) VALUES (?)', (src,))
+            conn.commit()
+
+    @store_coherent_non_write
+    def read_axis_index(self) -> tp.Optional[bytes]:
+        with sqlite3.connect(self._fp) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
+                    (self._AXIS_INDEX_NAME,))
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute(f'SELECT value FROM "{self._AXIS_INDEX_NAME}"')
+            return cursor.fetchone()[0] # type: ignore
+
+    def labels_from_config(self, config: StoreConfig) -> bool:
+        # tables of NPY-encoded BLOBs are read without using constructor parameters of the config
+        return not config.write_npy_blob
@@ -12,10 +12,15 @@ from static_frame.core.container_util import index_from_optional_constructors
 from static_frame.core.frame import Frame
 from static_frame.core.index import Index
 from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.shared_memory import FrameSharedMemory
+from static_frame.core.shared_memory import frame_from_shared_memory
+from static_frame.core.shared_memory import frame_to_shared_memory
+from static_frame.core.shared_memory import shared_memory_prepare
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
 from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_config import StoreConfigHE
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.store_filter import STORE_FILTER_DEFAULT
@@ -33,6 +38,7 @@ from static_frame.core.util import TCallableAny
 from static_frame.core.util import TIndexCtor
 from static_frame.core.util import TLabel
 from static_frame.core.util import array1d_to_last_contiguous_to_edge
+from static_frame.core.util import get_concurrent_executor
 
 if tp.TYPE_CHECKING:
     from openpyxl import Workbook as WorkbookOpenpyxl  # pragma: no cover
@@ -45,6 +51,18 @@ if tp.TYPE_CHECKING:
     # from openpyxl.cell.read_only import EmptyCell #pragma: no cover
 TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]]
 
+
+class PayloadSheetToFrame(tp.NamedTuple):
+    '''
+    Defines the necessary objects to read a sheet into a Frame. Used for multiprocessing.
+    '''
+    fp: str
+    sheet_name: tp.Optional[str]
+    name: TLabel
+    config: StoreConfigHE
+    store_filter: tp.Optional[StoreFilter]
+    container_type: tp.Type[TFrameAny]
+
 MAX_XLSX_ROWS = 1048576
 MAX_XLSX_COLUMNS = 16384 #1024 on libre office
 
@@ -378,6 +396,204 @@ class StoreXLSX(Store):
                 data_only=True
                 )
 
+    @classmethod
+    def _worksheet_to_frame(cls,
+            ws: tp.Any,
+            *,
+            name: TLabel,
+            config: tp.Union[StoreConfig, StoreConfigHE],
+            store_filter: tp.Optional[StoreFilter],
+            container_type: tp.Type[TFrameAny],
+            ) -> TFrameAny:
+        '''
+        Create a ``Frame`` from an openpyxl worksheet.
+        '''
+        index_depth = config.index_depth
+        index_name_depth_level = config.index_name_depth_level
+        index_constructors = config.index_constructors
+        columns_depth = config.columns_depth
+        columns_name_depth_level = config.columns_name_depth_level
+        columns_constructors = config.columns_constructors
+        trim_nadir = config.trim_nadir
+        skip_header = config.skip_header
+        skip_footer = config.skip_footer
+        dtypes = config.dtypes
+        consolidate_blocks = config.consolidate_blocks
+
+        if ws.max_column <= 1 or ws.max_row <= 1: # pyright: ignore
+            # https://openpyxl.readthedocs.io/en/stable/optimized.html
+            # says that some clients might not report correct dimensions
+            ws.calculate_dimension() # pyright: ignore
+
+        max_column: int = ws.max_column # pyright: ignore
+        max_row: int = ws.max_row # pyright: ignore
+
+        # adjust for downward shift for skipping header, then reduce for footer; at this value and beyond we stop
+        last_row_count: int = max_row - skip_header - skip_footer
+
+        index_values: tp.List[tp.Any] = []
+        columns_values: tp.List[tp.Any] = []
+        data = []
+        apex_rows = []
+
+        if trim_nadir:
+            mask = np.full((last_row_count, max_column), False)
+
+        for row_count, row in enumerate(
+                ws.iter_rows(max_row=max_row), start=-skip_header): # pyright: ignore
+            if row_count < 0:
+                continue # due to skip header; preserves comparison to columns_depth
+            if row_count >= last_row_count:
+                break
+
+            if trim_nadir:
+                row_data: tp.Sequence[tp.Any] = []
+                for col_count, cell in enumerate(row):
+                    if store_filter is None:
+                        value = cell.value
+                    else:
+                        value = store_filter.to_type_filter_element(cell.value)
+                    if value is None: # NOTE: only checking None, not np.nan
+                        mask[row_count, col_count] = True
+                    row_data.append(value) # type: ignore
+                if not row_data:
+                    # NOTE: there might be scenarios where there are empty ``row`` iterables that still increment the row_count; we cannot generate these directly for test
+                    mask[row_count] = True #pragma: no cover
+            else:
+                if store_filter is None:
+                    row_data = tuple(cell.value for cell in row)
+                else: # only need to filter string values, but probably too expensive to pre-check
+                    row_data = tuple(store_filter.to_type_filter_element(cell.value) for cell in row)
+
+            if row_count <= columns_depth - 1:
+                apex_rows.append(row_data[:index_depth])
+                if columns_depth == 1:
+                    columns_values.extend(row_data[index_depth:])
+                elif columns_depth > 1:
+                    columns_values.append(row_data[index_depth:])
+                continue
+
+            if index_depth == 0:
+                data.append(row_data)
+            elif index_depth == 1:
+                index_values.append(row_data[0])
+                data.append(row_data[1:])
+            else:
+                index_values.append(row_data[:index_depth])
+                data.append(row_data[index_depth:])
+
+        #-----------------------------------------------------------------------
+        # Trim all-empty trailing rows created from style formatting GH#146. As the wb is opened in read-only mode, reverse iterating on the wb is not an option, nor is direct row access by integer
+        if trim_nadir:
+            # NOTE: `mask` is all data, while `data` is post index/columns extraction; this means that if a non-None label is found, the row/column will not be trimmed.
+            row_mask = mask.all(axis=1)
+            row_trim_start = array1d_to_last_contiguous_to_edge(row_mask) - columns_depth
+            if row_trim_start < len(row_mask) - columns_depth:
+                data = data[:row_trim_start]
+                if index_depth > 0: # this handles depth 1 and greater
+                    index_values = index_values[:row_trim_start]
+
+            col_mask = mask.all(axis=0)
+            col_trim_start = array1d_to_last_contiguous_to_edge(col_mask) - index_depth
+            if col_trim_start < len(col_mask) - index_depth:
+                data = (r[:col_trim_start] for r in data) #type: ignore
+                if columns_depth == 1:
+                    columns_values = columns_values[:col_trim_start]
+                if columns_depth > 1:
+                    columns_values = (r[:col_trim_start] for r in columns_values) #type: ignore
+
+        #-----------------------------------------------------------------------
+        # continue with Index and Frame creation
+        index_name = None if columns_depth == 0 else apex_to_name(
+                rows=apex_rows,
+                depth_level=index_name_depth_level,
+                axis=0,
+                axis_depth=index_depth)
+
+        # index: tp.Optional[IndexBase] = None
+        index_default_constructor: TIndexCtor
+
+        if index_depth <= 1:
+            index_default_constructor = partial(Index, name=index_name)
+        else: # > 1
+            index_default_constructor = partial(IndexHierarchy.from_labels,
+                    name=index_name,
+                    continuation_token=None, # NOTE: needed
+                    )
+
+        index, own_index = index_from_optional_constructors(
+                index_values,
+                depth=index_depth,
+                default_constructor=index_default_constructor,
+                explicit_constructors=index_constructors, # cannot supply name
+                )
+
+        columns_name = None if index_depth == 0 else apex_to_name(
+                    rows=apex_rows,
+                    depth_level=columns_name_depth_level,
+                    axis=1,
+                    axis_depth=columns_depth)
+
+        # columns: tp.Optional[IndexBase] = None
+        # own_columns = False
+        columns_default_constructor: TIndexCtor
+        if columns_depth <= 1:
+            columns_default_constructor = partial(
+                    container_type._COLUMNS_CONSTRUCTOR,
+                    name=columns_name,
+                    )
+        elif columns_depth > 1:
+            columns_default_constructor = partial(
+                    container_type._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels,
+                    name=columns_name,
+                    continuation_token=None, # NOTE: needed, not the default
+                    )
+            columns_values = zip(*columns_values) #type: ignore
+
+        columns, own_columns = index_from_optional_constructors(
+                columns_values,
+                depth=columns_depth,
+                default_constructor=columns_default_constructor,
+                explicit_constructors=columns_constructors, # cannot supply name
+                )
+
+        return container_type.from_records(data,
+                index=index,
+                columns=columns,
+                dtypes=dtypes,
+                own_index=own_index,
+                own_columns=own_columns,
+                name=name,
+                consolidate_blocks=consolidate_blocks
+                )
+
+    @classmethod
+    def _payload_to_frame(cls, payload: PayloadSheetToFrame) -> TFrameAny:
+        '''
+        Single argument wrapper for _worksheet_to_frame(). Each call opens the workbook read-only and reads a single sheet. Used for multiprocessing.
+        '''
+        wb = cls._load_workbook(payload.fp)
+        try:
+            if payload.sheet_name is None:
+                ws = wb[wb.sheetnames[0]] # pyright: ignore
+            else:
+                ws = wb[payload.sheet_name] # pyright: ignore
+            return cls._worksheet_to_frame(ws,
+                    name=payload.name,
+                    config=payload.config,
+                    store_filter=payload.store_filter,
+                    container_type=payload.container_type,
+                    )
+        finally:
+            wb.close()
+
+    @classmethod
+    def _payload_to_shared_memory(cls, payload: PayloadSheetToFrame) -> FrameSharedMemory:
+        '''
+        Single argument wrapper for _payload_to_frame() that returns block arrays in shared memory. Used for multiprocessing.
+        '''
+        return frame_to_shared_memory(cls._payload_to_frame(payload))
+
     @store_coherent_non_write
     def read_many(self,
             labels: tp.Iterable[TLabel],
@@ -388,23 +604,52 @@ class StoreXLSX(Store):
             ) -> tp.Iterator[TFrameAny]:
 
         config_map = StoreConfigMap.from_initializer(config)
-        wb = self._load_workbook(self._fp)
 
-        for label in labels:
-            c = config_map[label]
+        if config_map.default.read_max_workers is not None:
+
+            def gen() -> tp.Iterator[PayloadSheetToFrame]:
+                for label in labels:
+                    if label is STORE_LABEL_DEFAULT:
+                        sheet_name = None
+                        name = None # do not set to default sheet name
+                    else:
+                        sheet_name = config_map.default.label_encode(label)
+                        name = label # set name to the un-encoded hashable
+                    yield PayloadSheetToFrame( # pylint: disable=no-value-for-parameter
+                            fp=self._fp,
+                            sheet_name=sheet_name,
+                            name=name,
+                            config=config_map[label].to_store_config_he(),
+                            store_filter=store_filter,
+                            container_type=container_type,
+                            )
 
-            index_depth = c.index_depth
-            index_name_depth_level = c.index_name_depth_level
-            index_constructors = c.index_constructors
-            columns_depth = c.columns_depth
-            columns_name_depth_level = c.columns_name_depth_level
-            columns_constructors = c.columns_constructors
-            trim_nadir = c.trim_nadir
-            skip_header = c.skip_header
-            skip_footer = c.skip_footer
-            dtypes = c.dtypes
-            consolidate_blocks = c.consolidate_blocks
+            shared_memory = config_map.default.read_shared_memory
+            if shared_memory:
+                shared_memory_prepare()
 
+            pool_executor = get_concurrent_executor(
+                    use_threads=False,
+                    max_workers=config_map.default.read_max_workers,
+                    mp_context=config_map.default.mp_context,
+                    )
+            with pool_executor() as executor:
+                if shared_memory:
+                    yield from (frame_from_shared_memory(payload)
+                            for payload in executor.map(self._payload_to_shared_memory,
+                            gen(),
+                            chunksize=config_map.default.read_chunksize,
+                            ))
+                else:
+                    yield from executor.map(self._payload_to_frame,
+                            gen(),
+                            chunksize=config_map.default.read_chunksize,
+                            )
+            return
+
+        wb = self._load_workbook(self._fp)
+
+        for label in labels:
             if label is STORE_LABEL_DEFAULT:
                 ws = wb[wb.sheetnames[0]] # pyright: ignore
                 name = None # do not set to default sheet name
@@ -413,151 +658,11 @@ class StoreXLSX(Store):
                 ws = wb[label_encoded] # pyright: ignore
                 name = label # set name to the un-encoded hashable
 
-            if ws.max_column <= 1 or ws.max_row <= 1: # pyright: ignore
-                # https://openpyxl.readthedocs.io/en/stable/optimized.html
-                # says that some clients might not report correct dimensions
-                ws.calculate_dimension() # pyright: ignore
-
-            max_column: int = ws.max_column # pyright: ignore
-            max_row: int = ws.max_row # pyright: ignore
-
-            # adjust for downward shift for skipping header, then reduce for footer; at this value and beyond we stop
-            last_row_count: int = max_row - skip_header - skip_footer
-
-            index_values: tp.List[tp.Any] = []
-            columns_values: tp.List[tp.Any] = []
-            data = []
-            apex_rows = []
-
-            if trim_nadir:
-                mask = np.full((last_row_count, max_column), False)
-
-            for row_count, row in enumerate(
-                    ws.iter_rows(max_row=max_row), start=-skip_header): # pyright: ignore
-                if row_count < 0:
-                    continue # due to skip header; preserves comparison to columns_depth
-                if row_count >= last_row_count:
-                    break
-
-                if trim_nadir:
-                    row_data: tp.Sequence[tp.Any] = []
-                    for col_count, cell in enumerate(row):
-                        if store_filter is None:
-                            value = cell.value
-                        else:
-                            value = store_filter.to_type_filter_element(cell.value)
-                        if value is None: # NOTE: only checking None, not np.nan
-                            mask[row_count, col_count] = True
-                        row_data.append(value) # type: ignore
-                    if not row_data:
-                        # NOTE: there might be scenarios where there are empty ``row`` iterables that still increment the row_count; we cannot generate these directly for test
-                        mask[row_count] = True #pragma: no cover
-                else:
-                    if store_filter is None:
-                        row_data = tuple(cell.value for cell in row)
-                    else: # only need to filter string values, but probably too expensive to pre-check
-                        row_data = tuple(store_filter.to_type_filter_element(cell.value) for cell in row)
-
-                if row_count <= columns_depth - 1:
-                    apex_rows.append(row_data[:index_depth])
-                    if columns_depth == 1:
-                        columns_values.extend(row_data[index_depth:])
-                    elif columns_depth > 1:
-                        columns_values.append(row_data[index_depth:])
-                    continue
-
-                if index_depth == 0:
-                    data.append(row_data)
-                elif index_depth == 1:
-                    index_values.append(row_data[0])
-                    data.append(row_data[1:])
-                else:
-                    index_values.append(row_data[:index_depth])
-                    data.append(row_data[index_depth:])
-
-            #-----------------------------------------------------------------------
-            # Trim all-empty trailing rows created from style formatting GH#146. As the wb is opened in read-only mode, reverse iterating on the wb is not an option, nor is direct row access by integer
-            if trim_nadir:
-                # NOTE: `mask` is all data, while `data` is post index/columns extraction; this means that if a non-None label is found, the row/column will not be trimmed.
-                row_mask = mask.all(axis=1)
-                row_trim_start = array1d_to_last_contiguous_to_edge(row_mask) - columns_depth
-                if row_trim_start < len(row_mask) - columns_depth:
-                    data = data[:row_trim_start]
-                    if index_depth > 0: # this handles depth 1 and greater
-                        index_values = index_values[:row_trim_start]
-
-                col_mask = mask.all(axis=0)
-                col_trim_start = array1d_to_last_contiguous_to_edge(col_mask) - index_depth
-                if col_trim_start < len(col_mask) - index_depth:
-                    data = (r[:col_trim_start] for r in data) #type: ignore
-                    if columns_depth == 1:
-                        columns_values = columns_values[:col_trim_start]
-                    if columns_depth > 1:
-                        columns_values = (r[:col_trim_start] for r in columns_values) #type: ignore
-
-            #-----------------------------------------------------------------------
-            # continue with Index and Frame creation
-            index_name = None if columns_depth == 0 else apex_to_name(
-                    rows=apex_rows,
-                    depth_level=index_name_depth_level,
-                    axis=0,
-                    axis_depth=index_depth)
-
-            # index: tp.Optional[IndexBase] = None
-            index_default_constructor: TIndexCtor
-
-            if index_depth <= 1:
-                index_default_constructor = partial(Index, name=index_name)
-            else: # > 1
-                index_default_constructor = partial(IndexHierarchy.from_labels,
-                        name=index_name,
-                        continuation_token=None, # NOTE: needed
-                        )
-
-            index, own_index = index_from_optional_constructors(
-                    index_values,
-                    depth=index_depth,
-                    default_constructor=index_default_constructor,
-                    explicit_constructors=index_constructors, # cannot supply name
-                    )
-
-            columns_name = None if index_depth == 0 else apex_to_name(
-                        rows=apex_rows,
-                        depth_level=columns_name_depth_level,
-                        axis=1,
-                        axis_depth=columns_depth)
-
-            # columns: tp.Optional[IndexBase] = None
-            # own_columns = False
-            columns_default_constructor: TIndexCtor
-            if columns_depth <= 1:
-                columns_default_constructor = partial(
-                        container_type._COLUMNS_CONSTRUCTOR,
-                        name=columns_name,
-                        )
-            elif columns_depth > 1:
-                columns_default_constructor = partial(
-                        container_type._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels,
-                        name=columns_name,
-                        continuation_token=None, # NOTE: needed, not the default
-                        )
-                columns_values = zip(*columns_values) #type: ignore
-
-            columns, own_columns = index_from_optional_constructors(
-                    columns_values,
-                    depth=columns_depth,
-                    default_constructor=columns_default_constructor,
-                    explicit_constructors=columns_constructors, # cannot supply name
-                    )
-
-            yield container_type.from_records(data,
-                    index=index,
-                    columns=columns,
-                    dtypes=dtypes,
-                    own_index=own_index,
-                    own_columns=own_columns,
+            yield self._worksheet_to_frame(ws,
                     name=name,
-                    consolidate_blocks=consolidate_blocks
+                    config=config_map[label],
+                    store_filter=store_filter,
+                    container_type=container_type,
                     )
         wb.close()
 
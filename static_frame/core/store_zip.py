@@ -10,11 +10,18 @@ import typing_extensions as tp
 
 from static_frame.core.archive_npy import ArchiveFrameConverter
 from static_frame.core.archive_npy import ArchiveZipWrapper
+from static_frame.core.archive_npy import NPZFrameConverter
+from static_frame.core.archive_zip import ZipFileRO
+from static_frame.core.archive_zip import ZipFileSectionRO
 from static_frame.core.archive_zip import zip_namelist
 from static_frame.core.container_util import container_to_exporter_attr
 from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.exception import StoreLabelNonUnique
 from static_frame.core.frame import Frame
+from static_frame.core.shared_memory import FrameSharedMemory
+from static_frame.core.shared_memory import frame_from_shared_memory
+from static_frame.core.shared_memory import frame_to_shared_memory
+from static_frame.core.shared_memory import shared_memory_prepare
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
@@ -83,6 +90,13 @@ class _StoreZip(Store):
                 constructor=payload.constructor,
                 )
 
+    @classmethod
+    def _payload_to_shared_memory(cls, payload: PayloadBytesToFrame) -> FrameSharedMemory:
+        '''
+        Single argument wrapper for _payload_to_frame() that returns the block arrays of the :obj:`Frame` in a shared memory segment.
+        '''
+        return frame_to_shared_memory(cls._payload_to_frame(payload))
+
     @staticmethod
     def _set_container_type(frame: TFrameAny, container_type: tp.Type[TFrameAny]) -> TFrameAny:
         '''
@@ -101,11 +115,31 @@ class _StoreZip(Store):
         config_map = StoreConfigMap.from_initializer(config)
 
         for name in zip_namelist(self._fp):
+            if name == self._AXIS_INDEX_NAME:
+                continue
             if strip_ext:
                 name = name.replace(self._EXT_CONTAINED, '')
             # always use default decoder
             yield config_map.default.label_decode(name)
 
+    @store_coherent_write
+    def write_axis_index(self, src: bytes) -> None:
+        # NOTE: not compressed, such that memory-mapped reading from an uncompressed ZIP remains possible
+        with zipfile.ZipFile(self._fp,
+                mode='a',
+                compression=zipfile.ZIP_STORED,
+                allowZip64=True,
+                ) as zf:
+            zf.writestr(self._AXIS_INDEX_NAME, src)
+
+    @store_coherent_non_write
+    def read_axis_index(self) -> tp.Optional[bytes]:
+        with zipfile.ZipFile(self._fp) as zf:
+            try:
+                return zf.read(self._AXIS_INDEX_NAME)
+            except KeyError:
+                return None
+
     @store_coherent_non_write
     def _read_many_single_thread(self,
             labels: tp.Iterable[TLabel],
@@ -215,20 +249,38 @@ class _StoreZip(Store):
                             )
 
         chunksize = config_map.default.read_chunksize
+        shared_memory = config_map.default.read_shared_memory
+        if shared_memory:
+            shared_memory_prepare()
+
         pool_executor = get_concurrent_executor(
                 use_threads=False,
                 max_workers=config_map.default.read_max_workers,
                 mp_context=config_map.default.mp_context,
                 )
 
+        func: tp.Callable[[PayloadBytesToFrame], tp.Union[TFrameAny, FrameSharedMemory]]
+        if shared_memory:
+            func = self._payload_to_shared_memory
+        else:
+            func = self._payload_to_frame
+
         with pool_executor() as executor:
-            frame_gen = executor.map(self._payload_to_frame, gen(), chunksize=chunksize)
+            frame_gen = executor.map(
+                    func,
+                    gen(),
+                    chunksize=chunksize,
+                    )
 
             for label, cached_frame in results_items():
                 if cached_frame is not None:
                     yield cached_frame
                 else:
-                    frame = next(frame_gen)
+                    post = next(frame_gen)
+                    if isinstance(post, FrameSharedMemory):
+                        frame = frame_from_shared_memory(post)
+                    else:
+                        frame = post
                     # Newly read frame, add it to our weak_cache
                     self._weak_cache[label] = frame
                     yield frame
@@ -368,6 +420,9 @@ class StoreZipPickle(_StoreZip):
     _EXT_CONTAINED = '.pickle'
     _EXPORTER = pickle.dumps # NOTE: might be able to use to_pickle
 
+    def labels_from_config(self, config: StoreConfig) -> bool:
+        return False
+
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[TFrameAny]) -> FrameConstructor:
         return pickle.loads
@@ -412,6 +467,9 @@ class StoreZipNPZ(_StoreZip):
     _EXT_CONTAINED = '.npz'
     _EXPORTER = Frame.to_npz
 
+    def labels_from_config(self, config: StoreConfig) -> bool:
+        return False
+
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[TFrameAny]) -> FrameConstructor:
         return container_type.from_npz
@@ -427,6 +485,45 @@ class StoreZipNPZ(_StoreZip):
             BytesIO(src),
             )
 
+    @store_coherent_non_write
+    def read_many(self,
+            labels: tp.Iterable[TLabel],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[TFrameAny] = Frame,
+            ) -> tp.Iterator[TFrameAny]:
+
+        config_map = StoreConfigMap.from_initializer(config)
+        if not config_map.default.memory_map:
+            yield from _StoreZip.read_many(self,
+                    labels,
+                    config=config_map,
+                    container_type=container_type,
+                    )
+            return
+
+        # NOTE: as the contained NPZ are not compressed, if the outer ZIP is also not compressed, arrays can be memory mapped from the outer ZIP; ZipFileRO will raise if the outer ZIP is compressed. Memory maps are closed when the arrays that use them are garbage collected.
+        with ZipFileRO(self._fp) as zf:
+            for label in labels:
+                cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+                if cache_lookup is not NOT_IN_CACHE_SENTINEL:
+                    yield self._set_container_type(cache_lookup, container_type) # type: ignore
+                    continue
+
+                name = config_map.default.label_encode(label) + self._EXT_CONTAINED
+                with zf.open(name) as part:
+                    end = part.tell() + zf.getinfo(name).file_size
+
+                with ZipFileSectionRO(open(self._fp, 'rb'), end) as section: # pylint: disable=R1732
+                    # NOTE: ZipFileSectionRO provides the interface of a binary file used by ZipFileRO
+                    frame, _ = NPZFrameConverter.from_archive_mmap(
+                            constructor=container_type,
+                            fp=tp.cast(tp.IO[bytes], section),
+                            )
+                # Newly read frame, add it to our weak_cache
+                self._weak_cache[label] = frame
+                yield frame
+
     @staticmethod
     def _payload_to_bytes(payload: PayloadFrameToBytes) -> LabelAndBytes:
         c = payload.config
@@ -492,6 +589,9 @@ class StoreZipNPY(Store):
     _EXT: tp.FrozenSet[str] = frozenset(('.zip',))
     _DELIMITER = '/'
 
+    def labels_from_config(self, config: StoreConfig) -> bool:
+        return False
+
     @store_coherent_write
     def write(self,
             items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
@@ -546,6 +646,9 @@ class StoreZipNPY(Store):
             yield from (config_map.default.label_decode(name)
                     for name in archive.labels())
 
+    write_axis_index = _StoreZip.write_axis_index
+    read_axis_index = _StoreZip.read_axis_index
+
     @store_coherent_non_write
     def read_many(self,
             labels: tp.Iterable[TLabel],
@@ -583,6 +583,62 @@ class TypeBlocks(ContainerOperand):
                 block_parts = [tb._extract_array(column_key=i) for tb in type_blocks]
                 yield concat_resolved(block_parts)
 
+    @staticmethod
+    def vstack_blocks_to_blocks_allocated(
+            type_blocks: tp.Sequence['TypeBlocks'],
+            ) -> tp.Iterator[TNDArrayAny]:
+        '''
+        Given a sequence of TypeBlocks with the same shape[1], return an iterator of arrays, one for each run of adjacent columns of the same resolved dtype. Each array is allocated once and filled from the blocks of each TypeBlocks, such that neither consolidation nor per-column concatenation is required.
+        '''
+        columns = type_blocks[0].shape[1]
+        if not columns:
+            return
+
+        dtypes = list(type_blocks[0]._iter_dtypes())
+        for tb in type_blocks[1:]:
+            for i, dt in enumerate(tb._iter_dtypes()):
+                if dtypes[i] != dt:
+                    dtypes[i] = resolve_dtype(dtypes[i], dt)
+
+        # runs of adjacent columns of the same dtype, as start, stop
+        runs: tp.List[tp.Tuple[int, int]] = []
+        start = 0
+        for i in range(1, columns + 1):
+            if i == columns or dtypes[i] != dtypes[start]:
+                runs.append((start, i))
+                start = i
+
+        rows = sum(tb.shape[0] for tb in type_blocks)
+        targets = [np.empty((rows, stop - start), dtype=dtypes[start])
+                for start, stop in runs]
+
+        row_start = 0
+        for tb in type_blocks:
+            row_stop = row_start + tb.shape[0]
+            run_idx = 0
+            col_start = 0 # of the current block
+            for block in tb._blocks:
+                block = column_2d_filter(block)
+                col_stop = col_start + block.shape[1]
+                col = col_start
+                while col < col_stop: # a block might span many runs
+                    while runs[run_idx][1] <= col:
+                        run_idx += 1
+                    run_start, run_stop = runs[run_idx]
+                    col_end = min(col_stop, run_stop)
+                    targets[run_idx][row_start:row_stop, col - run_start: col_end - run_start] = block[
+                            NULL_SLICE, col - col_start: col_end - col_start]
+                    col = col_end
+                col_start = col_stop
+            row_start = row_stop
+
+        for target in targets:
+            target.flags.writeable = False
+            if target.shape[1] == 1:
+                yield target[NULL_SLICE, 0]
+            else:
+                yield target
+
 
     #---------------------------------------------------------------------------
 
@@ -10,7 +10,7 @@ from collections.abc import Sequence
 from enum import Enum
 from functools import partial
 from functools import wraps
-from inspect import BoundArguments
+from inspect import Parameter
 from inspect import Signature
 from itertools import chain
 from itertools import repeat
@@ -137,10 +137,10 @@ def to_name(v: tp.Any,
     return s
 
 def to_signature(
-        sig: BoundArguments,
+        sig: Signature,
         hints: tp.Mapping[str, tp.Any]) -> str:
     msg = []
-    for k in sig.arguments:
+    for k in sig.parameters:
         msg.append(f'{k}: {to_name(hints.get(k, tp.Any))}')
     r = to_name(hints.get('return', tp.Any))
     return f'({", ".join(msg)}) -> {r}'
@@ -223,6 +223,20 @@ class ClinicError(TypeError):
 
 #-------------------------------------------------------------------------------
 
+def sample_rows(value: tp.Any, sample: tp.Optional[int]) -> tp.Any:
+    '''Return a random selection of `sample` rows, in order, of a :obj:`Frame`, :obj:`Series`, or array larger than `sample`; return all other values unchanged.
+    '''
+    if sample is None or not isinstance(value, (Frame, Series, np.ndarray)):
+        return value
+    count = len(value)
+    if count <= sample:
+        return value
+    positions = np.sort(np.random.default_rng().choice(count, sample, replace=False))
+    if isinstance(value, np.ndarray):
+        return value[positions]
+    return value.iloc[positions]
+
+
 class Validator:
     '''Base class of all run-time constraints, deployed in ``Annotated`` generics.
     '''
@@ -233,7 +247,12 @@ class Validator:
             hint: tp.Any,
             parent_hints: TParent,
             parent_values: TParent,
+            sample: tp.Optional[int] = None,
             ) -> tp.Iterator[TValidation]:
+        '''
+        Args:
+            sample: If given, validators that evaluate values evaluate only this many randomly selected rows.
+        '''
         raise NotImplementedError() #pragma: no cover
 
     def __repr__(self) -> str:
@@ -263,6 +282,7 @@ class Require:
                 hint: tp.Any,
                 parent_hints: TParent,
                 parent_values: TParent,
+                sample: tp.Optional[int] = None,
                 ) -> tp.Iterator[TValidation]:
             # returning anything is an error
             if (n := value.name) != self._name:
@@ -290,6 +310,7 @@ class Require:
                 hint: tp.Any,
                 parent_hints: TParent,
                 parent_values: TParent,
+                sample: tp.Optional[int] = None,
                 ) -> tp.Iterator[TValidation]:
             if (vl := len(value)) != self._len:
                 yield (ERROR_MESSAGE_TYPE,
@@ -323,6 +344,7 @@ class Require:
                 hint: tp.Any,
                 parent_hints: TParent,
                 parent_values: TParent,
+                sample: tp.Optional[int] = None,
                 ) -> tp.Iterator[TValidation]:
 
             # same for both 1d and 2d
@@ -393,6 +415,7 @@ class Require:
                 validators: tp.Sequence[TValidator],
                 parent_hints: TParent,
                 parent_values: TParent,
+                sample: tp.Optional[int] = None,
                 ) -> tp.Iterator[TValidation]:
             # be a no-op when no validators are present
             if validators:
@@ -405,6 +428,7 @@ class Require:
                     s = frame[label]
                 else:
                     raise RuntimeError('Labels associated with an index that is not a member of the parent Frame')
+                s = sample_rows(s, sample)
                 for validator in validators:
                     if not validator(s):
                         yield (ERROR_MESSAGE_TYPE,
@@ -455,6 +479,7 @@ class Require:
                 hint: tp.Any,
                 parent_hints: TParent,
                 parent_values: TParent,
+                sample: tp.Optional[int] = None,
                 ) -> tp.Iterator[TValidation]:
 
             if not isinstance(value, IndexBase):
@@ -485,7 +510,9 @@ class Require:
                                 frame=pf,
                                 labels=value,
                                 parent_hints=parent_hints,
-                                parent_values=parent_values,)
+                                parent_values=parent_values,
+                                sample=sample,
+                                )
 
                     if label_e is not ...:
                         if not self._provided_is_expected(
@@ -606,6 +633,7 @@ class Require:
                 hint: tp.Any,
                 parent_hints: TParent,
                 parent_values: TParent,
+                sample: tp.Optional[int] = None,
                 ) -> tp.Iterator[TValidation]:
 
             if not isinstance(value, IndexBase):
@@ -624,7 +652,9 @@ class Require:
                             frame=pf,
                             labels=value,
                             parent_hints=parent_hints,
-                            parent_values=parent_values,)
+                            parent_values=parent_values,
+                            sample=sample,
+                            )
 
                 # NOTE: a label_p will be tested to match each of the possible three scenarios, as different validators might be assigned to different groups, and all should be tested if validators exist
 
@@ -696,8 +726,9 @@ class Require:
                 hint: tp.Any,
                 parent_hints: TParent,
                 parent_values: TParent,
+                sample: tp.Optional[int] = None,
                 ) -> tp.Iterator[TValidation]:
-            post = self._func(value)
+            post = self._func(sample_rows(value, sample))
             if not bool(post):
                 yield (ERROR_MESSAGE_TYPE,
                         f'{to_name(type(value))} failed validation with {self._prepare_callable(self._func)}', parent_hints,
@@ -1131,6 +1162,7 @@ def _check(
         parent_hints: TParent = (),
         parent_values: TParent = (),
         fail_fast: bool = False,
+        sample: tp.Optional[int] = None,
         ) -> ClinicResult:
 
     # Check queue: queue all checks
@@ -1163,7 +1195,7 @@ def _check(
             u_log: tp.List[TValidation] = []
             for c_hint in tp.get_args(h): # get components
                 # handing one pair at a time with a secondary call will allow nested types in the union to be evaluated on their own
-                c_log = _check(v, c_hint, ph_next, pv, fail_fast)
+                c_log = _check(v, c_hint, ph_next, pv, fail_fast, sample)
                 if not c_log: # no error found, can exit
                     break
                 u_log.extend(c_log)
@@ -1171,7 +1203,7 @@ def _check(
                 e_log.extend(u_log)
 
         elif isinstance(h, Validator):
-            e_log.extend(h._iter_errors(v, h, ph_next, pv))
+            e_log.extend(h._iter_errors(v, h, ph_next, pv, sample))
 
         elif is_generic(h):
             origin = tp.get_origin(h)
@@ -1197,7 +1229,7 @@ def _check(
             elif origin == tp.Literal: # NOTE: cannot use is due backwards compat
                 l_log: tp.List[TValidation] = []
                 for l_hint in tp.get_args(h): # get components
-                    c_log = _check(v, l_hint, ph_next, pv, fail_fast)
+                    c_log = _check(v, l_hint, ph_next, pv, fail_fast, sample)
                     if not c_log: # no error found, can exit
                         break
                     l_log.extend(c_log)
@@ -1377,13 +1409,15 @@ class TypeClinic:
             hint: tp.Any,
             /, *,
             fail_fast: bool = False,
+            sample: tp.Optional[int] = None,
             ) -> None:
         '''Given a hint (a type and/or generic alias), raise a ``ClinicError`` exception describing the result of the check if an error is found.
 
         Args:
             fail_fast: If True, return on first failure. If False, all failures are discovered and reported.
+            sample: If given, ``Require`` validators that evaluate values (``Apply`` and validators of labels) evaluate only this many randomly selected rows; types, dtypes, names, shapes, and labels are always fully checked.
         '''
-        if cr := self(hint, fail_fast=fail_fast):
+        if cr := self(hint, fail_fast=fail_fast, sample=sample):
             raise ClinicError(cr)
 
     def warn(self,
@@ -1391,14 +1425,16 @@ class TypeClinic:
             /, *,
             fail_fast: bool = False,
             category: tp.Type[Warning] = UserWarning,
+            sample: tp.Optional[int] = None,
             ) -> None:
         '''Given a hint (a type and/or generic alias), issue a warning describing the result of the check if an error is found.
 
         Args:
             fail_fast: If True, return on first failure. If False, all failures are discovered and reported.
             category: The ``Warning`` subclass to be used for issueing the warning.
+            sample: If given, ``Require`` validators that evaluate values (``Apply`` and validators of labels) evaluate only this many randomly selected rows; types, dtypes, names, shapes, and labels are always fully checked.
         '''
-        if cr := self(hint, fail_fast=fail_fast):
+        if cr := self(hint, fail_fast=fail_fast, sample=sample):
             warnings.warn(cr.to_str(), category)
 
 
@@ -1406,13 +1442,15 @@ class TypeClinic:
             hint: tp.Any,
             /, *,
             fail_fast: bool = False,
+            sample: tp.Optional[int] = None,
             ) -> ClinicResult:
         '''Given a hint (a type and/or generic alias), return a ``ClinicResult`` object describing the result of the check.
 
         Args:
             fail_fast: If True, return on first failure. If False, all failures are discovered and reported.
+            sample: If given, ``Require`` validators that evaluate values (``Apply`` and validators of labels) evaluate only this many randomly selected rows; types, dtypes, names, shapes, and labels are always fully checked.
         '''
-        return _check(self._value, hint, fail_fast=fail_fast)
+        return _check(self._value, hint, fail_fast=fail_fast, sample=sample)
 
 
 
@@ -1421,27 +1459,189 @@ class ErrorAction(Enum):
     WARN = 1
     RETURN = 2
 
-def _check_interface(
-        func: tp.Callable[..., tp.Any],
-        args: tp.Any,
-        kwargs: tp.Any,
-        fail_fast: bool,
-        error_action: ErrorAction,
-        category: tp.Type[Warning] = UserWarning,
-        ) -> tp.Any:
-    # include_extras insures that Annotated generics are returned
-    hints = tp.get_type_hints(func, include_extras=True)
-
-    sig = Signature.from_callable(func)
-    sig_bound = sig.bind(*args, **kwargs)
-    sig_bound.apply_defaults()
-    sig_str = to_signature(sig_bound, hints)
-    parent_hints = (f'args of {sig_str}',)
-    parent_values = (func,)
-
-    for k, v in sig_bound.arguments.items():
-        if h_p := hints.get(k, None):
-            if cr := _check(v, h_p, parent_hints, parent_values, fail_fast=fail_fast):
+TChecker = tp.Callable[[tp.Any], bool]
+
+def _check_any(value: tp.Any) -> bool:
+    return True
+
+def _to_checker(hint: tp.Any) -> tp.Optional[TChecker]:
+    '''Return a function that returns True if a value is known to pass a check of `hint`, or None if such a function cannot be derived. As a False return does not identify a failure, values not known to pass are checked with `_check`, which also collects errors.
+    '''
+    if hint is tp.Any:
+        return _check_any
+
+    if is_union(hint):
+        checkers = [_to_checker(h) for h in tp.get_args(hint)]
+        if any(c is None for c in checkers):
+            return None
+        return lambda v: any(c(v) for c in checkers) # type: ignore
+
+    if isinstance(hint, Validator) or tp.is_typeddict(hint):
+        return None
+
+    if is_generic(hint):
+        origin = tp.get_origin(hint)
+        if origin == tp.Annotated:
+            h_type, *h_annotations = tp.get_args(hint)
+            if any(isinstance(h, Validator) for h in h_annotations):
+                return None
+            return _to_checker(h_type)
+        if origin == tp.Literal:
+            checkers = [_to_checker(h) for h in tp.get_args(hint)]
+            return lambda v: any(c(v) for c in checkers) # type: ignore
+        if origin == tp.Required or origin == tp.NotRequired:
+            return _to_checker(tp.get_args(hint)[0])
+        return None # generic containers are checked by component
+
+    if not isinstance(hint, type): # a value from a literal
+        return lambda v: type(v) == type(hint) and not v != hint # pylint: disable=C0123
+
+    if issubclass(hint, NBitBase):
+        return None
+    if hint is bool:
+        return lambda v: v.__class__ is bool
+    # as in _check, bools are only valid for bool
+    return lambda v: v.__class__ is not bool and isinstance(v, hint)
+
+
+class _InterfacePlan:
+    '''The hints, signature, and value checkers of a function, derived on first usage and retained for checking all subsequent calls.
+    '''
+    __slots__ = (
+            '_func',
+            '_sig',
+            '_hints',
+            '_params',
+            '_params_bind',
+            '_return',
+            '_sig_str',
+            '_interval',
+            '_calls',
+            )
+
+    _params: tp.Sequence[tp.Tuple[str, tp.Any, tp.Optional[TChecker]]]
+    _params_bind: tp.Optional[tp.Dict[str, tp.Tuple[int, tp.Any]]]
+    _return: tp.Optional[tp.Tuple[tp.Any, tp.Optional[TChecker]]]
+
+    def __init__(self,
+            func: tp.Callable[..., tp.Any],
+            interval: int = 1,
+            ) -> None:
+        if interval < 1:
+            raise RuntimeError('interval must be greater than 0.')
+        self._func = func
+        self._sig: tp.Optional[Signature] = None # set when compiled
+        self._sig_str: tp.Optional[str] = None
+        self._interval = interval
+        self._calls = 0
+
+    def _compile(self) -> None:
+        # include_extras insures that Annotated generics are returned
+        self._hints = tp.get_type_hints(self._func, include_extras=True)
+        sig = Signature.from_callable(self._func)
+
+        self._params = [(k, h, _to_checker(h))
+                for k in sig.parameters if (h := self._hints.get(k, None))]
+        h_return = self._hints.get('return', None)
+        self._return = (h_return, _to_checker(h_return)) if h_return else None
+
+        # arguments can be bound by position and name, without Signature.bind, if all parameters are positional or keyword
+        self._params_bind = {}
+        for i, p in enumerate(sig.parameters.values()):
+            if p.kind is not Parameter.POSITIONAL_OR_KEYWORD:
+                self._params_bind = None
+                break
+            self._params_bind[p.name] = (i, p.default)
+        self._sig = sig
+
+    @property
+    def sig_str(self) -> str:
+        # only needed for reporting errors
+        if self._sig_str is None:
+            self._sig_str = to_signature(self._sig, self._hints) # type: ignore
+        return self._sig_str
+
+    def _bind(self,
+            args: tp.Any,
+            kwargs: tp.Any,
+            ) -> tp.Mapping[str, tp.Any]:
+        '''Return a mapping of all parameter names to values, including defaults.
+        '''
+        params = self._params_bind
+        if params is not None and len(args) <= len(params):
+            count = len(args)
+            for k in kwargs:
+                if (pos_default := params.get(k)) is None or pos_default[0] < count:
+                    break # let Signature.bind raise
+            else:
+                arguments = {}
+                for k, (i, default) in params.items():
+                    if i < count:
+                        arguments[k] = args[i]
+                    elif k in kwargs:
+                        arguments[k] = kwargs[k]
+                    elif default is Parameter.empty:
+                        break # let Signature.bind raise
+                    else:
+                        arguments[k] = default
+                else:
+                    return arguments
+
+        sig_bound = self._sig.bind(*args, **kwargs) # type: ignore
+        sig_bound.apply_defaults()
+        return sig_bound.arguments
+
+    def __call__(self,
+            args: tp.Any,
+            kwargs: tp.Any,
+            fail_fast: bool,
+            error_action: ErrorAction,
+            category: tp.Type[Warning] = UserWarning,
+            sample: tp.Optional[int] = None,
+            ) -> tp.Any:
+        func = self._func
+        if self._interval > 1:
+            calls = self._calls
+            self._calls = calls + 1
+            if calls % self._interval: # only check every interval calls, starting with the first
+                return func(*args, **kwargs)
+
+        if self._sig is None:
+            self._compile()
+
+        if self._params:
+            arguments = self._bind(args, kwargs)
+            for k, h_p, checker in self._params:
+                v = arguments[k]
+                if checker is not None and checker(v):
+                    continue
+                if cr := _check(v,
+                        h_p,
+                        (f'args of {self.sig_str}',),
+                        (func,),
+                        fail_fast=fail_fast,
+                        sample=sample,
+                        ):
+                    if error_action is ErrorAction.RAISE:
+                        raise ClinicError(cr)
+                    elif error_action is ErrorAction.WARN:
+                        warnings.warn(cr.to_str(), category)
+                    elif error_action is ErrorAction.RETURN:
+                        return cr
+
+        post = func(*args, **kwargs)
+
+        if self._return is not None:
+            h_return, checker = self._return
+            if checker is not None and checker(post):
+                return post
+            if cr := _check(post,
+                    h_return,
+                    (f'return of {self.sig_str}',),
+                    (func,),
+                    fail_fast=fail_fast,
+                    sample=sample,
+                    ):
                 if error_action is ErrorAction.RAISE:
                     raise ClinicError(cr)
                 elif error_action is ErrorAction.WARN:
@@ -1449,23 +1649,19 @@ def _check_interface(
                 elif error_action is ErrorAction.RETURN:
                     return cr
 
-    post = func(*args, **kwargs)
+        return post
 
-    if h_return := hints.get('return', None):
-        if cr := _check(post,
-                h_return,
-                (f'return of {sig_str}',),
-                parent_values,
-                fail_fast=fail_fast,
-                ):
-            if error_action is ErrorAction.RAISE:
-                raise ClinicError(cr)
-            elif error_action is ErrorAction.WARN:
-                warnings.warn(cr.to_str(), category)
-            elif error_action is ErrorAction.RETURN:
-                return cr
 
-    return post
+def _check_interface(
+        func: tp.Callable[..., tp.Any],
+        args: tp.Any,
+        kwargs: tp.Any,
+        fail_fast: bool,
+        error_action: ErrorAction,
+        category: tp.Type[Warning] = UserWarning,
+        sample: tp.Optional[int] = None,
+        ) -> tp.Any:
+    return _InterfacePlan(func)(args, kwargs, fail_fast, error_action, category, sample)
 
 
 TVFunc = tp.TypeVar('TVFunc', bound=tp.Callable[..., tp.Any])
@@ -1480,28 +1676,45 @@ class CallGuard:
 
     @tp.overload
     @staticmethod
-    def check(*, fail_fast: bool) -> tp.Callable[[TVFunc], TVFunc]: ...
+    def check(*,
+            fail_fast: bool = ...,
+            sample: tp.Optional[int] = ...,
+            interval: int = ...,
+            ) -> tp.Callable[[TVFunc], TVFunc]: ...
 
     @tp.overload
     @staticmethod
-    def check(func: None, /, *, fail_fast: bool) -> tp.Callable[[TVFunc], TVFunc]: ...
+    def check(func: None, /, *,
+            fail_fast: bool = ...,
+            sample: tp.Optional[int] = ...,
+            interval: int = ...,
+            ) -> tp.Callable[[TVFunc], TVFunc]: ...
 
     @staticmethod
     def check(
             func: TVFunc | None = None,
             /, *,
             fail_fast: bool = False,
+            sample: tp.Optional[int] = None,
+            interval: int = 1,
             ) -> tp.Any:
         '''A function decorator to perform run-time checking of function arguments and return values based on the function type annotations, including type hints and ``Require``-provided validators. Raises ``ClinicError`` on failure.
+
+        Args:
+            fail_fast: If True, return on first failure. If False, all failures are discovered and reported.
+            sample: If given, ``Require`` validators that evaluate values (``Apply`` and validators of labels) evaluate only this many randomly selected rows; types, dtypes, names, shapes, and labels are always fully checked.
+            interval: Check only every ``interval`` calls, starting with the first.
         '''
         def decorator(func: TVFunc) -> TVFunc:
+            plan = _InterfacePlan(func, interval)
+
             @wraps(func)
             def wrapper(*args: tp.Any, **kwargs: tp.Any) -> tp.Any:
-                return _check_interface(func,
-                        args,
+                return plan(args,
                         kwargs,
                         fail_fast,
                         ErrorAction.RAISE,
+                        sample=sample,
                         )
             return tp.cast(TVFunc, wrapper)
 
@@ -1516,11 +1729,21 @@ class CallGuard:
 
     @tp.overload
     @staticmethod
-    def warn(*, fail_fast: bool, category: tp.Type[Warning]) -> tp.Callable[[TVFunc], TVFunc]: ...
+    def warn(*,
+            fail_fast: bool = ...,
+            category: tp.Type[Warning] = ...,
+            sample: tp.Optional[int] = ...,
+            interval: int = ...,
+            ) -> tp.Callable[[TVFunc], TVFunc]: ...
 
     @tp.overload
     @staticmethod
-    def warn(func: None, /, *, fail_fast: bool, category: tp.Type[Warning]) -> tp.Callable[[TVFunc], TVFunc]: ...
+    def warn(func: None, /, *,
+            fail_fast: bool = ...,
+            category: tp.Type[Warning] = ...,
+            sample: tp.Optional[int] = ...,
+            interval: int = ...,
+            ) -> tp.Callable[[TVFunc], TVFunc]: ...
 
     @staticmethod
     def warn(
@@ -1528,22 +1751,31 @@ class CallGuard:
             /, *,
             fail_fast: bool = False,
             category: tp.Type[Warning] = UserWarning,
+            sample: tp.Optional[int] = None,
+            interval: int = 1,
             ) -> tp.Any:
         '''A function decorator to perform run-time checking of function arguments and return values based on the function type annotations, including type hints and ``Require``-provided validators. Issues a warning on failure.
+
+        Args:
+            fail_fast: If True, return on first failure. If False, all failures are discovered and reported.
+            category: The ``Warning`` subclass to be used for issueing the warning.
+            sample: If given, ``Require`` validators that evaluate values (``Apply`` and validators of labels) evaluate only this many randomly selected rows; types, dtypes, names, shapes, and labels are always fully checked.
+            interval: Check only every ``interval`` calls, starting with the first.
         '''
         def decorator(func: TVFunc) -> TVFunc:
+            plan = _InterfacePlan(func, interval)
+
             @wraps(func)
             def wrapper(*args: tp.Any, **kwargs: tp.Any) -> tp.Any:
-                return _check_interface(func,
-                        args,
+                return plan(args,
                         kwargs,
                         fail_fast,
                         ErrorAction.WARN,
                         category,
+                        sample,
                         )
             return tp.cast(TVFunc, wrapper)
 
         if func is not None:
             return decorator(func)
         return decorator
-
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import contextlib
+import csv
 import datetime
 import math
 import operator
@@ -244,6 +245,9 @@ NON_STR_TYPES = {int, float, bool}
 INT_MAX_COERCIBLE_TO_FLOAT = 1_000_000_000_000_000
 INT64_MAX = np.iinfo(np.int64).max
 
+# number of rows fetched from a DBAPI cursor at a time; larger batches retain more row tuples at once, increasing the cost of garbage collection
+SQL_FETCH_ROWS = 256
+
 # for getitem / loc selection
 KEY_ITERABLE_TYPES = (list, np.ndarray)
 TKeyIterable = tp.Union[tp.Iterable[tp.Any], TNDArrayAny]
@@ -319,6 +323,8 @@ TShape = tp.Union[int, tp.Tuple[int, ...]]
 
 # mloc, shape, and strides
 TArraySignature = tp.Tuple[int, tp.Tuple[int, ...], tp.Tuple[int, ...]]
+# components of a byte signature, such as memoryviews of array buffers
+TBytesLike = tp.Union[bytes, memoryview]
 
 def array_signature(value: TNDArrayAny) -> TArraySignature:
     return mloc(value), value.shape, value.strides
@@ -341,6 +347,7 @@ TPathSpecifier = tp.Union[str, PathLike[tp.Any]]
 TPathSpecifierOrIO = tp.Union[str, PathLike[tp.Any], tp.IO[tp.Any]]
 TPathSpecifierOrBinaryIO = tp.Union[str, PathLike[tp.Any], tp.BinaryIO]
 TPathSpecifierOrTextIO = tp.Union[str, PathLike[tp.Any], tp.TextIO]
+
 TPathSpecifierOrTextIOOrIterator = tp.Union[str, PathLike[tp.Any], tp.TextIO, tp.Iterator[str]]
 
 TDtypeSpecifier = tp.Union[str, TDtypeAny, type, None]
@@ -1401,6 +1408,390 @@ def array_ufunc_axis_skipna(
         return ufunc_skipna(v, axis=axis, out=out)
     return ufunc(v, axis=axis, out=out)
 
+#-------------------------------------------------------------------------------
+# window reductions
+
+# kinds for which window reductions are evaluated with cumulative kernels
+DTYPE_WINDOW_REDUCE_KINDS = frozenset((
+        DTYPE_FLOAT_KIND,
+        DTYPE_BOOL_KIND,
+        'i', 'u' # int kinds
+        ))
+
+FLOAT_EPS_SQRT = np.sqrt(np.finfo(DTYPE_FLOAT_DEFAULT).eps)
+
+# maximum number of elements gathered at a time when evaluating windows directly
+WINDOW_GATHER_SIZE = 262_144
+
+WINDOW_REDUCE_FUNCS = ('count', 'max', 'mean', 'min', 'std', 'sum', 'var')
+
+# ufuncs for min and max reductions, keyed by function name and skipna
+EXTREME_UFUNCS: tp.Dict[tp.Tuple[str, bool], np.ufunc] = {
+        ('min', True): np.fmin,
+        ('min', False): np.minimum,
+        ('max', True): np.fmax,
+        ('max', False): np.maximum,
+        }
+
+def _window_cumsum(
+        array: TNDArrayAny,
+        dtype: TDtypeAny,
+        ) -> TNDArrayAny:
+    '''Return a cumulative sum along axis 0 with a leading row of zeros, such that the sum of ``array[a:b]`` is ``post[b] - post[a]``.
+    '''
+    post = np.empty((array.shape[0] + 1,) + array.shape[1:], dtype=dtype)
+    post[0] = 0
+    np.cumsum(array, axis=0, dtype=dtype, out=post[1:])
+    return post
+
+def _window_gather(
+        values: TNDArrayAny,
+        *,
+        isna: tp.Optional[TNDArrayAny],
+        starts: TNDArrayIntDefault,
+        stops: TNDArrayIntDefault,
+        ) -> tp.Iterator[tp.Tuple[slice, TNDArrayAny, TNDArrayAny]]:
+    '''Yield, for chunks of windows ``values[starts[i]:stops[i]]``, the slice of windows in the chunk, the values of those windows as rows padded with zeros, and a Boolean mask of positions that are within the window and not excluded by ``isna``.
+    '''
+    offsets = np.arange((stops - starts).max())
+    step = max(WINDOW_GATHER_SIZE // max(len(offsets), 1), 1)
+
+    for start in range(0, len(starts), step):
+        chunk = slice(start, start + step)
+        positions = starts[chunk, None] + offsets
+        valid = positions < stops[chunk, None]
+        positions[~valid] = 0
+        mask = valid if values.ndim == 1 else valid[:, :, None]
+        if isna is not None:
+            mask = mask & ~isna[positions]
+        yield chunk, np.where(mask, values[positions], 0), mask
+
+def _window_sum(
+        values: TNDArrayAny,
+        *,
+        starts: TNDArrayIntDefault,
+        stops: TNDArrayIntDefault,
+        ) -> TNDArrayAny:
+    '''Return the sum of each window ``values[starts[i]:stops[i]]`` of a float array. The array is divided into blocks of the size of the largest window, and values are accumulated within each block from its first and from its last element; a window that spans two blocks, or that begins or ends at a block boundary, is summed from at most two of these accumulations, such that only values within the window contribute to its sum. Other windows are summed directly.
+    '''
+    count = values.shape[0]
+    post = np.zeros((len(starts),) + values.shape[1:], dtype=values.dtype)
+    lengths = stops - starts
+    size = lengths.max() if len(lengths) else 0
+    if not size:
+        return post
+
+    block_count = -(-count // size)
+    pad = block_count * size - count
+    # padded zeros do not change sums accumulated from the end of the last block
+    padded = (values if not pad
+            else np.concatenate((values, np.zeros((pad,) + values.shape[1:], dtype=values.dtype))))
+    blocks = padded.reshape((block_count, size) + values.shape[1:])
+    prefix = np.cumsum(blocks, axis=1).reshape(padded.shape)
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+
+    filled = lengths > 0
+    block_stops = (starts // size + 1) * size
+    spans = filled & (stops > block_stops)
+    post[spans] = suffix[starts[spans]] + prefix[stops[spans] - 1]
+    ends = filled & ~spans & ((stops == block_stops) | (stops == count))
+    post[ends] = suffix[starts[ends]]
+    heads = filled & ~spans & ~ends & (starts % size == 0)
+    post[heads] = prefix[stops[heads] - 1]
+
+    inner = filled & ~(spans | ends | heads)
+    if inner.any():
+        iloc = np.nonzero(inner)[0]
+        for chunk, windows, _ in _window_gather(values,
+                isna=None,
+                starts=starts[iloc],
+                stops=stops[iloc],
+                ):
+            post[iloc[chunk]] = windows.sum(axis=1)
+    return post
+
+def _window_deviations(
+        values: TNDArrayAny,
+        *,
+        isna: tp.Optional[TNDArrayAny],
+        starts: TNDArrayIntDefault,
+        stops: TNDArrayIntDefault,
+        counts: TNDArrayAny,
+        ) -> TNDArrayAny:
+    '''Return the sum of squared deviations from the mean of each window ``values[starts[i]:stops[i]]``, evaluated from the values of windows gathered in chunks. Positions where ``isna`` is True are excluded, and ``counts`` are the count of values in each window.
+    '''
+    post = np.empty((len(starts),) + values.shape[1:], dtype=DTYPE_FLOAT_DEFAULT)
+    for chunk, windows, mask in _window_gather(values,
+            isna=isna,
+            starts=starts,
+            stops=stops,
+            ):
+        windows -= (windows.sum(axis=1) / counts[chunk])[:, None]
+        windows[~np.broadcast_to(mask, windows.shape)] = 0
+        post[chunk] = (windows * windows).sum(axis=1)
+    return post
+
+def _window_extreme(
+        array: TNDArrayAny,
+        *,
+        starts: TNDArrayIntDefault,
+        stops: TNDArrayIntDefault,
+        size: int,
+        ufunc: np.ufunc,
+        ) -> TNDArrayAny:
+    '''Evaluate a min or max ``ufunc`` over windows of fixed ``size`` with the van Herk/Gil-Werman algorithm: the array is divided into blocks of ``size``, and each full window is the combination of a suffix-accumulation of one block and a prefix-accumulation of the next. Windows truncated at either end of the array are taken from whole-array prefix or suffix accumulations.
+    '''
+    count = array.shape[0]
+    post = np.empty((len(starts),) + array.shape[1:], dtype=array.dtype)
+
+    head = starts == 0
+    if head.any():
+        prefix = ufunc.accumulate(array, axis=0)
+        post[head] = prefix[stops[head] - 1]
+    tail = (stops == count) & ~head
+    if tail.any():
+        suffix = ufunc.accumulate(array[::-1], axis=0)[::-1]
+        post[tail] = suffix[starts[tail]]
+
+    inner = ~(head | tail)
+    if inner.any():
+        block_count = -(-count // size)
+        pad = block_count * size - count
+        # padded values are never part of a full window
+        padded = (array if not pad
+                else np.concatenate((array, np.repeat(array[-1:], pad, axis=0))))
+        shape = (block_count, size) + array.shape[1:]
+        blocks = padded.reshape(shape)
+        prefix = ufunc.accumulate(blocks, axis=1).reshape(padded.shape)
+        suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+        post[inner] = ufunc(suffix[starts[inner]], prefix[stops[inner] - 1])
+    return post
+
+def array_window_reduce(
+        array: TNDArrayAny,
+        *,
+        starts: TNDArrayIntDefault,
+        stops: TNDArrayIntDefault,
+        func_name: str,
+        size: tp.Optional[int] = None,
+        skipna: bool = True,
+        ddof: int = 0,
+        ) -> TNDArrayAny:
+    '''Reduce the windows ``array[starts[i]:stops[i]]`` along axis 0, returning an array of one row per window. For Boolean, integer, and float arrays, counts, and integer sums and means, are derived from cumulative sums; float sums and means, and variances, from sums accumulated within blocks of the size of the largest window; and minima and maxima (when all full windows are of ``size``) from block-wise accumulations, such that all windows are evaluated in time linear to the length of ``array``. Other arrays are reduced window by window.
+
+    Args:
+        func_name: one of "count", "max", "mean", "min", "std", "sum", or "var".
+        size: the size of all windows not truncated by the bounds of the array, or None if sizes vary.
+    '''
+    kind = array.dtype.kind
+    shape = (len(starts),) + array.shape[1:]
+    lengths = stops - starts
+    if array.ndim == 2:
+        lengths = lengths[:, None]
+
+    if kind in DTYPE_INEXACT_KINDS or kind == DTYPE_OBJECT_KIND or kind in DTYPE_NAT_KINDS:
+        isna = isna_array(array)
+        na_cumsum = _window_cumsum(isna, DTYPE_INT_DEFAULT)
+        na_count = na_cumsum[stops] - na_cumsum[starts]
+        has_na = na_count > 0
+    else:
+        isna = None
+        na_count = np.zeros(shape, dtype=DTYPE_INT_DEFAULT)
+        has_na = None
+
+    if func_name == 'count':
+        if skipna:
+            return lengths - na_count # type: ignore
+        return np.broadcast_to(lengths, shape).copy()
+
+    if kind not in DTYPE_WINDOW_REDUCE_KINDS or (
+            size is None and (func_name == 'min' or func_name == 'max')):
+        if array.ndim == 2:
+            if not array.shape[1]:
+                return np.empty(shape, dtype=array.dtype)
+            return np.stack([array_window_reduce(array[NULL_SLICE, i],
+                    starts=starts,
+                    stops=stops,
+                    func_name=func_name,
+                    size=size,
+                    skipna=skipna,
+                    ddof=ddof,
+                    ) for i in range(array.shape[1])], axis=1)
+
+        ufunc: tp.Callable[..., tp.Any]
+        ufunc_skipna: tp.Callable[..., tp.Any]
+        if func_name == 'sum':
+            ufunc, ufunc_skipna = np.sum, partial(ufunc_nansum, allna=0)
+        elif func_name == 'min':
+            ufunc, ufunc_skipna = np.min, np.nanmin
+        elif func_name == 'max':
+            ufunc, ufunc_skipna = np.max, np.nanmax
+        elif func_name == 'mean':
+            ufunc, ufunc_skipna = np.mean, np.nanmean
+        elif func_name == 'std':
+            ufunc, ufunc_skipna = partial(np.std, ddof=ddof), partial(np.nanstd, ddof=ddof)
+        elif func_name == 'var':
+            ufunc, ufunc_skipna = partial(np.var, ddof=ddof), partial(np.nanvar, ddof=ddof)
+        else:
+            raise NotImplementedError(f'no window reduction for {func_name}')
+
+        with WarningsSilent():
+            reduced = [array_ufunc_axis_skipna(
+                    array[start: stop],
+                    skipna=skipna,
+                    axis=0,
+                    ufunc=ufunc,
+                    ufunc_skipna=ufunc_skipna,
+                    ) for start, stop in zip(starts, stops)]
+        post, _ = iterable_to_array_1d(reduced, count=len(reduced))
+        return post
+
+    if func_name == 'min' or func_name == 'max':
+        assert size is not None
+        return _window_extreme(array,
+                starts=starts,
+                stops=stops,
+                size=size,
+                ufunc=EXTREME_UFUNCS[func_name, skipna],
+                )
+
+    counts = lengths - na_count
+
+    if func_name == 'sum' or func_name == 'mean':
+        if kind == DTYPE_FLOAT_KIND:
+            # differences of a cumulative sum of floats lose the precision of small values after large values
+            values = array.astype(DTYPE_FLOAT_DEFAULT)
+            if isna is not None:
+                values[isna] = 0
+            post = _window_sum(values, starts=starts, stops=stops)
+        else: # int and bool sums are exact
+            cumsum = _window_cumsum(array,
+                    DTYPE_UINT_DEFAULT if kind == 'u' else DTYPE_INT_DEFAULT)
+            post = cumsum[stops] - cumsum[starts]
+
+        if func_name == 'mean':
+            with WarningsSilent():
+                post = post / counts
+        if has_na is not None and not skipna:
+            post[has_na] = np.nan
+        if kind == DTYPE_FLOAT_KIND:
+            return post.astype(array.dtype)
+        return post
+
+    if func_name == 'std' or func_name == 'var':
+        values = array.astype(DTYPE_FLOAT_DEFAULT)
+        if isna is not None:
+            values[isna] = 0
+        sums = _window_sum(values, starts=starts, stops=stops)
+        squares = _window_sum(values * values, starts=starts, stops=stops)
+
+        with WarningsSilent():
+            deviations = squares - sums * sums / counts
+            # where the deviation is not well above the precision of the sum of squares, as for windows of near-equal values, the window is evaluated directly
+            unstable = deviations < squares * FLOAT_EPS_SQRT
+            if unstable.ndim == 2:
+                unstable = unstable.any(axis=1)
+            if unstable.any():
+                iloc = np.nonzero(unstable)[0]
+                deviations[iloc] = _window_deviations(values,
+                        isna=isna,
+                        starts=starts[iloc],
+                        stops=stops[iloc],
+                        counts=counts[iloc],
+                        )
+            post = deviations / (counts - ddof)
+        post[np.broadcast_to(counts - ddof <= 0, post.shape)] = np.nan
+        if has_na is not None and not skipna:
+            post[has_na] = np.nan
+        if func_name == 'std':
+            return np.sqrt(post)
+        return post
+
+    raise NotImplementedError(f'no window reduction for {func_name}')
+
+SEGMENT_REDUCE_FUNCS = ('count', 'first', 'last', 'max', 'mean', 'min', 'sum')
+
+def array_segment_reduce(
+        array: TNDArrayAny,
+        *,
+        starts: TNDArrayIntDefault,
+        func_name: str,
+        skipna: bool = True,
+        ) -> TNDArrayAny:
+    '''Reduce contiguous, non-empty segments of ``array`` along axis 0, where each segment begins at a position in ``starts`` and ends at the next, returning an array of one row per segment. For Boolean, integer, and float arrays, segments are reduced with ``reduceat``; other arrays are reduced segment by segment.
+
+    Args:
+        starts: ascending start positions, where the first is 0.
+        func_name: one of "count", "first", "last", "max", "mean", "min", or "sum".
+    '''
+    count = array.shape[0]
+    if not count:
+        return np.empty((0,) + array.shape[1:], dtype=array.dtype)
+
+    stops = np.empty(len(starts), dtype=DTYPE_INT_DEFAULT)
+    stops[:-1] = starts[1:]
+    stops[-1] = count
+
+    if func_name == 'first':
+        return array[starts]
+    if func_name == 'last':
+        post: TNDArrayAny = array[stops - 1]
+        return post
+
+    kind = array.dtype.kind
+    if kind in DTYPE_INEXACT_KINDS or kind == DTYPE_OBJECT_KIND or kind in DTYPE_NAT_KINDS:
+        isna = isna_array(array)
+    else:
+        isna = None
+
+    lengths = stops - starts
+    if array.ndim == 2:
+        lengths = lengths[:, None]
+
+    if func_name == 'count':
+        if skipna and isna is not None:
+            return np.add.reduceat(~isna, starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+        return np.broadcast_to(lengths, (len(starts),) + array.shape[1:]).copy()
+
+    if kind not in DTYPE_WINDOW_REDUCE_KINDS:
+        # other dtypes are reduced segment by segment
+        return array_window_reduce(array,
+                starts=starts,
+                stops=stops,
+                func_name=func_name,
+                skipna=skipna,
+                )
+
+    has_na = None
+    if isna is not None and isna.any():
+        has_na = np.add.reduceat(isna, starts, axis=0, dtype=DTYPE_INT_DEFAULT) > 0
+
+    if func_name == 'min' or func_name == 'max':
+        post = EXTREME_UFUNCS[func_name, skipna].reduceat(array, starts, axis=0)
+        return post
+
+    if func_name == 'sum' or func_name == 'mean':
+        if kind == DTYPE_FLOAT_KIND:
+            values = array if has_na is None else np.where(isna, 0, array) # type: ignore
+            post = np.add.reduceat(values, starts, axis=0, dtype=DTYPE_FLOAT_DEFAULT)
+        elif kind == 'u':
+            post = np.add.reduceat(array, starts, axis=0, dtype=DTYPE_UINT_DEFAULT)
+        else: # int and bool sums are exact
+            post = np.add.reduceat(array, starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+
+        if func_name == 'mean':
+            counts = (lengths if has_na is None
+                    else lengths - np.add.reduceat(isna, starts, axis=0, dtype=DTYPE_INT_DEFAULT)) # type: ignore
+            with WarningsSilent():
+                post = post / counts
+        if has_na is not None and not skipna:
+            post[has_na] = np.nan
+        if kind == DTYPE_FLOAT_KIND:
+            return post.astype(array.dtype)
+        return post
+
+    raise NotImplementedError(f'no segment reduction for {func_name}')
+
 #-------------------------------------------------------------------------------
 # unique value discovery; based on NP's arraysetops.py
 
@@ -3748,6 +4139,89 @@ def file_like_manager(
         if is_file:
             f.close()
 
+def delimited_line_in_quote(
+        line: str,
+        *,
+        in_quote: bool,
+        delimiter: str,
+        quotechar: str,
+        doublequote: bool,
+        escapechar: tp.Optional[str],
+        skipinitialspace: bool,
+        ) -> bool:
+    '''
+    Given a line of delimited text and whether the line starts within a quoted field, return True if the line ends within a quoted field. Follows the quote handling of the ``csv`` module: a quote character only opens a quoted field at the start of a field.
+    '''
+    field_start = not in_quote
+    i = 0
+    count = len(line)
+    while i < count:
+        c = line[i]
+        if in_quote:
+            if c == escapechar:
+                i += 1
+            elif c == quotechar:
+                if doublequote and i + 1 < count and line[i + 1] == quotechar:
+                    i += 1
+                else:
+                    in_quote = False
+        elif c == delimiter:
+            field_start = True
+        elif c == escapechar:
+            field_start = False
+            i += 1
+        elif field_start:
+            if c == quotechar:
+                in_quote = True
+                field_start = False
+            elif not (skipinitialspace and c == ' '):
+                field_start = False
+        i += 1
+    return in_quote
+
+def iter_delimited_chunks(
+        lines: tp.Iterable[str],
+        *,
+        count: int,
+        delimiter: str,
+        quoting: int,
+        quotechar: str,
+        doublequote: bool,
+        escapechar: tp.Optional[str],
+        skipinitialspace: bool,
+        ) -> tp.Iterator[tp.List[str]]:
+    '''
+    Group lines of delimited text into lists of at most ``count`` records. Lines of a record that continue a quoted field over line breaks are always kept in the same list.
+    '''
+    if count < 1:
+        raise ValueError('count must be greater than 0')
+
+    quote_aware = quoting != csv.QUOTE_NONE
+    chunk: tp.List[str] = []
+    records = 0
+    in_quote = False
+
+    for line in lines:
+        chunk.append(line)
+        if quote_aware and (in_quote or quotechar in line):
+            in_quote = delimited_line_in_quote(line,
+                    in_quote=in_quote,
+                    delimiter=delimiter,
+                    quotechar=quotechar,
+                    doublequote=doublequote,
+                    escapechar=escapechar,
+                    skipinitialspace=skipinitialspace,
+                    )
+            if in_quote:
+                continue
+        records += 1
+        if records == count:
+            yield chunk
+            chunk = []
+            records = 0
+    if chunk:
+        yield chunk
+
 #-------------------------------------------------------------------------------
 # trivial, non NP util
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections.abc import Set
 from functools import partial
-from itertools import chain
 
 import numpy as np
 import typing_extensions as tp
@@ -56,6 +55,7 @@ from static_frame.core.util import INT_TYPES
 from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import TBoolOrBools
+from static_frame.core.util import TBytesLike
 from static_frame.core.util import TDtypeObject
 from static_frame.core.util import TILocSelector
 from static_frame.core.util import TILocSelectorMany
@@ -1080,30 +1080,38 @@ class Yarn(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]):
                 name=self._name,
                 )
 
-    def _to_signature_bytes(self,
+    def _iter_signature_bytes(self,
             include_name: bool = True,
             include_class: bool = True,
             encoding: str = 'utf-8',
-            ) -> bytes:
+            ) -> tp.Iterator[TBytesLike]:
 
         # For a Yarn, the signature bytes need only contain the signature of the associated Frame and the index; all else are internal implementation mechanisms
 
-        v = (f._to_signature_bytes(
+        yield from iter_component_signature_bytes(self,
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        yield from self._index._iter_signature_bytes(
+                include_name=include_name,
+                include_class=include_class,
+                encoding=encoding)
+        for f in self._axis_element():
+            yield from f._iter_signature_bytes(
+                    include_name=include_name,
+                    include_class=include_class,
+                    encoding=encoding)
+
+    def _to_signature_bytes(self,
+            include_name: bool = True,
+            include_class: bool = True,
+            encoding: str = 'utf-8',
+            ) -> bytes:
+
+        return b''.join(self._iter_signature_bytes(
                 include_name=include_name,
                 include_class=include_class,
-                encoding=encoding,
-                ) for f in self._axis_element())
-
-        return b''.join(chain(
-                iter_component_signature_bytes(self,
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),
-                (self._index._to_signature_bytes(
-                        include_name=include_name,
-                        include_class=include_class,
-                        encoding=encoding),),
-                v))
+                encoding=encoding))
 
 
 TYarnAny = Yarn[tp.Any]
@@ -1052,6 +1052,12 @@ class JoinLeft(Perf):
         self.sff_right = ff.parse('s(20,3)|v(int,bool,bool)|i(I,str)').assign[sf.ILoc[0]].apply(lambda s: s % 4)
         self.pdf_right = self.sff_right.to_pandas()
 
+        self.sff_left_large = ff.parse('s(100_000,4)|v(int)|i(I,str)|c(I,str)').assign[sf.ILoc[0]].apply(lambda s: s % 10_000)
+        self.pdf_left_large = self.sff_left_large.to_pandas()
+
+        self.sff_right_large = ff.parse('s(10_000,3)|v(int,bool,bool)|i(I,str)').assign[sf.ILoc[0]](np.arange(10_000))
+        self.pdf_right_large = self.sff_right_large.to_pandas()
+
         # NOTE: SF returns a composite index of tuples; Pandas just returns a auto index
         from static_frame.core.join import join
         self.meta = {
@@ -1059,6 +1065,10 @@ class JoinLeft(Perf):
                 line_target=join,
                 perf_status=PerfStatus.UNEXPLAINED_LOSS,
                 ),
+            'large_cardinality': FunctionMetaData(
+                line_target=join,
+                perf_status=PerfStatus.UNEXPLAINED_LOSS,
+                ),
             }
 
 
@@ -1068,6 +1078,10 @@ class JoinLeft_N(JoinLeft, Native):
         post = self.sff_left.join_left(self.sff_right, left_columns='zZbu', right_columns=0)
         assert post.shape == (5046, 7)
 
+    def large_cardinality(self) -> None:
+        post = self.sff_left_large.join_left(self.sff_right_large, left_columns='zZbu', right_columns=0)
+        assert post.shape == (100_000, 7)
+
 
 class JoinLeft_R(JoinLeft, Reference):
 
@@ -1075,6 +1089,10 @@ class JoinLeft_R(JoinLeft, Reference):
         post = self.pdf_left.merge(self.pdf_right, how='left', left_on='zZbu', right_on=0)
         assert post.shape == (5046, 7)
 
+    def large_cardinality(self) -> None:
+        post = self.pdf_left_large.merge(self.pdf_right_large, how='left', left_on='zZbu', right_on=0)
+        assert post.shape == (100_000, 7)
+
 
 class JoinLeftUnique(Perf):
     NUMBER = 200
@@ -1088,12 +1106,22 @@ class JoinLeftUnique(Perf):
         self.sff_right = ff.parse('s(500,3)|v(str,bool,int)')
         self.pdf_right = self.sff_right.to_pandas()
 
+        self.sff_left_large = ff.parse('s(100_000,4)|v(int)|i(I,str)|c(I,str)')
+        self.pdf_left_large = self.sff_left_large.to_pandas()
+
+        self.sff_right_large = ff.parse('s(50_000,3)|v(str,bool,int)')
+        self.pdf_right_large = self.sff_right_large.to_pandas()
+
         from static_frame.core.join import join
         self.meta = {
             'left_larger': FunctionMetaData(
                 line_target=join,
                 perf_status=PerfStatus.UNEXPLAINED_LOSS,
                 ),
+            'large_cardinality': FunctionMetaData(
+                line_target=join,
+                perf_status=PerfStatus.UNEXPLAINED_LOSS,
+                ),
             }
 
 class JoinLeftUnique_N(JoinLeftUnique, Native):
@@ -1102,6 +1130,10 @@ class JoinLeftUnique_N(JoinLeftUnique, Native):
         post = self.sff_left.join_left(self.sff_right, left_depth_level=0, right_columns=0)
         assert post.shape == (1000, 7)
 
+    def large_cardinality(self) -> None:
+        post = self.sff_left_large.join_left(self.sff_right_large, left_depth_level=0, right_columns=0)
+        assert post.shape == (100_000, 7)
+
 class JoinLeftUnique_R(JoinLeftUnique, Reference):
 
     def left_larger(self) -> None:
@@ -1109,6 +1141,10 @@ class JoinLeftUnique_R(JoinLeftUnique, Reference):
         post = self.pdf_left.merge(self.pdf_right, how='left', left_index=True, right_on=0)
         assert post.shape == (1000, 7)
 
+    def large_cardinality(self) -> None:
+        post = self.pdf_left_large.merge(self.pdf_right_large, how='left', left_index=True, right_on=0)
+        assert post.shape == (100_000, 7)
+
 #-------------------------------------------------------------------------------
 
 class BusItemsZipPickle(PerfPrivate):
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import contextlib
 import os
+import sqlite3
 # import typing_extensions as tp
+import weakref
 import zipfile
 from io import StringIO
 from io import UnsupportedOperation
@@ -15,9 +17,11 @@ from numpy.lib.format import write_array
 from static_frame.core.archive_npy import NPY
 from static_frame.core.archive_npy import NPZ
 from static_frame.core.archive_npy import ArchiveDirectory
+from static_frame.core.archive_npy import ArchiveSQLiteWrapper
 from static_frame.core.archive_npy import ArchiveZip
 from static_frame.core.archive_npy import ArchiveZipWrapper
 from static_frame.core.archive_npy import NPYConverter
+from static_frame.core.archive_npy import NPYFrameConverter
 from static_frame.core.bus import Bus
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorNPYDecode
@@ -182,6 +186,67 @@ class TestUnit(TestCase):
             with self.assertRaises(RuntimeError):
                 _ = ArchiveZip(fp, writeable=True, memory_map=True)
 
+    def test_archive_zip_b(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,float)')
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp)
+            archive = ArchiveZip(fp, writeable=False, memory_map=True)
+            a1 = archive.read_array('__blocks_0__.npy')
+            self.assertEqual(a1.tolist(), [-88017, 92867, 84967, 13448])
+            self.assertFalse(a1.flags.writeable)
+            self.assertEqual(len(archive._closable), 1)
+            del a1
+            archive.close()
+
+    def test_archive_zip_write_arrays_a(self) -> None:
+        arrays = [np.arange(i, i + 20).reshape(5, 4) for i in range(7)]
+        with temp_file('.npz') as fp:
+            archive = ArchiveZip(fp, writeable=True, memory_map=False)
+            archive.write_arrays(
+                    ((f'a{i}.npy', a) for i, a in enumerate(arrays)),
+                    max_workers=3,
+                    )
+            archive.__del__() # close the zip
+            # members are written in order
+            with zipfile.ZipFile(fp) as zf:
+                self.assertEqual(zf.namelist(), [f'a{i}.npy' for i in range(7)])
+            archive = ArchiveZip(fp, writeable=False, memory_map=False)
+            for i, a in enumerate(arrays):
+                self.assertEqual(archive.read_array(f'a{i}.npy').tolist(), a.tolist())
+
+    def test_archive_directory_write_arrays_a(self) -> None:
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp)
+            archive = ArchiveDirectory(fp, writeable=True, memory_map=False)
+            with self.assertRaises(ErrorNPYEncode):
+                archive.write_arrays(
+                        (('a.npy', np.arange(3)), ('b.npy', np.array([None]))),
+                        max_workers=2,
+                        )
+            archive = ArchiveDirectory(fp, writeable=False, memory_map=False)
+            self.assertEqual(archive.read_array('a.npy').tolist(), [0, 1, 2])
+
+    def test_archive_directory_release_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,float,bool)')
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp)
+            f1.to_npy(fp)
+            archive = ArchiveDirectory(fp, writeable=False, memory_map=True)
+            f2 = NPYFrameConverter.frame_decode(archive=archive, constructor=Frame)
+            refs = [weakref.ref(mm) for mm in archive._closable]
+            self.assertEqual(len(refs), 3)
+
+            a1 = f2.values[:, 0] # a copy
+            s1 = f2.iloc[:, 1] # a view of a memory-mapped array
+            del f2
+            archive.release()
+            self.assertFalse(archive._closable)
+
+            self.assertEqual([r() is None for r in refs], [True, False, True])
+            self.assertFalse(refs[1]().closed) # type: ignore
+            self.assertEqual(s1.values.tolist(), f1.iloc[:, 1].values.tolist())
+            self.assertEqual(a1.tolist(), f1.values[:, 0].tolist())
+
     def test_archive_directory_a(self) -> None:
         with temp_file('.npy') as fp:
             with self.assertRaises(RuntimeError):
@@ -526,6 +591,26 @@ class TestUnit(TestCase):
                         (('a', ((0, 1930.4), (1, -1760.34), (2, 0.0), (3, 0.0))), ('b', ((0, -610.8), (1, 3243.94), (2, 1930.4), (3, -1760.34))), ('c', ((0, 0.0), (1, 0.0), (2, -610.8), (3, 3243.94))))
                         )
 
+    def test_archive_components_npz_from_frames_n(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,str,bool)').relabel(columns=('a', 'b', 'c'))
+        f2 = ff.parse('s(4,2)|v(float)').relabel(columns=('d', 'e'))
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            NPY(fp, 'w').from_frames(frames=(f1, f2), axis=1, max_workers=2)
+            f3 = Frame.from_npy(fp)
+            self.assertTrue(f3.equals(Frame.from_concat((f1, f2), axis=1), compare_dtype=True))
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            with self.assertRaises(RuntimeError):
+                NPY(fp, 'w').from_arrays(blocks=(np.arange(3), np.arange(4)), axis=1, max_workers=2)
+
+        with temp_file('.npz') as fp:
+            # members of an NPZ are written in sequence
+            with self.assertRaises(TypeError):
+                NPZ(fp, 'w').from_frames(frames=(f1, f2), axis=1, max_workers=2) # type: ignore #pylint: disable=E1123
+
     def test_archive_components_npz_from_frames_m(self) -> None:
         f1 = ff.parse('s(2,2)|v(int)').relabel(index=('a', 'b'))
         f2 = ff.parse('s(2,2)|v(int)').relabel(index=('c', 'd'))
@@ -633,6 +718,33 @@ class TestUnit(TestCase):
                 post3 = archive.size_metadata()
                 self.assertEqual(post3, 90)
 
+    #---------------------------------------------------------------------------
+    def test_archive_sqlite_wrapper_a(self) -> None:
+        with sqlite3.connect(':memory:') as conn:
+            with self.assertRaises(RuntimeError):
+                ArchiveSQLiteWrapper(conn, writeable=True, memory_map=True)
+
+            conn.execute('CREATE TABLE a (name TEXT PRIMARY KEY, value BLOB)')
+            archive = ArchiveSQLiteWrapper(conn, writeable=False, memory_map=False)
+            archive.prefix = 'a'
+            archive.write_array('x.npy', np.array([[True, False], [False, False]]))
+            archive.write_metadata(dict(b=[1, 2]))
+
+            self.assertEqual(list(archive.labels()), ['x.npy', '__meta__.json'])
+            self.assertIn('x.npy', archive)
+            self.assertNotIn('y.npy', archive)
+
+            post1 = archive.read_array('x.npy')
+            self.assertEqual(post1.tolist(), [[True, False], [False, False]])
+            self.assertFalse(post1.flags.writeable)
+            self.assertEqual(archive.read_array_header('x.npy'), (np.dtype('bool'), False, (2, 2)))
+            self.assertEqual(archive.size_array('x.npy'), 68)
+
+            self.assertEqual(archive.read_metadata(), dict(b=[1, 2]))
+            self.assertEqual(archive.size_metadata(), 13)
+            with self.assertRaises(KeyError):
+                archive.read_array('y.npy')
+
 
 if __name__ == '__main__':
     import unittest
@@ -8,6 +8,7 @@ import numpy as np
 
 # from static_frame.core.archive_zip import ZipFilePartRO
 from static_frame.core.archive_zip import ZipFileRO
+from static_frame.core.archive_zip import ZipFileSectionRO
 from static_frame.core.archive_zip import ZipInfoRO
 from static_frame.core.archive_zip import zip_namelist
 from static_frame.core.frame import Frame
@@ -182,6 +183,40 @@ class TestUnit(TestCase):
                 with ZipFileRO(fp) as zfro:
                     pass
 
+    #---------------------------------------------------------------------------
+    def test_zip_file_section_ro_a(self) -> None:
+        f = Frame(np.arange(20))
+        src = io.BytesIO()
+        f.to_npz(src)
+
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w') as zf:
+                zf.writestr('a', b'012')
+                zf.writestr('f.npz', src.getvalue())
+
+            with ZipFileRO(fp) as zf:
+                with zf.open('f.npz') as part:
+                    start = part.tell()
+                end = start + zf.getinfo('f.npz').file_size
+
+            with ZipFileSectionRO(open(fp, 'rb'), end) as section:
+                self.assertEqual(section.seek(-4, 2), end - 4)
+                self.assertEqual(len(section.read()), 4)
+                self.assertEqual(section.read(), b'')
+
+                with ZipFileRO(section) as zf:
+                    self.assertEqual(zf.namelist(), ['__blocks_0__.npy', '__meta__.json'])
+                    with zf.open('__meta__.json') as part:
+                        # offsets are relative to the start of the outer ZIP
+                        self.assertTrue(part.tell() > start)
+
+            with ZipFileSectionRO(open(fp, 'rb'), end) as section:
+                f2 = Frame.from_npz(section)
+                self.assertTrue(f2.equals(f))
+
+            with self.assertRaises(ValueError):
+                section.tell()
+
 
     #---------------------------------------------------------------------------
     def test_zip_namelist_a(self) -> None:
@@ -4,6 +4,8 @@ import frame_fixtures as ff
 import numpy as np
 import typing_extensions as tp
 
+from static_frame.core.axis_map import axis_index_from_bytes
+from static_frame.core.axis_map import axis_index_to_bytes
 from static_frame.core.axis_map import bus_to_hierarchy
 from static_frame.core.axis_map import buses_to_iloc_hierarchy
 from static_frame.core.bus import Bus
@@ -13,6 +15,7 @@ from static_frame.core.exception import ErrorInitQuilt
 from static_frame.core.exception import ErrorInitYarn
 from static_frame.core.frame import Frame
 from static_frame.core.index import Index
+from static_frame.core.index_datetime import IndexDate
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.index_hierarchy import TTreeNode
 from static_frame.test.test_case import TestCase
@@ -171,6 +174,36 @@ class TestUnit(TestCase):
                 [[0, 'f1'], [0, 'f2'], [0, 'f3'], [1, 'f4'], [1, 'f5']]
                 )
 
+    #---------------------------------------------------------------------------
+
+    def test_axis_index_to_bytes_a(self) -> None:
+        f1 = ff.parse('s(3,2)|i(ID,dtD)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(2,2)|i(ID,dtD)|c(I,str)').rename('f2')
+        b1 = Bus.from_frames((f1, f2))
+        hierarchy, opposite = bus_to_hierarchy(b1, axis=0, deepcopy_from_bus=False, init_exception_cls=ErrorInitQuilt)
+
+        axis, depths, post1, post2 = axis_index_from_bytes(
+                axis_index_to_bytes(0, hierarchy, opposite.rename('x'))) # type: ignore
+        self.assertEqual(axis, 0)
+        self.assertIsNone(depths)
+        self.assertTrue(post1.equals(hierarchy, compare_class=True, compare_dtype=True))
+        self.assertEqual(post1.index_types.values.tolist(), [Index, IndexDate])
+        self.assertEqual(post2.values.tolist(), ['zZbu', 'ztsv'])
+        self.assertEqual(post2.name, 'x')
+
+    def test_axis_index_to_bytes_b(self) -> None:
+        f1 = ff.parse('s(3,2)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(3,2)|c(I,str)').rename('f2')
+        b1 = Bus.from_frames((f1, f2))
+        hierarchy, opposite = bus_to_hierarchy(b1, axis=1, deepcopy_from_bus=False, init_exception_cls=ErrorInitQuilt)
+
+        axis, depths, post1, post2 = axis_index_from_bytes(axis_index_to_bytes(1, hierarchy, opposite, (1, 2)))
+        self.assertEqual(axis, 1)
+        self.assertEqual(depths, (1, 2))
+        self.assertEqual(post1.values.tolist(), hierarchy.values.tolist())
+        self.assertEqual(post2.values.tolist(), [0, 1, 2])
+        self.assertTrue(post2._map is None)
+
 if __name__ == '__main__':
     import unittest
     unittest.main()
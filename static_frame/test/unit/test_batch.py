@@ -31,6 +31,9 @@ def func1(f: Frame) -> Frame:
 def func2(label: TLabel, f: Frame) -> Frame:
     return f.loc['q']
 
+def func3(f: Frame) -> Frame:
+    return f * 2
+
 class TestUnit(TestCase):
 
     def test_normalize_container_a(self) -> None:
@@ -347,6 +350,33 @@ class TestUnit(TestCase):
             _ = Batch.from_frames((f1, f2, f3), max_workers=3, chunksize=2,
                     ).apply_except(func1, KeyError).to_frame()
 
+    def test_batch_apply_pool_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)|i(I,str)').rename('f1')
+        f2 = ff.parse('s(3,3)|v(int)|i(I,str)').rename('f2')
+        f3 = Frame.from_dict(dict(d=(10,20), b=(50,60)), index=('x', 'q'), name='f3')
+
+        # chained operations are fused into stages evaluated in one pool
+        b1 = Batch.from_frames((f1, f2, f3), max_workers=2, chunksize=2
+                ).apply(func3).sort_index().sum()
+        self.assertEqual(len(b1._stages), 3)
+        post1 = b1.to_frame()
+        post2 = Batch.from_frames((f1, f2, f3)).apply(func3).sort_index().sum().to_frame()
+        self.assertTrue(post1.equals(post2, compare_dtype=True))
+
+        # Frame results are returned in shared memory
+        b3 = Batch.from_frames((f1, f2, f3), max_workers=2, shared_memory=True
+                ).apply(func3).sort_index()
+        post3 = dict(b3.items())
+        self.assertTrue(post3['f1'].equals((f1 * 2).sort_index(), compare_dtype=True))
+        self.assertEqual(post3['f3'].to_pairs(), (f3 * 2).sort_index().to_pairs())
+        post4 = Batch.from_frames((f1, f2), max_workers=2, shared_memory=True).sum().to_frame()
+        self.assertTrue(post4.equals(Batch.from_frames((f1, f2)).sum().to_frame()))
+
+        # excluded containers are not passed to subsequent stages
+        b2 = Batch.from_frames((f1, f2, f3), max_workers=2, use_threads=True
+                ).apply_except(func1, KeyError).apply_items(lambda l, f: f.rename(l * 2))
+        self.assertEqual([(l, f.name) for l, f in b2.items()], [('f3', 'f3f3')])
+
     def test_batch_apply_except_c(self) -> None:
 
         f1 = Frame.from_dict(
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import ast
+import mmap
 import os
 import pickle
+import zipfile
 from datetime import date
 from datetime import datetime
 from hashlib import sha256
+from tempfile import TemporaryDirectory
 
 import frame_fixtures as ff
 import numpy as np
@@ -1681,6 +1684,187 @@ class TestUnit(TestCase):
                     [('a', 5), ('a', 6)],
                     )
 
+    def test_bus_max_persist_o(self) -> None:
+        b1 = Bus.from_frames(
+            [Frame(np.arange(20).reshape(10, 2) * i, name=f'f{i}') for i in range(1, 5)],
+        )
+        with TemporaryDirectory() as fp:
+            fp_bus = os.path.join(fp, 'bus')
+            b1.to_npy(fp_bus)
+            b2 = Bus.from_npy_mmap(fp_bus, max_persist=2)
+            store = b2._store
+
+            for label in b2.index:
+                self.assertTrue(b2[label].equals(b1[label], compare_name=True, compare_dtype=True))
+                self.assertIsInstance(b2[label].values.base, mmap.mmap)
+            # memory maps of evicted Frames are released
+            self.assertEqual(list(store._archives), ['f3', 'f4']) # type: ignore
+
+            b2.unpersist()
+            self.assertEqual(list(store._archives), []) # type: ignore
+
+            _ = b2.iloc[:3]
+            self.assertEqual(list(store._archives), ['f2', 'f3']) # type: ignore
+
+    #---------------------------------------------------------------------------
+
+    def test_bus_max_persist_bytes_a(self) -> None:
+        b1 = Bus.from_frames(
+            [Frame(np.arange(20).reshape(10, 2) * i, name=f'f{i}') for i in range(1, 7)],
+        )
+        nbytes = b1.iloc[0].nbytes
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp, max_persist_bytes=nbytes * 2)
+
+            for label in b2.index:
+                _ = b2[label]
+                self.assertTrue(b2._loaded.sum() <= 2)
+                self.assertTrue(b2.nbytes <= nbytes * 2)
+
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, True, True])
+            self.assertEqual(b2.nbytes, b2.status['nbytes'].sum())
+
+            # accessing a loaded Frame moves it to the end of the LRU
+            _ = b2['f5']
+            _ = b2['f1']
+            self.assertEqual(b2.status.index[b2.status['loaded']].tolist(),
+                    ['f1', 'f5'])
+
+            b2.unpersist()
+            self.assertEqual(b2.nbytes, 0)
+            self.assertEqual(len(b2._last_accessed), 0)
+
+    def test_bus_max_persist_bytes_b(self) -> None:
+        f1 = Frame(np.arange(20).reshape(10, 2), name='f1')
+        f2 = Frame(np.arange(2000).reshape(1000, 2), name='f2')
+        f3 = Frame(np.arange(20).reshape(10, 2), name='f3')
+        b1 = Bus.from_frames((f1, f2, f3))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp, max_persist_bytes=f2.nbytes // 2)
+
+            _ = b2['f1']
+            self.assertEqual(b2._loaded.tolist(), [True, False, False])
+
+            # a Frame larger than the budget is retained, but all others are removed
+            self.assertTrue(b2['f2'].equals(f2))
+            self.assertEqual(b2._loaded.tolist(), [False, True, False])
+            self.assertEqual(b2.nbytes, f2.nbytes)
+
+            _ = b2['f3']
+            self.assertEqual(b2._loaded.tolist(), [False, False, True])
+
+            # selecting more than the budget retains the selection
+            b3 = b2.iloc[:2]
+            self.assertEqual(b2._loaded.tolist(), [True, True, False])
+            self.assertEqual(b3._loaded.tolist(), [True, True])
+
+    def test_bus_max_persist_bytes_c(self) -> None:
+        b1 = Bus.from_frames(
+            [Frame(np.arange(20).reshape(10, 2) * i, name=f'f{i}') for i in range(1, 7)],
+        )
+        nbytes = b1.iloc[0].nbytes
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp, max_persist=3, max_persist_bytes=nbytes * 2)
+
+            for (label, f), f_src in zip(b2.items(), b1.values):
+                self.assertTrue(f.equals(f_src))
+                self.assertTrue(b2._loaded.sum() <= 3)
+
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, True, True, True])
+
+            # the count limit applies even if the bytes limit is not reached
+            b3 = Bus.from_zip_npz(fp, max_persist=1, max_persist_bytes=nbytes * 10)
+            self.assertTrue(b3.values[2].equals(b1.values[2]))
+            self.assertEqual(b3._loaded.tolist(),
+                    [False, False, False, False, False, True])
+
+            b4 = Bus.from_zip_npz(fp, max_persist_bytes=nbytes * 3)
+            self.assertTrue(b4.equals(b1))
+            self.assertEqual(b4.nbytes, nbytes * 3)
+            self.assertEqual(b4.rename('foo')._max_persist_bytes, nbytes * 3)
+
+    #---------------------------------------------------------------------------
+
+    def test_bus_prefetch_a(self) -> None:
+        b1 = Bus.from_frames(
+            [Frame(np.arange(20).reshape(10, 2) * i, name=f'f{i}') for i in range(1, 8)],
+        )
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            b2 = Bus.from_zip_npz(fp, max_persist=2, prefetch=2)
+            for (label, f), f_src in zip(b2.items(), b1.values):
+                self.assertEqual(label, f_src.name)
+                self.assertTrue(f.equals(f_src))
+                self.assertTrue(b2._loaded.sum() + len(b2._prefetcher._futures) <= 2) # type: ignore
+
+            self.assertIsNone(b2._prefetcher)
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, False, True, True])
+
+            b3 = Bus.from_zip_npz(fp, max_persist=3, prefetch=3)
+            for f, f_src in zip(b3.iter_element(), b1.values):
+                self.assertTrue(f.equals(f_src))
+                self.assertTrue(b3._loaded.sum() <= 3)
+            self.assertEqual(b3._loaded.tolist(),
+                    [False, False, False, False, True, True, True])
+
+            b4 = Bus.from_zip_npz(fp, max_persist=2, prefetch=1)
+            self.assertTrue(b4.equals(b1))
+            self.assertEqual([f.name for f in b4.values], list(b1.index))
+            self.assertEqual(b4._loaded.sum(), 2)
+
+    def test_bus_prefetch_b(self) -> None:
+        b1 = Bus.from_frames(
+            [Frame(np.arange(20).reshape(10, 2) * i, name=f'f{i}') for i in range(1, 5)],
+        )
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            b2 = Bus.from_zip_npz(fp, prefetch=2)
+            it = b2.items()
+            label, f = next(it)
+            self.assertEqual(label, 'f1')
+            self.assertEqual(b2._loaded.tolist(), [True, False, False, False])
+            # an abandoned iterator releases the prefetcher
+            it.close()
+            self.assertIsNone(b2._prefetcher)
+
+            self.assertEqual(b2.iloc[1:].rename('foo')._prefetch, 2)
+            self.assertEqual([f.name for f in b2.iter_element()], list(b1.index))
+            self.assertTrue(b2._loaded_all)
+
+    def test_bus_prefetch_c(self) -> None:
+        with self.assertRaises(ErrorInitBus):
+            Bus((Frame(),), index=('a',), prefetch=-1)
+        # no Frame can be read ahead if only one can be loaded
+        with self.assertRaises(ErrorInitBus):
+            Bus((Frame(),), index=('a',), max_persist=1, prefetch=2)
+        self.assertEqual(Bus((Frame(),), index=('a',), max_persist=1)._prefetch, 0)
+
+    def test_bus_prefetch_d(self) -> None:
+        b1 = Bus.from_frames(
+            [Frame(np.arange(20).reshape(10, 2) * i, name=f'f{i}') for i in range(1, 10)],
+        )
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            # read-ahead Frame are counted against max_persist
+            for max_persist, prefetch in ((2, 3), (3, 5), (4, 2), (5, 1)):
+                b2 = Bus.from_zip_npz(fp, max_persist=max_persist, prefetch=prefetch)
+                for f, f_src in zip(b2.iter_element(), b1.values):
+                    self.assertTrue(f.equals(f_src))
+                    self.assertTrue(b2._loaded.sum() + len(b2._prefetcher._futures) <= max_persist) # type: ignore
+                self.assertEqual(b2._loaded.sum(), max_persist)
+
 
     #---------------------------------------------------------------------------
 
@@ -2424,6 +2608,21 @@ class TestUnit(TestCase):
             self.assertEqual(frame.name, b2.iloc[0].name)
             self.assertEqual(frame.shape, b2.iloc[0].shape)
 
+    def test_bus_npz_d(self) -> None:
+        b1 = Bus.from_frames(
+            [Frame(np.arange(20).reshape(10, 2) * i, name=f'f{i}') for i in range(1, 5)],
+        )
+        config = StoreConfig(memory_map=True)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp, compression=zipfile.ZIP_STORED)
+            b2 = Bus.from_zip_npz(fp, max_persist=2, config=config)
+            for label in b2.index:
+                self.assertTrue(b2[label].equals(b1[label], compare_name=True, compare_dtype=True))
+                self.assertIsInstance(b2[label].values.base, mmap.mmap)
+            self.assertEqual(b2.status.index[b2.status['loaded']].tolist(),
+                    ['f3', 'f4'])
+
 
     #---------------------------------------------------------------------------
     def test_bus_npy_a(self) -> None:
@@ -2500,6 +2699,21 @@ class TestUnit(TestCase):
         self.assertEqual(d,
                 '29a271e0d800ecaa673c7deded9dd7e8166cc746963c1717298e6af9e4189f23')
 
+    def test_bus_via_hashlib_b(self) -> None:
+        f1 = ff.parse('s(4,2)').rename('f1')
+        f2 = ff.parse('s(4,5)').rename('f2')
+        f3 = ff.parse('s(2,2)').rename('f3')
+
+        b1 = Bus.from_frames((f1, f2, f3))
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp, max_persist=1)
+            d = b2.via_hashlib(include_name=False).sha256().hexdigest()
+            self.assertEqual(b2.status['loaded'].sum(), 1)
+
+        self.assertEqual(d,
+                '29a271e0d800ecaa673c7deded9dd7e8166cc746963c1717298e6af9e4189f23')
+
     #---------------------------------------------------------------------------
 
     def test_bus_store_pickle_roundtrip(self) -> None:
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+from tempfile import TemporaryDirectory
+
+import frame_fixtures as ff
+import numpy as np
+
+from static_frame.core.bus import Bus
+from static_frame.core.cache import Cache
+from static_frame.core.cache import iter_cache_func_bytes
+from static_frame.core.cache import iter_cache_key_bytes
+from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
+from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.series import Series
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_iter_cache_key_bytes_a(self) -> None:
+        f1 = ff.parse('s(3,2)|v(int,float)')
+
+        def key(value: object) -> bytes:
+            return b''.join(iter_cache_key_bytes(value))
+
+        self.assertEqual(key(f1), key(ff.parse('s(3,2)|v(int,float)')))
+        self.assertNotEqual(key(f1), key(f1.rename('a')))
+        self.assertNotEqual(key(f1), key(f1.rename(index='a')))
+        self.assertNotEqual(key((1, 'a')), key([1, 'a']))
+        self.assertNotEqual(key(1), key(1.0))
+        self.assertNotEqual(key(np.arange(4)), key(np.arange(4).reshape(2, 2)))
+        self.assertEqual(key(dict(a=(1, None))), key(dict(a=(1, None))))
+
+        with self.assertRaises(TypeError):
+            key(object())
+        with self.assertRaises(TypeError):
+            key(np.array([1, None]))
+
+    def test_iter_cache_key_bytes_b(self) -> None:
+
+        def key(value: object) -> bytes:
+            return b''.join(iter_cache_key_bytes(value))
+
+        # object values are signed by address: two Frames with different contents at the same address
+        value = [1]
+        f1 = Frame.from_fields(([value, 'a'],), columns=('a',))
+        value.append(2)
+        f2 = Frame.from_fields(([value, 'a'],), columns=('a',))
+        self.assertIs(f1.values[0, 0], f2.values[0, 0])
+        with self.assertRaises(TypeError):
+            key(f1)
+        with self.assertRaises(TypeError):
+            key(f2)
+
+        with self.assertRaises(TypeError):
+            key(Series((1, 2), index=(None, 'a')))
+        with self.assertRaises(TypeError):
+            key(Series((None, 'a')))
+        with self.assertRaises(TypeError):
+            key(Frame.from_records([(1, 2)], columns=IndexHierarchy.from_labels([(1, None), (1, 'a')])))
+        with self.assertRaises(TypeError):
+            key(Bus.from_frames((Frame.from_records([(1, 2)], name='a'),)))
+
+        self.assertEqual(key(Series((1, 2), index=('a', 'b'))), key(Series((1, 2), index=('a', 'b'))))
+
+    def test_iter_cache_func_bytes_a(self) -> None:
+
+        def func_a(f: Frame) -> Frame:
+            return f * 2
+
+        def func_b(f: Frame) -> Frame:
+            return f * 3
+
+        def func_c(f: Frame) -> Frame:
+            return f.iter_element().apply(lambda e: e * 2)
+
+        post1 = b''.join(iter_cache_func_bytes(func_a))
+        self.assertIn(b'func_a', post1)
+        self.assertNotEqual(post1, b''.join(iter_cache_func_bytes(func_b)))
+        # nested code objects do not include memory addresses
+        self.assertNotIn(b' at 0x', b''.join(iter_cache_func_bytes(func_c)))
+
+    #---------------------------------------------------------------------------
+
+    def test_cache_a(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)').rename('f1')
+        calls = []
+
+        with TemporaryDirectory() as fp:
+            cache = Cache(fp)
+
+            @cache
+            def func(f: Frame, *, scale: int = 2) -> Frame:
+                calls.append(scale)
+                return (f * scale).rename('post')
+
+            post1 = func(f1)
+            post2 = func(f1)
+            self.assertEqual(calls, [2])
+            self.assertTrue(post1.equals(post2, compare_name=True, compare_dtype=True, compare_class=True))
+            self.assertEqual(func.__name__, 'func')
+
+            func(f1, scale=3)
+            func(f1.rename('f2'))
+            self.assertEqual(calls, [2, 3, 2])
+            self.assertEqual(len(cache), 3)
+
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.nbytes, 0)
+
+    def test_cache_b(self) -> None:
+        f1 = FrameGO(ff.parse('s(4,4)|v(int,float)'))
+
+        with TemporaryDirectory() as fp:
+            cache = Cache(fp)
+            post1 = cache.call(FrameGO.relabel, f1, columns=tuple('abcd'))
+            post2 = cache.call(FrameGO.relabel, f1, columns=tuple('abcd'))
+            self.assertIs(post2.__class__, FrameGO)
+            self.assertEqual(post1.to_pairs(), post2.to_pairs())
+
+            with self.assertRaises(TypeError):
+                cache.call(lambda f: f.iloc[0], f1)
+
+            with self.assertRaises(TypeError):
+                cache.put(cache.key(print), Series((1, 2)))
+
+    def test_cache_e(self) -> None:
+        f1 = ff.parse('s(4,2)|v(int)')
+
+        def func_a(f: Frame) -> Frame:
+            return f.cumsum()
+
+        def func_b(f: Frame) -> Frame:
+            return f.cumprod()
+
+        # functions of the same name that differ only by the names they reference
+        func_b.__qualname__ = func_a.__qualname__
+        self.assertEqual(func_a.__code__.co_code, func_b.__code__.co_code)
+
+        with TemporaryDirectory() as fp:
+            cache = Cache(fp)
+            self.assertNotEqual(cache.key(func_a, f1), cache.key(func_b, f1))
+            post1 = cache.call(func_a, f1)
+            post2 = cache.call(func_b, f1)
+            self.assertTrue(post1.equals(f1.cumsum()))
+            self.assertTrue(post2.equals(f1.cumprod()))
+
+    def test_cache_c(self) -> None:
+        frames = [ff.parse('s(100,4)|v(float)').rename(str(i)) for i in range(6)]
+
+        with TemporaryDirectory() as fp:
+            cache = Cache(fp)
+            key = cache.key(Frame.sort_index, frames[0])
+            self.assertIsNone(cache.get(key))
+            cache.put(key, frames[0])
+            size = cache.nbytes
+
+            cache = Cache(fp, max_bytes=size * 3)
+            keys = []
+            for i, f in enumerate(frames):
+                keys.append(cache.key(Frame.sort_index, f))
+                cache.put(keys[-1], f)
+                if i == 2:
+                    # mark the first as most-recently used
+                    os.utime(cache._fp(keys[0], Frame), ns=(0, 2**62))
+
+            self.assertTrue(cache.nbytes <= size * 3)
+            self.assertEqual(len(cache), 3)
+            self.assertIsNotNone(cache.get(keys[0]))
+            self.assertIsNotNone(cache.get(keys[-1]))
+            self.assertIsNone(cache.get(keys[1]))
+
+    def test_cache_d(self) -> None:
+        with TemporaryDirectory() as fp:
+            with self.assertRaises(RuntimeError):
+                Cache(fp, max_bytes=-1)
+            cache = Cache(os.path.join(fp, 'a', 'b'))
+            self.assertTrue(os.path.isdir(os.path.join(fp, 'a', 'b')))
+            self.assertTrue(repr(cache).startswith('<Cache: '))
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
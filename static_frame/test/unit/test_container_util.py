@@ -17,6 +17,8 @@ from static_frame import Series
 from static_frame.core.container_util import ContainerMap
 from static_frame.core.container_util import apex_to_name
 from static_frame.core.container_util import apply_binary_operator_blocks_columnar
+from static_frame.core.container_util import axis_window_bounds
+from static_frame.core.container_util import axis_window_items
 from static_frame.core.container_util import bloc_key_normalize
 from static_frame.core.container_util import container_to_exporter_attr
 from static_frame.core.container_util import get_block_match
@@ -28,6 +30,7 @@ from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_to_one
 from static_frame.core.container_util import is_static
+from static_frame.core.container_util import iter_array_signature_bytes
 from static_frame.core.container_util import key_to_ascending_key
 from static_frame.core.container_util import matmul
 from static_frame.core.container_util import pandas_to_numpy
@@ -899,6 +902,58 @@ class TestUnit(TestCase):
         post = group_from_container(idx, s, None, 0)
         self.assertEqual(post.tolist(), [[0], [None], [0]])
 
+    #---------------------------------------------------------------------------
+
+    def test_axis_window_bounds_a(self) -> None:
+        starts, stops, labels = axis_window_bounds(count_labels=5, size=2)
+        self.assertEqual(starts.tolist(), [0, 1, 2, 3])
+        self.assertEqual(stops.tolist(), [2, 3, 4, 5])
+        self.assertEqual(labels.tolist(), [1, 2, 3, 4])
+
+        starts, stops, labels = axis_window_bounds(count_labels=5,
+                size=3,
+                window_sized=False,
+                label_shift=-2,
+                step=2,
+                )
+        self.assertEqual(starts.tolist(), [0, 2, 4])
+        self.assertEqual(stops.tolist(), [3, 5, 5])
+        self.assertEqual(labels.tolist(), [0, 2, 4])
+
+        with self.assertRaises(RuntimeError):
+            axis_window_bounds(count_labels=5, size=0)
+
+    def test_axis_window_bounds_b(self) -> None:
+        s = Series(range(7))
+        for kwargs in (
+                dict(size=3, start_shift=-2, window_sized=False, label_missing_skips=False),
+                dict(size=1, step=0, size_increment=1),
+                dict(size=4, step=3, size_increment=-1, window_sized=False),
+                dict(size=2, label_shift=2, start_shift=3),
+                ):
+            starts, stops, labels = axis_window_bounds(count_labels=7, **kwargs) # type: ignore
+            windows = [(label, w.tolist()) for label, w in axis_window_items(
+                    source=s, as_array=True, **kwargs)] # type: ignore
+            self.assertEqual(windows,
+                    [(None if l < 0 else l, list(range(a, b))) for a, b, l in zip(starts, stops, labels)])
+
+    #---------------------------------------------------------------------------
+
+    def test_iter_array_signature_bytes_a(self) -> None:
+        a1 = np.arange(12).reshape(3, 4)
+        for a in (a1, a1.T, a1[:, 1], a1[1], a1[:0], a1.astype('datetime64[D]')):
+            post = list(iter_array_signature_bytes(a))
+            self.assertEqual(b''.join(post), a.tobytes('F'))
+
+        # contiguous arrays are not copied
+        post1 = list(iter_array_signature_bytes(a1.T))
+        self.assertEqual(len(post1), 1)
+        self.assertIsInstance(post1[0], memoryview)
+
+        # C-ordered 2D arrays are copied one column at a time
+        post2 = list(iter_array_signature_bytes(a1))
+        self.assertEqual(len(post2), 4)
+
 
     def test_get_containers(self) -> None:
         keys_gc = set(cls.__name__ for cls in TestCase.get_containers())
@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import dataclasses
 import datetime
+import hashlib
 import io
 import itertools as it
 import os
@@ -20,6 +21,7 @@ from itertools import chain
 from itertools import repeat
 from tempfile import TemporaryDirectory
 from tempfile import TemporaryFile
+from unittest.mock import patch
 
 import frame_fixtures as ff
 import numpy as np
@@ -7280,6 +7282,100 @@ class TestUnit(TestCase):
         self.assertEqual(f3.columns.name, 'index')
         self.assertEqual(f3.to_pairs(), (('column', ()),))
 
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_from_csv_iter_a(self) -> None:
+        f1 = ff.parse('s(10,3)|v(int,str,float)').rename('a')
+        s = io.StringIO()
+        f1.to_csv(s)
+
+        s.seek(0)
+        post = list(sf.Frame.from_csv_iter(s, chunk_rows=4, index_depth=1, name='a'))
+        self.assertEqual([f.shape for f in post], [(4, 3), (4, 3), (2, 3)])
+        self.assertTrue(all(f.name == 'a' for f in post))
+
+        s.seek(0)
+        f2 = sf.Frame.from_csv(s, index_depth=1, name='a')
+        self.assertEqualFrames(sf.Frame.from_concat(post, name='a'), f2)
+
+    def test_frame_from_csv_iter_b(self) -> None:
+        f1 = sf.Frame.from_records(
+                [(1, 'a\n"x"', 0.5), (2, 'b', 1.5), (3, 'c\nd', 2.5), (4, 'e', 3.5)],
+                columns=('p', 'q', 'r'),
+                )
+        s = io.StringIO()
+        f1.to_csv(s, include_index=False)
+
+        s.seek(0)
+        post = list(sf.FrameGO.from_csv_iter(s,
+                chunk_rows=3,
+                dtypes=dict(p=np.int16),
+                ))
+        self.assertEqual([f.shape for f in post], [(3, 3), (1, 3)])
+        self.assertEqual([f.dtypes['p'] for f in post], [np.int16, np.int16])
+        self.assertEqual(post[0]['q'].values.tolist(), ['a\n"x"', 'b', 'c\nd'])
+        self.assertIsNot(post[0].columns, post[1].columns)
+
+        post[0]['s'] = 0
+        self.assertEqual(post[1].columns.values.tolist(), ['p', 'q', 'r'])
+
+    def test_frame_from_csv_max_workers_a(self) -> None:
+        lines = ['idx,a,b,c,d,e\n']
+        for i in range(40):
+            b = '' if i == 35 else i * 0.5
+            c = 'True' if i < 30 else 'x'
+            e = i if i < 20 else ''
+            lines.append(f'r{i},{i},{b},{c},"a\n{i}",{e}\n')
+        text = ''.join(lines)
+
+        f1 = sf.Frame.from_csv(io.StringIO(text), index_depth=1)
+        f2 = sf.Frame.from_csv(io.StringIO(text), index_depth=1, max_workers=3)
+        self.assertEqualFrames(f1, f2)
+        self.assertEqual(f2.dtypes.values.tolist(),
+                [np.dtype(np.int64), np.dtype(np.float64), np.dtype('<U4'), np.dtype('<U4'), np.dtype(np.int64)]
+                )
+
+        f3 = sf.Frame.from_csv(io.StringIO(text), columns_select=('c', 'e', 'a'))
+        f4 = sf.Frame.from_csv(io.StringIO(text), columns_select=('c', 'e', 'a'), max_workers=4)
+        self.assertEqualFrames(f3, f4)
+
+        f5 = sf.Frame.from_csv(io.StringIO(text), index_depth=1, dtypes=dict(e=str))
+        f6 = sf.Frame.from_csv(io.StringIO(text), index_depth=1, dtypes=dict(e=str), max_workers=2)
+        self.assertEqualFrames(f5, f6)
+
+    def test_frame_from_csv_max_workers_b(self) -> None:
+        f1 = sf.Frame.from_csv(io.StringIO('a,b\n1,2\n'), max_workers=4)
+        self.assertEqual(f1.to_pairs(), (('a', ((0, 1),)), ('b', ((0, 2),))))
+
+        f2 = sf.Frame.from_csv(io.StringIO('a,b\n1,2\n3,4\n'), max_workers=4)
+        self.assertEqual(f2.to_pairs(), (('a', ((0, 1), (1, 3))), ('b', ((0, 2), (1, 4)))))
+
+    def test_frame_from_delimited_iter_a(self) -> None:
+        s = io.StringIO('a|b\n1|2\n3|4\n5|6\nfooter\n')
+        post = list(sf.Frame.from_delimited_iter(s,
+                delimiter='|',
+                chunk_rows=2,
+                skip_footer=1,
+                columns_select=('b',),
+                ))
+        self.assertEqual([f.to_pairs() for f in post],
+                [(('b', ((0, 2), (1, 4))),), (('b', ((0, 6),)),)]
+                )
+
+        with self.assertRaises(ErrorInitFrame):
+            sf.Frame.from_delimited_iter(s, delimiter='|', chunk_rows=0)
+
+        with self.assertRaises(ErrorInitFrame):
+            sf.Frame.from_delimited_iter(s, delimiter='|', chunk_rows=2, skip_header=-1)
+
+        self.assertEqual(
+                list(sf.Frame.from_delimited_iter(io.StringIO('a|b\n'),
+                delimiter='|',
+                chunk_rows=2,
+                )),
+                [])
+
     #---------------------------------------------------------------------------
 
     def test_frame_to_pairs_a(self) -> None:
@@ -10707,6 +10803,15 @@ class TestUnit(TestCase):
             f2.equals(f3, compare_dtype=True, compare_class=True, compare_name=True)
             self.assertEqual(f3._blocks.shapes.tolist(), [(20, 50)])
 
+    def test_frame_to_npy_max_workers_a(self) -> None:
+        f1 = ff.parse('s(20,100)|v(int,str,bool,float)').rename('foo')
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp, max_workers=4)
+            f2 = Frame.from_npy(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+
     def test_frame_to_npy_failure_a(self) -> None:
         from datetime import date
         with TemporaryDirectory() as fp:
@@ -10786,6 +10891,34 @@ class TestUnit(TestCase):
             self.assertFalse(os.path.exists(fp))
             os.mkdir(fp)
 
+    def test_frame_from_npz_b(self) -> None:
+        f1 = Frame(index=('a', 'b', 'c'), name='x')
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp)
+            f2 = sf.Frame.from_npz(fp)
+            self.assertEqual(f2.shape, (3, 0))
+            self.assertTrue(f2.equals(f1, compare_name=True, compare_class=True))
+
+    def test_frame_from_npz_memory_map_a(self) -> None:
+        f1 = ff.parse('s(10_000,3)|v(int,str,bool)|i((I, ID),(str,dtD))|c(ID,dtD)').rename('foo')
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp)
+            f2, finalizer = Frame.from_npz_mmap(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+            self.assertFalse(f2.values.flags.writeable)
+            del f2
+            finalizer()
+
+    def test_frame_from_npz_memory_map_b(self) -> None:
+        f1 = ff.parse('s(3,3)')
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp)
+            with open(fp, 'rb') as f:
+                src = f.read()
+        # memory maps require a file descriptor
+        with self.assertRaises(io.UnsupportedOperation):
+            Frame.from_npz_mmap(io.BytesIO(src))
+
 
     #---------------------------------------------------------------------------
 
@@ -11896,6 +12029,72 @@ class TestUnit(TestCase):
                 ((('date', 'to'), ((('0', '2006-01-01'), 'a1'), (('1', '2006-01-02'), 'a1'), (('2', '2006-01-01'), 'b2'), (('3', '2006-01-02'), 'b2'))), (('value', 'a'), ((('0', '2006-01-01'), 12.5), (('1', '2006-01-02'), 12.5), (('2', '2006-01-01'), 12.5), (('3', '2006-01-02'), 12.5))))
                 )
 
+    def test_frame_from_sql_e(self) -> None:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('create table t (k integer, a integer, b text, c real)')
+        rows = [(i, i if i < 5 else 'x', f'b{i}', None if i == 2 else i * .5)
+                for i in range(7)]
+        conn.executemany('insert into t values (?, ?, ?, ?)', rows)
+
+        # types are resolved across batches of fetched rows
+        with patch('static_frame.core.frame.SQL_FETCH_ROWS', 3):
+            f1 = sf.Frame.from_sql('select * from t', connection=conn, index_depth=1)
+        f2 = sf.Frame.from_records([r[1:] for r in rows],
+                index=[r[0] for r in rows],
+                columns=('a', 'b', 'c'),
+                )
+        self.assertEqualFrames(f1, f2)
+        self.assertEqual(f1.dtypes.values.tolist(), [object, np.dtype('<U2'), object])
+
+    def test_frame_from_sql_iter_a(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_e()
+
+        post = list(sf.Frame.from_sql_iter('select * from events',
+                connection=conn,
+                chunk_rows=3,
+                index_depth=2,
+                index_constructors=(IndexDate, Index),
+                columns_select=('value',),
+                dtypes={'value': np.float32},
+                name='a',
+                ))
+        self.assertEqual([f.shape for f in post], [(3, 1), (1, 1)])
+        self.assertTrue(all(f.name == 'a' for f in post))
+        self.assertEqual([f.dtypes['value'] for f in post], [np.float32, np.float32])
+        self.assertEqual(post[1].index.index_types.values.tolist(), [IndexDate, Index])
+
+        f1 = sf.Frame.from_sql('select * from events',
+                connection=conn,
+                index_depth=2,
+                index_constructors=(IndexDate, Index),
+                columns_select=('value',),
+                dtypes={'value': np.float32},
+                name='a',
+                )
+        self.assertEqualFrames(sf.Frame.from_concat(post, name='a'), f1)
+
+    def test_frame_from_sql_iter_b(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_e()
+
+        post = list(sf.FrameGO.from_sql_iter('select * from events where identifier=?',
+                connection=conn,
+                chunk_rows=1,
+                parameters=('b2',),
+                ))
+        self.assertEqual([f.shape for f in post], [(1, 4), (1, 4)])
+        self.assertIsNot(post[0].columns, post[1].columns)
+        post[0]['x'] = 0
+        self.assertEqual(post[1].columns.values.tolist(), ['date', 'identifier', 'value', 'count'])
+
+        self.assertEqual(list(sf.Frame.from_sql_iter('select * from events where identifier=?',
+                connection=conn,
+                chunk_rows=2,
+                parameters=('c3',),
+                )), [])
+
+        with self.assertRaises(ErrorInitFrame):
+            sf.Frame.from_sql_iter('select * from events', connection=conn, chunk_rows=0)
+
     #---------------------------------------------------------------------------
 
     def test_frame_from_records_items_a(self) -> None:
@@ -15545,6 +15744,106 @@ class TestUnit(TestCase):
             'a9be99c9d2ab6f60294f2931bc875833993ce3f4d41d8da16802135e041317b6'
             )
 
+    def test_frame_via_hashlib_b(self) -> None:
+
+        f1 = ff.parse('f(Fg)|v(int64,bool,str)|c(Ig,str)|s(4,8)')
+        f2 = f1.consolidate[:]
+        h1 = f1.via_hashlib(include_name=False)
+        h2 = f2.via_hashlib(include_name=False)
+        self.assertEqual(h1.to_bytes(), h2.to_bytes())
+        self.assertEqual(h1.to_bytes(), f1._to_signature_bytes(include_name=False))
+
+        # digests are derived from components, not the concatenated bytes
+        self.assertTrue(len(list(f1._iter_signature_bytes(include_name=False))) > f1.shape[1])
+        for name in ('md5', 'sha256', 'sha3_512', 'blake2b', 'blake2s'):
+            self.assertEqual(getattr(h1, name)().hexdigest(),
+                    getattr(hashlib, name)(h2.to_bytes()).hexdigest())
+        self.assertEqual(h1.shake_256().hexdigest(8),
+                hashlib.shake_256(h2.to_bytes()).hexdigest(8))
+
+    #---------------------------------------------------------------------------
+    def test_frame_via_group_a(self) -> None:
+        f1 = Frame.from_fields(
+                ((1, 2, 1, 2, 1),
+                (10.0, np.nan, 30.0, 40.0, np.nan),
+                ('a', 'b', 'c', 'd', 'e'),
+                (True, False, False, True, True)),
+                columns=('k', 'x', 'y', 'z'),
+                index=tuple('pqrst'),
+                name='f',
+                )
+        g = f1.via_group('k')
+
+        f2 = g.sum()
+        self.assertEqual(f2.name, 'f')
+        self.assertEqual(f2.index.name, 'k')
+        self.assertEqual(f2.to_pairs(),
+                (('x', ((1, 40.0), (2, 40.0))), ('y', ((1, 'ace'), (2, 'bd'))), ('z', ((1, 2), (2, 1))))
+                )
+        self.assertEqual(g.min().to_pairs(),
+                (('x', ((1, 10.0), (2, 40.0))), ('y', ((1, 'a'), (2, 'b'))), ('z', ((1, False), (2, False))))
+                )
+        self.assertEqual(g.max().to_pairs(),
+                (('x', ((1, 30.0), (2, 40.0))), ('y', ((1, 'e'), (2, 'd'))), ('z', ((1, True), (2, True))))
+                )
+        self.assertEqual(g.count().to_pairs(),
+                (('x', ((1, 2), (2, 1))), ('y', ((1, 3), (2, 2))), ('z', ((1, 3), (2, 2))))
+                )
+
+    def test_frame_via_group_b(self) -> None:
+        f1 = Frame.from_fields(
+                ((1, 2, 1, 2, 1),
+                (10.0, np.nan, 30.0, 40.0, np.nan),
+                (True, False, False, True, True)),
+                columns=('k', 'x', 'z'),
+                index=tuple('pqrst'),
+                )
+        g = f1.via_group('k')
+
+        self.assertEqual(g.mean().to_pairs(),
+                (('x', ((1, 20.0), (2, 40.0))), ('z', ((1, 2 / 3), (2, 0.5))))
+                )
+        self.assertEqual(g.sum(skipna=False).fillna(-1).to_pairs(),
+                (('x', ((1, -1.0), (2, -1.0))), ('z', ((1, 2), (2, 1))))
+                )
+        self.assertEqual(g.count(skipna=False).to_pairs(),
+                (('x', ((1, 3), (2, 2))), ('z', ((1, 3), (2, 2))))
+                )
+        # first and last do not skip NA values
+        self.assertEqual(g.first().fillna(-1).to_pairs(),
+                (('x', ((1, 10.0), (2, -1.0))), ('z', ((1, True), (2, False))))
+                )
+        self.assertEqual(g.last().fillna(-1).to_pairs(),
+                (('x', ((1, -1.0), (2, 40.0))), ('z', ((1, True), (2, True))))
+                )
+
+    def test_frame_via_group_c(self) -> None:
+        f1 = FrameGO.from_fields(
+                ((1, 2, 1, 2, 1),
+                (10.0, np.nan, 30.0, 40.0, np.nan),
+                ('a', 'b', 'c', 'd', 'e'),
+                (True, False, False, True, True)),
+                columns=('k', 'x', 'y', 'z'),
+                )
+        f2 = f1.via_group(['k', 'z']).sum()
+        self.assertIs(f2.__class__, FrameGO)
+        self.assertEqual(f2.index.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(bool)])
+        self.assertEqual(f2.to_pairs(),
+                (('x', (((1, False), 30.0), ((1, True), 10.0), ((2, False), 0.0), ((2, True), 40.0))), ('y', (((1, False), 'c'), ((1, True), 'ae'), ((2, False), 'b'), ((2, True), 'd'))))
+                )
+
+    def test_frame_via_group_d(self) -> None:
+        f1 = ff.parse('s(40,4)|v(int,float,int,float)|c(I,str)')
+        f1 = f1.assign['zZbu'](f1['zZbu'] % 3)
+        f2 = f1.via_group('zZbu').mean()
+        f3 = Frame.from_concat(
+                (f.mean().rename(label) for label, f in f1.iter_group_items('zZbu')),
+                ).drop['zZbu']
+        self.assertEqual(f2.index.values.tolist(), f3.index.values.tolist())
+        self.assertEqual(f2.columns.values.tolist(), f3.columns.values.tolist())
+        self.assertTrue(np.allclose(f2.values, f3.values))
+
     #---------------------------------------------------------------------------
     def test_frame_consolidate_a(self) -> None:
         f1 = Frame.from_fields(
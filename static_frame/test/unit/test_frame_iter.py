@@ -1298,6 +1298,64 @@ class TestUnit(TestCase):
         self.assertEqual(len(post), 18)
         self.assertTrue(all(f.shape == (3, 4) for f in post))
 
+    def test_frame_iter_window_reduce_a(self) -> None:
+        f1 = ff.parse('s(8,4)|v(int,float,bool,float)').rename('x')
+
+        for func in ('max', 'mean', 'min', 'std', 'sum', 'var'):
+            f2 = getattr(f1.iter_window(size=3, step=2), func)()
+            self.assertEqual(f2.shape, (3, 4))
+            self.assertEqual(f2.name, 'x')
+            self.assertTrue(f2.columns.equals(f1.columns))
+            for label, window in f1.iter_window_items(size=3, step=2):
+                self.assertTrue(np.allclose(
+                        f2.loc[label].values.astype(float),
+                        getattr(window, func)().values.astype(float),
+                        ))
+
+    def test_frame_iter_window_reduce_b(self) -> None:
+        f1 = sf.FrameGO.from_fields(((10, -2, 0, 0), (8, -3, 8, 0), (1, 0, 9, 12)),
+                index=('p', 'q', 'r', 's'),
+                columns=('a', 'b', 'c'),
+                )
+        f2 = f1.iter_window(size=2, axis=1).sum()
+        self.assertIs(f2.__class__, sf.FrameGO)
+        self.assertEqual(f2.to_pairs(),
+                (('b', (('p', 18), ('q', -5), ('r', 8), ('s', 0))), ('c', (('p', 9), ('q', -3), ('r', 17), ('s', 12)))))
+
+        f3 = f1.iter_window(size=2).max()
+        self.assertEqual(f3.to_pairs(),
+                (('a', (('q', 10), ('r', 0), ('s', 0))), ('b', (('q', 8), ('r', 8), ('s', 8))), ('c', (('q', 1), ('r', 9), ('s', 12)))))
+
+    def test_frame_iter_window_reduce_c(self) -> None:
+        f1 = sf.Frame.from_fields(((1, 2, 3), ('a', 'c', 'b')),
+                index=('p', 'q', 'r'),
+                columns=('a', 'b'),
+                )
+        f2 = f1.iter_window(size=2).max()
+        self.assertEqual(f2.to_pairs(),
+                (('a', (('q', 2), ('r', 3))), ('b', (('q', 'c'), ('r', 'c')))))
+        self.assertEqual(f1.iter_window(size=2).count().to_pairs(),
+                (('a', (('q', 2), ('r', 2))), ('b', (('q', 2), ('r', 2)))))
+
+    def test_frame_iter_window_reduce_d(self) -> None:
+        # a large leading value must not reduce the precision of later windows
+        f1 = sf.Frame.from_fields((
+                (1e17, 1, 1, 1, 0.1, 0.2, 3),
+                (3, 0.2, 0.1, 1, 1, 1, 1e17),
+                ), columns=('a', 'b'))
+
+        for axis, f in ((0, f1), (1, f1.T)):
+            for func in ('max', 'mean', 'min', 'std', 'sum', 'var'):
+                f2 = getattr(f.iter_window(size=2, axis=axis), func)()
+                for label, window in f.iter_window_items(size=2, axis=axis):
+                    post = f2.loc[label] if axis == 0 else f2[label]
+                    self.assertTrue(np.allclose(
+                            post.values,
+                            getattr(window, func)(axis=axis).values,
+                            rtol=1e-12,
+                            atol=0,
+                            ))
+
     #---------------------------------------------------------------------------
 
     def test_frame_axis_interface_a(self) -> None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import datetime
+
 import numpy as np
 
 import static_frame as sf
@@ -8,6 +10,9 @@ from static_frame import IndexDate
 from static_frame import IndexHierarchy
 from static_frame.core.exception import InvalidFillValue
 from static_frame.core.fill_value_auto import FillValueAuto
+from static_frame.core.join import _join_map_iloc_hash
+from static_frame.core.join import _join_map_iloc_loop
+from static_frame.core.join import _join_take_right
 from static_frame.core.join import join
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import skip_win
@@ -470,6 +475,114 @@ class TestUnit(TestCase):
                 )
 
 
+    #---------------------------------------------------------------------------
+
+    def assert_map_iloc_equal(self,
+            target_left: np.ndarray,
+            target_right: np.ndarray,
+            ) -> None:
+        post_hash = _join_map_iloc_hash(target_left, target_right)
+        assert post_hash is not None
+        post_loop = _join_map_iloc_loop(target_left, target_right)
+
+        self.assertEqual(post_hash[1], post_loop[1])
+        self.assertEqual(list(post_hash[0].keys()), list(post_loop[0].keys()))
+        for k, v in post_hash[0].items():
+            self.assertEqual(v.tolist(), post_loop[0][k].tolist())
+
+    def test_join_map_iloc_hash_a(self) -> None:
+        a1 = np.array([[1, 2], [3, 4], [1, 2], [5, 6]])
+        a2 = np.array([[1.0, 2.0], [np.nan, 4.0], [5.0, 6.0], [5.0, 6.0]])
+        self.assert_map_iloc_equal(a1, a2)
+        self.assert_map_iloc_equal(a2, a1)
+        self.assert_map_iloc_equal(a2, a2)
+        self.assert_map_iloc_equal(a1[:, :1], a2[:, :1])
+
+    def test_join_map_iloc_hash_b(self) -> None:
+        a1 = np.array([[1], ['a'], [np.nan], [None]], dtype=object)
+        a2 = np.array([[np.nan], [None], [1.0], ['a']], dtype=object)
+        self.assert_map_iloc_equal(a1, a2)
+        self.assert_map_iloc_equal(a1, np.array([['a'], ['b']]))
+        self.assert_map_iloc_equal(np.array([['a'], ['b']]), np.array([[b'a']]))
+
+    def test_join_map_iloc_hash_c(self) -> None:
+        a1 = np.array([['2020-01-01'], ['NaT'], ['2020-01-02']], dtype='datetime64[D]')
+        self.assert_map_iloc_equal(a1, a1.astype('datetime64[ns]'))
+        self.assert_map_iloc_equal(np.array([[True], [False]]), np.array([[1], [0], [1]]))
+
+    def test_join_map_iloc_hash_d(self) -> None:
+        # comparison to strings is not hashable with equivalent semantics
+        a1 = np.array([['2020-01-01']], dtype='datetime64[D]')
+        self.assertIsNone(_join_map_iloc_hash(a1, np.array([['2020-01-01']])))
+
+        # unhashable elements
+        a2 = np.empty((1, 1), dtype=object)
+        a2[0, 0] = [1, 2]
+        self.assertIsNone(_join_map_iloc_hash(a2, a2))
+
+    def test_frame_join_m(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(10, 20, np.nan, 10), b=('y', 'z', 'x', 'w')))
+        f2 = sf.Frame.from_dict(dict(c=('foo', 'bar', 'baz'), d=(10.0, np.nan, 20.0)))
+
+        f3 = f1.join_left(f2, left_columns='a', right_columns='d')
+        self.assertEqual(f3.fillna(-1).to_pairs(),
+                (('a', ((0, 10.0), (1, 20.0), (2, 10.0), (3, -1.0))), ('b', ((0, 'y'), (1, 'z'), (2, 'w'), (3, 'x'))), ('c', ((0, 'foo'), (1, 'baz'), (2, 'foo'), (3, -1))), ('d', ((0, 10.0), (1, 20.0), (2, 10.0), (3, -1.0))))
+                )
+
+    def test_frame_join_n(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 3), b=('x', 'y', 'z')))
+        f2 = sf.Frame.from_fields(
+                ((3, 1), (True, False), np.array(('2020-01-01', '2021-01-01'), dtype='datetime64[D]')),
+                columns=('c', 'd', 'e'),
+                index=('p', 'q'))
+
+        f3 = f1.join_inner(f2, left_columns='a', right_columns='c')
+        self.assertEqual([dt.kind for dt in f3.dtypes.values], ['i', 'U', 'i', 'b', 'M'])
+        self.assertEqual(f3['d'].values.tolist(), [False, True])
+
+        f4 = f1.join_left(f2, left_columns='a', right_columns='c', fill_value=0)
+        # dtypes are derived from values, and elements of object arrays are not converted
+        self.assertEqual([dt.kind for dt in f4.dtypes.values], ['i', 'U', 'i', 'i', 'O'])
+        self.assertEqual(f4['c'].values.tolist(), [1, 0, 3])
+        self.assertEqual(f4['d'].values.tolist(), [0, 0, 1])
+        self.assertEqual(f4['e'].values.tolist(), [np.datetime64('2021-01-01'), 0, np.datetime64('2020-01-01')])
+
+        f5 = f1.join_left(f2.astype['e']('datetime64[ns]'), left_columns='a', right_columns='c')
+        self.assertEqual([dt.kind for dt in f5.dtypes.values], ['i', 'U', 'f', 'f', 'O'])
+        self.assertEqual([e.__class__ for e in f5['e'].values], [np.datetime64, float, np.datetime64])
+        self.assertEqual(f5['e'].values[0], np.datetime64('2021-01-01T00:00:00.000000000'))
+
+        f6 = f1.join_left(f2.iloc[:0], left_columns='a', right_columns='c', fill_value='')
+        self.assertEqual([dt.kind for dt in f6.dtypes.values], ['i', 'U', 'U', 'U', 'U'])
+
+    def test_join_take_right_a(self) -> None:
+        tb = sf.TypeBlocks.from_blocks((np.array([1, 2, 3]), np.array([[True, False], [False, True], [True, True]])))
+
+        post1 = _join_take_right(tb,
+                indexer=np.array([2, 0]),
+                fill_value=np.nan,
+                fill_value_dtype=np.dtype(float),
+                )
+        self.assertEqual(post1.dtypes.tolist(), [np.dtype(int), np.dtype(bool), np.dtype(bool)])
+        self.assertEqual(post1.values.tolist(), [[3, True, True], [1, True, False]])
+
+        post2 = _join_take_right(tb,
+                indexer=np.array([-1, 1]),
+                fill_value=-1,
+                fill_value_dtype=np.dtype(int),
+                )
+        # as bool columns resolve to object with an int fill, the dtype is derived from values
+        self.assertEqual(post2.dtypes.tolist(), [np.dtype(int), np.dtype(int), np.dtype(int)])
+        self.assertEqual(post2.values.tolist(), [[-1, -1, -1], [2, 0, 1]])
+
+        post3 = _join_take_right(tb._extract(row_key=np.array([], dtype=int)),
+                indexer=np.array([-1, -1]),
+                fill_value=np.nan,
+                fill_value_dtype=np.dtype(float),
+                )
+        self.assertEqual(post3.shape, (2, 3))
+        self.assertEqual(post3.dtypes.tolist(), [np.dtype(float), np.dtype(float), np.dtype(float)])
+
 
     # def test_frame_join_sort_a(self) -> None:
     #     from static_frame.core.join import join_sort
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from hashlib import sha256
+from unittest.mock import patch
 
 import frame_fixtures as ff
 import numpy as np
@@ -12,6 +13,7 @@ from static_frame.core.bus import Bus
 from static_frame.core.display_config import DisplayConfig
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitQuilt
+from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.hloc import HLoc
 from static_frame.core.index import ILoc
@@ -682,6 +684,55 @@ class TestUnit(TestCase):
         self.assertTrue(a1.tolist(),
                 [[-88017.0, -610.8, -3648.0, 1080.4, False, False, True, False], [92867.0, 3243.94, 91301.0, 2580.34, False, False, False, False], [84967.0, -823.14, 30205.0, 700.42, False, False, False, True], [13448.0, 114.58, 54020.0, 3338.48, True, False, True, True]])
 
+
+    def test_quilt_extract_range_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,str)|c(I,str)').relabel(index=tuple('abcd')).rename('f1')
+        f2 = ff.parse('s(3,3)|v(bool,float)|c(I,str)').relabel(index=tuple('efg')).rename('f2')
+        f3 = ff.parse('s(2,3)|v(int)|c(I,str)').relabel(index=tuple('hi')).rename('f3')
+        q1 = Quilt.from_frames((f1, f2, f3), retain_labels=False)
+
+        f4 = q1.iloc[2:8]
+        self.assertEqual(f4.index.values.tolist(), list('cdefgh'))
+        self.assertEqual([dt.kind for dt in f4.dtypes.values], ['O', 'O', 'O'])
+        self.assertTrue(f4.equals(Frame.from_concat((f1, f2, f3)).iloc[2:8]))
+        self.assertIsNone(f4.name)
+
+        f5 = q1.iloc[4:7, [0, 2]]
+        self.assertEqual(f5.name, 'f2')
+        self.assertEqual(f5.to_pairs(),
+                (('zZbu', (('e', False), ('f', False), ('g', False))), ('zUvW', (('e', True), ('f', False), ('g', False)))))
+
+        self.assertEqual(q1.iloc[3:3].shape, (0, 3))
+
+    def test_quilt_extract_range_b(self) -> None:
+        f1 = ff.parse('s(3,4)|v(int,float)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(3,2)|v(bool)|c(I,str)').relabel(columns=('a', 'b')).rename('f2')
+        q1 = Quilt.from_frames((f1, f2), axis=1, retain_labels=True)
+
+        f3 = q1.iloc[1:, 2:5]
+        self.assertEqual(f3.columns.values.tolist(),
+                [['f1', 'zUvW'], ['f1', 'zkuW'], ['f2', 'a']])
+        self.assertEqual([dt.kind for dt in f3.dtypes.values], ['i', 'f', 'b'])
+        self.assertTrue(f3.equals(q1.to_frame().iloc[1:, 2:5]))
+
+    def test_quilt_extract_range_c(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,str)|c(I,str)').relabel(index=tuple('abcd')).rename('f1')
+        f2 = ff.parse('s(3,3)|v(int,str)|c(I,str)').relabel(index=tuple('efg')).rename('f2')
+        q1 = Quilt.from_frames((f1, f2), retain_labels=False)
+
+        # empty slices on a boundary, within a Frame, and at either end are the same
+        for key in (slice(4, 4), slice(2, 2), slice(0, 0), slice(7, 7), slice(5, 1)):
+            f3 = q1.iloc[key]
+            self.assertEqual(f3.shape, (0, 3))
+            self.assertEqual([dt.kind for dt in f3.dtypes.values], ['i', 'U', 'i'])
+            self.assertIsNone(f3.name)
+
+        q2 = Quilt.from_frames((f1.T.rename('f1'), f2.T.rename('f2')), axis=1, retain_labels=True)
+        f4 = q2.iloc[1:, 4:4]
+        self.assertEqual(f4.shape, (2, 0))
+        self.assertEqual(f4.columns.depth, 2)
+        self.assertIsNone(f4.name)
+
     #---------------------------------------------------------------------------
 
     def test_quilt_retain_labels_a(self) -> None:
@@ -1289,6 +1340,86 @@ class TestUnit(TestCase):
             self.assertEqual(f1.shape, (75, 3))
             self.assertEqual(q1.status['loaded'].sum(), 1)
 
+    def test_quilt_iter_window_c(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int,float)').relabel(index=range(i * 4, i * 4 + 4)).rename(str(i))
+                for i in range(6)]
+        f1 = Frame.from_concat(frames)
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames(frames).to_zip_npz(fp)
+            q1 = Quilt.from_zip_npz(fp, max_persist=1, retain_labels=False)
+            q1._update_axis_labels() # reads all Frames
+            store = q1._bus._store
+            read_many = store.read_many
+            labels_read = []
+
+            def read_many_record(labels, **kwargs): # type: ignore
+                labels = list(labels)
+                labels_read.extend(labels)
+                return read_many(labels, **kwargs)
+
+            with patch.object(store, 'read_many', read_many_record):
+                post1 = tuple(q1.iter_window_items(size=6, step=1))
+            # each Frame is read once, in order
+            self.assertEqual(labels_read, ['0', '1', '2', '3', '4', '5'])
+            self.assertEqual(q1.status['loaded'].sum(), 1)
+
+            post2 = tuple(f1.iter_window_items(size=6, step=1))
+            self.assertEqual(len(post1), 19)
+            self.assertEqual([label for label, _ in post1], [label for label, _ in post2])
+            self.assertTrue(all(w1.equals(w2, compare_dtype=True)
+                    for (_, w1), (_, w2) in zip(post1, post2)))
+
+    def test_quilt_iter_window_d(self) -> None:
+        f1 = ff.parse('s(3,4)|v(int,bool)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(3,3)|v(float)|c(I,str)').relabel(columns=('a', 'b', 'c')).rename('f2')
+        q1 = Quilt.from_frames((f1, f2), axis=1, retain_labels=True)
+        f3 = q1.to_frame()
+
+        post1 = q1.iter_window_array(size=3, step=2, axis=1, window_valid=lambda a: a.dtype.kind == 'O').apply(lambda a: a.shape)
+        post2 = f3.iter_window_array(size=3, step=2, axis=1, window_valid=lambda a: a.dtype.kind == 'O').apply(lambda a: a.shape)
+        self.assertEqual(post1.to_pairs(), post2.to_pairs()) # type: ignore
+        self.assertEqual(post1.to_pairs(), # type: ignore
+                ((('f1', 'zUvW'), (3, 3)), (('f2', 'a'), (3, 3))))
+
+        post3 = tuple(q1.iter_window(size=2, axis=1, step=3, label_shift=-1, label_missing_skips=False))
+        self.assertEqual([w.name for w in post3], ['f1', None])
+        self.assertEqual([w.columns.values.tolist() for w in post3],
+                [[['f1', 'zZbu'], ['f1', 'ztsv']], [['f1', 'zkuW'], ['f2', 'a']]])
+
+    def test_quilt_iter_window_e(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int,float,bool)').relabel(index=range(i * 4, i * 4 + 4)).rename(str(i))
+                for i in range(6)]
+        f1 = Frame.from_concat(frames)
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames(frames).to_zip_npz(fp)
+            q1 = Quilt.from_zip_npz(fp, max_persist=1, retain_labels=False)
+            q1._update_axis_labels() # reads all Frames
+            store = q1._bus._store
+            read_many = store.read_many
+            labels_read = []
+
+            def read_many_record(labels, **kwargs): # type: ignore
+                labels = list(labels)
+                labels_read.extend(labels)
+                return read_many(labels, **kwargs)
+
+            for func in ('count', 'max', 'mean', 'min', 'std', 'sum', 'var'):
+                labels_read.clear()
+                with patch.object(store, 'read_many', read_many_record):
+                    post = getattr(q1.iter_window(size=6, step=2), func)()
+                # each Frame is read once, in order, and the Bus retains no more than max_persist
+                self.assertEqual(labels_read, ['0', '1', '2', '3', '4', '5'])
+                self.assertEqual(q1.status['loaded'].sum(), 1)
+                expected = getattr(f1.iter_window(size=6, step=2), func)()
+                self.assertTrue(post.index.equals(expected.index))
+                self.assertEqual(post.dtypes.values.tolist(), expected.dtypes.values.tolist())
+                self.assertTrue(np.allclose(post.values.astype(float), expected.values.astype(float)))
+
+            post = q1.iter_window(size=5, axis=1).sum()
+            self.assertEqual(post.shape, (24, 0))
+
     #---------------------------------------------------------------------------
 
     def test_quilt_iter_window_items_a(self) -> None:
@@ -1567,6 +1698,65 @@ class TestUnit(TestCase):
 
             self.assertTrue(q1.equals(q2, compare_class=True, compare_dtype=True, compare_name=True))
 
+    def test_quilt_to_zip_npz_b(self) -> None:
+        frames = [ff.parse('s(3,2)|v(int,float)|i(ID,dtD)|c(I,str)').relabel(index=lambda d: d + i).rename(f'f{i}')
+                for i in range(3)]
+        q1 = Quilt.from_frames(frames, retain_labels=True)
+        config = StoreConfig(index_depth=1, index_constructors=IndexDate, write_axis_index=True)
+
+        with temp_file('.zip') as fp:
+            q1.to_zip_npz(fp, config=config)
+            q2 = Quilt.from_zip_npz(fp, retain_labels=True, config=config, max_persist=1)
+            # axis labels are available without reading any Frame
+            self.assertEqual(q2.shape, (9, 2))
+            self.assertIs(q2.index.index_types.values[1], IndexDate)
+            self.assertEqual(q2.status['loaded'].sum(), 0)
+            self.assertTrue(q2.to_frame().equals(q1.to_frame(), compare_class=True, compare_dtype=True))
+            self.assertEqual(tuple(q2._bus._store.labels()), ('f0', 'f1', 'f2'))
+
+            # stored labels are not used for the other axis
+            q3 = Quilt.from_zip_npz(fp, retain_labels=True, config=config, axis=1)
+            self.assertIsNone(q3._axis_hierarchy)
+
+    def test_quilt_to_sqlite_a(self) -> None:
+        f1 = ff.parse('s(4,2)|v(int)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(4,2)|v(int)|c(I,str)').rename('f2')
+        q1 = Quilt.from_frames((f1, f2), retain_labels=True, axis=1)
+
+        with temp_file('.sqlite') as fp:
+            q1.to_sqlite(fp, config=StoreConfig(write_axis_index=True))
+            q2 = Quilt.from_sqlite(fp, retain_labels=True, axis=1, config=StoreConfig(index_depth=1))
+            self.assertEqual(q2.columns.values.tolist(), q1.columns.values.tolist())
+            self.assertEqual(q2.status['loaded'].sum(), 0)
+            self.assertEqual(tuple(q2._bus._store.labels()), ('f1', 'f2'))
+            self.assertEqual(q2.to_frame().values.tolist(), q1.to_frame().values.tolist())
+
+        with temp_file('.xlsx') as fp:
+            with self.assertRaises(NotImplementedError):
+                q1.to_xlsx(fp, config=StoreConfig(write_axis_index=True))
+
+    def test_quilt_to_zip_csv_a(self) -> None:
+        f1 = ff.parse('s(2,3)|v(int)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(3,3)|v(int)|c(I,str)').rename('f2')
+        q1 = Quilt.from_frames((f1, f2), retain_labels=True)
+
+        with temp_file('.zip') as fp:
+            q1.to_zip_csv(fp, config=StoreConfig(write_axis_index=True))
+
+            # with the default config, Frames are read without an index: stored labels are not used
+            q2 = Quilt.from_zip_csv(fp, retain_labels=True)
+            self.assertIsNone(q2._axis_hierarchy)
+            self.assertEqual(q2.shape, (5, 4))
+            self.assertEqual(q2.iloc[0].values.tolist(), [0, -88017, 162197, -3648])
+
+            q3 = Quilt.from_zip_csv(fp, retain_labels=True, config=StoreConfig(index_depth=1))
+            self.assertEqual(q3.status['loaded'].sum(), 0)
+            self.assertEqual(q3.shape, (5, 3))
+            self.assertEqual(q3.to_frame().values.tolist(), q1.to_frame().values.tolist())
+
+            with self.assertRaises(StoreParameterConflict):
+                q1.to_zip_csv(fp, config=StoreConfig(write_axis_index=True, include_index=False))
+
     #---------------------------------------------------------------------------
 
     def test_quilt_equals_a(self) -> None:
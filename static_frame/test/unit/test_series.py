@@ -4112,6 +4112,76 @@ class TestUnit(TestCase):
         self.assertEqual(len(list(s.iter_window_items(size=2, window_sized=False, start_shift=-1))), 10)
         self.assertEqual(len(list(s.iter_window_items(size=2, window_sized=False, start_shift=-1, label_missing_skips=False))), 11)
 
+    def test_series_iter_window_reduce_a(self) -> None:
+        s = sf.Series((3, np.nan, 1, 8, 2, 5, np.nan, 4), index=tuple('abcdefgh'), name='x')
+
+        for kwargs in (
+                dict(size=3),
+                dict(size=3, step=2, window_sized=False),
+                dict(size=2, label_shift=-1, start_shift=-1, window_sized=False),
+                dict(size=2, size_increment=1),
+                ):
+            for func in ('max', 'mean', 'min', 'std', 'sum', 'var'):
+                post = getattr(s.iter_window(**kwargs), func)()
+                expected = s.iter_window(**kwargs).apply(lambda w: getattr(w, func)())
+                self.assertEqual(post.name, 'x')
+                self.assertTrue(post.index.equals(expected.index))
+                self.assertTrue(np.allclose(post.values, expected.values, equal_nan=True))
+
+    def test_series_iter_window_reduce_b(self) -> None:
+        s = sf.Series((3, np.nan, 1, 8, 2), index=tuple('abcde'))
+
+        self.assertEqual(s.iter_window(size=2).count().to_pairs(),
+                (('b', 1), ('c', 1), ('d', 2), ('e', 2)))
+        self.assertEqual(s.iter_window(size=2).count(skipna=False).to_pairs(),
+                (('b', 2), ('c', 2), ('d', 2), ('e', 2)))
+        self.assertEqual(s.iter_window(size=2).sum(skipna=False).fillna(-1).to_pairs(),
+                (('b', -1.0), ('c', -1.0), ('d', 9.0), ('e', 10.0)))
+        self.assertEqual(s.iter_window_array(size=2).max().to_pairs(),
+                (('b', 3.0), ('c', 1.0), ('d', 8.0), ('e', 8.0)))
+
+    def test_series_iter_window_reduce_c(self) -> None:
+        s1 = sf.Series((3, 0, 1, 8, 2), index=tuple('abcde'))
+        s2 = s1.iter_window(size=3).sum()
+        self.assertEqual(s2.dtype, np.dtype(np.int64))
+        self.assertEqual(s2.to_pairs(), (('c', 4), ('d', 9), ('e', 11)))
+        self.assertEqual(s1.iter_window(size=3).min().to_pairs(),
+                (('c', 0), ('d', 0), ('e', 1)))
+
+        s3 = sf.Series((True, False, True, True))
+        self.assertEqual(s3.iter_window(size=2).sum().to_pairs(),
+                ((1, 1), (2, 1), (3, 2)))
+
+        s4 = sf.Series(('b', 'a', 'c'))
+        self.assertEqual(s4.iter_window(size=2).max().to_pairs(),
+                ((1, 'b'), (2, 'c')))
+
+    def test_series_iter_window_reduce_d(self) -> None:
+        s = sf.Series(range(5))
+        with self.assertRaises(RuntimeError):
+            s.iter_window(size=2, window_func=lambda w: w * 2).sum()
+        with self.assertRaises(InvalidWindowLabel):
+            s.iter_window(size=2, window_sized=False, label_missing_raises=True, label_shift=1).sum()
+
+    def test_series_iter_window_reduce_e(self) -> None:
+        # a large leading value must not reduce the precision of later windows
+        s = sf.Series((1e17, 1, 1, 1, 1, 0.1, 0.2, np.nan, 3, 1e8 + 1, 1e8 + 2, 1e8 + 4))
+
+        for kwargs in (
+                dict(size=2),
+                dict(size=3),
+                dict(size=3, step=2, window_sized=False),
+                dict(size=2, size_increment=1),
+                ):
+            for func in ('max', 'mean', 'min', 'std', 'sum', 'var'):
+                post = getattr(s.iter_window(**kwargs), func)()
+                expected = s.iter_window(**kwargs).apply(lambda w: getattr(w, func)())
+                self.assertTrue(np.allclose(post.values, expected.values, rtol=1e-12, atol=0, equal_nan=True))
+
+        self.assertEqual(s.iter_window(size=2).sum().values[:6].tolist(),
+                [1e17, 2.0, 2.0, 2.0, 1.1, 0.30000000000000004])
+        self.assertEqual(round(s.iter_window(size=2).std().values[4], 12), 0.45)
+
 
 
     #---------------------------------------------------------------------------
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pickle
+from unittest.mock import patch
+
+import frame_fixtures as ff
+import numpy as np
+
+import static_frame.core.shared_memory
+from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
+from static_frame.core.shared_memory import SharedMemoryArray
+from static_frame.core.shared_memory import frame_from_shared_memory
+from static_frame.core.shared_memory import frame_to_shared_memory
+from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import skip_win
+
+
+class TestUnit(TestCase):
+
+    @skip_win
+    def test_frame_shared_memory_a(self) -> None:
+        f1 = FrameGO(ff.parse('s(6,7)|v(int,str,bool,object,float)|i(I,str)|c(I,str)').rename('a'))
+
+        payload = pickle.loads(pickle.dumps(frame_to_shared_memory(f1)))
+        self.assertIsNotNone(payload.segment)
+        # object arrays are not stored in the segment
+        self.assertEqual([b.__class__ is tuple for b in payload.blocks],
+                [True, True, True, False, True, True, True])
+        # offsets are aligned
+        self.assertTrue(all(b[2] % 64 == 0 for b in payload.blocks if b.__class__ is tuple))
+
+        f2 = frame_from_shared_memory(payload)
+        self.assertIs(f2.__class__, FrameGO)
+        self.assertTrue(f2.equals(f1, compare_dtype=True, compare_name=True, compare_class=True))
+
+        a1 = f2._blocks._blocks[0]
+        self.assertIs(a1.base.__class__, SharedMemoryArray)
+        self.assertFalse(a1.flags.writeable)
+
+        f2['h'] = 0 # columns are mutable
+        del f2
+        # arrays retain the segment
+        self.assertEqual(a1.tolist(), f1.iloc[:, 0].values.tolist())
+
+    def test_frame_shared_memory_b(self) -> None:
+        f1 = Frame(np.array([[None, 'a']], dtype=object), columns=('x', 'y'))
+        payload = frame_to_shared_memory(f1)
+        self.assertIsNone(payload.segment)
+        self.assertTrue(frame_from_shared_memory(payload).equals(f1, compare_dtype=True))
+
+        f2 = Frame(index=('a', 'b'))
+        self.assertEqual(frame_from_shared_memory(frame_to_shared_memory(f2)).shape, (2, 0))
+
+    def test_frame_shared_memory_c(self) -> None:
+        f1 = ff.parse('s(3,4)|v(int,str,float)').rename('a')
+
+        # where a segment cannot outlive the worker, arrays are pickled
+        with patch.object(static_frame.core.shared_memory, 'SHARED_MEMORY_PERSISTS', False):
+            payload = pickle.loads(pickle.dumps(frame_to_shared_memory(f1)))
+        self.assertIsNone(payload.segment)
+        f2 = frame_from_shared_memory(payload)
+        self.assertTrue(f2.equals(f1, compare_dtype=True, compare_name=True))
+        self.assertFalse(f2._blocks._blocks[0].flags.writeable)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import pickle
 from io import StringIO
 
 import numpy as np
@@ -373,6 +374,23 @@ class TestUnit(TestCase):
                 ['0.413-0.000j', '0.412-0.593j', 'foo', False, 100, '0.833', '20.000+3.000j'])
 
 
+    def test_store_filter_pickle_a(self) -> None:
+        sf1 = StoreFilter(
+                from_nan='*',
+                to_none=('none', 'null'),
+                value_format_float_positional='{:.3f}',
+                )
+        sf2 = pickle.loads(pickle.dumps(sf1))
+
+        self.assertEqual(sf2.from_nan, '*')
+        self.assertEqual(sf2.to_none, frozenset(('none', 'null')))
+        self.assertEqual(sf2.to_type_filter_element('null'), None)
+        self.assertEqual(
+                sf2.from_type_filter_array(np.array([np.nan, 1.5])).tolist(),
+                ['*', '1.500'],
+                )
+
+
 if __name__ == '__main__':
     import unittest
     unittest.main()
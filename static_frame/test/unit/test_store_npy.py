@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+from tempfile import TemporaryDirectory
+
+import frame_fixtures as ff
+
+from static_frame.core.exception import ErrorNPYEncode
+from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
+from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_npy import StoreNPY
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_store_npy_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,str,bool)|i(ID,dtD)').rename('b')
+        f2 = ff.parse('s(5,2)|v(float)|c(I,str)').rename('a')
+
+        with TemporaryDirectory() as fp:
+            st = StoreNPY(os.path.join(fp, 'bus'))
+            st.write(((f.name, f) for f in (f1, f2)))
+            # labels retain the order of writing
+            self.assertEqual(tuple(st.labels()), ('b', 'a'))
+
+            post = tuple(st.read_many(('a', 'b'), container_type=FrameGO))
+            self.assertIs(post[0].__class__, FrameGO)
+            self.assertTrue(post[0].equals(f2, compare_dtype=True, compare_name=True))
+            self.assertTrue(post[1].equals(f1, compare_dtype=True, compare_name=True))
+            self.assertIsInstance(post[0].values.base, mmap.mmap)
+            self.assertEqual(set(st._archives), {'a', 'b'})
+
+            # the weak cache returns the same Frame
+            self.assertIs(st.read('a', container_type=FrameGO), post[0])
+
+            st.release(('a', 'c'))
+            self.assertEqual(set(st._archives), {'b'})
+            # memory maps used by arrays are not closed
+            self.assertEqual(post[0].sum().values.tolist(), f2.sum().values.tolist())
+
+    def test_store_npy_b(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,float)').rename('a')
+        f2 = ff.parse('s(4,3)|v(object)').rename('b')
+
+        with TemporaryDirectory() as fp:
+            fp_bus = os.path.join(fp, 'bus')
+            st = StoreNPY(fp_bus)
+            with self.assertRaises(ErrorNPYEncode):
+                st.write(((f.name, f) for f in (f1, f2)))
+            self.assertFalse(os.path.exists(fp_bus))
+
+            st.write(((f.name, f) for f in (f1,)))
+            with self.assertRaises(RuntimeError):
+                st.write(((f.name, f) for f in (f1,)))
+
+    def test_store_npy_c(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,float)').rename(('a', 1))
+        config = StoreConfig(label_encoder=str, label_decoder=eval)
+
+        with TemporaryDirectory() as fp:
+            st1 = StoreNPY(os.path.join(fp, 'bus.npy'))
+            st1.write(((f1.name, f1),), config=config)
+            _ = st1.read(('a', 1), config=config)
+
+            st2 = pickle.loads(pickle.dumps(st1))
+            self.assertEqual(st2._archives, {})
+            self.assertEqual(tuple(st2.labels(config=config)), (('a', 1),))
+            f2 = st2.read(('a', 1), config=config)
+            self.assertTrue(f2.equals(f1, compare_name=True))
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import sqlite3
 from fractions import Fraction
+from unittest.mock import patch
 
+import frame_fixtures as ff
 import numpy as np
 import typing_extensions as tp
 
+from static_frame.core.bus import Bus
+from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.frame import Frame
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.store_config import StoreConfig
@@ -164,6 +169,94 @@ class TestUnit(TestCase):
 
             self.assertEqual(list(st2.labels()), ['f2'])
 
+    def test_store_sqlite_write_g(self) -> None:
+        f1 = ff.parse('s(7,3)|v(int,str,bool)|i(I,str)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(5,2)|v(float)|i(I,int)|c(I,str)').sort_index().rename('f2')
+        f3 = ff.parse('s(6,2)|v(int8,float32)|i(IH,(str,int))|c(I,str)').rename('f3')
+        frames = (f1, f2, f3)
+        config = StoreConfig(write_bulk=True, write_pragmas=dict(page_size=8192))
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            with patch.object(StoreSQLite, '_WRITE_ROWS', 2):
+                st1.write(((f.name, f) for f in frames), config=config)
+
+            with sqlite3.connect(fp) as conn:
+                self.assertEqual(conn.execute('PRAGMA page_size').fetchone(), (8192,))
+                indices = conn.execute("SELECT tbl_name FROM sqlite_master WHERE type='index'").fetchall()
+            # an INTEGER primary key is an alias of the rowid
+            self.assertEqual(indices, [('f1',), ('f3',)])
+
+            for f in frames:
+                f_loaded = st1.read(f.name, config=StoreConfig.from_frame(f))
+                self.assertEqualFrames(f, f_loaded, compare_dtype=False)
+
+    def test_store_sqlite_write_h(self) -> None:
+        f1 = Frame.from_records(((1, 2), (3, 4)), index=(0.5, 1.5), name='f1')
+
+        with temp_file('.sqlite') as fp:
+            f1.to_sqlite(fp, bulk=True, pragmas=dict(cache_size=-1024))
+            f2 = Frame.from_sqlite(fp, label='f1', index_depth=1)
+            self.assertEqual(f2.to_pairs(),
+                    (('0', ((0.5, 1), (1.5, 3))), ('1', ((0.5, 2), (1.5, 4))))
+                    )
+
+            f1.to_sqlite(fp, include_index=False, bulk=True)
+            f3 = Frame.from_sqlite(fp, label='f1')
+            self.assertEqual(f3.values.tolist(), [[1, 2], [3, 4]])
+
+    def test_store_sqlite_write_i(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int8,str,dtD)|i(IH,(str,int))|c(I,str)').rename('f1')
+        f2 = ff.parse('s(3,2)|v(float)|i(I,str)|c(I,str)').rename('f2')
+        f3 = Frame.from_fields((np.arange(3.0), np.arange(3.0)), columns=('a', 'b'), name='f3')
+        frames = (f1, f2, f3)
+        config = {
+                'f1': StoreConfig(write_npy_blob=True),
+                'f2': StoreConfig(index_depth=1),
+                'f3': StoreConfig(write_npy_blob=True, consolidate_blocks=True),
+                }
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f.name, f) for f in frames), config=config)
+            self.assertEqual(list(st1.labels()), ['f1', 'f2', 'f3'])
+
+            for read_max_workers in (None, 2):
+                config_read = StoreConfig(index_depth=1, read_max_workers=read_max_workers)
+                post = list(st1.read_many(('f1', 'f2', 'f3'), config=config_read))
+                # NPY tables ignore constructor parameters
+                self.assertTrue(post[0].equals(f1, compare_dtype=True, compare_class=True, compare_name=True))
+                self.assertEqualFrames(post[1], f2)
+                self.assertTrue(post[2].equals(f3, compare_dtype=True, compare_name=True))
+                self.assertEqual(len(post[2]._blocks._blocks), 1)
+
+    def test_store_sqlite_write_j(self) -> None:
+        f1 = ff.parse('s(2,2)|v(object)').rename('f1')
+
+        with temp_file('.sqlite') as fp:
+            with self.assertRaises(ErrorNPYEncode):
+                f1.to_sqlite(fp, npy_blob=True)
+
+            f2 = f1.astype(int)
+            f2.to_sqlite(fp, npy_blob=True)
+            self.assertTrue(Frame.from_sqlite(fp, label='f1').equals(f2, compare_dtype=True))
+
+    def test_store_sqlite_write_k(self) -> None:
+        f1 = Frame.from_fields(
+                (np.array((2**63, 1), dtype=np.uint64), np.array((3, 4), dtype=np.uint64)),
+                columns=('a', 'b'),
+                index=('x', 'y'),
+                name='f1',
+                )
+        with temp_file('.sqlite') as fp:
+            f1.to_sqlite(fp)
+            f2 = Frame.from_sqlite(fp, label='f1', index_depth=1)
+            self.assertEqual(f2.dtypes.values.tolist(), [np.dtype(float), np.dtype(int)])
+            self.assertEqual(f2.to_pairs(),
+                    (('a', (('x', float(2**63)), ('y', 1.0))),
+                    ('b', (('x', 3), ('y', 4))))
+                    )
+
     #---------------------------------------------------------------------------
 
     def test_store_sqlite_read_many_a(self) -> None:
@@ -221,6 +314,44 @@ class TestUnit(TestCase):
                 self.assertEqualFrames(f_src, f_loaded, compare_dtype=False)
 
 
+    def test_store_sqlite_read_many_b(self) -> None:
+
+        frames = [Frame.from_dict(
+                dict(a=(i, 2, 3), b=(4.5, 5, i), c=('x', 'y', str(i))),
+                index=('p', 'q', 'r'),
+                name=f'f{i}') for i in range(8)]
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write((f.name, f) for f in frames)
+            labels = tuple(st1.labels())
+
+            config_serial = StoreConfig(index_depth=1)
+            post_serial = list(st1.read_many(labels, config=config_serial))
+
+            for read_max_workers in (1, 3):
+                config = StoreConfig(index_depth=1, read_max_workers=read_max_workers)
+                post = list(st1.read_many(labels, config=config))
+                self.assertEqual([f.name for f in post], list(labels))
+                for f1, f2 in zip(post_serial, post):
+                    self.assertEqualFrames(f1, f2)
+
+    def test_store_sqlite_read_many_c(self) -> None:
+        frames = [Frame.from_dict(dict(a=(i, 2), b=(3, i)), name=f'f{i}')
+                for i in range(6)]
+        config = StoreConfig(index_depth=1, read_max_workers=2)
+
+        with temp_file('.sqlite') as fp:
+            Bus.from_frames(frames).to_sqlite(fp, config=config)
+
+            b1 = Bus.from_sqlite(fp, config=config, max_persist=3)
+            self.assertEqual(
+                    [f.sum().sum() for f in b1.values],
+                    [5, 7, 9, 11, 13, 15],
+                    )
+            self.assertEqual(b1.status['loaded'].sum(), 3)
+
+
 if __name__ == '__main__':
     import unittest
     unittest.main()
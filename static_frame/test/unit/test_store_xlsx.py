@@ -390,6 +390,37 @@ class TestUnit(TestCase):
                         ((0, (((2, 2, 'a'), False), ((30, 73, 'd'), True))),)
                         )
 
+    def test_store_xlsx_read_many_g(self) -> None:
+        frames = [Frame.from_dict(
+                dict(a=(i, 2, 3), b=(4.5, 5, i), c=('x', 'y', str(i))),
+                index=('p', 'q', 'r'),
+                name=f'f{i}') for i in range(5)]
+
+        with temp_file('.xlsx') as fp:
+            st1 = StoreXLSX(fp)
+            st1.write((f.name, f) for f in frames)
+            labels = tuple(st1.labels())
+
+            post_serial = list(st1.read_many(labels,
+                    config=StoreConfig(index_depth=1)))
+
+            config = StoreConfig(index_depth=1, read_max_workers=2, read_chunksize=2)
+            post = list(st1.read_many(labels, config=config))
+
+            self.assertEqual([f.name for f in post], list(labels))
+            for f1, f2 in zip(post_serial, post):
+                self.assertEqualFrames(f1, f2)
+
+            config_shm = StoreConfig(index_depth=1, read_max_workers=2, read_shared_memory=True)
+            for f1, f2 in zip(post_serial, st1.read_many(labels, config=config_shm)):
+                self.assertEqualFrames(f1, f2)
+
+            f3 = st1.read(STORE_LABEL_DEFAULT, config=config)
+            self.assertEqual(f3.name, None)
+            self.assertEqual(f3.to_pairs(),
+                    (('a', (('p', 0), ('q', 2), ('r', 3))), ('b', (('p', 4.5), ('q', 5.0), ('r', 0.0))), ('c', (('p', 'x'), ('q', 'y'), ('r', '0'))))
+                    )
+
     #---------------------------------------------------------------------------
 
     def test_dtype_to_writer_attr(self) -> None:
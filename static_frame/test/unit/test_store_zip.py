@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import mmap
+import zipfile
+from zipfile import BadZipFile
+
 import frame_fixtures as ff
 import typing_extensions as tp
 
@@ -18,6 +22,7 @@ from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
 from static_frame.core.store_zip import _StoreZip
 from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import skip_win
 from static_frame.test.test_case import temp_file
 
 
@@ -424,6 +429,56 @@ class TestUnitMultiProcess(TestCase):
             self.assertIs(post[0].index.__class__, IndexDate)
             self.assertIs(post[1].index.__class__, IndexDate)
 
+    def test_store_zip_npz_b(self) -> None:
+
+        f1, f2 = get_test_framesB()
+        config = StoreConfig(memory_map=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in (f1, f2)), compression=zipfile.ZIP_STORED)
+
+            post = tuple(st.read_many(('a', 'b'),
+                    container_type=FrameGO,
+                    config=config,
+                    ))
+            self.assertIs(post[0].__class__, FrameGO)
+            self.assertTrue(post[0].equals(f1, compare_dtype=True, compare_name=True))
+            self.assertTrue(post[1].equals(f2, compare_dtype=True, compare_name=True))
+            self.assertEqual(
+                    {a.base.__class__ for a in post[1]._blocks._blocks},
+                    {mmap.mmap},
+                    )
+            # frames are retained in the weak cache
+            self.assertIs(st.read('a', config=config, container_type=FrameGO), post[0])
+
+    def test_store_zip_npz_c(self) -> None:
+
+        f1, f2 = get_test_framesB()
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in (f1, f2)))
+            # memory maps cannot be created from a compressed ZIP
+            with self.assertRaises(BadZipFile):
+                st.read('a', config=StoreConfig(memory_map=True))
+
+    @skip_win
+    def test_store_zip_npz_d(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,str,bool)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,2)|v(float)|i(I,str)|c(I,str)').rename('b')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in (f1, f2)))
+
+            config = StoreConfig(read_max_workers=2, read_shared_memory=True)
+            post = tuple(st.read_many(('b', 'a'), config=config, container_type=FrameGO))
+            self.assertIs(post[0].__class__, FrameGO)
+            self.assertTrue(post[0].equals(f2, compare_dtype=True, compare_name=True))
+            self.assertTrue(post[1].equals(f1, compare_dtype=True, compare_name=True))
+            self.assertFalse(post[1]._blocks._blocks[0].flags.writeable)
+
     #---------------------------------------------------------------------------
     def test_store_zip_npy_a(self) -> None:
 
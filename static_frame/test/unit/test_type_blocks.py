@@ -3477,6 +3477,34 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_type_blocks_vstack_blocks_to_blocks_allocated_a(self) -> None:
+        tb1 = TypeBlocks.from_blocks((np.array([[1, 2], [3, 4]]), np.array([True, False]), np.array([1.5, 2.5])))
+        tb2 = TypeBlocks.from_blocks((np.array([5]), np.array([6]), np.array([[False, 3.5]], dtype=object)))
+
+        post = list(TypeBlocks.vstack_blocks_to_blocks_allocated((tb1, tb2)))
+        self.assertEqual([a.dtype.kind for a in post], ['i', 'O'])
+        self.assertEqual([a.shape for a in post], [(3, 2), (3, 2)])
+        self.assertTrue(all(not a.flags.writeable for a in post))
+
+        tb3 = TypeBlocks.from_blocks(post)
+        self.assertEqual(tb3.values.tolist(),
+                [[1, 2, True, 1.5], [3, 4, False, 2.5], [5, 6, False, 3.5]])
+
+    def test_type_blocks_vstack_blocks_to_blocks_allocated_b(self) -> None:
+        tb1 = TypeBlocks.from_blocks((np.array([1, 2]), np.array(['a', 'b'])))
+        tb2 = TypeBlocks.from_blocks(np.array([[3, 4], [5, 6]]))
+
+        post = list(TypeBlocks.vstack_blocks_to_blocks_allocated((tb1, tb2)))
+        # each run of one column is one dimensional
+        self.assertEqual([a.ndim for a in post], [1, 1])
+        self.assertEqual([a.dtype.kind for a in post], ['i', 'O'])
+        self.assertEqual(post[1].tolist(), ['a', 'b', 4, 6])
+
+        tb3 = TypeBlocks.from_blocks(np.array([[]]).reshape(2, 0))
+        self.assertEqual(list(TypeBlocks.vstack_blocks_to_blocks_allocated((tb3, tb3))), [])
+
+    #---------------------------------------------------------------------------
+
     def test_type_blocks_append_a(self) -> None:
         a1 = np.array([1, 2, 3])
         a2 = np.array([False, True, False])
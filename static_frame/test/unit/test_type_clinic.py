@@ -17,9 +17,12 @@ from static_frame.core.type_clinic import ErrorAction
 from static_frame.core.type_clinic import Require
 from static_frame.core.type_clinic import TValidation
 from static_frame.core.type_clinic import TypeClinic
+from static_frame.core.type_clinic import _check
 from static_frame.core.type_clinic import _check_interface
+from static_frame.core.type_clinic import _to_checker
 from static_frame.core.type_clinic import is_union
 from static_frame.core.type_clinic import is_unpack
+from static_frame.core.type_clinic import sample_rows
 from static_frame.test.test_case import skip_pyle38
 from static_frame.test.test_case import skip_pyle310
 from static_frame.test.test_case import skip_win
@@ -725,6 +728,108 @@ def test_check_interface_g3():
         assert 'Expected int, provided bool invalid' in str(w[0])
         assert 'Expected int, provided bool invalid' in str(w[1])
 
+
+def test_check_interface_h1():
+    calls = []
+
+    @CallGuard.check
+    def proc1(a: int, b: tp.Optional[str] = None, *, c: 'float' = 1.0) -> int:
+        calls.append((a, b, c))
+        return a
+
+    assert proc1(1) == 1
+    # the plan is compiled on first call and retained
+    plan = dict(zip(proc1.__code__.co_freevars, proc1.__closure__))['plan'].cell_contents # type: ignore
+    sig = plan._sig
+    assert proc1(2, 'x', c=2.0) == 2
+    assert proc1(b='y', a=3) == 3
+    assert plan._sig is sig
+    assert calls == [(1, None, 1.0), (2, 'x', 2.0), (3, 'y', 1.0)]
+
+    with pytest.raises(sf.ClinicError):
+        proc1(1, c=3)
+    with pytest.raises(sf.ClinicError):
+        proc1(True)
+    with pytest.raises(TypeError):
+        proc1(1, a=2) #pylint: disable=E1124
+    with pytest.raises(TypeError):
+        proc1(1, d=2) #pylint: disable=E1123
+
+def test_check_interface_h2():
+
+    @CallGuard.check
+    def proc1(a: int, b: tp.Optional[str] = None) -> int:
+        return a
+
+    assert proc1(b='x', a=3) == 3
+    with pytest.raises(sf.ClinicError) as e:
+        proc1(b=3, a=3)
+    assert scrub_str(str(e.value)) == 'In args of (a: int, b: Optional[str, NoneType]) -> int Optional[str, NoneType] Expected str, provided int invalid In args of (a: int, b: Optional[str, NoneType]) -> int Optional[str, NoneType] Expected NoneType, provided int invalid'
+
+    with pytest.raises(TypeError):
+        proc1() #pylint: disable=E1120
+    with pytest.raises(TypeError):
+        proc1(1, 'a', 2)
+
+def test_check_interface_i1():
+
+    @CallGuard.check(interval=3)
+    def proc1(a: int) -> int:
+        return a
+
+    # only the first of every three calls is checked
+    with pytest.raises(sf.ClinicError):
+        proc1('a')
+    assert proc1('b') == 'b'
+    assert proc1('c') == 'c'
+    with pytest.raises(sf.ClinicError):
+        proc1('d')
+
+    with pytest.raises(RuntimeError):
+        CallGuard.check(interval=0)(proc1)
+
+def test_check_interface_i2():
+    lens = []
+
+    def valid(f: sf.Frame) -> bool:
+        lens.append(len(f))
+        return bool((f.values > 0).all())
+
+    def proc1(f):
+        return len(f)
+
+    # set hints directly, as string annotations cannot refer to local names
+    proc1.__annotations__ = {
+            'f': tp.Annotated[sf.Frame, Require.Apply(valid), Require.Shape(..., 2)],
+            'return': int,
+            }
+    proc1 = CallGuard.warn(sample=20)(proc1)
+
+    f1 = sf.Frame.from_element(1, index=range(1000), columns=('a', 'b'))
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        assert proc1(f1) == 1000
+        assert proc1(f1.iloc[:10]) == 10
+        assert proc1(f1.iloc[:, :1]) == 1000
+        assert len(w) == 1
+        assert 'Expected shape' in str(w[0])
+    assert lens == [20, 10, 20]
+
+def test_to_checker_a():
+    hints = (int, bool, object, np.object_, tp.Any, tp.Optional[int], tp.Literal[1, 'a', True], tp.Annotated[int, 'a'])
+    values = (1, True, np.int64(1), 'a', None, 1.5, [1])
+    for h in hints:
+        checker = _to_checker(h)
+        assert checker is not None
+        for v in values:
+            # a checker must not pass a value that fails
+            assert not checker(v) or not _check(v, h)
+
+    assert _to_checker(tp.List[int]) is None
+    assert _to_checker(tp.Annotated[int, Require.Len(1)]) is None
+    assert _to_checker(tp.Union[int, tp.List[int]]) is None
+    assert not _to_checker(int)(True) # type: ignore
+
 #-------------------------------------------------------------------------------
 
 def test_check_annotated_a():
@@ -1729,6 +1834,39 @@ def test_validate_labels_match_h1():
     assert tuple(v4._iter_errors(f.columns, None, (), (f,)))
 
 
+def test_validate_labels_match_sample_a():
+    f = sf.Frame.from_fields((range(100), range(100, 0, -1)), columns=('a', 'b'))
+    lens = []
+
+    def valid(s: sf.Series) -> bool:
+        lens.append(len(s))
+        # sampled rows retain their order
+        return bool((s.values[1:] > s.values[:-1]).all())
+
+    v1 = Require.LabelsMatch(['a', valid])
+    assert not tuple(v1._iter_errors(f.columns, None, (), (f,), 10))
+    v2 = Require.LabelsOrder(..., ['b', valid])
+    assert tuple(v2._iter_errors(f.columns, None, (), (f,), 10))
+    assert lens == [10, 10]
+
+    hint = sf.Frame[sf.Index[tp.Any], tp.Annotated[sf.Index[tp.Any], Require.LabelsOrder(['a', valid], ['b', valid])]]
+    assert len(TypeClinic(f)(hint, sample=5)) == 1
+    assert lens[2:] == [5, 5]
+
+def test_sample_rows_a():
+    a1 = np.arange(100)
+    a2 = sample_rows(a1, 10)
+    assert len(a2) == 10
+    assert (np.diff(a2) > 0).all()
+    assert sample_rows(a1, 200) is a1
+    assert sample_rows(a1, None) is a1
+    assert sample_rows([1, 2, 3], 1) == [1, 2, 3]
+
+    s1 = sf.Series(range(50), index=tuple(f'a{i}' for i in range(50)))
+    s2 = sample_rows(s1, 5)
+    assert s2.shape == (5,)
+    assert s1.loc[s2.index].equals(s2)
+
 def test_validate_labels_match_h2():
     records = (
             (1, 3, True, 'y'),
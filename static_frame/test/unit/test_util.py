@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import datetime
 import json
 import unittest
@@ -44,14 +45,17 @@ from static_frame.core.util import array1d_to_last_contiguous_to_edge
 from static_frame.core.util import array_from_element_apply
 from static_frame.core.util import array_from_element_method
 from static_frame.core.util import array_sample
+from static_frame.core.util import array_segment_reduce
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import array_ufunc_axis_skipna
+from static_frame.core.util import array_window_reduce
 from static_frame.core.util import binary_transition
 from static_frame.core.util import blocks_to_array_2d
 from static_frame.core.util import bytes_to_size_label
 from static_frame.core.util import concat_resolved
 from static_frame.core.util import datetime64_not_aligned
+from static_frame.core.util import delimited_line_in_quote
 from static_frame.core.util import depth_level_from_specifier
 from static_frame.core.util import dtype_from_element
 from static_frame.core.util import dtype_to_fill_value
@@ -64,6 +68,7 @@ from static_frame.core.util import is_strict_int
 from static_frame.core.util import isfalsy_array
 from static_frame.core.util import isin
 from static_frame.core.util import isna_array
+from static_frame.core.util import iter_delimited_chunks
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_2d
 from static_frame.core.util import iterable_to_array_nd
@@ -3172,6 +3177,168 @@ class TestUnit(TestCase):
 
         self.assertEqual(out.tolist(), [1, -1, 3])
 
+    #---------------------------------------------------------------------------
+
+    def test_array_window_reduce_a(self) -> None:
+        a1 = np.array([4, 2, 9, 1, 7, 3, 8])
+        starts = np.array([0, 1, 2, 3, 4])
+        stops = starts + 3
+        for func_name, func in (
+                ('max', np.max),
+                ('min', np.min),
+                ('mean', np.mean),
+                ('std', np.std),
+                ('sum', np.sum),
+                ('var', np.var),
+                ):
+            post = array_window_reduce(a1, starts=starts, stops=stops, func_name=func_name, size=3)
+            self.assertTrue(np.allclose(post, [func(a1[i:i+3]) for i in starts]))
+
+    def test_array_window_reduce_b(self) -> None:
+        a1 = np.array([[1, np.nan], [np.nan, np.nan], [3, 2], [4, 5]])
+        starts = np.array([0, 0, 1, 2])
+        stops = np.array([1, 2, 3, 4])
+
+        post1 = array_window_reduce(a1, starts=starts, stops=stops, func_name='sum', size=2)
+        self.assertEqual(post1.tolist(), [[1.0, 0.0], [1.0, 0.0], [3.0, 2.0], [7.0, 7.0]])
+
+        post2 = array_window_reduce(a1, starts=starts, stops=stops, func_name='max', size=2)
+        self.assertEqual(np.isnan(post2).tolist(), [[False, True], [False, True], [False, False], [False, False]])
+        self.assertEqual(post2[2:].tolist(), [[3.0, 2.0], [4.0, 5.0]])
+
+        post3 = array_window_reduce(a1, starts=starts, stops=stops, func_name='count', skipna=False)
+        self.assertEqual(post3.tolist(), [[1, 1], [2, 2], [2, 2], [2, 2]])
+
+        post4 = array_window_reduce(a1, starts=starts, stops=stops, func_name='var', ddof=1)
+        self.assertTrue(np.isnan(post4[:2]).all())
+        self.assertTrue(np.allclose(post4[3], [0.5, 4.5]))
+
+    def test_array_window_reduce_c(self) -> None:
+        a1 = np.array([None, 'b', 'a', 'c'], dtype=object)
+        starts = np.array([0, 1, 2])
+        stops = np.array([2, 3, 4])
+        self.assertEqual(array_window_reduce(a1,
+                starts=starts, stops=stops, func_name='count').tolist(),
+                [1, 2, 2])
+        self.assertEqual(array_window_reduce(a1,
+                starts=starts[1:], stops=stops[1:], func_name='min').tolist(),
+                ['a', 'a'])
+        with self.assertRaises(NotImplementedError):
+            array_window_reduce(a1, starts=starts, stops=stops, func_name='median')
+
+    def test_array_window_reduce_d(self) -> None:
+        # small variances after large values are not lost to the precision of cumulative sums
+        a1 = np.concatenate((np.array([1e9, -1e9] * 50), np.arange(20) * 1e-3, np.full(5, 3.0)))
+        starts = np.arange(len(a1) - 4)
+        stops = starts + 5
+
+        post1 = array_window_reduce(a1, starts=starts, stops=stops, func_name='var', size=5)
+        self.assertTrue(np.allclose(post1,
+                [np.var(a1[i:i+5]) for i in starts], rtol=1e-6, atol=0))
+        self.assertEqual(post1[-1], 0)
+
+        a2 = np.stack((a1, a1[::-1]), axis=1)
+        a2[110] = np.nan
+        post2 = array_window_reduce(a2, starts=starts, stops=stops, func_name='std', size=5, ddof=1)
+        self.assertTrue(np.allclose(post2,
+                [np.nanstd(a2[i:i+5], axis=0, ddof=1) for i in starts], rtol=1e-6, atol=0))
+
+    #---------------------------------------------------------------------------
+
+    def test_array_segment_reduce_a(self) -> None:
+        a1 = np.array([1.0, np.nan, 3.0, 4.0, np.nan, np.nan])
+        starts = np.array([0, 2, 4])
+
+        self.assertEqual(array_segment_reduce(a1, starts=starts, func_name='sum').tolist(),
+                [1.0, 7.0, 0.0])
+        self.assertEqual(array_segment_reduce(a1, starts=starts, func_name='count').tolist(),
+                [1, 2, 0])
+        self.assertEqual(array_segment_reduce(a1, starts=starts, func_name='max').tolist()[:2],
+                [1.0, 4.0])
+        self.assertEqual(array_segment_reduce(a1, starts=starts, func_name='mean').tolist()[:2],
+                [1.0, 3.5])
+        post1 = array_segment_reduce(a1, starts=starts, func_name='sum', skipna=False)
+        self.assertEqual(np.isnan(post1).tolist(), [True, False, True])
+        post2 = array_segment_reduce(a1, starts=starts, func_name='last')
+        self.assertEqual(np.isnan(post2).tolist(), [True, False, True])
+
+    def test_array_segment_reduce_b(self) -> None:
+        a1 = np.array([[1, 2], [3, 4], [5, 6]])
+        starts = np.array([0, 1])
+        self.assertEqual(array_segment_reduce(a1, starts=starts, func_name='sum').tolist(),
+                [[1, 2], [8, 10]])
+        self.assertEqual(array_segment_reduce(a1, starts=starts, func_name='min').tolist(),
+                [[1, 2], [3, 4]])
+        self.assertEqual(array_segment_reduce(a1, starts=starts, func_name='first').tolist(),
+                [[1, 2], [3, 4]])
+
+        a2 = np.array(['b', 'a', 'c'])
+        self.assertEqual(array_segment_reduce(a2, starts=starts, func_name='max').tolist(),
+                ['b', 'c'])
+        self.assertEqual(array_segment_reduce(a2[:0], starts=starts, func_name='max').tolist(),
+                [])
+        with self.assertRaises(NotImplementedError):
+            array_segment_reduce(a1, starts=starts, func_name='median')
+
+    #---------------------------------------------------------------------------
+
+    def test_delimited_line_in_quote_a(self) -> None:
+        kwargs = dict(
+                delimiter=',',
+                quotechar='"',
+                doublequote=True,
+                escapechar=None,
+                skipinitialspace=False,
+                )
+        self.assertFalse(delimited_line_in_quote('a,b,c\n', in_quote=False, **kwargs))
+        self.assertTrue(delimited_line_in_quote('a,"b\n', in_quote=False, **kwargs))
+        self.assertFalse(delimited_line_in_quote('b",c\n', in_quote=True, **kwargs))
+        self.assertTrue(delimited_line_in_quote('b"",c\n', in_quote=True, **kwargs))
+        # a quote not at the start of a field is literal
+        self.assertFalse(delimited_line_in_quote('a,b"c\n', in_quote=False, **kwargs))
+        self.assertFalse(delimited_line_in_quote('a, "b\n', in_quote=False, **kwargs))
+        self.assertTrue(delimited_line_in_quote('a, "b\n',
+                in_quote=False,
+                **dict(kwargs, skipinitialspace=True)),
+                )
+
+    def test_delimited_line_in_quote_b(self) -> None:
+        kwargs = dict(
+                delimiter=',',
+                quotechar='"',
+                doublequote=False,
+                escapechar='\\',
+                skipinitialspace=False,
+                )
+        self.assertTrue(delimited_line_in_quote('a,"b\\",c\n', in_quote=False, **kwargs))
+        self.assertFalse(delimited_line_in_quote('a,"b\\"",c\n', in_quote=False, **kwargs))
+        self.assertFalse(delimited_line_in_quote('a,\\"b,c\n', in_quote=False, **kwargs))
+
+    def test_iter_delimited_chunks_a(self) -> None:
+        lines = ['a,b\n', '1,"x\n', 'y"\n', '2,z\n', '3,"""\n', '"\n', '4,w\n']
+        kwargs = dict(
+                delimiter=',',
+                quoting=csv.QUOTE_MINIMAL,
+                quotechar='"',
+                doublequote=True,
+                escapechar=None,
+                skipinitialspace=False,
+                )
+        post1 = list(iter_delimited_chunks(lines, count=2, **kwargs))
+        self.assertEqual(post1, [
+                ['a,b\n', '1,"x\n', 'y"\n'],
+                ['2,z\n', '3,"""\n', '"\n'],
+                ['4,w\n'],
+                ])
+
+        post2 = list(iter_delimited_chunks(lines,
+                count=2,
+                **dict(kwargs, quoting=csv.QUOTE_NONE)))
+        self.assertEqual([len(c) for c in post2], [2, 2, 2, 1])
+
+        with self.assertRaises(ValueError):
+            list(iter_delimited_chunks(lines, count=0, **kwargs))
+
 
 if __name__ == '__main__':
     unittest.main()